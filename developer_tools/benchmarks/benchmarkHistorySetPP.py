@@ -0,0 +1,111 @@
+# Copyright 2017 Battelle Energy Alliance, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+  Benchmark for the HistorySetSync and TypicalHistoryFromHistorySet interfaced post-processors.
+  It only reports timings (the outputs are checked by the regression tests); run it directly, e.g.
+    python developer_tools/benchmarks/benchmarkHistorySetPP.py --histories 10000 --steps 10000
+"""
+import os
+import sys
+import time
+import argparse
+import numpy as np
+
+# add RAVEN to path
+frameworkDir = os.path.abspath(os.path.join(*([os.path.dirname(__file__)] + [os.pardir]*2 + ['framework'])))
+if frameworkDir not in sys.path:
+  sys.path.append(frameworkDir)
+
+from utils.utils import find_crow
+find_crow(frameworkDir)
+
+from Models.PostProcessors.HistorySetSync import HistorySetSync
+from Models.PostProcessors.TypicalHistoryFromHistorySet import TypicalHistoryFromHistorySet
+
+def createHistorySet(numHistories, numSteps, numVars, synchronized, seed=42):
+  """
+    Creates a synthetic HistorySet in the format provided to the interfaced post-processors.
+    @ In, numHistories, int, number of histories
+    @ In, numSteps, int, (approximate) number of pivot values in each history
+    @ In, numVars, int, number of output variables
+    @ In, synchronized, bool, if True then all the histories share the same pivot values
+    @ In, seed, int, optional, seed for the random data
+    @ Out, inputDic, dict, HistorySet data
+  """
+  rng = np.random.RandomState(seed)
+  outVars = ['x{}'.format(v) for v in range(numVars)]
+  data = {'time': np.zeros(numHistories, dtype=object), 'scale': rng.rand(numHistories)}
+  for var in outVars:
+    data[var] = np.zeros(numHistories, dtype=object)
+  for h in range(numHistories):
+    if synchronized:
+      pivot = np.arange(numSteps, dtype=float)
+    else:
+      pivot = np.sort(rng.rand(numSteps + rng.randint(0, 10))) * numSteps
+    data['time'][h] = pivot
+    for var in outVars:
+      data[var][h] = np.sin(2. * np.pi * pivot / 24.) + rng.randn(len(pivot))
+  return {'data': data,
+          'inpVars': ['scale'],
+          'outVars': outVars,
+          'metaKeys': [],
+          'dims': dict((var, ['time']) for var in outVars),
+          'numberRealizations': numHistories}
+
+def benchmarkSync(inputDic, syncMethod, numberOfSamples):
+  """
+    Times the HistorySetSync post-processor.
+    @ In, inputDic, dict, HistorySet data
+    @ In, syncMethod, str, synchronization method
+    @ In, numberOfSamples, int, number of samples for the "grid" method
+    @ Out, elapsed, float, wall time in seconds
+  """
+  pp = HistorySetSync()
+  pp.setParams(numberOfSamples, 'time', 'extended', syncMethod)
+  start = time.time()
+  pp.run({'Data': [(inputDic['inpVars'], inputDic['outVars'], inputDic)]})
+  return time.time() - start
+
+def benchmarkTypical(inputDic, outputLen, subseqLen):
+  """
+    Times the TypicalHistoryFromHistorySet post-processor.
+    @ In, inputDic, dict, (synchronized) HistorySet data
+    @ In, outputLen, float, length of the typical history
+    @ In, subseqLen, list(int), length of the subsequences
+    @ Out, elapsed, float, wall time in seconds
+  """
+  pp = TypicalHistoryFromHistorySet()
+  pp.name = 'benchmark'
+  pp.pivotParameter = 'time'
+  pp.outputLen = outputLen
+  pp.subseqLen = subseqLen
+  start = time.time()
+  pp.run({'Data': [(inputDic['inpVars'], list(inputDic['outVars']), inputDic)]})
+  return time.time() - start
+
+if __name__ == '__main__':
+  parser = argparse.ArgumentParser(description='Benchmark the HistorySet interfaced post-processors')
+  parser.add_argument('--histories', type=int, default=1000, help='number of histories')
+  parser.add_argument('--steps', type=int, default=8760, help='number of pivot values in each history')
+  parser.add_argument('--variables', type=int, default=3, help='number of output variables')
+  args = parser.parse_args()
+
+  print('HistorySet: {} histories x {} steps x {} variables'.format(args.histories, args.steps, args.variables))
+  unsynched = createHistorySet(args.histories, args.steps, args.variables, synchronized=False)
+  for method in ['grid', 'max']:
+    elapsed = benchmarkSync(unsynched, method, args.steps)
+    print('HistorySetSync ({:>4s}): {:8.3f} s'.format(method, elapsed))
+  synched = createHistorySet(args.histories, args.steps, args.variables, synchronized=True)
+  elapsed = benchmarkTypical(synched, float(args.steps - 1), [24 * 30])
+  print('TypicalHistoryFromHistorySet: {:8.3f} s'.format(elapsed))
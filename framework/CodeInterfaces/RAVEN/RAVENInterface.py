@@ -17,13 +17,21 @@ Created on Sept 10, 2017
 @author: alfoa
 """
 import os
+import queue
+import atexit
+import threading
+import multiprocessing
+import xml.etree.ElementTree as ET
 import numpy as np
 from sys import platform
 from utils import utils
 from CodeInterfaceBaseClass import CodeInterfaceBase
+import MessageHandler # makes sure getMessageHandler is defined
 import DataObjects
 import Databases
 
+mh = getMessageHandler()
+
 class RAVEN(CodeInterfaceBase):
   """
     this class is used as part of a code dictionary to specialize Model.Code for RAVEN
@@ -51,6 +59,42 @@ class RAVEN(CodeInterfaceBase):
     # input manipulation module
     self.inputManipulationModule = None
     self.printFailedRuns = False  # whether to print failed runs to the screen
+    # number of persistent INNER RAVEN workers (0 => a new RAVEN process is started for each sample)
+    self.persistentWorkers = 0
+    self._resetWorkers()
+
+  def __getstate__(self):
+    """
+      Get state for pickling; the persistent workers and the imported modules are not pickled
+      @ In, None
+      @ Out, state, dict, the state of the object
+    """
+    state = dict(self.__dict__)
+    for key in ['_workers', '_idleWorkers', '_workerLock', '_pendingInputs', '_workerResults', '_conversionModules']:
+      state.pop(key, None)
+    return state
+
+  def __setstate__(self, state):
+    """
+      Set state after unpickling; the persistent workers are restarted when needed
+      @ In, state, dict, the state of the object
+      @ Out, None
+    """
+    self.__dict__.update(state)
+    self._resetWorkers()
+
+  def _resetWorkers(self):
+    """
+      Resets the (lazily started) pool of persistent workers and the related containers
+      @ In, None
+      @ Out, None
+    """
+    self._workers = None          # all the started workers [(process, connection)]
+    self._idleWorkers = None      # workers ready to receive a new input
+    self._workerLock = threading.Lock()
+    self._pendingInputs = {}      # {input file: modified input (xml string)}
+    self._workerResults = {}      # {sample directory: reply of the worker}
+    self._conversionModules = {}  # {module path: imported module}
 
   def addDefaultExtension(self):
     """
@@ -115,6 +159,7 @@ class RAVEN(CodeInterfaceBase):
         if checkImport is None:
           raise IOError(self.printTag+' ERROR: the conversionModule "{}" failed on import!'
                         .format(source))
+        self._conversionModules[source] = checkImport
         # variable conversion modules
         if moduleNode.tag == 'module':
           # check methods are in place
@@ -135,6 +180,27 @@ class RAVEN(CodeInterfaceBase):
         elif moduleNode.tag == 'input':
           self.inputManipulationModule = source
 
+    child = xmlNode.find("persistentWorkers")
+    if child is not None:
+      try:
+        self.persistentWorkers = int(child.text)
+      except (TypeError, ValueError):
+        self.persistentWorkers = -1
+      if self.persistentWorkers < 0:
+        raise IOError(self.printTag+' ERROR: <persistentWorkers> must be a non-negative integer! Got "{}"!'.format(child.text))
+
+  def _importModule(self, source):
+    """
+      Imports (once) a conversion or input manipulation module
+      @ In, source, str, the full path of the module
+      @ Out, module, module, the imported module
+    """
+    module = self._conversionModules.get(source, None)
+    if module is None:
+      module = utils.importFromPath(source)
+      self._conversionModules[source] = module
+    return module
+
   def __findInputFile(self,inputFiles):
     """
       Method to return the index of the RAVEN input file (error out in case it is not found)
@@ -243,7 +309,7 @@ class RAVEN(CodeInterfaceBase):
 
     # apply conversion scripts
     for source, convDict in self.conversionDict.items():
-      module = utils.importFromPath(source)
+      module = self._importModule(source)
       varVals = dict((var,np.asarray(modifDict[var])) for var in convDict['variables'])
       # modify vector+ variables that need to be flattened
       if convDict['noScalar']:
@@ -286,14 +352,114 @@ class RAVEN(CodeInterfaceBase):
     modifiedRoot = parser.modifyOrAdd(modifDict, save=True, allowAdd=True)
     # modify tree
     if self.inputManipulationModule is not None:
-      module = utils.importFromPath(self.inputManipulationModule)
+      module = self._importModule(self.inputManipulationModule)
       modifiedRoot = module.modifyInput(modifiedRoot,modifDict)
     # write input file
     parser.printInput(modifiedRoot, currentInputFiles[index].getAbsFile())
+    if self.persistentWorkers > 0:
+      # the persistent workers receive the modified tree directly
+      self._pendingInputs[currentInputFiles[index].getAbsFile()] = ET.tostring(modifiedRoot)
     # copy slave files
     parser.copySlaveFiles(currentInputFiles[index].getPath())
     return currentInputFiles
 
+  def _acquireWorker(self):
+    """
+      Gets an idle persistent worker, starting a new one if the pool is not full yet
+      (otherwise, waits for one of the workers to be released)
+      @ In, None
+      @ Out, worker, tuple, (process, connection) of the worker
+    """
+    with self._workerLock:
+      if self._workers is None:
+        self._workers = []
+        self._idleWorkers = queue.Queue()
+      if self._idleWorkers.empty() and len(self._workers) < self.persistentWorkers:
+        import RAVENWorker
+        frameworkDir = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir, os.pardir))
+        # "spawn" so that the worker does not inherit the state (threads, locks, etc.) of this process
+        context = multiprocessing.get_context('spawn')
+        conn, childConn = context.Pipe()
+        process = context.Process(target=RAVENWorker.workerLoop, args=(childConn, frameworkDir))
+        process.start()
+        childConn.close()
+        if not self._workers:
+          # registered after the first start, so that it runs before the multiprocessing exit handler
+          # (that waits for the non-daemonic processes to end)
+          atexit.register(self.shutdownWorkers)
+        self._workers.append((process, conn))
+        return process, conn
+    return self._idleWorkers.get()
+
+  def _discardWorker(self, worker):
+    """
+      Removes a (failed or hanging) worker from the pool
+      @ In, worker, tuple, (process, connection) of the worker
+      @ Out, None
+    """
+    process, conn = worker
+    with self._workerLock:
+      if worker in self._workers:
+        self._workers.remove(worker)
+    if process.is_alive():
+      process.terminate()
+    conn.close()
+
+  def shutdownWorkers(self):
+    """
+      Stops the persistent workers
+      @ In, None
+      @ Out, None
+    """
+    with self._workerLock:
+      workers, self._workers, self._idleWorkers = self._workers, None, None
+    for process, conn in workers or []:
+      try:
+        conn.send(None)
+      except (OSError, ValueError):
+        pass
+    for process, conn in workers or []:
+      process.join(5)
+      if process.is_alive():
+        process.terminate()
+      conn.close()
+
+  def runInPersistentWorker(self, inputFiles, workingDir, logFile, timeout=None):
+    """
+      Runs the (already created) INNER RAVEN input in one of the persistent workers.
+      The linked DataObjects are kept in memory and returned by "finalizeCodeOutput".
+      @ In, inputFiles, list, list of current input files
+      @ In, workingDir, string, current working dir (where the input files are)
+      @ In, logFile, string, path of the log file of the run
+      @ In, timeout, float, optional, maximum wall time of the run in seconds (None => no limit)
+      @ Out, returnCode, int, the return code of the run (0 => success)
+    """
+    index = self.__findInputFile(inputFiles)
+    inputFile = inputFiles[index].getAbsFile()
+    xml = self._pendingInputs.pop(inputFile, None)
+    if xml is None:
+      with open(inputFile, 'r') as inFile:
+        xml = inFile.read()
+    dataObjects = [self.outStreamsNamesAndType[name][0] for name in self.linkedDataObjectOutStreamsNames or []]
+    request = {'input':xml, 'inputFile':inputFile, 'logFile':os.path.abspath(logFile), 'dataObjects':dataObjects}
+    worker = self._acquireWorker()
+    reply = None
+    try:
+      worker[1].send(request)
+      if timeout is None or worker[1].poll(timeout):
+        reply = worker[1].recv()
+      else:
+        mh.message(self, 'walltime exceeded in run in working dir "'+str(workingDir)+'". Killing the worker...', 'Warning', 'quiet')
+    except (EOFError, OSError):
+      mh.message(self, 'the persistent worker running "'+str(inputFile)+'" died!', 'ERROR', 'silent')
+    if reply is None:
+      self._discardWorker(worker)
+      return -1
+    self._idleWorkers.put(worker)
+    if reply['returnCode'] == 0:
+      self._workerResults[workingDir] = reply
+    return reply['returnCode']
+
   def checkForOutputFailure(self,output,workingDir):
     """
       This method is called by the RAVEN code at the end of each run  if the return code is == 0.
@@ -306,12 +472,21 @@ class RAVEN(CodeInterfaceBase):
       @ Out, failure, bool, True if the job is failed, False otherwise
     """
     failure = False
+    # persistent worker case: the results are in memory
+    if workingDir in self._workerResults:
+      message = self._workerResults[workingDir]['failure']
+      if message is not None:
+        mh.message(self, message, 'ERROR', 'silent')
+        self._workerResults.pop(workingDir)
+        return True
+      if self.linkedDataObjectOutStreamsNames:
+        return False
     # check for log file
     ## NOTE this can be falsely accepted if the run dir isn't cleared before running,
     ##      which it automatically is but can be disabled
     toCheck = os.path.join(workingDir, self.innerWorkingDir, '.ravenStatus')
     if not os.path.isfile(toCheck):
-      print(f'RAVENInterface WARNING: Could not find {toCheck}, assuming failed RAVEN run.')
+      mh.message(self, f'Could not find {toCheck}, assuming failed RAVEN run.', 'Warning', 'quiet')
       return True
     # check for output CSV (and data)
     if not failure:
@@ -321,13 +496,13 @@ class RAVEN(CodeInterfaceBase):
           try:
             fileObj = open(outStreamFile,"r")
           except IOError:
-            print(self.printTag+' ERROR: The RAVEN INNER output file "'+str(outStreamFile)+'" does not exist!')
+            mh.message(self, 'The RAVEN INNER output file "'+str(outStreamFile)+'" does not exist!', 'ERROR', 'silent')
             failure = True
           if not failure:
             readLines = fileObj.readlines()
             if any("nan" in x.lower() for x in readLines):
               failure = True
-              print(self.printTag+' ERROR: Found nan in RAVEN INNER output "'+str(outStreamFile)+'!')
+              mh.message(self, 'Found nan in RAVEN INNER output "'+str(outStreamFile)+'!', 'ERROR', 'silent')
               break
             del readLines
       else:
@@ -335,7 +510,7 @@ class RAVEN(CodeInterfaceBase):
         path = self.outDatabases[dbName]
         fullPath = os.path.join(workingDir, self.innerWorkingDir, path)
         if not os.path.isfile(fullPath):
-          print(f'{self.printTag} ERROR: The RAVEN INNER output file "{os.path.abspath(fullPath)}" was not found!')
+          mh.message(self, f'The RAVEN INNER output file "{os.path.abspath(fullPath)}" was not found!', 'ERROR', 'silent')
           failure = True
     return failure
 
@@ -358,6 +533,7 @@ class RAVEN(CodeInterfaceBase):
     #####
     dataObjectsToReturn = {}
     numRlz = None
+    workerResults = self._workerResults.pop(workingDir, None)
     if self.linkedDataObjectOutStreamsNames:
       for filename in self.linkedDataObjectOutStreamsNames:
         # load the output CSV into a data object, so we can return that
@@ -369,7 +545,13 @@ class RAVEN(CodeInterfaceBase):
         data.readXML(dataObjectInfo[2], variableGroups=self.variableGroups)
         # set the name, then load the data
         data.name = filename
-        data.load(os.path.join(workingDir,self.innerWorkingDir,filename),style='csv')
+        if workerResults is None:
+          data.load(os.path.join(workingDir,self.innerWorkingDir,filename),style='csv')
+        else:
+          # the persistent worker returned the data in memory
+          metaKeys, params = workerResults['meta'][dataObjectInfo[0]]
+          data.addExpectedMeta(metaKeys, params)
+          data.load(workerResults['data'][dataObjectInfo[0]],style='dataset')
         # check consistency of data object number of realizations
         if numRlz is None:
           # set the standard if you're the first data object
@@ -0,0 +1,138 @@
+# Copyright 2017 Battelle Energy Alliance, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Created on Oct 18, 2026
+
+Persistent worker for the RAVEN interface (RAVEN running RAVEN).
+A worker is a long-lived process that imports the framework once and then runs
+the INNER RAVEN inputs it receives from the OUTER RAVEN, returning the linked
+DataObjects in memory instead of through the OutStream files.
+"""
+import os
+import sys
+import traceback
+import xml.etree.ElementTree as ET
+import numpy as np
+import pandas as pd
+
+def _setupFramework(frameworkDir):
+  """
+    Sets up the paths needed to run the framework (as done by the Driver)
+    @ In, frameworkDir, str, absolute path to the framework directory
+    @ Out, None
+  """
+  if frameworkDir not in sys.path:
+    sys.path.append(frameworkDir)
+  from utils import utils
+  utils.find_crow(frameworkDir)
+  utils.add_path(os.path.join(frameworkDir, 'contrib', 'AMSC'))
+  utils.add_path(os.path.join(frameworkDir, 'contrib'))
+  utils.add_path_recursively(os.path.join(frameworkDir, 'contrib', 'pp'))
+  os.environ['RAVENinterfaceCheck'] = 'False'
+
+def _hasNaN(dataset, sampleTag):
+  """
+    Checks if a DataObject, in xarray.Dataset form, contains NaN values.
+    The padding that aligns histories of different lengths is not considered.
+    @ In, dataset, xarray.Dataset, the data to check
+    @ In, sampleTag, str, name of the sample dimension
+    @ Out, hasNaN, bool, True if any NaN has been found
+  """
+  indexes = [dim for dim in dataset.dims if dim != sampleTag]
+  for i in range(dataset.sizes.get(sampleTag, 0)):
+    rlz = dataset.isel({sampleTag: i})
+    for index in indexes:
+      rlz = rlz.dropna(index, how='all')
+    if any(pd.isnull(np.asarray(rlz[var].values)).any() for var in rlz.data_vars):
+      return True
+  return False
+
+def runInput(request, frameworkDir):
+  """
+    Runs one INNER RAVEN input.
+    @ In, request, dict, the input to run: {'input': xml string of the (modified) input,
+                         'inputFile': path of the input file, 'logFile': path of the log file,
+                         'dataObjects': names of the DataObjects to return}
+    @ In, frameworkDir, str, absolute path to the framework directory
+    @ Out, reply, dict, {'returnCode': int, 'failure': str or None,
+                         'data': {name: xarray.Dataset}, 'meta': {name: (keys, {key: indexes})}}
+  """
+  reply = {'returnCode': 0, 'failure': None, 'data': {}, 'meta': {}}
+  cwd = os.getcwd()
+  path = list(sys.path)
+  # the output of the INNER run goes to the log file of the sample, as for the subprocess mode
+  sys.stdout.flush()
+  sys.stderr.flush()
+  logFile = open(request['logFile'], 'a')
+  savedFds = os.dup(1), os.dup(2)
+  os.dup2(logFile.fileno(), 1)
+  os.dup2(logFile.fileno(), 2)
+  try:
+    from Simulation import Simulation
+    import utils.TreeStructure as TS
+    from utils import randomUtils
+    # the INNER run starts from the same random state as a new RAVEN process,
+    # so its results do not depend on the runs previously done by this worker
+    randomUtils.resetGlobalEngines()
+    inputFile = request['inputFile']
+    simulation = Simulation(frameworkDir, verbosity='all')
+    simulation.setInputFiles([inputFile])
+    root = TS.xmlToInputTree(ET.ElementTree(ET.fromstring(request['input']))).getroot()
+    simulation.XMLpreprocess(root, os.path.dirname(inputFile))
+    simulation.XMLread(root, runInfoSkip=set(["DefaultInputFile"]), xmlFilename=inputFile)
+    simulation.initialize()
+    simulation.run()
+    for name in request['dataObjects']:
+      data = simulation.entities['DataObjects'][name]
+      dataset = data.asDataset()
+      if _hasNaN(dataset, data.sampleTag):
+        reply['failure'] = 'Found nan in RAVEN INNER DataObject "{}"!'.format(name)
+      metaKeys = data.getVars('meta')
+      # vector meta variables need their indexes
+      params = dict((key, data.getDimensions(key)[key]) for key in metaKeys)
+      params = dict((key, dims) for key, dims in params.items() if len(dims) > 0)
+      reply['data'][name] = dataset
+      reply['meta'][name] = (metaKeys, params)
+  except BaseException:
+    traceback.print_exc()
+    reply = {'returnCode': -1, 'failure': None, 'data': {}, 'meta': {}}
+  finally:
+    sys.stdout.flush()
+    sys.stderr.flush()
+    os.dup2(savedFds[0], 1)
+    os.dup2(savedFds[1], 2)
+    for fd in savedFds:
+      os.close(fd)
+    logFile.close()
+    os.chdir(cwd)
+    sys.path[:] = path
+  return reply
+
+def workerLoop(conn, frameworkDir):
+  """
+    Main loop of a persistent worker: runs the received inputs until None is received.
+    @ In, conn, multiprocessing.connection.Connection, connection to the OUTER RAVEN
+    @ In, frameworkDir, str, absolute path to the framework directory
+    @ Out, None
+  """
+  _setupFramework(frameworkDir)
+  while True:
+    try:
+      request = conn.recv()
+    except EOFError:
+      break
+    if request is None:
+      break
+    conn.send(runInput(request, frameworkDir))
+  conn.close()
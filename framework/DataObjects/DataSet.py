@@ -587,7 +587,7 @@ class DataSet(DataObject):
           if numInCollector > 0:
             index, rlz = self._getRealizationFromCollectorByValue(matchDict, noMatchDict, tol=tol, first=first)
       # if as Dataset convert it
-      if asDataSet:
+      if asDataSet and rlz is not None:
         if not isinstance(rlz, xr.Dataset):
           rlzs = rlz if type(rlz).__name__ == "list" else [rlz]
           rlzs = [self._addIndexMapToRlz(rl) for rl in rlzs]
@@ -1765,6 +1765,9 @@ class DataSet(DataObject):
       rr = rlz[self.sampleTag].item(0) if first else rlz[self.sampleTag].data.tolist()
     except IndexError:
       return len(self),None
+    if not first and not rr:
+      # no matches (the caller can still look for them in the collector)
+      return len(self),None
     return (rr, self._getRealizationFromDataByIndex(rr, unpackXArray)) if first else (rr, rlz)
 
   def _getRequestedElements(self, options):
@@ -81,6 +81,7 @@ class HistorySet(DataSet):
     self._neededForReload = [] # HistorySet doesn't need anything special to load, since it's written in cluster-by-sample CSV format
     self._inputMetaVars = [] # meta vars belong to the input of HistorySet, i.e. scalar
     self._outputMetaVars = [] # meta vara belong to the output of HistorySet, i.e. vector
+    self._historyRowsPrinted = {} # number of rows printed in the single-file history CSVs, by file name
 
   def _readMoreXML(self,xmlNode):
     """
@@ -158,26 +159,47 @@ class HistorySet(DataSet):
       labels = None
     # load subfiles for output spaces
     subFiles = main['filename'].values
+    # if the histories are stored in a single file, each realization points to its rows in it
+    singleFile = 'historyOffset' in main and 'historyLength' in main
+    if singleFile:
+      offsets = main['historyOffset'].values.astype(int)
+      lengths = main['historyLength'].values.astype(int)
     # pre-build realization spots
     for out in self._outputs + self.indexes + self._outputMetaVars:
       data[out] = np.zeros(nSamples,dtype=object)
     # read in secondary CSVs
+    histories = {}
     for i,sub in enumerate(subFiles):
       subFile = sub
       # check if the sub has an absolute path, otherwise take it from the master file (fileName)
       if not os.path.isabs(subFile):
         subFile = os.path.join(os.path.dirname(fileName),subFile)
-      # read in file
-      subDat = self._readPandasCSV(subFile)
-      # first time create structures
-      if len(set(subDat.keys()).intersection(self.indexes)) != len(self.indexes):
-        self.raiseAnError(IOError,'Importing HistorySet from .csv: the pivot parameters "'+', '.join(self.indexes)+'" have not been found in the .csv file. Check that the '
-                                  'correct <pivotParameter> has been specified in the dataObject or make sure the <pivotParameter> is included in the .csv files')
+      # read in file (only once if shared by the histories)
+      if singleFile:
+        if subFile not in histories:
+          histories[subFile] = self._readHistoryCSV(subFile)
+        subDat = histories[subFile]
+        rows = slice(offsets[i], offsets[i] + lengths[i])
+      else:
+        subDat = self._readHistoryCSV(subFile)
+        rows = slice(None)
       for out in self._outputs + self.indexes + self._outputMetaVars:
-        data[out][i] = subDat[out].values
+        data[out][i] = subDat[out][rows]
     # construct final data object
     self.load(data,style='dict',dims=self.getDimensions())
 
+  def _readHistoryCSV(self,fileName):
+    """
+      Reads a CSV containing one or more histories.
+      @ In, fileName, str, name of the file to read (WITH the .csv extension)
+      @ Out, subDat, dict, {var:np.ndarray} contents of the file
+    """
+    subDat = self._readPandasCSV(fileName)
+    if len(set(subDat.keys()).intersection(self.indexes)) != len(self.indexes):
+      self.raiseAnError(IOError,'Importing HistorySet from .csv: the pivot parameters "'+', '.join(self.indexes)+'" have not been found in the .csv file. Check that the '
+                                'correct <pivotParameter> has been specified in the dataObject or make sure the <pivotParameter> is included in the .csv files')
+    return dict((var, subDat[var].values) for var in subDat.keys())
+
   def _identifyVariablesInCSV(self,fileName):
     """
       Gets the list of available variables from the file "fileName.csv".
@@ -252,6 +274,9 @@ class HistorySet(DataSet):
       @ In, fileName, str, path/name to write file
       @ In, start, int, optional, starting realization to print
       @ In, kwargs, dict, optional, keywords for options
+            Possibly includes:
+                'historyFormat': 'files' (default) to write each history in its own CSV, or 'single'
+                                 to write all the histories in a single CSV (see _historyRows)
       @ Out, None
     """
     # specialized to write custom RAVEN-style history CSVs
@@ -285,8 +310,32 @@ class HistorySet(DataSet):
     ordered = list(i for i in itertools.chain(self._inputs,self._inputMetaVars) if i in keep)
     ### select input part of dataset
     inpData = data[ordered]
-    ### add column for realization information, pointing to the appropriate CSV
-    subFiles = np.array(list('{}_{}.csv'.format(fileName,rid) for rid in data[self.sampleTag].values),dtype=object)
+    ### get list of output variables to keep
+    outOrdered = list(o for o in itertools.chain(self._outputs,self._outputMetaVars) if o in keep)
+    singleFile = kwargs.get('historyFormat', 'files') == 'single' and len(outOrdered)
+    if singleFile:
+      ### all the histories are stored one after the other in the same CSV; the input space CSV points
+      ### to the rows of each history in it
+      historyFile = '{}_histories'.format(fileName)
+      if not self.hierarchical and 'RAVEN_isEnding' in self.getVars():
+        rows = [self._historyRows(fullData[i], outOrdered) for i in range(len(fullData))]
+        lengths = np.asarray([np.sum(length) for _, length in rows], dtype=int)
+        columns = dict((var, np.concatenate([r[var] for r, _ in rows])) for var in rows[0][0]) if len(rows) else {}
+      else:
+        columns, lengths = self._historyRows(data, outOrdered)
+      if mode == 'a' and historyFile not in self._historyRowsPrinted:
+        # another instance printed the file, so count the rows already in it
+        with open(historyFile+'.csv','r') as histories:
+          self._historyRowsPrinted[historyFile] = sum(1 for _ in histories) - 1
+      previous = self._historyRowsPrinted.get(historyFile, 0) if mode == 'a' else 0
+      offsets = previous + np.cumsum(lengths) - lengths
+      inpData = inpData.assign(historyOffset=self._collapseNDtoDataArray(offsets,'historyOffset',labels=data[self.sampleTag]))
+      inpData = inpData.assign(historyLength=self._collapseNDtoDataArray(lengths,'historyLength',labels=data[self.sampleTag]))
+      ordered += ['historyOffset', 'historyLength']
+      subFiles = np.array(list(historyFile+'.csv' for _ in data[self.sampleTag].values),dtype=object)
+    else:
+      ### add column for realization information, pointing to the appropriate CSV
+      subFiles = np.array(list('{}_{}.csv'.format(fileName,rid) for rid in data[self.sampleTag].values),dtype=object)
     #### don't print directories in the file names, since the files are in that directory
     subFilesNames = np.array(list(os.path.split(s)[1] for s in subFiles),dtype=object)
     ### add column to dataset
@@ -297,9 +346,12 @@ class HistorySet(DataSet):
     ### write CSV
     self._usePandasWriteCSV(fileName,inpData,ordered,keepSampleTag = self.sampleTag in keep,mode=mode)
     ## obtain slices to write subset CSVs
-    ordered = list(o for o in itertools.chain(self._outputs,self._outputMetaVars) if o in keep)
+    ordered = outOrdered
 
-    if len(ordered):
+    if singleFile:
+      pd.DataFrame(columns, columns=list(columns.keys())).to_csv(historyFile+'.csv', mode=mode, header=mode=='w', index=False)
+      self._historyRowsPrinted[historyFile] = previous + int(np.sum(lengths))
+    elif len(ordered):
       # hierarchical flag controls the printing/plotting of the dataobject in case it is an hierarchical one.
       # If True, all the branches are going to be printed/plotted independenttly, otherwise the are going to be reconstructed
       # In this case, if self.hierarchical is False, the histories are going to be reconstructed
@@ -327,6 +379,26 @@ class HistorySet(DataSet):
     else:
       self.raiseAWarning('No output space variables have been requested for DataObject "{}"! No history files will be printed!'.format(self.name))
 
+  def _historyRows(self, data, ordered):
+    """
+      Collects the rows of the histories in "data", one history after the other, in the
+      layout of the single-file history CSV (pivot parameter first, then the "ordered" variables).
+      As for the one-file-per-history CSVs, the pivot values where any of the variables is
+      missing are not included.
+      @ In, data, xr.Dataset, histories to collect
+      @ In, ordered, list(str), ordered list of the variables to collect
+      @ Out, columns, dict, {var:np.ndarray} values of the rows, for the pivot and each variable
+      @ Out, lengths, np.ndarray, number of rows of each history
+    """
+    pivot = self.indexes[0]
+    values = [data[var].transpose(self.sampleTag, pivot).values for var in ordered]
+    valid = np.logical_and.reduce([~pd.isnull(val) for val in values])
+    pivotValues = np.broadcast_to(data[pivot].values, valid.shape)
+    columns = {pivot: pivotValues[valid]}
+    for var, val in zip(ordered, values):
+      columns[var] = val[valid]
+    return columns, valid.sum(axis=1)
+
   def addExpectedMeta(self,keys, params={}, overwrite=False):
     """
       Registers meta to look for in realizations.
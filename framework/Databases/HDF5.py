@@ -22,11 +22,14 @@ from __future__ import division, print_function, unicode_literals, absolute_impo
 
 #External Modules------------------------------------------------------------------------------------
 import numpy as np
+import pandas as pd
 #External Modules End--------------------------------------------------------------------------------
 
 #Internal Modules------------------------------------------------------------------------------------
 from utils import InputData, InputTypes
 from h5py_interface_creator import hdf5Database as h5Data
+from h5py_interface_creator import hdf5ColumnarDatabase as h5ColumnarData
+from h5py_interface_creator import databaseLayout
 from DataObjects import PointSet, HistorySet
 from .Database import DateBase
 #Internal Modules End--------------------------------------------------------------------------------
@@ -36,6 +39,21 @@ class HDF5(DateBase):
     class to handle h5py (hdf5) databases,
     Used to add and retrieve attributes and values from said database
   """
+  @classmethod
+  def getInputSpecification(cls):
+    """
+      Method to get a reference to a class that specifies the input data for
+      class cls.
+      @ In, cls, the class for which we are retrieving the specification
+      @ Out, inputSpecification, InputData.ParameterInput, class to use for
+        specifying input of cls.
+    """
+    inputSpecification = super().getInputSpecification()
+    inputSpecification.addParam("layout", InputTypes.makeEnumType("layout","layoutType",["groups","columnar"]),
+                                descr=r"""storage layout of the database: one group per realization (\xmlString{groups}, needed for
+                                hierarchical data) or one dataset per variable (\xmlString{columnar})""")
+    return inputSpecification
+
   #####################
   # __magic__
   def __init__(self):
@@ -51,6 +69,7 @@ class HDF5(DateBase):
     self._allvars  = []
     self.printTag = 'DATABASE-HDF5'
     self._extension = '.h5'
+    self.layout = 'groups' # storage layout, "groups" (one group per realization) or "columnar" (one dataset per variable)
 
   def __getstate__(self):
     """
@@ -78,7 +97,7 @@ class HDF5(DateBase):
     """
     self.__dict__.update(newstate)
     self.exist = True
-    self.database = h5Data(self.name, self.databaseDir, self.filename, self.exist)
+    self._createDatabase()
 
   def _handleInput(self, paramInput):
     """
@@ -86,6 +105,8 @@ class HDF5(DateBase):
       @ In, paramInput, ParameterInput, the already parsed input.
       @ Out, None
     """
+    # the layout is needed when the database is initialized in the base class
+    self.layout = paramInput.parameterValues.get('layout', self.layout)
     super(HDF5, self)._handleInput(paramInput)
 
   #####################
@@ -107,7 +128,19 @@ class HDF5(DateBase):
       @ Out, None
     """
     super(HDF5, self).initializeDatabase()
-    self.database = h5Data(self.name, self.databaseDir, self.filename, self.exist, self.variables)
+    self._createDatabase()
+
+  def _createDatabase(self):
+    """
+      Creates the underlying database object, for the requested layout.
+      An existing database is always read with the layout it has been written with.
+      @ In, None
+      @ Out, None
+    """
+    if self.exist:
+      self.layout = databaseLayout(self.get_fullpath())
+    dbClass = h5ColumnarData if self.layout == 'columnar' else h5Data
+    self.database = dbClass(self.name, self.databaseDir, self.filename, self.exist, self.variables)
 
   def saveDataToFile(self, source):
     """
@@ -118,6 +151,11 @@ class HDF5(DateBase):
     if not isinstance(source, (PointSet, HistorySet)):
       self.raiseAnError(TypeError, 'RAVEN HDF5 Databases cannot currently handle N-Dimensional Datasets; ' +
                         f'use NetCDF instead. Received Dataset for database "{source.name}"')
+    if self.layout == 'columnar':
+      if len(source) > 0:
+        self.database.addColumns(self._columnsFromData(source), len(source))
+        self.built = True
+      return
     for r in range(len(source)):
       rlz = source.realization(r, unpackXArray=True)
       rlz = dict((var, np.atleast_1d(val)) for var, val in rlz.items())
@@ -129,10 +167,73 @@ class HDF5(DateBase):
       @ In, target, DataObjects.DataObjet, object to write data into
       @ Out, None
     """
-    allRlz = self.allRealizations()
+    if self.layout == 'columnar':
+      if len(self.database) == 0:
+        return
+      columns = self.database.readColumns()
+      if self._canLoadColumns(target, columns):
+        target.load(columns, style='dict', dims=target.getDimensions())
+        return
+      allRlz = self._realizationsFromColumns(columns)
+    else:
+      allRlz = self.allRealizations()
     for rlz in allRlz:
       target.addRealization(rlz)
 
+  def _columnsFromData(self, source):
+    """
+      Collects the data of a data object in the format of the columnar layout.
+      As for the history CSVs, the pivot values where any of the time-dependent variables is missing are not stored.
+      @ In, source, DataObjects.DataObject, PointSet or HistorySet to collect
+      @ Out, columns, dict, {var:(values, lengths)} where "values" are the values of all the realizations,
+                            one after the other, and "lengths" is None for scalars or the number of values of each realization
+    """
+    data = source.asDataset()
+    dims = source.getDimensions()
+    columns = {}
+    byIndex = {}
+    for var in source.getVars():
+      if dims[var]:
+        byIndex.setdefault(dims[var][0], []).append(var)
+      else:
+        columns[var] = (data[var].values, None)
+    for index, variables in byIndex.items():
+      values = [data[var].transpose(source.sampleTag, index).values for var in variables]
+      valid = np.logical_and.reduce([~pd.isnull(val) for val in values])
+      lengths = valid.sum(axis=1)
+      columns[index] = (np.broadcast_to(data[index].values, valid.shape)[valid], lengths)
+      for var, val in zip(variables, values):
+        columns[var] = (val[valid], lengths)
+    if 'prefix' not in columns:
+      columns['prefix'] = (np.arange(len(self.database), len(self.database) + len(source)), None)
+    return columns
+
+  def _canLoadColumns(self, target, columns):
+    """
+      Checks if the columns read from the columnar layout can be loaded in bulk into the target.
+      That requires an empty target whose scalar and time-dependent variables are stored as such;
+      otherwise (e.g. a PointSet taking a row of the histories) the realizations are added one at a time.
+      @ In, target, DataObjects.DataObject, object to write data into
+      @ In, columns, dict, {var:np.ndarray} data read from the database
+      @ Out, canLoad, bool, True if the columns can be loaded in bulk
+    """
+    if not target.isEmpty:
+      return False
+    vectors = self.database.vectorVariables()
+    dims = target.getDimensions()
+    for var in target.getVars() + target.indexes:
+      if var not in columns or (bool(dims.get(var)) or var in target.indexes) != (var in vectors):
+        return False
+    return True
+
+  def _realizationsFromColumns(self, columns):
+    """
+      Splits the columns read from the columnar layout into realizations.
+      @ In, columns, dict, {var:np.ndarray} data read from the database
+      @ Out, allData, list(dict), the realizations
+    """
+    return [dict((var, np.atleast_1d(values[r])) for var, values in columns.items()) for r in range(len(self.database))]
+
   def addRealization(self, rlz):
     """
       Adds a "row" (or "sample") to this database.
@@ -218,6 +319,9 @@ class HDF5(DateBase):
       @ In, None
       @ Out, allData, list of arrays, all the data from this data object.
     """
+    if self.layout == 'columnar':
+      # in storage order
+      return self._realizationsFromColumns(self.database.readColumns())
     allRealizationNames = self.database.retrieveAllHistoryNames()
     # instead to use a OrderedDict in the database, I sort the names here (it is much faster)
     allRealizationNames.sort()
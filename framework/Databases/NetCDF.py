@@ -23,6 +23,7 @@ from __future__ import division, print_function, unicode_literals, absolute_impo
 import os
 import numpy as np
 import xarray as xr
+import netCDF4
 
 from utils import InputData, InputTypes, xmlUtils, mathUtils
 from .Database import DateBase
@@ -56,6 +57,8 @@ class NetCDF(DateBase):
     self.printTag = 'DATABASE-NetCDF'  # For printing verbosity labels
     self._format = 'netcdf4'  # writing format for disk
     self._extension = '.nc'
+    self._chunkBytes = 2**20  # target size of the on-disk chunks, along the sample dimension
+    self._dataEncodings = ['dtype', '_FillValue', 'units', 'calendar', 'zlib', 'complevel', 'shuffle'] # kept when rewriting
 
   def saveDataToFile(self, source):
     """
@@ -76,9 +79,26 @@ class NetCDF(DateBase):
         # is it a string?
         if mathUtils.isAString(ds[var].values[0]):
           ds[var] = ds[var].astype(str)
-    # is there existing data? Read it in and merge it, if so
+    self._appendToFile(path, ds)
+
+  def _appendToFile(self, path, ds):
+    """
+      Adds new samples to the database file.
+      When the file already stores the same variables over the same index coordinates, the samples are appended
+      in place along its unlimited "RAVEN_sample_ID" dimension; otherwise, the existing data is read, merged with
+      the new samples and the file is rewritten.
+      @ In, path, str, full path to the database file
+      @ In, ds, xr.Dataset, the new samples
+      @ Out, None
+    """
+    # is there existing data? Append to it or merge with it, if so
     # -> we've already wiped the file in initializeDatabase if it's in write mode
     if os.path.isfile(path):
+      try:
+        if self._appendInPlace(path, ds):
+          return
+      except PermissionError:
+        self.raiseAnError(PermissionError, f'NetCDF file "{path}" denied RAVEN permission to write! Is it open in another program?')
       exists = xr.load_dataset(path)
       if 'RAVEN_sample_ID' in exists:
         floor = int(exists['RAVEN_sample_ID'].values[-1]) + 1
@@ -86,14 +106,100 @@ class NetCDF(DateBase):
         ds = ds.assign_coords(RAVEN_sample_ID=new)
       # NOTE order matters! This preserves the sampling order in which data was inserted
       #      into this database
-      ds = xr.concat((exists, ds), 'RAVEN_sample_ID')
+      ds = xr.concat((exists, ds), 'RAVEN_sample_ID', join='outer')
     # if this is open somewhere else, we can't write to it
     # TODO is there a way to check if it's writable? I can't find one ...
     try:
-      ds.to_netcdf(path, engine=self._format)
+      ds.to_netcdf(path, engine=self._format, unlimited_dims=['RAVEN_sample_ID'], encoding=self._chunkEncoding(ds))
     except PermissionError:
       self.raiseAnError(PermissionError, f'NetCDF file "{path}" denied RAVEN permission to write! Is it open in another program?')
 
+  def _chunkEncoding(self, ds):
+    """
+      Provides the on-disk chunking of the variables depending on the sample dimension: each chunk contains
+      a block of samples (about self._chunkBytes in size) with the full extent of the other dimensions.
+      @ In, ds, xr.Dataset, data to write
+      @ Out, encoding, dict, {var: dict} encoding to write the variables with
+    """
+    encoding = {}
+    for var, variable in ds.variables.items():
+      if 'RAVEN_sample_ID' not in variable.dims:
+        continue
+      others = [max(1, ds.sizes[dim]) for dim in variable.dims if dim != 'RAVEN_sample_ID']
+      samples = max(1, self._chunkBytes // (max(variable.dtype.itemsize, 8) * int(np.prod(others))))
+      # the encoding given here replaces the one of the variable, so keep its data encoding
+      encoding[var] = dict((key, val) for key, val in variable.encoding.items() if key in self._dataEncodings)
+      # the samples merged in may have changed the numeric type (e.g. floats into integers)
+      dtype = encoding[var].get('dtype', None)
+      if dtype is not None and variable.dtype.kind in 'biuf' and np.dtype(dtype).kind != variable.dtype.kind:
+        del encoding[var]['dtype']
+      encoding[var]['chunksizes'] = tuple(samples if dim == 'RAVEN_sample_ID' else max(1, ds.sizes[dim]) for dim in variable.dims)
+    return encoding
+
+  def _appendInPlace(self, path, ds):
+    """
+      Appends new samples to the database file along its unlimited "RAVEN_sample_ID" dimension,
+      without reading or rewriting the samples already stored.
+      @ In, path, str, full path to the database file
+      @ In, ds, xr.Dataset, the new samples
+      @ Out, appended, bool, False if the file structure does not allow appending the samples in place
+    """
+    with netCDF4.Dataset(path, 'a') as nc:
+      if not self._canAppend(nc, ds):
+        return False
+      size = len(nc.dimensions['RAVEN_sample_ID'])
+      floor = int(nc.variables['RAVEN_sample_ID'][size - 1]) + 1 if size else 0
+      new = slice(size, size + ds.sizes['RAVEN_sample_ID'])
+      nc.variables['RAVEN_sample_ID'][new] = ds['RAVEN_sample_ID'].values + floor
+      for var in ds.data_vars:
+        variable = nc.variables[var]
+        values = ds[var].transpose(*variable.dimensions).values
+        if variable.dtype == str:
+          values = values.astype(object)
+        elif values.dtype != variable.dtype:
+          values = values.astype(variable.dtype)
+        variable[new] = values
+    return True
+
+  def _canAppend(self, nc, ds):
+    """
+      Checks if new samples can be appended in place to the database file: the file must have an unlimited
+      "RAVEN_sample_ID" dimension and the same variables, with compatible types, over the same index coordinates.
+      @ In, nc, netCDF4.Dataset, the open database file
+      @ In, ds, xr.Dataset, the new samples
+      @ Out, canAppend, bool, True if the samples can be appended in place
+    """
+    dim = nc.dimensions.get('RAVEN_sample_ID')
+    if dim is None or not dim.isunlimited() or 'RAVEN_sample_ID' not in nc.variables:
+      return False
+    if set(nc.variables) - set(nc.dimensions) != set(ds.data_vars):
+      return False
+    for var in ds.data_vars:
+      variable = nc.variables[var]
+      if set(variable.dimensions) != set(ds[var].dims) or variable.dimensions[0] != 'RAVEN_sample_ID':
+        return False
+      new = ds[var].dtype.kind
+      if variable.dtype == str:
+        if new not in 'US':
+          return False
+      elif variable.dtype.kind == 'f':
+        if new not in 'fiub':
+          return False
+      elif variable.dtype.kind in 'iu':
+        if new not in 'iub':
+          return False
+      else:
+        return False
+    # the index coordinates must not change
+    for idx in ds.dims:
+      if idx == 'RAVEN_sample_ID':
+        continue
+      if idx not in nc.dimensions or len(nc.dimensions[idx]) != ds.sizes[idx]:
+        return False
+      if idx in nc.variables and idx in ds.coords and not np.array_equal(nc.variables[idx][:], ds[idx].values):
+        return False
+    return True
+
   def loadIntoData(self, target):
     """
       Loads this database into the target data object
@@ -122,18 +228,9 @@ class NetCDF(DateBase):
       @ Out, None
     """
     # apparently we're storing samples!
-    # -> do we already have data present?
+    # -> the sample ID is shifted after the existing ones (if any) when appending
     path = self.get_fullpath()
-    if os.path.isfile(path):
-      # load data as 100 sample chunks, lazily (not into memory)
-      # -> using the argument "chunks" triggers the lazy loading using dask
-      # existing = xr.open_dataset(path, chunks={'RAVEN_sample_ID': 100}) # TODO user option
-      existing = True
-      with xr.open_dataset(path) as ds: # autocloses at end of scope
-        counter = int(ds.RAVEN_sample_ID.values[-1]) + 1
-    else:
-      existing = None
-      counter = 0
+    counter = 0
     # create DS from realization # TODO make a feature of the Realization object
     indexMap = rlz.get('_indexMap', [{}])[0]
     indices = list(set().union(*(set(x) for x in indexMap.values())))
@@ -151,10 +248,4 @@ class NetCDF(DateBase):
       coords = dict((idx, rlz[idx]) for idx in indexMap.get(var, []))
       xarrs[var] = xr.DataArray(vals, dims=dims, coords=coords).expand_dims(dim={'RAVEN_sample_ID': [counter]})
     rlzDS = xr.Dataset(xarrs)
-    if existing:
-      with xr.open_dataset(path) as ds: # autocloses at end of scope
-        # after research, best approach is concatenating xr.DataSet along RAVEN_sample_ID dim
-        new = xr.concat((ds, rlzDS), dim='RAVEN_sample_ID')
-    else:
-      new = rlzDS
-    new.to_netcdf(path) # TODO would appending instead of writing work for new samples? I doubt it.
+    self._appendToFile(path, rlzDS)
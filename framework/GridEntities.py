@@ -18,6 +18,7 @@ Created on Mar 30, 2015
 """
 import abc
 import sys
+import itertools
 
 #External Modules------------------------------------------------------------------------------------
 import numpy as np
@@ -250,8 +251,7 @@ class GridEntity(GridBase):
     self.gridContainer['gridCoord']             = None               # the matrix containing all coordinate of all points in the grid
     self.gridContainer['nVar']                  = 0                  # this is the number of grid dimensions
     self.gridContainer['transformationMethods'] = None               # Dictionary of methods to transform the coordinate from 0-1 values to something else. These methods are pointed and passed into the initialize method. {varName:method}
-    self.gridContainer['cellIDs']               = {}                 # Cell IDs and verteces coordinates
-    self.gridContainer['vertexToCellIds']       = {}                 # mapping between verteces and cell ids
+    self.gridContainer['firstCellId']           = None               # id of the first cell (the cell ids follow the C-ordering of the cells' lowest verteces). None if the cells are not computed
     self.gridContainer['initDictionary']        = None               # dictionary of initialization parameters passed in the initialize method
     self.constructTensor                        = False              # True if we need to construct the tensor product of the the ND grid (full grid) or just the iterator (False)
     self.uniqueCellNumber                       = 0                  # number of unique cells
@@ -511,41 +511,67 @@ class GridEntity(GridBase):
       self.gridContainer['gridCoord'] = np.zeros(self.gridContainer['gridCoorShape'])   # the matrix containing all coordinate of all points in the grid
     self.uniqueCellNumber                               = np.prod ([element-1 for element in pointByVar]) # number of unique cells
     #filling the coordinate on the grid
+    if self.constructTensor:
+      for varId, varName in enumerate(self.gridContainer['dimensionNames']):
+        # broadcast the grid vector along its own axis
+        axisShape = [1]*self.nVar
+        axisShape[varId] = -1
+        self.gridContainer['gridCoord'][...,varId] = self.gridContainer['gridVectors'][varName].reshape(axisShape)
     self.gridIterator = ravenArrayIterator(arrayIn=self.gridContainer['gridCoord']) if self.constructTensor else ravenArrayIterator(shape=self.gridContainer['gridShape'])
-    if computeCells:
-      gridIterCells =  ravenArrayIterator(arrayIn=np.zeros(shape=(2,)*self.nVar,dtype=int))
-      origin = [-1]*self.nVar
-      pp     = [element - 1 for element in pointByVar]
-      cellID = int(initDict['startingCellId']) if 'startingCellId' in  initDict.keys() else 1
-    if self.constructTensor or computeCells:
-      while not self.gridIterator.finished:
-        if self.constructTensor:
-          coordinateID                          = self.gridIterator.multiIndex[-1]
-          dimName                               = self.gridContainer['dimensionNames'][coordinateID]
-          valuePosition                         = self.gridIterator.multiIndex[coordinateID]
-          self.gridContainer['gridCoord'][self.gridIterator.multiIndex] = self.gridContainer['gridVectors'][dimName][valuePosition]
-        if computeCells:
-          if all(np.greater(pp,list(self.gridIterator.multiIndex[:
-            -1]))) and list(self.gridIterator.multiIndex[:-1]) != origin:
-            self.gridContainer['cellIDs'][cellID] = []
-            origin = list(self.gridIterator.multiIndex[:-1])
-            while not gridIterCells.finished:
-              vertex = tuple(np.array(origin)+gridIterCells.multiIndex)
-              self.gridContainer['cellIDs'][cellID].append(vertex)
-              if vertex in self.gridContainer['vertexToCellIds'].keys():
-                self.gridContainer['vertexToCellIds'][vertex].append(cellID)
-              else:
-                self.gridContainer['vertexToCellIds'][vertex] = [cellID]
-              gridIterCells.iternext()
-            gridIterCells.reset()
-            cellID+=1
-        self.gridIterator.iternext()
-      if len(self.gridContainer['cellIDs'].keys()) != self.uniqueCellNumber and computeCells:
-        self.raiseAnError(IOError, "number of cells detected != than the number of actual cells!")
-      self.resetIterator()
+    # the cells (and their verteces) are identified arithmetically from the cell id, in the C-ordering of their lowest vertex
+    self.gridContainer['firstCellId'] = int(initDict.get('startingCellId',1)) if computeCells else None
 
     self.raiseAMessage("Grid "+"initialized...")
 
+  def returnCellIds(self):
+    """
+      Method to return the ids of the cells in the grid
+      @ In, None
+      @ Out, cellIds, range, the cell ids (empty if the cells have not been computed)
+    """
+    firstCellId = self.gridContainer['firstCellId']
+    if firstCellId is None:
+      return range(0)
+    return range(firstCellId, firstCellId + int(self.uniqueCellNumber))
+
+  def returnCellCorners(self, cellId):
+    """
+      Method to return the lowest and highest verteces of a cell
+      @ In, cellId, int, the cell id
+      @ Out, corners, tuple, (lowestVertex, highestVertex), the grid indexes of the two verteces
+    """
+    if cellId not in self.returnCellIds():
+      self.raiseAnError(IndexError, 'cell id '+str(cellId)+' is not in the grid!')
+    cellShape = tuple(element - 1 for element in self.gridContainer['gridShape'])
+    lowest = tuple(int(index) for index in np.unravel_index(cellId - self.gridContainer['firstCellId'], cellShape))
+    return lowest, tuple(index + 1 for index in lowest)
+
+  def returnCellVerteces(self, cellId):
+    """
+      Method to return the verteces of a cell
+      @ In, cellId, int, the cell id
+      @ Out, verteces, list, list of the grid indexes (tuples) of the 2^nVar verteces of the cell
+    """
+    lowest, _ = self.returnCellCorners(cellId)
+    return [tuple(np.add(lowest, offset)) for offset in itertools.product((0, 1), repeat=self.nVar)]
+
+  def _vertecesToCellIds(self, verteces):
+    """
+      Method to compute the ids of all the cells that share any of the given verteces
+      @ In, verteces, array-like, grid indexes of the verteces (shape (nVerteces, nVar))
+      @ Out, cellIds, np.array, unique ids of the cells sharing the verteces
+    """
+    verteces = np.asarray(verteces, dtype=int).reshape(-1, self.nVar)
+    cellShape = np.asarray(self.gridContainer['gridShape']) - 1
+    cellIds = [np.zeros(0, dtype=int)]
+    if self.uniqueCellNumber > 0:
+      # a vertex is shared by the (up to 2^nVar) cells whose lowest vertex is one step lower in any subset of the dimensions
+      for offset in itertools.product((0, 1), repeat=self.nVar):
+        lowest = verteces - np.asarray(offset)
+        inGrid = np.all(np.logical_and(lowest >= 0, lowest < cellShape), axis=1)
+        cellIds.append(np.ravel_multi_index(tuple(lowest[inGrid].T), tuple(cellShape)))
+    return np.unique(np.concatenate(cellIds)) + self.gridContainer['firstCellId']
+
   def retrieveCellIds(self,listOfPoints,containedOnly=False):
     """
       This method is aimed to retrieve the cell IDs that are contained in certain boundaries provided as list of points
@@ -553,18 +579,17 @@ class GridEntity(GridBase):
       @ In, containedOnly, bool, optional, flag to ask for cells contained in the listOfPoints or just cells that touch the listOfPoints, default False
       @ Out, previousSet, list, list of cell ids
     """
-    cellIds = []
+    if self.gridContainer['firstCellId'] is None:
+      self.raiseAnError(Exception, 'the cells have not been computed for this grid! Initialize it with "computeCells"')
     for cntb, bound in enumerate(listOfPoints):
-      cellIds.append([])
-      for point in bound:
-        cellIds[cntb].extend(self.gridContainer['vertexToCellIds'][tuple(point)])
+      cellIds = set(self._vertecesToCellIds(bound).tolist())
       if cntb == 0:
-        previousSet = set(cellIds[cntb])
+        previousSet = cellIds
       if containedOnly:
-        previousSet = set(previousSet).intersection(cellIds[cntb])
+        previousSet = previousSet.intersection(cellIds)
       else:
-        previousSet.update(cellIds[cntb])
-    return list(set(previousSet))
+        previousSet.update(cellIds)
+    return list(previousSet)
 
   def returnGridAsArrayOfCoordinates(self):
     """
@@ -809,7 +834,7 @@ class MultiGridEntity(GridBase):
     """
     maxCellId = 0
     for node in self.grid.iter():
-      maxLocalCellId = max(node.get('grid').returnParameter('cellIDs').keys())
+      maxLocalCellId = max(node.get('grid').returnCellIds(), default=0)
       maxCellId = maxLocalCellId if maxLocalCellId > maxCellId else maxCellId
     return maxCellId
 
@@ -840,18 +865,18 @@ class MultiGridEntity(GridBase):
     cellIdsToRefine, didWeFoundCells = refineDict['cellIDs'], dict.fromkeys(refineDict['cellIDs'], False)
     maxCellId = self._getMaxCellIds()
     for node in self.grid.iter():
-      parentNodeCellIds  = node.get("grid").returnParameter('cellIDs')
-      level, nodeCellIds = node.get("level"), parentNodeCellIds.keys()
-      foundCells = set(nodeCellIds).intersection(cellIdsToRefine)
+      parentGrid = node.get("grid")
+      level, nodeCellIds = node.get("level"), parentGrid.returnCellIds()
+      foundCells = set(cellId for cellId in cellIdsToRefine if cellId in nodeCellIds)
       if len(foundCells) > 0:
-        parentGrid = node.get("grid")
         initDict   = parentGrid.returnParameter("initDictionary")
         if "transformationMethods" in initDict.keys():
           initDict.pop("transformationMethods")
         for idcnt, fcellId in enumerate(foundCells):
           didWeFoundCells[fcellId] = True
           newGrid = factory.returnInstance("GridEntity")
-          verteces = parentNodeCellIds[fcellId]
+          # the lowest and highest verteces bound the cell
+          verteces = parentGrid.returnCellCorners(fcellId)
           lowerBounds,upperBounds = dict.fromkeys(parentGrid.returnParameter('dimensionNames'), sys.float_info.max), dict.fromkeys(parentGrid.returnParameter('dimensionNames'), -sys.float_info.max)
           for vertex in verteces:
             coordinates = parentGrid.returnCoordinateFromIndex(vertex, True, recastMethods=initDict["transformationMethods"] if "transformationMethods" in initDict.keys() else {})
@@ -868,7 +893,7 @@ class MultiGridEntity(GridBase):
               initDict["stepLength"][key] = [(upperBounds[key] - lowerBounds[key])/float(refineDict["refiningNumSteps"])]
           initDict["startingCellId"] = maxCellId+1
           newGrid.initialize(initDict)
-          maxCellId   = max(newGrid.returnParameter('cellIDs').keys())
+          maxCellId   = max(newGrid.returnCellIds())
           refinedNode = self.__createNewNode(node.name+"_cell:"+str(fcellId),{"grid":newGrid,"level":level+"."+str(idcnt)})
           self.mappingLevelName[level+"."+str(idcnt)] = node.name+"_cell:"+str(fcellId)
           node.appendBranch(refinedNode)
@@ -80,6 +80,55 @@ class MetricDistributor(utils.metaclass_insert(abc.ABCMeta,BaseType), MessageUse
     output = self.estimator.evaluate(feat,targ)
     return output
 
+  def isChunkable(self, pairedData):
+    """
+      Method to check if the given paired data can be evaluated in chunks of history steps, i.e. if
+      the metric is evaluated independently for each history step
+      @ In, pairedData, tuple, see "evaluate"
+      @ Out, isChunkable, bool, True if the paired data can be split in history step chunks
+    """
+    if self.canHandleDynamicData or self.estimator.isInstanceString(['DSS']):
+      return False
+    return not all(isinstance(pData, Distributions.Distribution) for pData in pairedData)
+
+  def evaluateBatch(self, pairedDataList, weights = None, multiOutput='mean', chunkSize=None, **kwargs):
+    """
+      Method to perform the evaluation of a list of paired data.
+      The metrics evaluated independently for each history step process the history steps of all the
+      paired data together, so that the metrics that can (e.g. CDFAreaDifference and PDFCommonArea)
+      evaluate them in vectorized batches. If chunkSize is given, the history steps are read from the
+      data chunkSize at a time: only a chunk of the data is held in memory when the data values are
+      lazily loaded (e.g. xarray.DataArray backed by a file).
+      @ In, pairedDataList, list, list of pairedData, see "evaluate"; the featureValues and targetValues
+        can be any array supporting numpy slicing
+      @ In, weights, array_like (numpy.ndarray or list), optional,  An array of weights associated with the pairedData
+      @ In, multiOutput, string, optional, 'mean', 'max', 'min' or 'raw_values'
+      @ In, chunkSize, int, optional, number of history steps read and evaluated at a time, all of them if None
+      @ Out, outputs, list, list of numpy.ndarray (1D arrays), processed output from the estimator for each pairedData
+    """
+    numSteps = {}
+    for cnt, pairedData in enumerate(pairedDataList):
+      if self.isChunkable(pairedData):
+        shapes = [np.shape(pData[0]) for pData in pairedData if not isinstance(pData, Distributions.Distribution)]
+        numSteps[cnt] = max(shape[1] if len(shape) > 1 else 1 for shape in shapes)
+    dynamicOutputs = dict((cnt, []) for cnt in numSteps)
+    if len(numSteps) > 0:
+      maxSteps = max(numSteps.values())
+      chunkSize = maxSteps if chunkSize is None else int(chunkSize)
+      for start in range(0, maxSteps, chunkSize):
+        steps = slice(start, start + chunkSize)
+        chunk = [cnt for cnt in numSteps if start < numSteps[cnt]]
+        chunkData = [self._readSteps(pairedDataList[cnt], steps) for cnt in chunk]
+        for cnt, stepOutputs in zip(chunk, self._evaluateSteps(chunkData)):
+          dynamicOutputs[cnt].extend(stepOutputs)
+    outputs = []
+    for cnt, pairedData in enumerate(pairedDataList):
+      if cnt in dynamicOutputs:
+        outputs.append(self._aggregate(dynamicOutputs[cnt], weights, multiOutput))
+      else:
+        outputs.append(self.evaluate(self._readSteps(pairedData, slice(None)), weights=weights, multiOutput=multiOutput, **kwargs))
+    return outputs
+
   def evaluate(self,pairedData, weights = None, multiOutput='mean',**kwargs):
     """
       Method to perform the evaluation of given paired data
@@ -100,44 +149,8 @@ class MetricDistributor(utils.metaclass_insert(abc.ABCMeta,BaseType), MessageUse
       self.raiseAMessage('Using feature and target as distributions ...')
       out = self.estimator.evaluate(feat, targ,**kwargs)
       dynamicOutput.append(out)
-    elif isinstance(feat, Distributions.Distribution):
-      self.raiseAMessage('Using feature as distribution ...')
-      targVals = np.asarray(targ[0])
-      for hist in range(targVals.shape[1]):
-        if targ[1] is not None:
-          assert(len(targVals[:,hist]) == len(targ[1]))
-          targIn = (targVals[:,hist], targ[1])
-        else:
-          targIn = targVals[:,hist]
-        out = self.estimator.evaluate(feat, targIn)
-        dynamicOutput.append(out)
-    elif isinstance(targ, Distributions.Distribution):
-      self.raiseAMessage('Using target as distribution ...')
-      featVals = np.asarray(feat[0])
-      for hist in range(featVals.shape[1]):
-        if feat[1] is not None:
-          assert(len(featVals[:,hist]) == len(feat[1]))
-          featIn = (featVals[:,hist], feat[1])
-        else:
-          featIn = featVals[:,hist]
-        out = self.estimator.evaluate(featIn, targ)
-        dynamicOutput.append(out)
-    elif self.estimator.isInstanceString(['CDFAreaDifference', 'PDFCommonArea']):
-      self.raiseAMessage('Using PDF/CDF metrics ...')
-      featVals = np.asarray(feat[0])
-      targVals = np.asarray(targ[0])
-      for hist in range(featVals.shape[1]):
-        if feat[1] is not None:
-          featIn = (featVals[:,hist], feat[1])
-        else:
-          featIn = featVals[:,hist]
-        if targ[1] is not None:
-          assert(len(targVals[:,hist]) == len(targ[1]))
-          targIn = (targVals[:,hist], targ[1])
-        else:
-          targIn = targVals[:,hist]
-        out = self.estimator.evaluate(featIn, targIn)
-        dynamicOutput.append(out)
+    elif self.isChunkable(pairedData):
+      dynamicOutput = self._evaluateSteps([pairedData])[0]
     elif self.estimator.isInstanceString(['DSS']):
       featVals = np.asarray(feat)
       targVals = np.asarray(targ)
@@ -161,12 +174,108 @@ class MetricDistributor(utils.metaclass_insert(abc.ABCMeta,BaseType), MessageUse
       # FIXME: Currently, we only use the weights of given features to compute the metric, this
       # can be biased or uncorrect. The correct way is to use the joint probability weight.
       # This needs to be improved in the future when RAVEN can handle the joint probability weight correctly.
-      if self.canHandleDynamicData:
-        dynamicOutput = self.estimator.evaluate(featVals, targVals, dataWeight,**kwargs)
+      dynamicOutput = self.estimator.evaluate(featVals, targVals, dataWeight,**kwargs)
+    return self._aggregate(dynamicOutput, weights, multiOutput)
+
+  def _evaluateSteps(self, pairedDataList):
+    """
+      Method to evaluate the metric at each history step of a list of paired data.
+      The history steps of all the paired data are evaluated in a single batch by the PDF/CDF metrics.
+      @ In, pairedDataList, list, list of pairedData, see "evaluate"
+      @ Out, stepOutputs, list, for each pairedData, the list of outputs of the estimator at each history step
+    """
+    stepOutputs = []
+    # (featIn, targIn) of the history steps evaluated in batch, and the pairedData they belong to
+    batch = []
+    owners = []
+    for cnt, (feat, targ) in enumerate(pairedDataList):
+      dynamicOutput = []
+      if isinstance(feat, Distributions.Distribution):
+        self.raiseAMessage('Using feature as distribution ...')
+        targVals = np.asarray(targ[0])
+        for hist in range(targVals.shape[1]):
+          if targ[1] is not None:
+            assert(len(targVals[:,hist]) == len(targ[1]))
+            targIn = (targVals[:,hist], targ[1])
+          else:
+            targIn = targVals[:,hist]
+          out = self.estimator.evaluate(feat, targIn)
+          dynamicOutput.append(out)
+      elif isinstance(targ, Distributions.Distribution):
+        self.raiseAMessage('Using target as distribution ...')
+        featVals = np.asarray(feat[0])
+        for hist in range(featVals.shape[1]):
+          if feat[1] is not None:
+            assert(len(featVals[:,hist]) == len(feat[1]))
+            featIn = (featVals[:,hist], feat[1])
+          else:
+            featIn = featVals[:,hist]
+          out = self.estimator.evaluate(featIn, targ)
+          dynamicOutput.append(out)
+      elif self.estimator.isInstanceString(['CDFAreaDifference', 'PDFCommonArea']):
+        self.raiseAMessage('Using PDF/CDF metrics ...')
+        featVals = np.asarray(feat[0])
+        targVals = np.asarray(targ[0])
+        for hist in range(featVals.shape[1]):
+          if feat[1] is not None:
+            featIn = (featVals[:,hist], feat[1])
+          else:
+            featIn = featVals[:,hist]
+          if targ[1] is not None:
+            assert(len(targVals[:,hist]) == len(targ[1]))
+            targIn = (targVals[:,hist], targ[1])
+          else:
+            targIn = targVals[:,hist]
+          batch.append((featIn, targIn))
+          owners.append(cnt)
       else:
+        self.raiseAMessage('Using non-PDF/CDF metrics ...')
+        featVals = np.asarray(feat[0])
+        targVals = np.asarray(targ[0])
+        assert(featVals.shape[0] == targVals.shape[0])
+        if feat[1] is not None:
+          dataWeight = np.asarray(feat[1])
+          assert(featVals.shape[0] == dataWeight.shape[0])
+        else:
+          dataWeight = None
+        # FIXME: see "evaluate", only the weights of given features are used to compute the metric
         for hist in range(featVals.shape[1]):
           out = self.estimator.evaluate(featVals[:,hist], targVals[:,hist], dataWeight)
           dynamicOutput.append(out)
+      stepOutputs.append(dynamicOutput)
+    if len(batch) > 0:
+      for cnt, out in zip(owners, self.estimator.evaluateBatch(batch)):
+        stepOutputs[cnt].append(out)
+    return stepOutputs
+
+  @staticmethod
+  def _readSteps(pairedData, steps):
+    """
+      Method to read the given history steps of the paired data
+      @ In, pairedData, tuple, see "evaluateBatch"
+      @ In, steps, slice, the history steps to read
+      @ Out, pairedData, tuple, the paired data restricted to the history steps, with numpy.ndarray values
+    """
+    read = []
+    for pData in pairedData:
+      if isinstance(pData, Distributions.Distribution):
+        read.append(pData)
+        continue
+      values, probabilityWeight = pData
+      # the data of a single history step (e.g. from a PointSet) can be provided as a 1D array
+      if len(np.shape(values)) == 1:
+        values = np.asarray(values[:]).reshape(-1,1)
+      read.append((np.asarray(values[:, steps]), probabilityWeight))
+    return tuple(read)
+
+  def _aggregate(self, dynamicOutput, weights, multiOutput):
+    """
+      Method to aggregate the outputs of the estimator over the history steps
+      @ In, dynamicOutput, list or numpy.ndarray, outputs of the estimator
+      @ In, weights, array_like (numpy.ndarray or list), An array of weights associated with the outputs
+      @ In, multiOutput, string, 'mean', 'max', 'min' or 'raw_values'
+      @ Out, output, numpy.ndarray, 1D array, processed output from the estimator
+    """
     if multiOutput == 'mean':
       output = [np.average(dynamicOutput, weights = weights)]
     elif multiOutput == 'max':
@@ -118,6 +118,16 @@ class MetricEntity(utils.metaclass_insert(abc.ABCMeta, PluginReadyEntity)):
     #   However, for consistency, we keep it here for future investigation.
     return self._metric.run(x, y, weights=weights, axis=0, **kwargs)
 
+  def evaluateBatch(self, pairs, weights=None, **kwargs):
+    """
+      This method compute the metric for each pair (x, y) of a batch
+      @ In, pairs, list, list of (x, y), see evaluate
+      @ In, weights, numpy.ndarray, optional, an array of weights associated with x
+      @ In, kwargs, dict, dictionary of parameters characteristic of each metric
+      @ Out, values, list, metric results for each pair
+    """
+    return self._metric.runBatch(pairs, weights=weights, axis=0, **kwargs)
+
   def getAlgorithmType(self):
     """
       Provide the metric sub-sub-type (used e.g. in SKL metrics)
@@ -50,3 +50,15 @@ class CDFAreaDifference(MetricInterface):
     """
     value = MetricUtilities._getCDFAreaDifference(x,y)
     return float(value)
+
+  def runBatch(self, pairs, weights=None, axis=0, **kwargs):
+    """
+      This method computes the CDF area difference of each pair (x, y), integrating the pairs of data together
+      @ In, pairs, list, list of (x, y), see run
+      @ In, weights, array_like (numpy.ndarray or list), optional, not used in this metric
+      @ In, axis, integer, optional, default is 0, not used for this metric.
+      @ In, kwargs, dict, dictionary of parameters characteristic of each metric
+      @ Out, values, list, metric results, CDF area difference of each pair
+    """
+    values = MetricUtilities._getCDFAreaDifferences(pairs)
+    return [float(value) for value in values]
@@ -85,28 +85,13 @@ class DSS(MetricInterface):
     """
     assert (isinstance(x, np.ndarray))
     assert (isinstance(y, np.ndarray))
-    tempX = x
-    tempY = y
-    omegaNormTarget = tempX[0]
-    omegaNormScaledFeature = tempY[0]
-    pTime = tempX[1]
-    D = tempY[1]
-    betaFeature = tempX[2]
-    betaTarget = tempX[2]
-    distance = np.zeros((pTime.shape))
-    distanceSum = np.zeros((pTime.shape[0]))
-    sigma = np.zeros((pTime.shape[0]))
-    for cnt in range(len(pTime)):
-      distanceSquaredSum = 0
-      for cnt2 in range(len(pTime[cnt])):
-        if D[cnt][cnt2] == 0 or omegaNormTarget[cnt][cnt2] == 0 or omegaNormScaledFeature[cnt][cnt2] == 0:
-          distance[cnt][cnt2] = 0
-        else:
-          distance[cnt][cnt2] = betaTarget[cnt][cnt2]*abs(D[cnt][cnt2])**0.5*(1/omegaNormTarget[cnt][cnt2]-1/omegaNormScaledFeature[cnt][cnt2])
-          if np.isnan(distance[cnt][cnt2]) == True:
-            distance[cnt][cnt2] = 0
-        distanceSum[cnt] += abs(distance[cnt][cnt2])
-        distanceSquaredSum += distance[cnt][cnt2]**2
-      sigma[cnt] = (1/len(sigma)*distanceSquaredSum)**0.5
+    omegaNormTarget = x[0]
+    omegaNormScaledFeature = y[0]
+    D = y[1]
+    betaTarget = x[2]
+    # all the samples and time steps are processed at once
+    with np.errstate(divide='ignore', invalid='ignore'):
+      distance = betaTarget*np.abs(D)**0.5*(1/omegaNormTarget-1/omegaNormScaledFeature)
+    distance[(D == 0) | (omegaNormTarget == 0) | (omegaNormScaledFeature == 0) | np.isnan(distance)] = 0
     value = distance
     return value
@@ -91,6 +91,18 @@ class MetricInterface(utils.metaclass_insert(abc.ABCMeta, BaseInterface)):
       @ Out, value, float or numpy.array, metric results between x and y
     """
 
+  def runBatch(self, pairs, weights=None, axis=0, **kwargs):
+    """
+      This method computes the metric for each pair (x, y) of a batch. The metrics that can evaluate
+      the pairs together override it.
+      @ In, pairs, list, list of (x, y), see run
+      @ In, weights, numpy.ndarray, optional, an array of weights associated with x
+      @ In, axis, integer, optional, axis along which a metric is performed, see run
+      @ In, kwargs, dict, dictionary of parameters characteristic of each metric
+      @ Out, values, list, metric results for each pair
+    """
+    return [self.run(x, y, weights=weights, axis=axis, **kwargs) for x, y in pairs]
+
   def isDynamic(self):
     """
       This method is utility function that tells if the metric is able to
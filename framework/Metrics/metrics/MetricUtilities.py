@@ -20,6 +20,8 @@ Created on September 18, 2017
 #External Modules------------------------------------------------------------------------------------
 import numpy as np
 import math
+import hashlib
+import collections
 import scipy
 #External Modules End--------------------------------------------------------------------------------
 
@@ -64,19 +66,21 @@ def _getPDFandCDFfromWeightedData(data, weights, numBins, uniformBins, interpola
     @ In, interpolation, str, "linear" or "quadratic", depending on which interpolation is used
     @ Out, (dataStats, cdfFunc, pdfFunc), tuple, dataStats is dictionary with things like "mean" and "stdev", cdfFunction is a function that returns the CDF value and pdfFunc is a function that returns the PDF value.
   """
-  # normalize weights
-  weightSum = sum(weights)
+  data = np.asarray(data, dtype=float)
+  weights = np.asarray(weights, dtype=float)
+  # normalize weights (cumulative sums keep the summation order of the sequential algorithm)
+  weightSum = np.cumsum(weights)[-1]
   if not math.isclose(weightSum, 1.0):
     weights = weights / weightSum
-  weightSum = sum(weights)
-  # Sort the data
-  sortedData = list(zip(data, weights))
-  sortedData.sort() #Sort the data.
-  value = 0 #Read only
-  weight = 1 #Read only
+  cumWeights = np.cumsum(weights)
+  weightSum = cumWeights[-1]
+  # Sort the data (ties are sorted by weight)
+  order = np.lexsort((weights, data))
+  sortedValues = data[order]
+  sortedWeights = weights[order]
   # Find data range
-  low = sortedData[0][value]
-  high = sortedData[-1][value]
+  low = sortedValues[0]
+  high = sortedValues[-1]
   dataRange = high - low
   #Find the values to use between the histogram bins
   if uniformBins:
@@ -85,16 +89,10 @@ def _getPDFandCDFfromWeightedData(data, weights, numBins, uniformBins, interpola
   else:
     #Equal probability bins
     probPerBin = weightSum/numBins
-    probSum = 0.0
-    bins = [None]*(numBins-1)
-    searchIndex = 0
-    #Look thru the array, and find the next place where probSum > nextProb
-    for i in range(numBins-1):
-      nextProb = (i + 1) * probPerBin
-      while probSum + sortedData[searchIndex][weight] < nextProb:
-        probSum += sortedData[searchIndex][weight]
-        searchIndex += 1
-      bins[i] = sortedData[searchIndex][value]
+    #Find the first place where the cumulative probability reaches each bin boundary
+    nextProb = np.arange(1, numBins) * probPerBin
+    searchIndex = np.searchsorted(np.cumsum(sortedWeights), nextProb, side='left')
+    bins = sortedValues[np.minimum(searchIndex, len(sortedValues) - 1)].tolist()
     #Remove duplicates
     for i in reversed(range(len(bins))):
       if i > 1 and bins[i-1] == bins[i]:
@@ -104,48 +102,44 @@ def _getPDFandCDFfromWeightedData(data, weights, numBins, uniformBins, interpola
     else:
       minBinSize = dataRange
   #Count the amount of weight in each bin
-  counts = _countWeightInBins(sortedData, bins)
-  binBoundaries = [low] + bins + [high]
-  countSum = sum(counts)
+  counts = np.bincount(np.searchsorted(bins, sortedValues, side='left'), weights=sortedWeights, minlength=len(bins) + 1)
+  binBoundaries = np.asarray([low] + list(bins) + [high])
+  countSum = np.cumsum(counts)[-1]
   assert -1e-4 < countSum - weightSum < 1e-4
   # Create CDF
-  cdf = [0.0] * len(counts)
-  midpoints = [0.0] * len(counts)
-  cdfSum = 0.0
-  for i in range(len(counts)):
-    f0 = counts[i] / countSum
-    cdfSum += f0
-    cdf[i] = cdfSum
-    midpoints[i] = (binBoundaries[i] + binBoundaries[i + 1]) / 2.0
+  cdf = np.cumsum(counts / countSum)
+  midpoints = (binBoundaries[:-1] + binBoundaries[1:]) / 2.0
   cdfFunc = mathUtils.createInterp(midpoints, cdf, 0.0, 1.0, interpolation)
   #Create PDF
-  fPrimeData = [0.0] * len(counts)
-  for i in range(len(counts)):
-    h = binBoundaries[i + 1] - binBoundaries[i]
-    nCount = counts[i] / countSum  # normalized count
-    f0 = cdf[i]
-    if i + 1 < len(counts):
-      f1 = cdf[i + 1]
-    else:
-      f1 = 1.0
-    if i + 2 < len(counts):
-      f2 = cdf[i + 2]
-    else:
-      f2 = 1.0
-    if interpolation == 'linear':
-      fPrime = (f1 - f0) / h
-    else:
-      fPrime = (-1.5 * f0 + 2.0 * f1 + -0.5 * f2) / h
-    fPrimeData[i] = fPrime
+  h = binBoundaries[1:] - binBoundaries[:-1]
+  f0 = cdf
+  f1 = np.append(cdf[1:], 1.0)
+  if interpolation == 'linear':
+    fPrimeData = (f1 - f0) / h
+  else:
+    f2 = np.append(cdf[2:], [1.0, 1.0][:min(2, len(cdf))])
+    fPrimeData = (-1.5 * f0 + 2.0 * f1 + -0.5 * f2) / h
   pdfFunc = mathUtils.createInterp(midpoints, fPrimeData, 0.0, 0.0, interpolation)
   mean = np.average(data, weights = weights)
   dataStats = {"mean":mean,"minBinSize":minBinSize,"low":low,"high":high}
+  if interpolation == 'linear':
+    # piecewise linear tables, used to integrate the CDF and PDF exactly
+    dataStats["cdfTable"] = (midpoints, cdf, 0.0, 1.0)
+    dataStats["pdfTable"] = (midpoints, fPrimeData, 0.0, 0.0)
   return dataStats, cdfFunc, pdfFunc
 
+## Empirical (stats, cdf, pdf) of the data sets that have been converted, keyed by a digest of
+## the data, so that a variable compared against many others is only binned once.
+## The least recently used entries are discarded when more than _commonFormatCacheSize are stored.
+_commonFormatCache = collections.OrderedDict()
+_commonFormatCacheSize = 256
 
 def _convertToCommonFormat(data):
   """
     Convert either a distribution or a set of data to a (stats, cdf, pdf) pair
+    @ In, data, Distributions.Distribution or tuple or list, the distribution, the (points, weights)
+      or the points (with uniform weights) to convert
+    @ Out, (stats, cdf, pdf), tuple, see _getPDFandCDFfromWeightedData
   """
   if isinstance(data, Distributions.Distribution):
     # data is a subclass of BoostDistribution, generate needed stats, and pass in cdf and pdf.
@@ -164,10 +158,151 @@ def _convertToCommonFormat(data):
     weights = [1.0/len(points)]*len(points)
   else:
     raise IOError("Unknown type in _convertToCommonFormat")
+  points = np.ascontiguousarray(points, dtype=float)
+  weights = np.ascontiguousarray(weights, dtype=float)
+  key = (len(points), hashlib.sha1(points.tobytes()).hexdigest(), hashlib.sha1(weights.tobytes()).hexdigest())
+  if key in _commonFormatCache:
+    _commonFormatCache.move_to_end(key)
+    return _commonFormatCache[key]
   #Sturges method for determining number of bins
   numBins = int(math.ceil(mathUtils.log2(len(points)) + 1))
-  return _getPDFandCDFfromWeightedData(points, weights, numBins, False, 'linear')
+  converted = _getPDFandCDFfromWeightedData(points, weights, numBins, False, 'linear')
+  _commonFormatCache[key] = converted
+  while len(_commonFormatCache) > _commonFormatCacheSize:
+    _commonFormatCache.popitem(last=False)
+  return converted
+
+def _stackTables(tables):
+  """
+    Stacks piecewise linear tables (see _getPDFandCDFfromWeightedData) in padded arrays, so that they
+    can be evaluated together
+    @ In, tables, list, the tables, (xValues, yValues, lowFill, highFill)
+    @ Out, stacked, tuple, (xValues, yValues, lowFill, highFill, sizes), the table values padded in 2D arrays
+      (one row per table, the x values are padded with inf) and the 1D arrays of fill values and table sizes
+  """
+  sizes = np.asarray([len(table[0]) for table in tables])
+  xValues = np.full((len(tables), sizes.max()), np.inf)
+  yValues = np.zeros((len(tables), sizes.max()))
+  for row, table in enumerate(tables):
+    xValues[row, :sizes[row]] = table[0]
+    yValues[row, :sizes[row]] = table[1]
+  lowFill = np.asarray([table[2] for table in tables], dtype=float)
+  highFill = np.asarray([table[3] for table in tables], dtype=float)
+  return xValues, yValues, lowFill, highFill, sizes
+
+def _evaluateTables(stacked, rows, x):
+  """
+    Evaluates stacked piecewise linear tables as numpy.interp does for a single table
+    @ In, stacked, tuple, the stacked tables, see _stackTables
+    @ In, rows, np.array, the row of the table to evaluate for each point
+    @ In, x, np.array, the points where the tables are evaluated
+    @ Out, values, np.array, the values of the tables in x
+  """
+  xValues, yValues, lowFill, highFill, sizes = stacked
+  xRows = xValues[rows]
+  yRows = yValues[rows]
+  sizes = sizes[rows]
+  # number of table points not larger than x
+  upper = np.sum(xRows <= x[:, None], axis=1)
+  values = np.where(upper == 0, lowFill[rows], highFill[rows])
+  # the last point of a table belongs to it
+  points = np.arange(len(x))
+  last = (upper == sizes) & (x == xRows[points, sizes - 1])
+  values[last] = yRows[points, sizes - 1][last]
+  inside = (upper > 0) & (upper < sizes)
+  points = points[inside]
+  x0 = xRows[points, upper[inside] - 1]
+  y0 = yRows[points, upper[inside] - 1]
+  slope = (yRows[points, upper[inside]] - y0) / (xRows[points, upper[inside]] - x0)
+  values[inside] = slope * (x[inside] - x0) + y0
+  return values
+
+def _integrateTablePairs(tables1, tables2, lows, highs):
+  """
+    Integrates exactly, between lows and highs, the absolute difference and the minimum of pairs of
+    piecewise linear tables. All the pairs are integrated in one vectorized pass.
+    @ In, tables1, list, the first table of each pair, (xValues, yValues, lowFill, highFill)
+    @ In, tables2, list, the second table of each pair, (xValues, yValues, lowFill, highFill)
+    @ In, lows, np.array, the lower bound of integration of each pair
+    @ In, highs, np.array, the upper bound of integration of each pair
+    @ Out, absDiff, np.array, integral of abs(table1 - table2) for each pair
+    @ Out, minimum, np.array, integral of min(table1, table2) for each pair
+  """
+  numPairs = len(tables1)
+  lows = np.asarray(lows, dtype=float)
+  highs = np.asarray(highs, dtype=float)
+  # rows [0, numPairs) are the first tables, rows [numPairs, 2*numPairs) the second ones
+  stacked = _stackTables(list(tables1) + list(tables2))
+  # both tables are linear between consecutive breakpoints: the bounds and the table points in between
+  xValues = stacked[0]
+  points = np.concatenate((lows, highs, xValues.ravel()))
+  owner = np.concatenate((np.arange(numPairs), np.arange(numPairs), np.repeat(np.arange(2 * numPairs) % numPairs, xValues.shape[1])))
+  keep = (points >= lows[owner]) & (points <= highs[owner])
+  points = points[keep]
+  owner = owner[keep]
+  order = np.lexsort((points, owner))
+  points = points[order]
+  owner = owner[order]
+  unique = np.ones(len(points), dtype=bool)
+  unique[1:] = (points[1:] != points[:-1]) | (owner[1:] != owner[:-1])
+  points = points[unique]
+  owner = owner[unique]
+  interval = owner[1:] == owner[:-1]
+  a = points[:-1][interval]
+  b = points[1:][interval]
+  pair = owner[:-1][interval]
+  width = b - a
+  # the tables can jump at the breakpoints, so the end values of each interval are extrapolated
+  # from the interval interior
+  q1 = a + 0.25 * width
+  q3 = a + 0.75 * width
+  table1q1 = _evaluateTables(stacked, pair, q1)
+  table2q1 = _evaluateTables(stacked, pair + numPairs, q1)
+  table1q3 = _evaluateTables(stacked, pair, q3)
+  table2q3 = _evaluateTables(stacked, pair + numPairs, q3)
+  diff1 = table1q1 - table2q1
+  diff3 = table1q3 - table2q3
+  sum1 = table1q1 + table2q1
+  sum3 = table1q3 + table2q3
+  diffA = 1.5 * diff1 - 0.5 * diff3
+  diffB = 1.5 * diff3 - 0.5 * diff1
+  absA = np.abs(diffA)
+  absB = np.abs(diffB)
+  # where the difference changes sign within the interval, the two triangles are integrated
+  crossing = diffA * diffB < 0
+  denominator = np.where(crossing, absA + absB, 1.0)
+  absDiff = np.where(crossing, (diffA**2 + diffB**2) / (2.0 * denominator), (absA + absB) / 2.0) * width
+  absDiff = np.bincount(pair, weights=absDiff, minlength=numPairs)
+  # min(f, g) = (f + g - abs(f - g)) / 2
+  minimum = (np.bincount(pair, weights=(sum1 + sum3) / 2.0 * width, minlength=numPairs) - absDiff) / 2.0
+  return absDiff, minimum
 
+def _integratePairs(pairs, tableName, which, integrand):
+  """
+    Integrates a function of the CDFs or PDFs of each pair of data. The pairs of data sets (that have
+    piecewise linear tables) are integrated exactly, all together; the pairs with a distribution are
+    integrated by quadrature.
+    @ In, pairs, list, list of (data1, data2), see _convertToCommonFormat
+    @ In, tableName, str, the tables integrated exactly, "cdfTable" or "pdfTable"
+    @ In, which, int, the exact integral to use, 0 for the absolute difference and 1 for the minimum
+      (see _integrateTablePairs)
+    @ In, integrand, function, integrand(common1, common2) returns the function to integrate by quadrature,
+      where common1 and common2 are the (stats, cdf, pdf) of the two data
+    @ Out, integrals, np.array, the integral for each pair
+  """
+  converted = [(_convertToCommonFormat(data1), _convertToCommonFormat(data2)) for data1, data2 in pairs]
+  bounds = [_getBounds(common1[0], common2[0]) for common1, common2 in converted]
+  integrals = np.zeros(len(pairs))
+  exact = [cnt for cnt, (common1, common2) in enumerate(converted) if tableName in common1[0] and tableName in common2[0]]
+  if len(exact) > 0:
+    integrals[exact] = _integrateTablePairs([converted[cnt][0][0][tableName] for cnt in exact],
+                                            [converted[cnt][1][0][tableName] for cnt in exact],
+                                            [bounds[cnt][0] for cnt in exact],
+                                            [bounds[cnt][1] for cnt in exact])[which]
+  for cnt in set(range(len(pairs))) - set(exact):
+    low, high = bounds[cnt]
+    integrals[cnt] = scipy.integrate.quad(integrand(*converted[cnt]), low, high, limit=1000)[0]
+  return integrals
 
 def _getBounds(stats1, stats2):
   """
@@ -209,10 +344,16 @@ def _getCDFAreaDifference(data1, data2):
     @ In, data2, varies, The second data to use, see _convertToCommonFormat
     @ Out, cdfAreaDifference, float, the area difference between the CDFs.
   """
-  stats1, cdf1, pdf1 =_convertToCommonFormat(data1)
-  stats2, cdf2, pdf2 =_convertToCommonFormat(data2)
-  low, high = _getBounds(stats1, stats2)
-  return scipy.integrate.quad(lambda x:abs(cdf1(x)-cdf2(x)),low,high,limit=1000)[0]
+  return float(_getCDFAreaDifferences([(data1, data2)])[0])
+
+def _getCDFAreaDifferences(pairs):
+  """
+    Gets the area between the two CDFs of each pair of data, evaluating the pairs together.
+    @ In, pairs, list, list of (data1, data2), see _convertToCommonFormat
+    @ Out, cdfAreaDifferences, np.array, the area difference between the CDFs of each pair.
+  """
+  integrand = lambda common1, common2: lambda x:abs(common1[1](x)-common2[1](x))
+  return _integratePairs(pairs, "cdfTable", 0, integrand)
 
 def _getPDFCommonArea(data1, data2):
   """
@@ -222,8 +363,13 @@ def _getPDFCommonArea(data1, data2):
     @ In, data2, varies, The second data to use, see _convertToCommonFormat
     @ Out, pdfCommonArea, float, the common area between the PDFs.
   """
-  stats1, cdf1, pdf1 =_convertToCommonFormat(data1)
-  stats2, cdf2, pdf2 =_convertToCommonFormat(data2)
-  low, high = _getBounds(stats1, stats2)
-  return scipy.integrate.quad(lambda x:min(pdf1(x),pdf2(x)),low,high,limit=1000)[0]
+  return float(_getPDFCommonAreas([(data1, data2)])[0])
 
+def _getPDFCommonAreas(pairs):
+  """
+    Gets the area that the PDFs of each pair of data overlap, evaluating the pairs together.
+    @ In, pairs, list, list of (data1, data2), see _convertToCommonFormat
+    @ Out, pdfCommonAreas, np.array, the common area between the PDFs of each pair.
+  """
+  integrand = lambda common1, common2: lambda x:min(common1[2](x),common2[2](x))
+  return _integratePairs(pairs, "pdfTable", 1, integrand)
@@ -50,3 +50,15 @@ class PDFCommonArea(MetricInterface):
     """
     value = MetricUtilities._getPDFCommonArea(x,y)
     return float(value)
+
+  def runBatch(self, pairs, weights=None, axis=0, **kwargs):
+    """
+      This method computes the PDF common area of each pair (x, y), integrating the pairs of data together
+      @ In, pairs, list, list of (x, y), see run
+      @ In, weights, array_like (numpy.ndarray or list), optional, not used in this metric
+      @ In, axis, integer, optional, default is 0, not used for this metric.
+      @ In, kwargs, dict, dictionary of parameters characteristic of each metric
+      @ Out, values, list, metric results, PDF common area of each pair
+    """
+    values = MetricUtilities._getPDFCommonAreas(pairs)
+    return [float(value) for value in values]
@@ -576,24 +576,30 @@ class Code(Model):
     self.raiseADebug(f'shell execution command: "{command}"')
     ## reset python path
     localenv.pop('PYTHONPATH',None)
-    ## This code should be evaluated by the job handler, so it is fine to wait
-    ## until the execution of the external subprocess completes.
-    process = utils.pickleSafeSubprocessPopen(command, shell=self.code.getRunOnShell(), stdout=outFileObject, stderr=outFileObject, cwd=localenv['PWD'], env=localenv)
-    if self.maxWallTime is not None:
-      timeout = time.time() + self.maxWallTime
-      while True:
-        time.sleep(0.5)
-        process.poll()
-        if time.time() > timeout and process.returncode is None:
-          self.raiseAWarning('walltime exeeded in run in working dir: '+str(metaData['subDirectory'])+'. Killing the run...')
-          process.kill()
-          process.returncode = -1
-        if process.returncode is not None or time.time() > timeout:
-          break
+    if getattr(self.code, 'persistentWorkers', 0) > 0:
+      ## RAVEN-runs-RAVEN with persistent workers: the INNER RAVEN runs in an
+      ## already initialized process and its outputs are kept in memory
+      outFileObject.flush()
+      returnCode = self.code.runInPersistentWorker(self.currentInputFiles, metaData['subDirectory'],
+                                                   os.path.join(sampleDirectory,codeLogFile), timeout=self.maxWallTime)
     else:
-      process.wait()
-
-    returnCode = process.returncode
+      ## This code should be evaluated by the job handler, so it is fine to wait
+      ## until the execution of the external subprocess completes.
+      process = utils.pickleSafeSubprocessPopen(command, shell=self.code.getRunOnShell(), stdout=outFileObject, stderr=outFileObject, cwd=localenv['PWD'], env=localenv)
+      if self.maxWallTime is not None:
+        timeout = time.time() + self.maxWallTime
+        while True:
+          time.sleep(0.5)
+          process.poll()
+          if time.time() > timeout and process.returncode is None:
+            self.raiseAWarning('walltime exeeded in run in working dir: '+str(metaData['subDirectory'])+'. Killing the run...')
+            process.kill()
+            process.returncode = -1
+          if process.returncode is not None or time.time() > timeout:
+            break
+      else:
+        process.wait()
+      returnCode = process.returncode
     # procOutput = process.communicate()[0]
 
     ## If the returnCode is already non-zero, we should maintain our current
@@ -80,7 +80,12 @@ class EnsembleModel(Dummy):
     self.convergenceTol         = 1.e-3                 # tolerance of the iteration scheme (if activated) => L2 norm
     self.initialConditions      = {}                    # dictionary of initial conditions in case non-linear system is detected
     self.initialStartModels     = []                    # list of models that will execute first.
+    self.acceleration           = 'none'                # acceleration of the iteration scheme (in case of non-linear system activated)
+    self.relaxationFactor       = None                  # (initial) relaxation factor of the accelerated iteration scheme
+    self.andersonDepth          = 5                     # number of previous iterations used by the Anderson mixing
+    self.couplingVariables      = []                    # [(modelName,variable)] outputs fed back to models preceding (or equal to) modelName in the execution list
     self.ensembleModelGraph     = None                  # graph object (graphStructure.graphObject)
+    self.modelDependencies      = {}                    # {'modelName':set(models that need to finish before 'modelName' can start)}
     self.printTag               = 'EnsembleModel MODEL' # print tag
     self.parallelStrategy = 1                           # parallel strategy [1=MPI like (internalParallel), 2=threads]
     self.runInfoDict = None                             # dictionary containing run info in case of parallelStrategy=2
@@ -155,6 +160,18 @@ class EnsembleModel(Dummy):
         self.convergenceTol = float(child.text)
       elif child.tag == 'initialStartModels':
         self.initialStartModels = list(inp.strip() for inp in child.text.strip().split(','))
+      elif child.tag == 'acceleration':
+        self.acceleration = child.text.strip().lower()
+        if self.acceleration not in ['none', 'relaxation', 'aitken', 'anderson']:
+          self.raiseAnError(IOError, 'Unknown acceleration "'+child.text.strip()+'"! Available are: none, relaxation, aitken, anderson')
+      elif child.tag == 'relaxationFactor':
+        self.relaxationFactor = float(child.text)
+        if self.relaxationFactor <= 0.:
+          self.raiseAnError(IOError, 'The relaxationFactor must be positive. Got '+child.text.strip())
+      elif child.tag == 'andersonDepth':
+        self.andersonDepth = int(child.text)
+        if self.andersonDepth < 1:
+          self.raiseAnError(IOError, 'The andersonDepth must be at least 1. Got '+child.text.strip())
       elif child.tag == 'initialConditions':
         for var in child:
           if "repeat" in var.attrib.keys():
@@ -239,6 +256,7 @@ class EnsembleModel(Dummy):
     isThereACode = False
     # collect the models
     self.allOutputs = set()
+    producedVars = {}
     for modelClass, modelType, modelName, modelInstance in self.assemblerDict['Model']:
       if not isThereACode:
         isThereACode = modelType == 'Code'
@@ -284,6 +302,8 @@ class EnsembleModel(Dummy):
       outDims = outDims - inDims
       newOuts = outs + list(set(outDims) - set(outs))
       self.modelsDictionary[modelName]['Output'] = newOuts
+      # all the variables (indexes included) this model can pass to the downstream ones
+      producedVars[modelName] = set(newOuts).union(inDims)
       self.allOutputs = self.allOutputs.union(newOuts)
     # END loop to collect models
     self.allOutputs = list(self.allOutputs)
@@ -340,6 +360,10 @@ class EnsembleModel(Dummy):
         self.raiseAnError(IOError, "The 'initialStartModels' xml node is missing, this is required siince the Picard's iteration is activated!")
       if len(self.initialConditions.keys()) == 0:
         self.raiseAnError(IOError,"Picard's iterations mode activated but no intial conditions provided!")
+      if self.acceleration != 'none':
+        self.raiseAMessage("Picard's iterations accelerated with scheme: "+self.acceleration)
+        if self.relaxationFactor is None:
+          self.relaxationFactor = 1. if self.acceleration == 'anderson' else 0.5
     else:
       if len(self.initialStartModels) !=0:
         self.raiseAnError(IOError, "The 'initialStartModels' xml node is not needed for non-Picard calculations, since the running sequence can be automatically determined by the code! Please delete this node to avoid a mistake.")
@@ -353,6 +377,24 @@ class EnsembleModel(Dummy):
           if self.orderList.index(source) >= indexModelIn:
             self.raiseAnError(IOError, 'In model "'+modelIn+'" the "metadataToTransfer" named "'+metadataToGet+
                                        '" is linked to the source"'+source+'" that will be executed after this model.')
+    # a model can start as soon as the models preceding it in the execution list that feed its inputs
+    # (or its metadata) are finished. The models following it in the execution list (only present if
+    # Picard's iterations are activated) feed it with the values of the previous iteration.
+    self.modelDependencies = {}
+    for indexModelIn, modelIn in enumerate(self.orderList):
+      inputs = set(self.modelsDictionary[modelIn]['Input'])
+      dependencies = set(source for _, source, _ in self.modelsInputDictionary[modelIn]['metadataToTransfer'])
+      dependencies.update(model for model in self.orderList[:indexModelIn] if producedVars[model].intersection(inputs))
+      self.modelDependencies[modelIn] = dependencies
+      self.raiseADebug('Model "'+modelIn+'" depends on: '+', '.join(sorted(dependencies)))
+    # the outputs that close the loops are the unknowns of the accelerated iteration scheme
+    self.couplingVariables = []
+    if self.activatePicard:
+      for indexModelIn, modelIn in enumerate(self.orderList):
+        for model in self.orderList[indexModelIn:]:
+          for var in self.localTargetEvaluations[model].getVars('output'):
+            if var in self.modelsDictionary[modelIn]['Input'] and (model, var) not in self.couplingVariables:
+              self.couplingVariables.append((model, var))
     self.needToCheckInputs = True
     # write debug statements
     self.raiseADebug("Specs of Graph Network represented by EnsembleModel:")
@@ -596,6 +638,13 @@ class EnsembleModel(Dummy):
           residueContainer[modelIn]['iterValues'][0][out] = np.zeros(1)
           residueContainer[modelIn]['iterValues'][1][out] = np.zeros(1)
 
+    # if accelerated nonlinear system, initialize the history of the coupling variables
+    accelerationHistory = None
+    if self.activatePicard and self.acceleration != 'none':
+      accelerationHistory = {'values':[], 'residues':[], 'factor':self.relaxationFactor,
+                             'current':np.concatenate([np.atleast_1d(self.initialConditions[var]).astype(float).ravel() if var in self.initialConditions
+                                                       else np.zeros(0) for _, var in self.couplingVariables])}
+
     maxIterations = self.maxIterations if self.activatePicard else 1
     iterationCount = 0
     while iterationCount < maxIterations:
@@ -605,73 +654,40 @@ class EnsembleModel(Dummy):
       if self.activatePicard:
         self.raiseAMessage("Picard's Iteration "+ str(iterationCount))
 
-      for modelCnt, modelIn in enumerate(self.orderList):
-        # clear the model's Target Evaluation data object
-        # in case there are metadataToTransfer, let's collect them from the source
-        metadataToTransfer = None
-        if self.modelsInputDictionary[modelIn]['metadataToTransfer']:
-          metadataToTransfer = {}
-        for metadataToGet, source, alias in self.modelsInputDictionary[modelIn]['metadataToTransfer']:
-          if metadataToGet in returnDict[source]['general_metadata']:
-            metaDataValue = returnDict[source]['general_metadata'][metadataToGet]
-            metaDataValue = metaDataValue[0] if len(metaDataValue) == 1 else metaDataValue
-            metadataToTransfer[metadataToGet if alias is None else alias] = metaDataValue
-          elif metadataToGet in returnDict[source]['response']:
-            metaDataValue = returnDict[source]['response'][metadataToGet]
-            metaDataValue = metaDataValue[0] if len(metaDataValue) == 1 else metaDataValue
-            metadataToTransfer[metadataToGet if alias is None else alias] = metaDataValue
+      # outputs of the previous iteration, used by the models that are fed by the ones that follow them in the execution list
+      previousOutputs = list(gotOutputs)
+      running = {}
+      while len(returnDict) < len(self.orderList):
+        # start all the models whose dependencies are satisfied
+        for modelCnt, modelIn in enumerate(self.orderList):
+          if modelIn in returnDict or modelIn in running or not self.modelDependencies[modelIn].issubset(returnDict):
+            continue
+          availableOutputs = gotOutputs[:modelCnt] + previousOutputs[modelCnt:]
+          self.__prepareModelInput(modelIn, identifier, inputKwargs, returnDict, availableOutputs, typeOutputs, iterationCount)
+          if self.parallelStrategy == 1:
+            # the model is evaluated directly, following the execution list
+            retDict, gotOuts, evaluation = self.__advanceModel(identifier, self.modelsDictionary[modelIn],
+                                                            originalInput[modelIn], inputKwargs[modelIn],
+                                                            inRunTargetEvaluations[modelIn], samplerType,
+                                                            iterationCount)
+            self.__storeModelResults(modelIn, modelCnt, retDict, gotOuts, evaluation, returnDict, gotOutputs, typeOutputs,
+                                     tempOutputs, inRunTargetEvaluations, residueContainer, iterationCount)
           else:
-            self.raiseAnError(RuntimeError,'metadata "'+metadataToGet+'" is not present among the ones available in source "'+source+'"!')
-        # get dependent outputs
-        dependentOutput = self.__retrieveDependentOutput(modelIn, gotOutputs, typeOutputs)
-        # if nonlinear system, check for initial coditions
-        if iterationCount == 1  and self.activatePicard:
-          sampledVars = inputKwargs[modelIn]['SampledVars'].keys()
-          conditionsToCheck = set(self.modelsDictionary[modelIn]['Input']) - set(itertools.chain(dependentOutput.keys(),sampledVars))
-          for initialConditionToSet in conditionsToCheck:
-            if initialConditionToSet in self.initialConditions.keys():
-              dependentOutput[initialConditionToSet] = self.initialConditions[initialConditionToSet]
-            else:
-              self.raiseAnError(IOError,"No initial conditions provided for variable "+ initialConditionToSet)
-        # set new identifiers
-        inputKwargs[modelIn]['prefix']        = modelIn+utils.returnIdSeparator()+identifier
-        inputKwargs[modelIn]['uniqueHandler'] = self.name+identifier
-        if metadataToTransfer is not None:
-          inputKwargs[modelIn]['metadataToTransfer'] = metadataToTransfer
-
-        for key, value in dependentOutput.items():
-          inputKwargs[modelIn]["SampledVars"  ][key] =  dependentOutput[key]
-          ## FIXME it is a mistake (Andrea). The SampledVarsPb for this variable should be transferred from outside
-          ## Who has this information? -- DPM 4/11/17
-          inputKwargs[modelIn]["SampledVarsPb"][key] =  1.0
-        self._replaceVariablesNamesWithAliasSystem(inputKwargs[modelIn]["SampledVars"  ],'input',False)
-        self._replaceVariablesNamesWithAliasSystem(inputKwargs[modelIn]["SampledVarsPb"],'input',False)
-        ## FIXME: this will come after we rework the "runInfo" collection in the code
-        ## if run info is present, we need to pass to to kwargs
-        ##if self.runInfoDict and 'Code' == self.modelsDictionary[modelIn]['Instance'].type:
-        ##  inputKwargs[modelIn].update(self.runInfoDict)
-
-        retDict, gotOuts, evaluation = self.__advanceModel(identifier, self.modelsDictionary[modelIn],
-                                                        originalInput[modelIn], inputKwargs[modelIn],
-                                                        inRunTargetEvaluations[modelIn], samplerType,
-                                                        iterationCount, jobHandler)
-
-        returnDict[modelIn] = retDict
-        typeOutputs[modelCnt] = inRunTargetEvaluations[modelIn].type
-        gotOutputs[modelCnt] =  gotOuts
-        tempOutputs[modelIn] = evaluation
-
-        # if nonlinear system, compute the residue
-        ## it looks like this is handling _indexMap, but it's not clear since there's not a way to test it (yet).
-        if self.activatePicard:
-          residueContainer[modelIn]['iterValues'][1] = copy.copy(residueContainer[modelIn]['iterValues'][0])
-          for out in  inRunTargetEvaluations[modelIn].getVars("output"):
-            residueContainer[modelIn]['iterValues'][0][out] = copy.copy(gotOutputs[modelCnt][out])
-            if iterationCount == 1:
-              residueContainer[modelIn]['iterValues'][1][out] = np.zeros(len(residueContainer[modelIn]['iterValues'][0][out]))
-          for out in gotOutputs[modelCnt].keys():
-            residueContainer[modelIn]['residue'][out] = abs(np.asarray(residueContainer[modelIn]['iterValues'][0][out]) - np.asarray(residueContainer[modelIn]['iterValues'][1][out]))
-          residueContainer[modelIn]['Norm'] =  np.linalg.norm(np.asarray(list(residueContainer[modelIn]['iterValues'][1].values()))-np.asarray(list(residueContainer[modelIn]['iterValues'][0].values())))
+            running[modelIn] = self.__submitModel(identifier, self.modelsDictionary[modelIn], originalInput[modelIn],
+                                                  inputKwargs[modelIn], samplerType, jobHandler)
+        # collect the models that are done, so that the models depending on them can start
+        finishedModels = [modelIn for modelIn, localIdentifier in running.items() if jobHandler.isThisJobFinished(localIdentifier)]
+        for modelIn in finishedModels:
+          running.pop(modelIn)
+          retDict, gotOuts, evaluation = self.__collectModel(identifier, self.modelsDictionary[modelIn],
+                                                          inRunTargetEvaluations[modelIn], iterationCount,
+                                                          jobHandler, running)
+          self.__storeModelResults(modelIn, self.orderList.index(modelIn), retDict, gotOuts, evaluation, returnDict, gotOutputs,
+                                   typeOutputs, tempOutputs, inRunTargetEvaluations, residueContainer, iterationCount)
+        if running and not finishedModels:
+          time.sleep(1.e-3)
+      # keep the results in the order of the execution list
+      returnDict = dict((modelIn, returnDict[modelIn]) for modelIn in self.orderList)
 
       # if nonlinear system, check the total residue and convergence
       if self.activatePicard:
@@ -687,14 +703,156 @@ class EnsembleModel(Dummy):
         if hasattr(residualPass,'__len__'):
           residualPass = all(residualPass)
         if residualPass:
-          self.raiseAMessage("Picard's Iteration converged. Norm: "+ str(residueContainer['TotalResidue']))
+          self.raiseAMessage("Picard's Iteration converged in "+str(iterationCount)+" iterations. Norm: "+ str(residueContainer['TotalResidue']))
           break
+        if iterationCount == maxIterations:
+          self.raiseAWarning("Picard's Iteration did not converge in "+str(iterationCount)+" iterations. Norm: "+ str(residueContainer['TotalResidue']))
+        elif accelerationHistory is not None:
+          self.__accelerateCoupling(gotOutputs, accelerationHistory)
     returnEvaluation = returnDict, inRunTargetEvaluations, tempOutputs
     return returnEvaluation
 
-  def __advanceModel(self, identifier, modelToExecute, origInputList, inputKwargs, inRunTargetEvaluations, samplerType, iterationCount, jobHandler = None):
+  def __accelerateCoupling(self, gotOutputs, history):
+    """
+      Method to compute the values of the coupling variables for the next Picard's iteration with the
+      selected acceleration scheme (relaxation, Aitken's dynamic relaxation or Anderson mixing)
+      @ In, gotOutputs, list, list of dictionary outputs of the models, the coupling variables are updated in place
+      @ In, history, dict, the history of the coupling variables of this sample, updated in place
+      @ Out, None
+    """
+    mapped, shapes = [], []
+    for model, var in self.couplingVariables:
+      value = np.atleast_1d(gotOutputs[self.orderList.index(model)][var])
+      shapes.append(value.shape)
+      mapped.append(value.astype(float).ravel())
+    mapped = np.concatenate(mapped)
+    current = history['current'] if len(history['current']) == len(mapped) else mapped
+    residue = mapped - current
+    if self.acceleration == 'aitken':
+      # Irons-Tuck update of the relaxation factor
+      if history['residues']:
+        delta = residue - history['residues'][-1]
+        denominator = np.dot(delta, delta)
+        if denominator > 0.:
+          history['factor'] = -history['factor']*np.dot(history['residues'][-1], delta)/denominator
+      history['residues'] = [residue]
+    new = current + history['factor']*residue
+    if self.acceleration == 'anderson':
+      history['values'].append(current)
+      history['residues'].append(residue)
+      history['values'] = history['values'][-(self.andersonDepth+1):]
+      history['residues'] = history['residues'][-(self.andersonDepth+1):]
+      if len(history['residues']) > 1:
+        deltaResidues = np.diff(np.asarray(history['residues']), axis=0).T
+        deltaValues = np.diff(np.asarray(history['values']), axis=0).T
+        gamma = np.linalg.lstsq(deltaResidues, residue, rcond=None)[0]
+        new -= np.dot(deltaValues + history['factor']*deltaResidues, gamma)
+    self.raiseADebug("Picard's Iteration "+self.acceleration+" update of the coupling variables. Relaxation factor: "+str(history['factor']))
+    history['current'] = new
+    # feed the accelerated values to the next iteration
+    start = 0
+    for (model, var), shape in zip(self.couplingVariables, shapes):
+      size = int(np.prod(shape))
+      position = self.orderList.index(model)
+      gotOutputs[position] = dict(gotOutputs[position])
+      gotOutputs[position][var] = new[start:start+size].reshape(shape)
+      start += size
+
+  def __prepareModelInput(self, modelIn, identifier, inputKwargs, returnDict, availableOutputs, typeOutputs, iterationCount):
+    """
+      Method to set the input of a sub-model with the sampled values, the outputs of the models it depends on
+      and the metadata it requests
+      @ In, modelIn, string, name of the model to prepare
+      @ In, identifier, str, current job identifier
+      @ In, inputKwargs, dict, dictionary of kwargs for each model ({modelName:kwargs}), updated in place
+      @ In, returnDict, dict, the results of the models already executed in this iteration ({modelName:results})
+      @ In, availableOutputs, list, list of dictionary outputs ({modelName:dictOfOutputs}) to take the dependent outputs from
+      @ In, typeOutputs, list, list of the types of the target evaluations
+      @ In, iterationCount, int, iteration counter (1 if not picard)
+      @ Out, None
+    """
+    # in case there are metadataToTransfer, let's collect them from the source
+    metadataToTransfer = None
+    if self.modelsInputDictionary[modelIn]['metadataToTransfer']:
+      metadataToTransfer = {}
+    for metadataToGet, source, alias in self.modelsInputDictionary[modelIn]['metadataToTransfer']:
+      if metadataToGet in returnDict[source]['general_metadata']:
+        metaDataValue = returnDict[source]['general_metadata'][metadataToGet]
+        metaDataValue = metaDataValue[0] if len(metaDataValue) == 1 else metaDataValue
+        metadataToTransfer[metadataToGet if alias is None else alias] = metaDataValue
+      elif metadataToGet in returnDict[source]['response']:
+        metaDataValue = returnDict[source]['response'][metadataToGet]
+        metaDataValue = metaDataValue[0] if len(metaDataValue) == 1 else metaDataValue
+        metadataToTransfer[metadataToGet if alias is None else alias] = metaDataValue
+      else:
+        self.raiseAnError(RuntimeError,'metadata "'+metadataToGet+'" is not present among the ones available in source "'+source+'"!')
+    # get dependent outputs
+    dependentOutput = self.__retrieveDependentOutput(modelIn, availableOutputs, typeOutputs)
+    # if nonlinear system, check for initial coditions
+    if iterationCount == 1  and self.activatePicard:
+      sampledVars = inputKwargs[modelIn]['SampledVars'].keys()
+      conditionsToCheck = set(self.modelsDictionary[modelIn]['Input']) - set(itertools.chain(dependentOutput.keys(),sampledVars))
+      for initialConditionToSet in conditionsToCheck:
+        if initialConditionToSet in self.initialConditions.keys():
+          dependentOutput[initialConditionToSet] = self.initialConditions[initialConditionToSet]
+        else:
+          self.raiseAnError(IOError,"No initial conditions provided for variable "+ initialConditionToSet)
+    # set new identifiers
+    inputKwargs[modelIn]['prefix']        = modelIn+utils.returnIdSeparator()+identifier
+    inputKwargs[modelIn]['uniqueHandler'] = self.name+identifier
+    if metadataToTransfer is not None:
+      inputKwargs[modelIn]['metadataToTransfer'] = metadataToTransfer
+
+    for key, value in dependentOutput.items():
+      inputKwargs[modelIn]["SampledVars"  ][key] =  dependentOutput[key]
+      ## FIXME it is a mistake (Andrea). The SampledVarsPb for this variable should be transferred from outside
+      ## Who has this information? -- DPM 4/11/17
+      inputKwargs[modelIn]["SampledVarsPb"][key] =  1.0
+    self._replaceVariablesNamesWithAliasSystem(inputKwargs[modelIn]["SampledVars"  ],'input',False)
+    self._replaceVariablesNamesWithAliasSystem(inputKwargs[modelIn]["SampledVarsPb"],'input',False)
+    ## FIXME: this will come after we rework the "runInfo" collection in the code
+    ## if run info is present, we need to pass to to kwargs
+    ##if self.runInfoDict and 'Code' == self.modelsDictionary[modelIn]['Instance'].type:
+    ##  inputKwargs[modelIn].update(self.runInfoDict)
+
+  def __storeModelResults(self, modelIn, modelCnt, retDict, gotOuts, evaluation, returnDict, gotOutputs, typeOutputs,
+                          tempOutputs, inRunTargetEvaluations, residueContainer, iterationCount):
+    """
+      Method to store the results of a sub-model that finished and, if nonlinear system, to compute its residue
+      @ In, modelIn, string, name of the model that finished
+      @ In, modelCnt, int, position of the model in the execution list
+      @ In, retDict, dict, dictionary containing the data extracted from the target evaluation
+      @ In, gotOuts, dict, dictionary containing all the data coming out the model
+      @ In, evaluation, dict, the evaluation dictinary with the "unprojected" data
+      @ In, returnDict, dict, the results of the models ({modelName:results}), updated in place
+      @ In, gotOutputs, list, list of dictionary outputs of the models, updated in place
+      @ In, typeOutputs, list, list of the types of the target evaluations, updated in place
+      @ In, tempOutputs, dict, the "unprojected" evaluations of the models ({modelName:evaluation}), updated in place
+      @ In, inRunTargetEvaluations, dict, the target evaluations of the models ({modelName:DataObject})
+      @ In, residueContainer, dict, the residue container (used if nonlinear system), updated in place
+      @ In, iterationCount, int, iteration counter (1 if not picard)
+      @ Out, None
     """
-      This method is aimed to advance the execution of a sub-model and to collect the data using
+    returnDict[modelIn] = retDict
+    typeOutputs[modelCnt] = inRunTargetEvaluations[modelIn].type
+    gotOutputs[modelCnt] =  gotOuts
+    tempOutputs[modelIn] = evaluation
+
+    # if nonlinear system, compute the residue
+    ## it looks like this is handling _indexMap, but it's not clear since there's not a way to test it (yet).
+    if self.activatePicard:
+      residueContainer[modelIn]['iterValues'][1] = copy.copy(residueContainer[modelIn]['iterValues'][0])
+      for out in  inRunTargetEvaluations[modelIn].getVars("output"):
+        residueContainer[modelIn]['iterValues'][0][out] = copy.copy(gotOutputs[modelCnt][out])
+        if iterationCount == 1:
+          residueContainer[modelIn]['iterValues'][1][out] = np.zeros(len(residueContainer[modelIn]['iterValues'][0][out]))
+      for out in gotOutputs[modelCnt].keys():
+        residueContainer[modelIn]['residue'][out] = abs(np.asarray(residueContainer[modelIn]['iterValues'][0][out]) - np.asarray(residueContainer[modelIn]['iterValues'][1][out]))
+      residueContainer[modelIn]['Norm'] =  np.linalg.norm(np.asarray(list(residueContainer[modelIn]['iterValues'][1].values()))-np.asarray(list(residueContainer[modelIn]['iterValues'][0].values())))
+
+  def __advanceModel(self, identifier, modelToExecute, origInputList, inputKwargs, inRunTargetEvaluations, samplerType, iterationCount):
+    """
+      This method is aimed to advance the execution of a sub-model (evaluating it directly) and to collect the data using
       the realization
       @ In, identifier, str, current job identifier
       @ In, modelToExecute, super(Model), Model instance than needs to be avanced
@@ -703,60 +861,96 @@ class EnsembleModel(Dummy):
       @ In, inRunTargetEvaluations, DataObject, target evaluation for the model to advance
       @ In, samplerType, str, sampler Type
       @ In, iterationCount, int, iteration counter (1 if not picard)
-      @ In, jobHandler, jobHandler instance, optional, jobHandler instance (available only if parallelStrategy == 2)
       @ Out, returnDict, dict, dictionary containing the data extracted from the target evaluation
       @ Out, gotOutputs, dict, dictionary containing all the data coming out the model
       @ Out, evaluation, dict, the evaluation dictinary with the "unprojected" data
     """
-    returnDict = {}
+    self.raiseADebug('Evaluating model',modelToExecute['Instance'].name)
+    localIdentifier =  modelToExecute['Instance'].name+utils.returnIdSeparator()+identifier
+    try:
+      evaluation = modelToExecute['Instance'].evaluateSample.original_function(modelToExecute['Instance'], origInputList, samplerType, inputKwargs)
+    except Exception as e:
+      self.__modelFailed(modelToExecute['Instance'].name, localIdentifier, sys.exc_info())
+    inRunTargetEvaluations.addRealization(evaluation)
+    return self.__extractModelResults(identifier, evaluation, inRunTargetEvaluations, iterationCount)
 
+  def __submitModel(self, identifier, modelToExecute, origInputList, inputKwargs, samplerType, jobHandler):
+    """
+      This method is aimed to submit a sub-model to the jobHandler, without waiting for it to finish
+      @ In, identifier, str, current job identifier
+      @ In, modelToExecute, super(Model), Model instance than needs to be submitted
+      @ In, origInputList, list, list of model input
+      @ In, inputKwargs, dict, dictionary of kwargs for this model
+      @ In, samplerType, str, sampler Type
+      @ In, jobHandler, jobHandler instance, jobHandler instance (available only if parallelStrategy == 2)
+      @ Out, localIdentifier, str, the identifier of the submitted job
+    """
     self.raiseADebug('Submitting model',modelToExecute['Instance'].name)
     localIdentifier =  modelToExecute['Instance'].name+utils.returnIdSeparator()+identifier
-    if self.parallelStrategy == 1:
-      # we evaluate the model directly
-      try:
-        evaluation = modelToExecute['Instance'].evaluateSample.original_function(modelToExecute['Instance'], origInputList, samplerType, inputKwargs)
-      except Exception as e:
-        excType, excValue, excTrace = sys.exc_info()
-        evaluation = None
-    else:
-      moveOn = False
-      while not moveOn:
-        # run the model
-        inputKwargs.pop("jobHandler", None)
-        modelToExecute['Instance'].submit(origInputList, samplerType, jobHandler, **inputKwargs)
-        ## wait until the model finishes, in order to get ready to run the subsequential one
-        while not jobHandler.isThisJobFinished(localIdentifier):
+    inputKwargs.pop("jobHandler", None)
+    modelToExecute['Instance'].submit(origInputList, samplerType, jobHandler, **inputKwargs)
+    return localIdentifier
+
+  def __collectModel(self, identifier, modelToExecute, inRunTargetEvaluations, iterationCount, jobHandler, running):
+    """
+      This method is aimed to collect the data of a sub-model, submitted to the jobHandler, that finished
+      @ In, identifier, str, current job identifier
+      @ In, modelToExecute, super(Model), Model instance that finished
+      @ In, inRunTargetEvaluations, DataObject, target evaluation for the model
+      @ In, iterationCount, int, iteration counter (1 if not picard)
+      @ In, jobHandler, jobHandler instance, jobHandler instance (available only if parallelStrategy == 2)
+      @ In, running, dict, the other sub-models still running ({modelName:localIdentifier})
+      @ Out, returnDict, dict, dictionary containing the data extracted from the target evaluation
+      @ Out, gotOutputs, dict, dictionary containing all the data coming out the model
+      @ Out, evaluation, dict, the evaluation dictinary with the "unprojected" data
+    """
+    localIdentifier =  modelToExecute['Instance'].name+utils.returnIdSeparator()+identifier
+    # get job that just finished to gather the results
+    finishedRun = jobHandler.getFinished(jobIdentifier = localIdentifier, uniqueHandler=self.name+identifier)
+    evaluation = finishedRun[0].getEvaluation()
+    if isinstance(evaluation, rerror):
+      # the model failed, wait for the other sub-models that are still running and discard them
+      for otherIdentifier in running.values():
+        while not jobHandler.isThisJobFinished(otherIdentifier):
           time.sleep(1.e-3)
-        moveOn = True
-      # get job that just finished to gather the results
-      finishedRun = jobHandler.getFinished(jobIdentifier = localIdentifier, uniqueHandler=self.name+identifier)
-      evaluation = finishedRun[0].getEvaluation()
-      if isinstance(evaluation, rerror):
-        evaluation = None
-        excType, excValue, excTrace = finishedRun[0].exceptionTrace
-        e = rerror
-        # the model failed
-        for modelToRemove in list(set(self.orderList) - set([modelToExecute['Instance'].name])):
-          jobHandler.getFinished(jobIdentifier = modelToRemove + utils.returnIdSeparator() + identifier, uniqueHandler = self.name + identifier)
-      else:
-        # collect the target evaluation
-        modelToExecute['Instance'].collectOutput(finishedRun[0],inRunTargetEvaluations)
-
-    if not evaluation:
-      # the model failed
-      import traceback
-      msg = io.StringIO()
-      traceback.print_exception(excType, excValue, excTrace, limit=10, file=msg)
-      msg = msg.getvalue().replace('\n', '\n        ')
-      self.raiseAnError(RuntimeError, f'The Model "{modelToExecute["Instance"].name}" id "{localIdentifier}" '+
-                        f'failed! Trace:\n{"*"*72}\n{msg}\n{"*"*72}')
-    else:
-      if self.parallelStrategy == 1:
-        inRunTargetEvaluations.addRealization(evaluation)
-      else:
-        modelToExecute['Instance'].collectOutput(finishedRun[0],inRunTargetEvaluations)
+      for modelToRemove in list(set(self.orderList) - set([modelToExecute['Instance'].name])):
+        jobHandler.getFinished(jobIdentifier = modelToRemove + utils.returnIdSeparator() + identifier, uniqueHandler = self.name + identifier)
+      self.__modelFailed(modelToExecute['Instance'].name, localIdentifier, finishedRun[0].exceptionTrace)
+    # collect the target evaluation
+    modelToExecute['Instance'].collectOutput(finishedRun[0],inRunTargetEvaluations)
+    return self.__extractModelResults(identifier, evaluation, inRunTargetEvaluations, iterationCount)
+
+  def __modelFailed(self, modelName, localIdentifier, excInfo):
+    """
+      Method to report the failure of a sub-model
+      @ In, modelName, str, the name of the model that failed
+      @ In, localIdentifier, str, the identifier of the failed run
+      @ In, excInfo, tuple, the exception information (type, value, traceback), None if not available
+      @ Out, None
+    """
+    import traceback
+    if excInfo is None:
+      # the exception was raised within the job thread, its trace was already printed
+      self.raiseAnError(RuntimeError, f'The Model "{modelName}" id "{localIdentifier}" failed!')
+    excType, excValue, excTrace = excInfo
+    msg = io.StringIO()
+    traceback.print_exception(excType, excValue, excTrace, limit=10, file=msg)
+    msg = msg.getvalue().replace('\n', '\n        ')
+    self.raiseAnError(RuntimeError, f'The Model "{modelName}" id "{localIdentifier}" '+
+                      f'failed! Trace:\n{"*"*72}\n{msg}\n{"*"*72}')
 
+  def __extractModelResults(self, identifier, evaluation, inRunTargetEvaluations, iterationCount):
+    """
+      This method is aimed to extract the data of a sub-model from its target evaluation
+      @ In, identifier, str, current job identifier
+      @ In, evaluation, dict, the evaluation dictinary with the "unprojected" data
+      @ In, inRunTargetEvaluations, DataObject, target evaluation for the model
+      @ In, iterationCount, int, iteration counter (1 if not picard)
+      @ Out, returnDict, dict, dictionary containing the data extracted from the target evaluation
+      @ Out, gotOutputs, dict, dictionary containing all the data coming out the model
+      @ Out, evaluation, dict, the evaluation dictinary with the "unprojected" data
+    """
+    returnDict = {}
     ## FIXME: The call asDataset() is unuseful here. It must be done because otherwise the realization(...) method from collector
     ## does not return the indexes values (TO FIX)
     inRunTargetEvaluations.asDataset()
@@ -31,9 +31,29 @@ from .PostProcessorInterface import PostProcessorInterface
 from utils import utils
 from utils import InputData, InputTypes
 from utils import mathUtils
+from utils import parallelUtils
 import Files
 #Internal Modules End-----------------------------------------------------------
 
+def _ownFeatureRegressions(block):
+  """
+    Regresses a block of targets that are also features on the remaining features.
+    Module-level to be used as worker of parallelUtils.mapInParallel.
+    @ In, block, list(int), indices (in the shared "ownIndices" list) of the targets to regress
+    @ Out, results, list(tuple), (regression coefficients, condition number of the feature matrix) of each target
+  """
+  from sklearn.linear_model import LinearRegression
+  featSamples = parallelUtils.getShared('featSamples')
+  targSamples = parallelUtils.getShared('targSamples')
+  ownIndices = parallelUtils.getShared('ownIndices')
+  results = []
+  for b in block:
+    p, ind = ownIndices[b]
+    featMat = np.delete(featSamples,ind,axis=1)
+    regCoeff = LinearRegression().fit(featMat, targSamples[:,p]).coef_
+    results.append((np.insert(regCoeff,ind,1.0), np.linalg.cond(featMat)))
+  return results
+
 class BasicStatistics(PostProcessorInterface):
   """
     BasicStatistics filter class. It computes all the most popular statistics
@@ -116,6 +136,9 @@ class BasicStatistics(PostProcessorInterface):
     multipleFeaturesInput = InputData.parameterInputFactory("multipleFeatures", contentType=InputTypes.BoolType)
     inputSpecification.addSub(multipleFeaturesInput)
 
+    numWorkersInput = InputData.parameterInputFactory("numWorkers", contentType=InputTypes.IntegerType)
+    inputSpecification.addSub(numWorkersInput)
+
     return inputSpecification
 
   def __init__(self):
@@ -139,6 +162,7 @@ class BasicStatistics(PostProcessorInterface):
     self.realizationWeight = None # The joint probabilities
     self.steMetaIndex   = 'targets' # when Dataset is requested as output, the default index of ste metadata is ['targets', self.pivotParameter]
     self.multipleFeatures = True # True if multiple features are employed in linear regression as feature inputs
+    self.numWorkers     = 1 # number of processes the regressions of the targets can be distributed on
     self.sampleSize     = None # number of sample size
     self.calculations   = {}
     self.validDataType  = ['PointSet', 'HistorySet', 'DataSet'] # The list of accepted types of DataObject
@@ -354,6 +378,8 @@ class BasicStatistics(PostProcessorInterface):
         self.outputDataset = child.value
       elif tag == "multipleFeatures":
         self.multipleFeatures = child.value
+      elif tag == "numWorkers":
+        self.numWorkers = child.value
       else:
         self.raiseAWarning('Unrecognized node in BasicStatistics "',tag,'" has been ignored!')
 
@@ -1000,10 +1026,7 @@ class BasicStatistics(PostProcessorInterface):
         featSet = dataSet.sel(**{'variable':features}).values
         targSet = dataSet.sel(**{'variable':targets}).values
         pivotVals = dataSet.coords[self.pivotParameter].values
-        da = None
-        for i in range(len(pivotVals)):
-          ds = self.sensitivityCalculation(features,targets,featSet[i,:,:],targSet[i,:,:],intersectionSet)
-          da = ds if da is None else xr.concat([da,ds], dim=self.pivotParameter)
+        da = xr.concat([self.sensitivityCalculation(features,targets,featSet[i,:,:],targSet[i,:,:],intersectionSet) for i in range(len(pivotVals))], dim=self.pivotParameter)
         da.coords[self.pivotParameter] = pivotVals
       else:
         # construct target and feature matrices
@@ -1107,10 +1130,7 @@ class BasicStatistics(PostProcessorInterface):
         featSet = dataSet.sel(**{'variable':features}).values
         targSet = dataSet.sel(**{'variable':targets}).values
         pivotVals = dataSet.coords[self.pivotParameter].values
-        da = None
-        for i in range(len(pivotVals)):
-          ds = self.spearmanCorrelation(features,targets,featSet[i,:,:],targSet[i,:,:],relWeight)
-          da = ds if da is None else xr.concat([da,ds], dim=self.pivotParameter)
+        da = xr.concat([self.spearmanCorrelation(features,targets,featSet[i,:,:],targSet[i,:,:],relWeight) for i in range(len(pivotVals))], dim=self.pivotParameter)
         da.coords[self.pivotParameter] = pivotVals
       else:
         # construct target and feature matrices
@@ -1261,27 +1281,35 @@ class BasicStatistics(PostProcessorInterface):
         senMatrix = LinearRegression().fit(featSamples,targSamples).coef_
       else:
         # Target variables are in feature variables list, multi-target linear regression can not be used
-        # Since the 'multi-colinearity' exists, we need to loop over target variables
+        # for them, since the 'multi-colinearity' exists: each of them is regressed on the other features.
+        # The remaining targets share the whole feature matrix, thus they are regressed all together.
         # TODO: Some general methods need to be implemented in order to handle the 'multi-colinearity' -- wangc
         senMatrix = np.zeros((len(targVars), len(featVars)))
-        for p, targ in enumerate(targVars):
-          ind = list(featVars).index(targ) if targ in featVars else None
-          if ind is not None:
-            featMat = np.delete(featSamples,ind,axis=1)
-          else:
-            featMat = featSamples
-          regCoeff = LinearRegression().fit(featMat, targSamples[:,p]).coef_
-          condNumber = np.linalg.cond(featMat)
+        featList = list(featVars)
+        shared = [p for p, targ in enumerate(targVars) if targ not in featVars]
+        if len(shared):
+          condNumber = np.linalg.cond(featSamples)
           if condNumber > 30.:
             self.raiseAWarning("Condition Number: {:10.4f} > 30.0. Detected SEVERE multicollinearity problem. Sensitivity might be incorrect!".format(condNumber))
-          if ind is not None:
-            regCoeff = np.insert(regCoeff,ind,1.0)
-          senMatrix[p,:] = regCoeff
+          senMatrix[shared,:] = LinearRegression().fit(featSamples, targSamples[:,shared]).coef_
+        own = [(p, featList.index(targ)) for p, targ in enumerate(targVars) if targ in featVars]
+        numWorkers = parallelUtils.resolveNumWorkers(self.numWorkers, len(own))
+        blocks = [(list(block),) for block in np.array_split(np.arange(len(own)), numWorkers) if len(block)]
+        results, _ = parallelUtils.mapInParallel(_ownFeatureRegressions, blocks, numWorkers=numWorkers,
+                                                 shared={'featSamples':featSamples, 'targSamples':targSamples, 'ownIndices':own})
+        for (block,), blockResults in zip(blocks, results):
+          for b, (regCoeff, condNumber) in zip(block, blockResults):
+            if condNumber > 30.:
+              self.raiseAWarning("Condition Number: {:10.4f} > 30.0. Detected SEVERE multicollinearity problem. Sensitivity might be incorrect!".format(condNumber))
+            senMatrix[own[b][0],:] = regCoeff
     else:
-      senMatrix = np.zeros((len(targVars), len(featVars)))
-      for p, feat in enumerate(featVars):
-        regCoeff = LinearRegression().fit(featSamples[:,p].reshape(-1,1),targSamples).coef_
-        senMatrix[:,p] = regCoeff[:,0]
+      # each target is regressed on a single feature, i.e. the coefficients are cov(target, feature)/var(feature)
+      centeredFeat = featSamples - featSamples.mean(axis=0)
+      centeredTarg = targSamples - targSamples.mean(axis=0)
+      featVariance = np.sum(centeredFeat**2, axis=0)
+      # a constant feature has no (minimum-norm) sensitivity
+      featVariance[featVariance == 0.] = np.inf
+      senMatrix = np.dot(centeredTarg.T, centeredFeat) / featVariance
     da = xr.DataArray(senMatrix, dims=('targets','features'), coords={'targets':targVars,'features':featVars})
 
     return da
@@ -1340,37 +1368,52 @@ class BasicStatistics(PostProcessorInterface):
       @ In, pbWeights, dataset, probability weights
       @ Out, da, xarray.DataArray, contains the calculations of spearman coefficients
     """
-    spearmanMat = np.zeros((len(targVars), len(featVars)))
     wf, wt = None, None
     # compute unbiased factor
     if self.pbPresent:
       fact = (self.__computeUnbiasedCorrection(2, self.realizationWeight)).to_array().values if not self.biased else 1.0
       vp = self.__computeVp(1,self.realizationWeight)['ProbabilityWeight'].values
       varianceFactor = fact*(1.0/vp)
+      wf = np.stack([np.asarray(pbWeights[feat]) for feat in featVars], axis=1)
+      wt = np.stack([np.asarray(pbWeights[target]) for target in targVars], axis=1)
     else:
       fact = 1.0 / (float(featSamples.shape[0]) - 1.0) if not self.biased else 1.0 / float(featSamples.shape[0])
       varianceFactor = fact
+    # rank all the variables at once
+    rankFeature, rankTarget = mathUtils.rankData(featSamples, wf), mathUtils.rankData(targSamples, wt)
 
+    def weightedCov(x, y, w):
+      """
+        Covariance between the columns of x and the column(s) of y, as computed by numpy.cov
+        @ In, x, numpy.ndarray, [#samples, #x] or [#samples, 1] values
+        @ In, y, numpy.ndarray, [#samples, #x] or [#samples] values
+        @ In, w, numpy.ndarray, [#samples, #x] or [#samples] weights (aweights), None if equally weighted
+        @ Out, cov, numpy.ndarray, [#x] covariances
+      """
+      if w is None:
+        w = np.ones((x.shape[0], 1))
+        norm = x.shape[0] - 1.0
+      else:
+        w = w if w.ndim == 2 else w[:,np.newaxis]
+        norm = None
+      y = y if y.ndim == 2 else y[:,np.newaxis]
+      v1 = np.sum(w, axis=0)
+      if norm is None:
+        norm = v1 - np.sum(w*w, axis=0)/v1
+      x = x - np.sum(x*w, axis=0)/v1
+      y = y - np.sum(y*w, axis=0)/v1
+      return np.sum(x*y*w, axis=0)/norm
+
+    # compute covariance of the ranked features (variance of the features with their own weights)
+    covF = weightedCov(rankFeature, rankFeature, wf) * fact * varianceFactor
+    spearmanMat = np.zeros((len(targVars), len(featVars)))
     for tidx, target in enumerate(targVars):
-      for fidx, feat in enumerate(featVars):
-        if self.pbPresent:
-          wf, wt = np.asarray(pbWeights[feat]), np.asarray(pbWeights[target])
-        rankFeature, rankTarget = mathUtils.rankData(featSamples[:,fidx],wf),  mathUtils.rankData(targSamples[:,tidx],wt)
-        # compute covariance of the ranked features
-        cov  = np.cov(rankFeature, y=rankTarget, aweights=wt)
-        covF = np.cov(rankFeature,y=rankFeature, aweights=wf)
-        covT = np.cov(rankTarget,y=rankTarget, aweights=wf)
-        # apply correction factor (for biased or unbiased) (off diagonal)
-        cov[~np.eye(2,dtype=bool)] *= fact
-        covF[~np.eye(2,dtype=bool)] *= fact
-        covT[~np.eye(2,dtype=bool)] *= fact
-        # apply correction factor (for biased or unbiased) (diagonal)
-        cov[np.eye(2,dtype=bool)] *= varianceFactor
-        covF[~np.eye(2,dtype=bool)] *= varianceFactor
-        covT[~np.eye(2,dtype=bool)] *= varianceFactor
-        # now we can compute the pearson of such pairs
-        spearman = (cov / np.sqrt(covF * covT))[-1,0]
-        spearmanMat[tidx,fidx] = spearman
+      rankT = rankTarget[:,tidx]
+      # apply correction factor (for biased or unbiased)
+      cov = weightedCov(rankFeature, rankT, None if wt is None else wt[:,tidx]) * fact
+      covT = weightedCov(rankT[:,np.newaxis], rankT, wf) * fact * varianceFactor
+      # now we can compute the pearson of such pairs
+      spearmanMat[tidx,:] = cov / np.sqrt(covF * covT)
 
     da = xr.DataArray(spearmanMat, dims=('targets','features'), coords={'targets':targVars,'features':featVars})
     return da
@@ -155,7 +155,10 @@ class DataMining(PostProcessorInterface):
                             ("leafCounts",InputTypes.StringType),
                             ("showContracted",InputTypes.StringType),
                             ("annotatedAbove",InputTypes.FloatType),
-                            ("dendFileID",InputTypes.StringType)]:
+                            ("dendFileID",InputTypes.StringType),
+                            ("reOrderStep",InputTypes.IntegerType),
+                            ("numWorkers",InputTypes.IntegerType),
+                            ("warmStart",InputTypes.StringType)]:
       dataType = InputData.parameterInputFactory(name, contentType=inputType)
       kddInput.addSub(dataType)
 
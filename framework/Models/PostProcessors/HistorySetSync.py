@@ -20,6 +20,7 @@ import os
 import copy
 import itertools
 import numpy as np
+from collections import defaultdict
 #External Modules End--------------------------------------------------------------------------------
 
 from .PostProcessorReadyInterface import PostProcessorReadyInterface
@@ -143,12 +144,7 @@ class HistorySetSync(PostProcessorReadyInterface):
       minTime = min(minInitTime)
       newTime = np.linspace(minTime,maxTime,self.numberOfSamples)
     elif self.syncMethod == 'all':
-      times = []
-      for hist in inputDic['data'][self.pivotParameter]:
-          times.extend(hist)
-      times = list(set(times))
-      times.sort()
-      newTime = np.array(times)
+      newTime = np.unique(np.concatenate(list(inputDic['data'][self.pivotParameter])))
     elif self.syncMethod in ['min','max']:
       notableHist   = None   #set on first iteration
       notableLength = None   #set on first iteration
@@ -168,11 +164,21 @@ class HistorySetSync(PostProcessorReadyInterface):
     for var in inputDic['inpVars']:
       outputDic['data'][var] = copy.deepcopy(inputDic['data'][var])
 
+    # histories sharing the same time axis are resampled together, as a (history, time, variable) array
+    groups = defaultdict(list)
     for rlz in range(inputDic['numberRealizations']):
-      outputDic['data'][self.pivotParameter][rlz] = newTime
-      for var in inputDic['outVars']:
-        oldTime = inputDic['data'][self.pivotParameter][rlz]
-        outputDic['data'][var][rlz] = self.resampleHist(inputDic['data'][var][rlz], oldTime, newTime)
+      oldTime = np.asarray(inputDic['data'][self.pivotParameter][rlz])
+      groups[(oldTime.size, oldTime.tobytes())].append(rlz)
+    outVars = list(inputDic['outVars'])
+    for group in groups.values():
+      oldTime = np.asarray(inputDic['data'][self.pivotParameter][group[0]])
+      if outVars:
+        stacked = np.stack([np.stack([inputDic['data'][var][rlz] for var in outVars], axis=-1) for rlz in group])
+        resampled = self.resampleHist(stacked, oldTime, newTime)
+      for g, rlz in enumerate(group):
+        outputDic['data'][self.pivotParameter][rlz] = newTime
+        for v, var in enumerate(outVars):
+          outputDic['data'][var][rlz] = resampled[g, :, v]
 
     # add meta variables back
     for key in inputDic['metaKeys']:
@@ -184,26 +190,30 @@ class HistorySetSync(PostProcessorReadyInterface):
   def resampleHist(self, variable, oldTime, newTime):
     """
       Method the re-sample on ''newTime'' the ''variable'' originally sampled on ''oldTime''
-      @ In, variable, np.array, array containing the sampled values of the dependent variable
+      @ In, variable, np.array, array containing the sampled values of the dependent variable; either with shape
+        (time,) or, to resample several histories and variables sharing ''oldTime'' at once, (history, time, variable)
       @ In, oldTime,  np.array, array containing the sampled values of the temporal variable
       @ In, newTime,  np.array, array containing the sampled values of the new temporal variable
       @ Out, variable, np.array, array containing the sampled values of the dependent variable re-sampled on oldTime
     """
-    newVar=np.zeros(newTime.size)
-    pos=0
-    for newT in newTime:
-      if newT<oldTime[0]:
-        if self.extension == 'extended':
-          newVar[pos] = variable[0]
-        elif self.extension == 'zeroed':
-          newVar[pos] = 0.0
-      elif newT>oldTime[-1]:
-        if self.extension == 'extended':
-          newVar[pos] = variable[-1]
-        elif self.extension == 'zeroed':
-          newVar[pos] = 0.0
-      else:
-        index = np.searchsorted(oldTime,newT)
-        newVar[pos] = variable[index-1] + (variable[index]-variable[index-1])/(oldTime[index]-oldTime[index-1])*(newT-oldTime[index-1])
-      pos=pos+1
-    return newVar
+    variable = np.asarray(variable)
+    oldTime = np.asarray(oldTime)
+    newTime = np.asarray(newTime)
+    # move time to the first axis
+    values = variable if variable.ndim == 1 else np.moveaxis(variable, 1, 0)
+    newVar = np.zeros((newTime.size,) + values.shape[1:])
+    before = newTime < oldTime[0]
+    after = newTime > oldTime[-1]
+    inside = np.logical_not(np.logical_or(before, after))
+    if self.extension == 'extended':
+      newVar[before] = values[0]
+      newVar[after] = values[-1]
+    # linear interpolation between the nearest old time values
+    newT = newTime[inside]
+    index = np.searchsorted(oldTime, newT)
+    # trailing axes for broadcasting the time weights over histories and variables
+    expand = (slice(None),) + (np.newaxis,) * (values.ndim - 1)
+    deltaT = (oldTime[index] - oldTime[index-1])[expand]
+    offset = (newT - oldTime[index-1])[expand]
+    newVar[inside] = values[index-1] + (values[index] - values[index-1])/deltaT*offset
+    return newVar if variable.ndim == 1 else np.moveaxis(newVar, 0, 1)
@@ -323,8 +323,11 @@ class ImportanceRank(PostProcessorInterface):
       feats = self.manifest
       self.dimensions = self.manifestDim
     sampledFeatMatrix = np.atleast_2d(np.asarray(featValues)).T
-    for target in self.targets:
-      featCoeffs = LinearRegression().fit(sampledFeatMatrix, inputDict['targets'][target]).coef_
+    # all the targets are regressed at once, factorizing the feature matrix only once
+    sampledTargMatrix = np.atleast_2d(np.asarray([inputDict['targets'][target] for target in self.targets])).T
+    allCoeffs = np.atleast_2d(LinearRegression().fit(sampledFeatMatrix, sampledTargMatrix).coef_)
+    for t, target in enumerate(self.targets):
+      featCoeffs = allCoeffs[t]
       featWeights = abs(featCoeffs)/np.sum(abs(featCoeffs))
       senWeightDict[target] = featWeights
       senCoeffDict[target] = featCoeffs
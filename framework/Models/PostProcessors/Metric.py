@@ -63,6 +63,8 @@ class Metric(PostProcessorInterface):
     inputSpecification.addSub(weightInput)
     pivotParameterInput = InputData.parameterInputFactory("pivotParameter", contentType=InputTypes.StringType)
     inputSpecification.addSub(pivotParameterInput)
+    chunkSizeInput = InputData.parameterInputFactory("chunkSize", contentType=InputTypes.IntegerType)
+    inputSpecification.addSub(chunkSizeInput)
     metricInput = InputData.parameterInputFactory("Metric", contentType=InputTypes.StringType)
     metricInput.addParam("class", InputTypes.StringType, True)
     metricInput.addParam("type", InputTypes.StringType, True)
@@ -88,6 +90,7 @@ class Metric(PostProcessorInterface):
                                 # for each individual output when all outputs are averaged
     self.pivotParameter = None
     self.pivotValues    = []
+    self.chunkSize      = None  # if provided, number of history steps read and evaluated at a time
     # assembler objects to be requested
     self.addAssemblerObject('Metric', InputData.Quantity.one_to_infinity)
 
@@ -121,9 +124,13 @@ class Metric(PostProcessorInterface):
             if metricData is not None:
               self.raiseAnError(IOError, "Same feature or target variable " + metricDataName + "is found in multiple input objects")
             #Found the data, now put it in the return value.
-            requestData = copy.copy(dataSet[metricDataName].values)
-            if len(requestData.shape) == 1:
-              requestData = requestData.reshape(-1,1)
+            if self.chunkSize is None:
+              requestData = copy.copy(dataSet[metricDataName].values)
+              if len(requestData.shape) == 1:
+                requestData = requestData.reshape(-1,1)
+            else:
+              # the history steps are read from the data object chunkSize at a time (see MetricDistributor.evaluateBatch)
+              requestData = dataSet[metricDataName]
             # If requested data are from input space, the shape will be (nSamples, 1)
             # If requested data are from history output space, the shape will be (nSamples, nTimeSteps)
             if 'ProbabilityWeight' in metadata:
@@ -232,6 +239,10 @@ class Metric(PostProcessorInterface):
         self.weight = np.asarray(child.value)
       elif child.getName() == 'pivotParameter':
         self.pivotParameter = child.value
+      elif child.getName() == 'chunkSize':
+        if child.value < 1:
+          self.raiseAnError(IOError, "XML node 'chunkSize' must be a positive integer")
+        self.chunkSize = child.value
       else:
         self.raiseAnError(IOError, "Unknown xml node ", child.getName(), " is provided for metric system")
 
@@ -316,9 +327,9 @@ class Metric(PostProcessorInterface):
     assert(len(self.features) == len(measureList))
     for metricInstance in self.metricsDict.values():
       metricEngine = MetricDistributor.factory.returnInstance('MetricDistributor', metricInstance)
+      outputs = metricEngine.evaluateBatch(measureList, weights=self.weight, multiOutput=self.multiOutput, chunkSize=self.chunkSize)
       for cnt in range(len(self.targets)):
         nodeName = (str(self.targets[cnt]) + '_' + str(self.features[cnt])).replace("|","_")
         varName = metricInstance.name + '|' + nodeName
-        output = metricEngine.evaluate(measureList[cnt], weights=self.weight, multiOutput=self.multiOutput)
-        outputDict[varName] = np.atleast_1d(output)
+        outputDict[varName] = np.atleast_1d(outputs[cnt])
     return outputDict
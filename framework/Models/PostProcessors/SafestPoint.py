@@ -280,65 +280,83 @@ class SafestPoint(PostProcessorInterface):
       @ In,  input, object, object contained the data to process. (inputToInternal output)
       @ Out, dataCollector, PointSet, PointSet containing the elaborated data
     """
-    ##TODO: This PP can be LARGELY optimized.
-    nearestPointsInd = []
-    surfTree = spatial.KDTree(copy.copy(self.surfPointsMatrix[:, 0:self.surfPointsMatrix.shape[-1] - 1]))
+    surfCoords = self.surfPointsMatrix[:, 0:self.surfPointsMatrix.shape[-1] - 1]
+    surfTree = spatial.KDTree(copy.copy(surfCoords))
+    # carry the label of each point in the tree along with its index;
+    # points with the same coordinates take the label of the first of them
+    _, firstIndex, inverse = np.unique(surfCoords, axis=0, return_index=True, return_inverse=True)
+    surfLabels = self.surfPointsMatrix[firstIndex[inverse.ravel()], -1]
     self.controllableSpace.shape = (np.prod(self.controllableSpace.shape[0:len(self.controllableSpace.shape) - 1]), self.controllableSpace.shape[-1])
     self.nonControllableSpace.shape = (np.prod(self.nonControllableSpace.shape[0:len(self.nonControllableSpace.shape) - 1]), self.nonControllableSpace.shape[-1])
     self.raiseADebug('RESHAPED CONTROLLABLE SPACE:')
     self.raiseADebug(self.controllableSpace)
     self.raiseADebug('RESHAPED NON-CONTROLLABLE SPACE:')
     self.raiseADebug(self.nonControllableSpace)
+    numControllable, controllableDims = self.controllableSpace.shape
+    numNonControllable = self.nonControllableSpace.shape[0]
+    # query all the (non-controllable, controllable) point combinations at once
+    queryPointsMatrix = np.append(np.tile(self.controllableSpace, (numNonControllable, 1)),
+                                  np.repeat(self.nonControllableSpace, numControllable, axis = 0), axis = 1)
+    self.raiseADebug('QUERIED POINTS MATRIX:')
+    self.raiseADebug(queryPointsMatrix)
+    nearestPointsInd = surfTree.query(queryPointsMatrix)[-1]
+    # distance in the controllable space from each query point to its nearest surface point,
+    # by non-controllable line (rows) and controllable point (columns)
+    distances = np.sqrt(np.sum(np.power(queryPointsMatrix[:, 0:controllableDims] - surfTree.data[nearestPointsInd, 0:controllableDims], 2), axis = 1))
+    distances.shape = (numNonControllable, numControllable)
+    safe = (surfLabels[nearestPointsInd] == 1).reshape(numNonControllable, numControllable)
+    unsafeLines = np.where(np.logical_not(safe.any(axis = 1)))[0]
+    if len(unsafeLines):
+      self.raiseAnError(ValueError, 'no safest point found for the current set of non-controllable variables: ' + str(self.nonControllableSpace[unsafeLines[0], :]) + '.')
+    # the safest point is the safe one farthest from the surface (first one, for ties)
+    distances[np.logical_not(safe)] = -np.inf
+    safestInd = np.argmax(distances, axis = 1)
     # create space for realization
-    rlz = {key : np.zeros(self.nonControllableSpace.shape[0])  for key in self.controllableOrd+self.nonControllableOrd}
-    rlz[self.outputName] = np.zeros(self.nonControllableSpace.shape[0])
-    rlz['ProbabilityWeight'] = np.zeros(self.nonControllableSpace.shape[0])
-    for ncLine in range(self.nonControllableSpace.shape[0]):
-      queryPointsMatrix = np.append(self.controllableSpace, np.tile(self.nonControllableSpace[ncLine, :], (self.controllableSpace.shape[0], 1)), axis = 1)
-      self.raiseADebug('QUERIED POINTS MATRIX:')
-      self.raiseADebug(queryPointsMatrix)
-      nearestPointsInd = surfTree.query(queryPointsMatrix)[-1]
-      distList = []
-      indexList = []
-      probList = []
-      for index in range(len(nearestPointsInd)):
-        if self.surfPointsMatrix[np.where(np.prod(surfTree.data[nearestPointsInd[index], 0:
-          self.surfPointsMatrix.shape[-1] - 1] == self.surfPointsMatrix[:, 0:self.surfPointsMatrix.shape[-1] - 1], axis = 1))[0][0], -1] == 1:
-          distList.append(np.sqrt(np.sum(np.power(queryPointsMatrix[index, 0:self.controllableSpace.shape[-1]] - surfTree.data[nearestPointsInd[index], 0:self.controllableSpace.shape[-1]], 2))))
-          indexList.append(index)
-      if distList == []:
-        self.raiseAnError(ValueError, 'no safest point found for the current set of non-controllable variables: ' + str(self.nonControllableSpace[ncLine, :]) + '.')
-      else:
-        for cVarIndex in range(len(self.controllableOrd)):
-          rlz[self.controllableOrd[cVarIndex]][ncLine] = copy.copy(queryPointsMatrix[indexList[distList.index(max(distList))], cVarIndex])
-        for ncVarIndex in range(len(self.nonControllableOrd)):
-          rlz[self.nonControllableOrd[ncVarIndex]][ncLine] = queryPointsMatrix[indexList[distList.index(max(distList))], len(self.controllableOrd) + ncVarIndex]
-          if queryPointsMatrix[indexList[distList.index(max(distList))], len(self.controllableOrd) + ncVarIndex] == self.nonControllableDist[self.nonControllableOrd[ncVarIndex]].lowerBound:
-            if self.nonControllableGrid[self.nonControllableOrd[ncVarIndex]][0] == 'CDF':
-              prob = self.nonControllableGrid[self.nonControllableOrd[ncVarIndex]][2] / 2.
-            else:
-              prob = self.nonControllableDist[self.nonControllableOrd[ncVarIndex]].cdf(self.nonControllableDist[self.nonControllableOrd[ncVarIndex]].lowerBound + self.nonControllableGrid[self.nonControllableOrd[ncVarIndex]][2] / 2.)
-          elif queryPointsMatrix[indexList[distList.index(max(distList))], len(self.controllableOrd) + ncVarIndex] == self.nonControllableDist[self.nonControllableOrd[ncVarIndex]].upperBound:
-            if self.nonControllableGrid[self.nonControllableOrd[ncVarIndex]][0] == 'CDF':
-              prob = self.nonControllableGrid[self.nonControllableOrd[ncVarIndex]][2] / 2.
-            else:
-              prob = 1 - self.nonControllableDist[self.nonControllableOrd[ncVarIndex]].cdf(self.nonControllableDist[self.nonControllableOrd[ncVarIndex]].upperBound - self.nonControllableGrid[self.nonControllableOrd[ncVarIndex]][2] / 2.)
-          else:
-            if self.nonControllableGrid[self.nonControllableOrd[ncVarIndex]][0] == 'CDF':
-              prob = self.nonControllableGrid[self.nonControllableOrd[ncVarIndex]][2]
-            else:
-              prob = self.nonControllableDist[self.nonControllableOrd[ncVarIndex]].cdf(queryPointsMatrix[indexList[distList.index(max(distList))],
-                      len(self.controllableOrd) + ncVarIndex] + self.nonControllableGrid[self.nonControllableOrd[ncVarIndex]][2] / 2.) - self.nonControllableDist[self.nonControllableOrd[ncVarIndex]].cdf(queryPointsMatrix[indexList[distList.index(max(distList))],
-                      len(self.controllableOrd) + ncVarIndex] - self.nonControllableGrid[self.nonControllableOrd[ncVarIndex]][2] / 2.)
-          probList.append(prob)
-      rlz[self.outputName][ncLine] = np.prod(probList)
-      rlz['ProbabilityWeight'][ncLine] = np.prod(probList)
+    rlz = {}
+    for cVarIndex, varName in enumerate(self.controllableOrd):
+      rlz[varName] = self.controllableSpace[safestInd, cVarIndex]
+    for ncVarIndex, varName in enumerate(self.nonControllableOrd):
+      rlz[varName] = copy.copy(self.nonControllableSpace[:, ncVarIndex])
+    probabilities = self.__probabilityWeights__()
+    rlz[self.outputName] = probabilities
+    rlz['ProbabilityWeight'] = copy.copy(probabilities)
     metadata = {'ProbabilityWeight':xarray.DataArray(rlz['ProbabilityWeight'])}
     targets = {tar:xarray.DataArray( rlz[tar])  for tar in self.controllableOrd}
     rlz['ExpectedSafestPointCoordinates'] = self.stat.run({'metadata':metadata, 'targets':targets})
     self.raiseADebug(rlz['ExpectedSafestPointCoordinates'])
     return rlz
 
+  def __probabilityWeights__(self):
+    """
+      Method to compute the probability weight of each point in the (reshaped) non-controllable space
+      @ In, None
+      @ Out, weights, np.array, probability weights
+    """
+    weights = np.ones(self.nonControllableSpace.shape[0])
+    for ncVarIndex, varName in enumerate(self.nonControllableOrd):
+      dist = self.nonControllableDist[varName]
+      gridType, _, step = self.nonControllableGrid[varName]
+      values = self.nonControllableSpace[:, ncVarIndex]
+      atLower = values == dist.lowerBound
+      atUpper = np.logical_and(values == dist.upperBound, np.logical_not(atLower))
+      inner = np.logical_not(np.logical_or(atLower, atUpper))
+      # the boundary cells are half cells
+      if gridType == 'CDF':
+        prob = np.full(len(values), float(step))
+        prob[np.logical_not(inner)] = step / 2.
+      else:
+        # not all the distributions accept arrays in their cdf (e.g. LogUniform, Custom1D)
+        cdf = np.vectorize(dist.cdf, otypes=[float])
+        prob = np.zeros(len(values))
+        if atLower.any():
+          prob[atLower] = cdf(dist.lowerBound + step / 2.)
+        if atUpper.any():
+          prob[atUpper] = 1 - cdf(dist.upperBound - step / 2.)
+        if inner.any():
+          prob[inner] = cdf(values[inner] + step / 2.) - cdf(values[inner] - step / 2.)
+      weights *= prob
+    return weights
+
   def collectOutput(self, finishedJob, output):
     """
       Function to place all of the computed data into the output object
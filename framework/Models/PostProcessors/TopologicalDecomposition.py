@@ -106,6 +106,7 @@ class TopologicalDecomposition(PostProcessorInterface):
     self.normalization = None
     self.weighted = False
     self.parameters = {}
+    self.__previousAmsc = None # decomposition of the previous run, extended if the data only grew
 
   def inputToInternal(self, currentInp):
     """
@@ -312,12 +313,19 @@ class TopologicalDecomposition(PostProcessorInterface):
     from AMSC_Object import AMSC_Object
 
     if self.__amsc is None:
-      self.__amsc = AMSC_Object(X=self.inputData, Y=self.outputData,
-                                w=self.weights, names=self.names,
-                                graph=self.graph, gradient=self.gradient,
-                                knn=self.knn, beta=self.beta,
-                                normalization=self.normalization,
-                                persistence=self.persistence, debug=False)
+      if self.__previousAmsc is not None:
+        ## when run again on a data set that only grew (e.g. after sampling
+        ## more points), only the new samples are added to the decomposition
+        self.__amsc = self.__previousAmsc
+        self.__amsc.Update(self.inputData, self.outputData, self.weights)
+      else:
+        self.__amsc = AMSC_Object(X=self.inputData, Y=self.outputData,
+                                  w=self.weights, names=self.names,
+                                  graph=self.graph, gradient=self.gradient,
+                                  knn=self.knn, beta=self.beta,
+                                  normalization=self.normalization,
+                                  persistence=self.persistence, debug=False)
+      self.__previousAmsc = self.__amsc
 
     self.__amsc.Persistence(self.simplification)
     partitions = self.__amsc.Partitions()
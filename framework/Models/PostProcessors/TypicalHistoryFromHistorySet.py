@@ -131,46 +131,38 @@ class TypicalHistoryFromHistorySet(PostProcessorReadyInterface):
         self.raiseAnError(IOError, errorMessage)
 
     # task: reshape the data into histories with the size of the output I'm looking for
-    #data dictionaries have form {historyNumber:{VarName:[data], VarName:[data]}}
-    reshapedData = {}
-    newHistoryCounter = 0 #new history tracking labels
-    for historyNumber in range(numSamples):
-      #array of the pivot values provided in the history
-      pivotValues = np.asarray(inputDict[self.pivotParameter][historyNumber])
-      #if the desired output pivot value length is (equal to or) longer than the provided history ...
-      #   -> (i.e. I have a year and I want output of a year)
-      if self.outputLen >= pivotValues[-1]:
-        #don't change the shape of this history; it's fine as is
-        reshapedData[newHistoryCounter] = self.retrieveHistory(inputDict,historyNumber)
-        newHistoryCounter += 1
-      #if the provided history is longer than the requested output period
-      #   -> (i.e., I have a year of data and I only want output of 1 year)
-      else:
-        #reshape the history into multiple histories to use
-        startPivot = 0
-        endPivot = self.outputLen
-        # until you find the last observed pivot point...
-        while endPivot <= pivotValues[-1]:
-          #create a storage place for each new usable history
-          reshapedData[newHistoryCounter] = {}
-          # acceptable is if the pivot value is greater than start and less than end
-          extractCondition = np.logical_and(pivotValues>=startPivot, pivotValues<=endPivot)
-          # extract out the acceptable parts from the pivotValues, and reset the base pivot point to 0
-          reshapedData[newHistoryCounter][self.pivotParameter] = np.extract(extractCondition, pivotValues)-startPivot
-          # for each feature...
-          for feature in self.features:
-            # extract applicable information from the feature set
-            reshapedData[newHistoryCounter][feature] = np.extract(extractCondition, inputDict[feature][historyNumber])
-          #increment history counter
-          newHistoryCounter += 1
-          #update new start/end points for grabbing the next history
-          startPivot = endPivot
-          endPivot += self.outputLen
-
-    inputDict['output'] = reshapedData
-    self.numHistory = len(inputDict['output'].keys()) #should be same as newHistoryCounter - 1, if that's faster
-    #update the set of pivot parameter values to match the first of the reshaped histories
-    self.pivotValues = np.asarray(inputDict['output'][utils.first(inputDict['output'].keys())][self.pivotParameter])
+    # the histories are synchronized, so the data is stacked as (history, pivot) arrays for each feature
+    pivotValues = np.asarray(referenceTimeAxis)
+    stackedData = dict((feature, np.vstack(list(inputDict[feature]))) for feature in self.features)
+    #if the desired output pivot value length is (equal to or) longer than the provided history ...
+    #   -> (i.e. I have a year and I want output of a year)
+    if self.outputLen >= pivotValues[-1]:
+      #don't change the shape of the histories; they are fine as they are
+      self.pivotValues = pivotValues
+      historyData = stackedData
+      self.numHistory = numSamples
+    #if the provided history is longer than the requested output period
+    #   -> (i.e., I have a year of data and I only want output of 1 year)
+    else:
+      #reshape each history into multiple histories to use
+      extractConditions = []
+      startPivot = 0
+      endPivot = self.outputLen
+      # until you find the last observed pivot point...
+      while endPivot <= pivotValues[-1]:
+        # acceptable is if the pivot value is greater than start and less than end
+        extractConditions.append(np.logical_and(pivotValues>=startPivot, pivotValues<=endPivot))
+        if len(extractConditions) == 1:
+          # the pivot values of the first new history, with the base pivot point reset to 0
+          self.pivotValues = np.extract(extractConditions[0], pivotValues)-startPivot
+        #update new start/end points for grabbing the next history
+        startPivot = endPivot
+        endPivot += self.outputLen
+      # new histories are ordered by original history, then by period
+      historyData = {}
+      for feature, data in stackedData.items():
+        historyData[feature] = np.stack(list(data[:, condition] for condition in extractConditions), axis=1).reshape(-1, len(self.pivotValues))
+      self.numHistory = numSamples * len(extractConditions)
 
     # task: split the history into multiple subsequences so that the typical history can be constructed
     #  -> i.e., split the year history into multiple months, so we get a typical January, February, ..., hence a typical year
@@ -200,28 +192,24 @@ class TypicalHistoryFromHistorySet(PostProcessorReadyInterface):
     #                                                 feature:[[parallel data]]}
     # 'all' means all the feature data is included,
     #     while the subseqIndex dictionaries only contain the relevant subsequence data (i.e., the monthly data)
-    # stack the similar histories in numpy arrays for full period (for example, by year)
+    # the similar histories for full period (for example, by year) are all the stacked data
     for feature in self.features:
-      subseqData['all'][feature] = np.concatenate(list(inputDict['output'][h][feature] for h in inputDict['output'].keys()))
+      subseqData['all'][feature] = historyData[feature].ravel()
 
-    # gather feature data by subsequence (for example, by month)
+    # gather feature data by subsequence (for example, by month), for all the histories at once
     for index in range(numParallelSubsequences):
       extractCondition = np.logical_and(self.pivotValues>=self.subsequence[index][0], self.pivotValues<self.subsequence[index][1])
       subseqData[index][self.pivotParameter] = np.extract(extractCondition, self.pivotValues)
       #get the pivot parameter entries as well, but only do it once, at the end
-      if self.pivotValues[-1] == self.subsequence[index][1]:
+      lastSubsequence = self.pivotValues[-1] == self.subsequence[index][1]
+      if lastSubsequence:
         subseqData[index][self.pivotParameter] = np.concatenate((subseqData[index][self.pivotParameter], np.asarray([self.pivotValues[-1]])))
-      #get the subsequence data for each feature, for each history
       for feature in self.features:
-        subseqData[index][feature] = np.zeros(shape=(self.numHistory,len(subseqData[index][self.pivotParameter])))
-        for h, historyNumber in enumerate(inputDict['output'].keys()):
-          if self.pivotValues[-1] == self.subsequence[index][1]:
-            #TODO this is doing the right action, but it's strange that we need to add one extra element.
-            #  Maybe this should be fixed where we set the self.subsequence[index][1] for the last index, instead of patched here
-            subseqData[index][feature][h,0:-1] = np.extract(extractCondition, inputDict['output'][historyNumber][feature])
-            subseqData[index][feature][h,-1] = inputDict['output'][historyNumber][feature][-1]
-          else:
-            subseqData[index][feature][h,:] = np.extract(extractCondition, inputDict['output'][historyNumber][feature])
+        subseqData[index][feature] = historyData[feature][:, extractCondition]
+        if lastSubsequence:
+          #TODO this is doing the right action, but it's strange that we need to add one extra element.
+          #  Maybe this should be fixed where we set the self.subsequence[index][1] for the last index, instead of patched here
+          subseqData[index][feature] = np.column_stack((subseqData[index][feature], historyData[feature][:, -1]))
 
     # task: compare CDFs to find the nearest match to the collective time's standard CDF (see the paper ref'd in the manual)
     # start by building the CDFs in the same structure as subseqData
@@ -229,32 +217,24 @@ class TypicalHistoryFromHistorySet(PostProcessorReadyInterface):
     cdfData = defaultdict(dict) # eventually {'all':{feature:[monotonically increasing floats], feature:[monotonically increasing floats]},
     #                                    subseqIndex:{pivotParam:pivotValues[-1]},
     #                                                 feature:[monotonically increasing floats]}
-    # TODO there surely is a faster way to do this than triple-for-loops
     for feature in self.features:
       #construct reasonable bins for feature
       numBins, binEdges = mathUtils.numBinsDraconis(subseqData['all'][feature])
       #get the empirical CDF by bin for entire history (e.g., full year or even multiple years)
-      cdfData['all'][feature] = self.__computeECDF(subseqData['all'][feature], binEdges)
-      #get the empirical CDF by bin for subsequence (e.g., for a month)
+      cdfData['all'][feature] = self.__computeECDF(subseqData['all'][feature], binEdges)[0]
+      #get the empirical CDF by bin for subsequence (e.g., for a month), for all histories at once
       for index in range(numParallelSubsequences):
-        cdfData[index][feature] = np.zeros(shape=(self.numHistory,numBins))
-        for h in range(self.numHistory):
-          cdfData[index][feature][h,:] = self.__computeECDF(subseqData[index][feature][h,:], binEdges)
+        cdfData[index][feature] = self.__computeECDF(subseqData[index][feature], binEdges)
 
     # now determine which subsequences are the most typical, using the CDF
     # find the smallestDeltaCDF and its index so the typical data can be set
-    # first, find and store them by history
     typicalDataHistories = {}
     for index in range(numParallelSubsequences):
       typicalDataHistories[index] = {}
       typicalDataHistories[index][self.pivotParameter] = subseqData[index][self.pivotParameter]
-      smallestDeltaCDF = np.inf
-      smallestDeltaIndex = numParallelSubsequences + 1 #initialized as bogus index to preserve errors
-      for h in range(self.numHistory):# for h, historyNumber in enumerate(inputDict['output'].keys()):
-        delta = sum(self.__computeDist(cdfData['all'][feature],cdfData[index][feature][h,:]) for feature in self.features)
-        if delta < smallestDeltaCDF:
-          smallestDeltaCDF = delta
-          smallestDeltaIndex = h
+      # distance of each history from the collective CDF
+      delta = sum(self.__computeDist(cdfData['all'][feature], cdfData[index][feature]) for feature in self.features)
+      smallestDeltaIndex = np.argmin(delta)
       for feature in self.features:
         typicalDataHistories[index][feature] = subseqData[index][feature][smallestDeltaIndex,:]
     # now collapse the data into the typical history
@@ -286,18 +266,30 @@ class TypicalHistoryFromHistorySet(PostProcessorReadyInterface):
   def __computeECDF(self, data, binEdgesIn):
     """
       Method to generate empirical CDF of input data, with the bins given.
-      @ In, data, numpy array, data for which empirical CDF is computed
+      @ In, data, numpy array, data for which empirical CDF is computed; if 2D, one CDF is computed for each row
       @ In, binEdgesIn, numpy array, bins over which CDF value is computed
-      @ Out, , numpy array, empirical CDF of the input data.
+      @ Out, , numpy array, empirical CDF of the input data, with shape (rows in data, bins)
     """
-    (counts, _) = np.histogram(data,bins=binEdgesIn,normed=True)
-    return np.cumsum(counts)/max(np.cumsum(counts))
+    data = np.atleast_2d(data)
+    numRows = data.shape[0]
+    numBins = len(binEdgesIn) - 1
+    # bin the data of all the rows at once, as np.histogram does:
+    # bins include their left edge, and the last bin also includes its right edge
+    inRange = np.logical_and(data >= binEdgesIn[0], data <= binEdgesIn[-1])
+    bins = np.searchsorted(binEdgesIn, data, side='right') - 1
+    bins[data == binEdgesIn[-1]] = numBins - 1
+    rows = np.broadcast_to(np.arange(numRows)[:, np.newaxis], data.shape)
+    counts = np.bincount((rows*numBins + bins)[inRange], minlength=numRows*numBins).reshape(numRows, numBins)
+    # density
+    counts = counts/np.diff(binEdgesIn)/counts.sum(axis=1)[:, np.newaxis]
+    cdf = np.cumsum(counts, axis=1)
+    return cdf/np.max(cdf, axis=1)[:, np.newaxis]
 
   def __computeDist(self, x1, x2):
     """
       Method to compute absolute difference of two points.
       @ In, x1, numpy array, input 1
-      @ In, x2, numpy array, input 2
-      @ Out, , float, difference between x1 and x2
+      @ In, x2, numpy array, input 2 (if 2D, one difference is computed for each row)
+      @ Out, , float or numpy array, difference between x1 and x2
     """
-    return np.average(np.absolute(x1-x2))
+    return np.average(np.absolute(x1-x2), axis=-1)
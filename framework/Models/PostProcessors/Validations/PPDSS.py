@@ -220,104 +220,32 @@ class PPDSS(ValidationBase):
       else:
         yCount = targData.shape[0]
         zCount = targData.shape[1]
-      featureD = np.zeros((yCount,zCount))
-      featureProcessTimeNorm = np.zeros((yCount,zCount))
-      featureOmegaNorm = np.zeros((yCount,zCount))
-      featureBeta = np.zeros((yCount,zCount))
-      naNCount = np.zeros((yCount,zCount))
-      #
-      feature = nameFeat[1]
-      for cnt2 in range(yCount):
-        if pivotFeatureSize == pivotSize:
-          featureBeta[cnt2] = featData[cnt2]
-          interpGrid = pivotFeature
-        else:
-          interpFunction = interp1d(pivotFeature,featData[cnt2],kind='linear',fill_value='extrapolate')
-          interpGrid = timeScalingRatio*pivotTarget
-          featureBeta[cnt2] = interpFunction(interpGrid)
-        featureOmega = np.gradient(featureBeta[cnt2],interpGrid)
-        featureProcessTime = featureBeta[cnt2]/featureOmega
-        featureDiffOmega = np.gradient(featureOmega,interpGrid)
-        featureD[cnt2] = -featureBeta[cnt2]/featureOmega**2*featureDiffOmega
-        for cnt3 in range(zCount):
-          if np.isnan(featureD[cnt2][cnt3]) == True:
-            naNCount[cnt2][cnt3] = 1
-          elif np.isinf(featureD[cnt2][cnt3]) == True:
-            naNCount[cnt2][cnt3] = 1
-        featureInt = featureD[cnt2]+1
-        # Excluding NaN type data and exclude corresponding time in grid in
-        # preperation for numpy simpson integration
-        count=0
-        for i in range(len(featureD[cnt2])):
-          if np.isnan(featureD[cnt2][i])==False and np.isinf(featureD[cnt2][i])==False:
-            count += 1
-        if count > 0:
-          featureIntNew = np.zeros(count)
-          interpGridNew = np.zeros(count)
-          trackCount = 0
-          for i in range(len(featureD[cnt2])):
-            if np.isnan(featureD[cnt2][i])==False and np.isinf(featureD[cnt2][i])==False:
-              interpGridNew[trackCount] = interpGrid[i]
-              featureIntNew[trackCount] = featureInt[i]
-              trackCount += 1
-            else:
-              featureD[cnt2][i] = 0
-        #
-        featureProcessAction = simps(featureIntNew, interpGridNew)
-        featureProcessTimeNorm[cnt2] = featureProcessTime/featureProcessAction
-        featureOmegaNorm[cnt2] = featureProcessAction*featureOmega
+      # all the histories are processed at once, stacked along the first axis
+      if pivotFeatureSize == pivotSize:
+        featureBeta = np.asarray(featData, dtype=float)[:yCount]
+        interpGrid = pivotFeature
+      else:
+        interpFunction = interp1d(pivotFeature,featData[:yCount],kind='linear',fill_value='extrapolate',axis=1)
+        interpGrid = timeScalingRatio*pivotTarget
+        featureBeta = interpFunction(interpGrid)
+      featureOmega, featureProcessTime, featureD, featureInvalid, featureProcessAction = self._processQuantities(featureBeta, interpGrid)
+      featureProcessTimeNorm = featureProcessTime/featureProcessAction[:,np.newaxis]
+      featureOmegaNorm = featureProcessAction[:,np.newaxis]*featureOmega
       #
-      targetD = np.zeros((yCount,zCount))
-      targetProcessTimeNorm = np.zeros((yCount,zCount))
-      targetOmegaNorm = np.zeros((yCount,zCount))
-      targetBeta = np.zeros((yCount,zCount))
-      target = nameTarg[1]
-      for cnt2 in range(yCount):
-        if pivotTargetSize == pivotSize:
-          targetBeta[cnt2] = targData[cnt2]
-          interpGrid = pivotTarget
-        else:
-          interpFunction = interp1d(pivotTarget,targData[cnt2],kind='linear',fill_value='extrapolate')
-          interpGrid = 1/timeScalingRatio*pivotFeature
-          targetBeta[cnt2] = interpFunction(interpGrid)
-        targetOmega = np.gradient(targetBeta[cnt2],interpGrid)
-        #print("targetOmega:",targetOmega)
-        targetProcessTime = targetBeta[cnt2]/targetOmega
-        targetDiffOmega = np.gradient(targetOmega,interpGrid)
-        targetD[cnt2] = -targetBeta[cnt2]/targetOmega**2*targetDiffOmega
-        for cnt3 in range(zCount):
-          if np.isnan(targetD[cnt2][cnt3]) == True:
-            naNCount[cnt2][cnt3] = 1
-          elif np.isinf(targetD[cnt2][cnt3]) == True:
-            naNCount[cnt2][cnt3] = 1
-        targetInt = targetD[cnt2]+1
-        # Excluding NaN type data and exclude corresponding time in grid in
-        # preperation for numpy simpson integration
-        count=0
-        for i in range(len(targetD[cnt2])):
-          if np.isnan(targetD[cnt2][i])==False and np.isinf(targetD[cnt2][i])==False:
-            count += 1
-        if count > 0:
-          targetIntNew = np.zeros(count)
-          interpGridNew = np.zeros(count)
-          trackCount = 0
-          for i in range(len(targetD[cnt2])):
-            if np.isnan(targetD[cnt2][i])==False and np.isinf(targetD[cnt2][i])==False:
-              interpGridNew[trackCount] = interpGrid[i]
-              targetIntNew[trackCount] = targetInt[i]
-              trackCount += 1
-            else:
-              targetD[cnt2][i] = 0
-        #
-        targetProcessAction = simps(targetIntNew, interpGridNew)
-        targetProcessTimeNorm[cnt2] = targetProcessTime/targetProcessAction
-        targetOmegaNorm[cnt2] = targetProcessAction*targetOmega
+      if pivotTargetSize == pivotSize:
+        targetBeta = np.asarray(targData, dtype=float)[:yCount]
+        interpGrid = pivotTarget
+      else:
+        interpFunction = interp1d(pivotTarget,targData[:yCount],kind='linear',fill_value='extrapolate',axis=1)
+        interpGrid = 1/timeScalingRatio*pivotFeature
+        targetBeta = interpFunction(interpGrid)
+      targetOmega, targetProcessTime, targetD, targetInvalid, targetProcessAction = self._processQuantities(targetBeta, interpGrid)
+      targetProcessTimeNorm = targetProcessTime/targetProcessAction[:,np.newaxis]
+      targetOmegaNorm = targetProcessAction[:,np.newaxis]*targetOmega
+      naNCount = np.logical_or(featureInvalid, targetInvalid)
       #
-      featureProcessTimeNormScaled = np.zeros((yCount,zCount))
-      featureOmegaNormScaled = np.zeros((yCount,zCount))
-      for cnt3 in range(yCount):
-        featureProcessTimeNormScaled[cnt3] = featureProcessTimeNorm[cnt3]/timeScalingRatio
-        featureOmegaNormScaled[cnt3] = featureOmegaNorm[cnt3]/scaleRatioBeta
+      featureProcessTimeNormScaled = featureProcessTimeNorm/timeScalingRatio
+      featureOmegaNormScaled = featureOmegaNorm/scaleRatioBeta
       newfeatureData = np.asarray([featureOmegaNormScaled,featureProcessTimeNormScaled,featureBeta])
       newtargetData = np.asarray([targetOmegaNorm,targetD,targetBeta])
       #------------------------------------------------------------------------------------------
@@ -326,19 +254,11 @@ class PPDSS(ValidationBase):
       else:
         timeParameter = pivotFeature
       outputDict = {}
-      distanceTotal = np.zeros((yCount,zCount))
-      sigma = np.zeros((yCount,zCount))
       for metric in self.metrics:
         name = "{}_{}_{}".format(metric.estimator.name, targ.split("|")[-1], feat.split("|")[-1])
-      output = metric.evaluate((newfeatureData,newtargetData), multiOutput='raw_values')
-      for cnt2 in range(yCount):
-        distanceSum = abs(np.sum(output[cnt2]))
-        sigmaSum = 0
-        for cnt3 in range(zCount):
-          distanceTotal[cnt2][cnt3] = distanceSum
-          sigmaSum += output[cnt2][cnt3]**2
-        for cnt3 in range(zCount):
-          sigma[cnt2][cnt3] = (1/(zCount-np.sum(naNCount[cnt2]))*sigmaSum)**0.5
+      output = np.asarray(metric.evaluate((newfeatureData,newtargetData), multiOutput='raw_values'))
+      distanceTotal = np.repeat(np.abs(np.sum(output, axis=1))[:,np.newaxis], zCount, axis=1)
+      sigma = np.repeat(((1/(zCount-np.sum(naNCount, axis=1)))*np.sum(output**2, axis=1))[:,np.newaxis]**0.5, zCount, axis=1)
       rlz = []
       for cnt in range(yCount):
         outputDict = {}
@@ -364,6 +284,37 @@ class PPDSS(ValidationBase):
       realizations.append(out)
     return realizations
 
+  def _processQuantities(self, beta, grid):
+    """
+      Computes the DSS process quantities of a set of histories sharing the same time grid
+      @ In, beta, numpy.ndarray, (numHistories, numTimeSteps) values of the parameter of interest
+      @ In, grid, numpy.ndarray, (numTimeSteps) time grid
+      @ Out, omega, numpy.ndarray, (numHistories, numTimeSteps) agents of change
+      @ Out, processTime, numpy.ndarray, (numHistories, numTimeSteps) process time
+      @ Out, D, numpy.ndarray, (numHistories, numTimeSteps) temporal displacement rate, 0 where not finite
+      @ Out, invalid, numpy.ndarray, (numHistories, numTimeSteps) True where D is not finite
+      @ Out, processAction, numpy.ndarray, (numHistories) process action, integral of D+1 over the grid
+    """
+    with np.errstate(divide='ignore', invalid='ignore'):
+      omega = np.gradient(beta, grid, axis=1)
+      processTime = beta/omega
+      diffOmega = np.gradient(omega, grid, axis=1)
+      D = -beta/omega**2*diffOmega
+    invalid = ~np.isfinite(D)
+    hasValid = ~np.all(invalid, axis=1)
+    integrand = D + 1
+    processAction = np.full(beta.shape[0], np.nan)
+    # histories without invalid points are integrated together, the others exclude the invalid
+    # times from the grid before integrating
+    complete = ~np.any(invalid, axis=1)
+    if np.any(complete):
+      processAction[complete] = simps(integrand[complete], grid, axis=1)
+    for cnt in np.where(~complete & hasValid)[0]:
+      valid = ~invalid[cnt]
+      processAction[cnt] = simps(integrand[cnt][valid], grid[valid])
+    D[invalid & hasValid[:,np.newaxis]] = 0
+    return omega, processTime, D, invalid, processAction
+
   def _getDataFromDatasets(self, datasets, var, names=None):
     """
       Utility function to retrieve the data from dataDict
@@ -29,6 +29,7 @@ import numpy as np
 from scipy.special import comb
 from collections import deque, defaultdict
 import xarray as xr
+from scipy import spatial
 #External Modules End--------------------------------------------------------------------------------
 
 #Internal Modules------------------------------------------------------------------------------------
@@ -73,6 +74,13 @@ class GeneticAlgorithm(RavenSampled):
     self.fitness = None    # population fitness
     self.ahdp = np.NaN     # p-Average Hausdorff Distance between populations
     self.ahd  = np.NaN     # Hausdorff Distance between populations
+    self._surrogate = None          # ROM used to pre-screen the offspring, if any
+    self._screenFraction = 0.5      # fraction of the population size submitted to the model when pre-screening
+    self._retrainEvery = 1          # number of generations between retrainings of the surrogate
+    self._duplicateTol = 0.0        # distance below which an offspring duplicates an evaluated chromosome
+    self._screeningRequested = False # True if the user provided the prescreening node
+    self._evaluated = None          # chromosomes evaluated by the model so far (when pre-screening)
+    self.addAssemblerObject('ROM', InputData.Quantity.zero_to_one)
 
   ##########################
   # Initialization Methods #
@@ -248,6 +256,36 @@ class GeneticAlgorithm(RavenSampled):
         descr=r"""provides the number of consecutive times convergence should be reached before a trajectory
               is considered fully converged. This helps in preventing early false convergence."""))
     specs.addSub(conv)
+
+    # surrogate-assisted pre-screening
+    screening = InputData.parameterInputFactory('prescreening', strictMode=True,
+        printPriority=110,
+        descr=r"""a node containing the settings for the surrogate-assisted pre-screening of the offspring.
+              Pre-screening is active when a \xmlNode{ROM} is provided to the optimizer. The ROM is trained
+              on all the chromosomes evaluated so far, and at each generation it predicts the objective (and
+              the outputs needed by the implicit constraints) of the candidate offspring; only the offspring
+              with the highest predicted fitness are submitted to the Model. Offspring duplicating an
+              already-evaluated chromosome are never submitted, unless too few candidates are left.""")
+    screening.addSub(InputData.parameterInputFactory('fraction', contentType=InputTypes.FloatType,
+        printPriority=110,
+        descr=r"""fraction of the population size to be submitted to the Model at each generation,
+              in (0, 1]. At least two offspring are always submitted. \default{0.5}"""))
+    screening.addSub(InputData.parameterInputFactory('retrainEvery', contentType=InputTypes.IntegerType,
+        printPriority=110,
+        descr=r"""number of generations between retrainings of the ROM on the evaluated chromosomes.
+              \default{1}"""))
+    screening.addSub(InputData.parameterInputFactory('duplicateTolerance', contentType=InputTypes.FloatType,
+        printPriority=110,
+        descr=r"""largest difference in any gene for which an offspring is considered a duplicate
+              of an already-evaluated chromosome. \default{0.0}"""))
+    specs.addSub(screening)
+
+    specs.addSub(InputData.assemblyInputFactory('ROM', contentType=InputTypes.StringType, strictMode=True,
+        printPriority=176,
+        descr=r"""name of a ROM used as a surrogate of the Model to pre-screen the offspring (see
+              \xmlNode{prescreening}). From a practical point of view, this XML node must contain the
+              name of a ROM defined in the \xmlNode{Models} block, whose features are the optimization
+              variables (and constants, if any) and whose targets include the objective variable."""))
     return specs
 
   @classmethod
@@ -341,6 +379,23 @@ class GeneticAlgorithm(RavenSampled):
       self.raiseADebug('No persistence given; setting to 1.')
       self._requiredPersistence = 1
 
+    # surrogate-assisted pre-screening
+    screeningNode = paramInput.findFirst('prescreening')
+    if screeningNode is not None:
+      self._screeningRequested = True
+      for sub in screeningNode.subparts:
+        if sub.getName() == 'fraction':
+          self._screenFraction = sub.value
+        elif sub.getName() == 'retrainEvery':
+          self._retrainEvery = sub.value
+        elif sub.getName() == 'duplicateTolerance':
+          self._duplicateTol = sub.value
+      if not 0 < self._screenFraction <= 1:
+        self.raiseAnError(IOError, 'The pre-screening <fraction> must be in (0, 1], got {}'.format(self._screenFraction))
+      if self._retrainEvery < 1:
+        self.raiseAnError(IOError, 'The pre-screening <retrainEvery> must be a positive integer, got {}'.format(self._retrainEvery))
+      if self._duplicateTol < 0:
+        self.raiseAnError(IOError, 'The pre-screening <duplicateTolerance> must be non-negative, got {}'.format(self._duplicateTol))
 
   def initialize(self, externalSeeding=None, solutionExport=None):
     """
@@ -354,6 +409,11 @@ class GeneticAlgorithm(RavenSampled):
     meta = ['batchId']
     self.addMetaKeys(meta)
     self.batch = self._populationSize
+    if self.assemblerDict.get('ROM', False):
+      self._surrogate = self.assemblerDict['ROM'][0][3]
+      self._evaluated = None
+    elif self._screeningRequested:
+      self.raiseAnError(IOError, 'The <prescreening> node requires a <ROM> to be provided to the optimizer "{}"!'.format(self.name))
     if self._populationSize != len(self._initialValues):
       self.raiseAnError(IOError, 'Number of initial values provided for each variable is {}, while the population size is {}'.format(len(self._initialValues),self._populationSize,self._populationSize))
     for _, init in enumerate(self._initialValues):
@@ -423,27 +483,7 @@ class GeneticAlgorithm(RavenSampled):
         constraintData[p] = list(np.atleast_1d(rlz[p].data))
     # Compute constraint function g_j(x) for all constraints (j = 1 .. J)
     # and all x's (individuals) in the population
-    g0 = np.zeros((np.shape(offSprings)[0],len(self._constraintFunctions)+len(self._impConstraintFunctions)))
-
-    g = xr.DataArray(g0,
-                     dims=['chromosome','Constraint'],
-                     coords={'chromosome':np.arange(np.shape(offSprings)[0]),
-                             'Constraint':[y.name for y in (self._constraintFunctions + self._impConstraintFunctions)]})
-    ## FIXME The constraint handling is following the structure of the RavenSampled.py,
-    #        there are many utility functions that can be simplified and/or merged together
-    #        _check, _handle, and _apply, for explicit and implicit constraints.
-    #        This can be simplified in the near future in GradientDescent, SimulatedAnnealing, and here in GA
-    for index,individual in enumerate(offSprings):
-      newOpt = individual
-      opt = {self._objectiveVar:objectiveVal[index]}
-      for p,v in constraintData.items():
-        opt[p] = v[index]
-
-      for constIndex,constraint in enumerate(self._constraintFunctions + self._impConstraintFunctions):
-        if constraint in self._constraintFunctions:
-          g.data[index, constIndex] = self._handleExplicitConstraints(newOpt, constraint)
-        else:
-          g.data[index, constIndex] = self._handleImplicitConstraints(newOpt, opt, constraint)
+    g = self._computeConstraints(offSprings, objectiveVal, constraintData, self._constraintFunctions + self._impConstraintFunctions)
 
     offSpringFitness = self._fitnessInstance(rlz,
                                              objVar = self._objectiveVar,
@@ -473,6 +513,9 @@ class GeneticAlgorithm(RavenSampled):
         self.fitness = offSpringFitness
         self.objectiveVal = rlz[self._objectiveVar].data
 
+      if self._surrogate is not None:
+        self._updateSurrogate(traj, offSprings)
+
       # 1 @ n: Parent selection from population
       # pair parents together by indexes
       parents = self._parentSelectionInstance(self.population,
@@ -529,8 +572,13 @@ class GeneticAlgorithm(RavenSampled):
             children = children.drop_sel(chromosome=repeated)
         else:
           flag = False
-      # keeping the population size constant by ignoring the excessive children
-      children = children[:self._populationSize,:]
+      if self._surrogate is not None and self._surrogate.amITrained:
+        # only submit the offspring the surrogate deems most promising
+        children = self._screenOffsprings(children)
+      else:
+        # keeping the population size constant by ignoring the excessive children
+        children = children[:self._populationSize,:]
+      self.batch = np.shape(children)[0]
 
       daChildren = xr.DataArray(children,
                               dims=['chromosome','Gene'],
@@ -545,6 +593,91 @@ class GeneticAlgorithm(RavenSampled):
           newRlz[var] = float(daChildren.loc[i,var].values)
         self._submitRun(newRlz, traj, self.getIteration(traj))
 
+  def _computeConstraints(self, offSprings, objectiveVal, constraintData, constraints):
+    """
+      Computes the constraint functions g_j(x) for the given constraints and chromosomes
+      @ In, offSprings, xr.DataArray, chromosomes (chromosome x Gene)
+      @ In, objectiveVal, list, objective values at each chromosome
+      @ In, constraintData, dict, {param: list} values of the additional parameters needed by the constraints
+      @ In, constraints, list, explicit and implicit constraint functions to evaluate
+      @ Out, g, xr.DataArray, constraint function values (chromosome x Constraint)
+    """
+    g0 = np.zeros((np.shape(offSprings)[0],len(constraints)))
+
+    g = xr.DataArray(g0,
+                     dims=['chromosome','Constraint'],
+                     coords={'chromosome':np.arange(np.shape(offSprings)[0]),
+                             'Constraint':[y.name for y in constraints]})
+    ## FIXME The constraint handling is following the structure of the RavenSampled.py,
+    #        there are many utility functions that can be simplified and/or merged together
+    #        _check, _handle, and _apply, for explicit and implicit constraints.
+    #        This can be simplified in the near future in GradientDescent, SimulatedAnnealing, and here in GA
+    for index,individual in enumerate(offSprings):
+      newOpt = individual
+      opt = {self._objectiveVar:objectiveVal[index]}
+      for p,v in constraintData.items():
+        opt[p] = v[index]
+
+      for constIndex,constraint in enumerate(constraints):
+        if constraint in self._constraintFunctions:
+          g.data[index, constIndex] = self._handleExplicitConstraints(newOpt, constraint)
+        else:
+          g.data[index, constIndex] = self._handleImplicitConstraints(newOpt, opt, constraint)
+    return g
+
+  def _updateSurrogate(self, traj, offSprings):
+    """
+      Stores the newly evaluated chromosomes and retrains the pre-screening surrogate when due
+      @ In, traj, int, trajectory identifier
+      @ In, offSprings, xr.DataArray, chromosomes evaluated in this generation
+      @ Out, None
+    """
+    evaluated = np.atleast_2d(offSprings.data)
+    self._evaluated = evaluated if self._evaluated is None else np.vstack((self._evaluated, evaluated))
+    # the iterations are 0-based, so the surrogate is first trained on the initial population
+    if self.getIteration(traj) % self._retrainEvery == 0:
+      self.raiseADebug('Retraining pre-screening surrogate "{}" on {} evaluated chromosomes'.format(self._surrogate.name, len(self._evaluated)))
+      self._surrogate.train(self._targetEvaluation)
+
+  def _screenOffsprings(self, children):
+    """
+      Ranks the candidate offspring by the fitness predicted by the surrogate, and keeps the most promising ones
+      @ In, children, xr.DataArray, candidate offspring (chromosome x Gene)
+      @ Out, children, xr.DataArray, offspring to submit to the Model, most promising first
+    """
+    nChildren = np.shape(children)[0]
+    nSubmit = min(nChildren, max(2, int(np.ceil(self._screenFraction * self._populationSize))))
+    # duplicates of evaluated chromosomes (or of other candidates) would only repeat a Model evaluation
+    distance, _ = spatial.cKDTree(self._evaluated).query(children.data, p=np.inf)
+    duplicate = distance <= self._duplicateTol
+    _, first = np.unique(children.data, axis=0, return_index=True)
+    duplicate[np.setdiff1d(np.arange(nChildren), first)] = True
+    # predicted objective and constraints
+    request = dict((var, children.data[:, v]) for v, var in enumerate(self.toBeSampled))
+    for var, value in self.constants.items():
+      request[var] = np.full(nChildren, value)
+    prediction = self._surrogate.evaluate(request)
+    if self._objectiveVar not in prediction:
+      self.raiseAnError(IOError, 'The pre-screening ROM "{}" must have the objective "{}" among its targets!'.format(self._surrogate.name, self._objectiveVar))
+    objectiveVal = np.atleast_1d(prediction[self._objectiveVar]) * (-1 if self._minMax == 'max' else 1)
+    # implicit constraints can only be screened if the surrogate predicts all their parameters
+    known = set(self.toBeSampled) | set(self.constants) | set(prediction)
+    constraints = self._constraintFunctions + [y for y in self._impConstraintFunctions if set(y.parameterNames()) <= known]
+    constraintData = dict((p, list(np.atleast_1d(v))) for p, v in prediction.items() if p != self._objectiveVar)
+    g = self._computeConstraints(children, list(objectiveVal), constraintData, constraints)
+    predicted = xr.Dataset({self._objectiveVar: xr.DataArray(objectiveVal, dims=['RAVEN_sample_ID'])})
+    fitness = self._fitnessInstance(predicted,
+                                    objVar = self._objectiveVar,
+                                    a = self._objCoeff,
+                                    b = self._penaltyCoeff,
+                                    penalty = None,
+                                    constraintFunction=g,
+                                    type=self._minMax)
+    # non-duplicates first, then by decreasing predicted fitness
+    order = np.lexsort((-np.atleast_1d(fitness.data), duplicate))[:nSubmit]
+    self.raiseADebug('Pre-screening: submitting {} of {} offspring ({} duplicates)'.format(nSubmit, nChildren, int(duplicate.sum())))
+    return children[order,:]
+
   def _submitRun(self, point, traj, step, moreInfo=None):
     """
       Submits a single run with associated info to the submission queue
@@ -204,6 +204,7 @@ class GradientDescent(RavenSampled):
     self._stepHistory = {}         # {'magnitude': size, 'versor': direction, 'info': dict} for step
     self._acceptHistory = {}       # acceptability
     self._stepRecommendations = {} # by traj, if a 'cut' or 'grow' is recommended else None
+    self._candidateTracker = {}    # by traj, {candidate: {'opt': (rlz, info), 'grads': [(rlz, info)]}} for speculative steps
     self._acceptRerun = {}         # by traj, if True then override accept for point rerun
     self._convergenceCriteria = defaultdict(mathUtils.giveZero) # names and values for convergence checks
     self._convergenceInfo = {}       # by traj, the persistence and convergence information for most recent opt
@@ -337,13 +338,26 @@ class GradientDescent(RavenSampled):
       @ Out, None
     """
     traj = info['traj']
-    optVal = rlz[self._objectiveVar]
-    info['optVal'] = optVal
-    purpose = info['purpose']
-    if purpose.startswith('opt'):
+    if not info.get('reused', False):
+      self._gradientInstance.recordRealization(rlz, self._objectiveVar)
+    if 'candidate' in info:
+      # speculative step: wait for all the candidates, then continue from the chosen one
+      chosen = self._resolveCandidate(traj, rlz, info)
+      if chosen is None:
+        return
+      rlz, info, grads = chosen
+      optVal = rlz[self._objectiveVar]
+      info['optVal'] = optVal
       self._resolveNewOptPoint(traj, rlz, optVal, info)
-    elif purpose.startswith('grad'):
-      self._resolveNewGradPoint(traj, rlz, optVal, info)
+      self._stepTracker[traj]['grads'].extend(grads)
+    else:
+      optVal = rlz[self._objectiveVar]
+      info['optVal'] = optVal
+      purpose = info['purpose']
+      if purpose.startswith('opt'):
+        self._resolveNewOptPoint(traj, rlz, optVal, info)
+      elif purpose.startswith('grad'):
+        self._resolveNewGradPoint(traj, rlz, optVal, info)
     if self._checkStepReady(traj):
       # get new gradient
       self.raiseADebug('Opt point accepted and gradient points collected, searching new opt point ...')
@@ -369,15 +383,23 @@ class GradientDescent(RavenSampled):
         self._closeTrajectory(traj, 'converge', 'converged', optVal)
         return
       self.raiseADebug(' ... found new proposed opt point ...')
+      # speculative step manipulators propose several candidate opt points at once
+      candidates = newOpt if isinstance(newOpt, list) else [newOpt]
       # check new opt point against constraints
-      try:
-        suggested, modded = self._handleExplicitConstraints(newOpt, opt, 'opt')
-      except NoConstraintResolutionFound:
+      suggestions = []
+      for candidate in candidates:
+        try:
+          suggested, modded = self._handleExplicitConstraints(candidate, opt, 'opt')
+        except NoConstraintResolutionFound:
+          continue
+        suggestions.append(suggested)
+      if not suggestions:
         # we've tried everything, but we just can't hack it
         self.raiseAMessage('Optimizer "{}" trajectory {} was unable to continue due to functional or boundary constraints.'
                            .format(self.name, traj))
         self._closeTrajectory(traj, 'converge', 'no constraint resolution', opt[self._objectiveVar])
         return
+      suggested = suggestions[0]
       # update values if modified by constraint handling
       deltas = dict((var, suggested[var] - opt[var]) for var in self.toBeSampled)
       actualStepSize, stepVersor, _ = mathUtils.calculateMagnitudeAndVersor(np.array(list(deltas.values())))
@@ -400,7 +422,13 @@ class GradientDescent(RavenSampled):
       self.raiseADebug(' ... current opt point:', self.denormalizeData(opt))
       self.raiseADebug(' ... new optimum candidate:', self.denormalizeData(suggested))
       # initialize step
-      self._submitOptAndGrads(suggested, traj, self.getIteration(traj), self._stepHistory[traj][-1]['magnitude'])
+      if isinstance(newOpt, list):
+        self.raiseADebug(' ... submitting {} candidate opt points ...'.format(len(suggestions)))
+        for c, candidate in enumerate(suggestions):
+          self._submitOptAndGrads(candidate, traj, self.getIteration(traj), self._stepHistory[traj][-1]['magnitude'],
+                                  moreInfo={'candidate': c, 'candidates': len(suggestions)})
+      else:
+        self._submitOptAndGrads(suggested, traj, self.getIteration(traj), self._stepHistory[traj][-1]['magnitude'])
     # otherwise, continue submitting and collecting
 
   ###################
@@ -445,6 +473,7 @@ class GradientDescent(RavenSampled):
     self._stepHistory[traj] = deque(maxlen=self._maxHistLen)
     self._acceptHistory[traj] = deque(maxlen=self._maxHistLen)
     self._stepRecommendations[traj] = None
+    self._candidateTracker[traj] = {}
     self._acceptRerun[traj] = False
     self._convergenceInfo[traj] = {'persistence': 0}
     for criteria in self._convergenceCriteria:
@@ -461,6 +490,36 @@ class GradientDescent(RavenSampled):
     """
     self._stepTracker[traj]['grads'].append((rlz, info))
 
+  def _resolveCandidate(self, traj, rlz, info):
+    """
+      Collects a realization of a speculative candidate opt point (or of its gradient points);
+      once all the candidates are collected, the step manipulator chooses one of them.
+      @ In, traj, int, trajectory for this new point
+      @ In, rlz, dict, realized realization
+      @ In, info, dict, identifying information about the realization
+      @ Out, chosen, tuple, (rlz, info, grads) for the chosen candidate opt point, or None if still collecting
+    """
+    tracker = self._candidateTracker[traj]
+    candidate = tracker.setdefault(info['candidate'], {'opt': None, 'grads': []})
+    if info['purpose'].startswith('opt'):
+      candidate['opt'] = (rlz, info)
+    else:
+      candidate['grads'].append((rlz, info))
+    numGrads = self._gradientInstance.numGradPoints()
+    if len(tracker) < info['candidates'] or any(c['opt'] is None or len(c['grads']) < numGrads for c in tracker.values()):
+      return None
+    evaluated = []
+    for c in range(info['candidates']):
+      opt, _ = tracker[c]['opt']
+      grads, gradInfos = zip(*tracker[c]['grads'])
+      gradMag, gradVersor, _ = self._gradientInstance.evaluate(opt, grads, gradInfos, self._objectiveVar)
+      evaluated.append((opt, gradMag, gradVersor))
+    choice = self._stepInstance.chooseCandidate(evaluated, self._objectiveVar, self._stepHistory[traj][-1]['info'])
+    self.raiseADebug(' ... chose candidate {} of {}'.format(choice, info['candidates']))
+    self._candidateTracker[traj] = {}
+    rlz, info = tracker[choice]['opt']
+    return rlz, info, tracker[choice]['grads']
+
   # * * * * * * * * * * * * * * * *
   # Resolving potential opt points
   def _applyFunctionalConstraints(self, suggested, previous):
@@ -508,19 +567,20 @@ class GradientDescent(RavenSampled):
 
   # * * * * * * * * * * * * * * * *
   # Queuing Runs
-  def _submitOptAndGrads(self, opt, traj, step, stepSize):
+  def _submitOptAndGrads(self, opt, traj, step, stepSize, moreInfo=None):
     """
       Submits a set of opt + grad points to the submission queue
       @ In, opt, dict, suggested opt point to evaluate
       @ In, traj, int, trajectory identifier
       @ In, step, int, iteration number identifier
       @ In, stepSize, float, nominal step size to use
+      @ In, moreInfo, dict, optional, additional run-identifying information for the opt and grad points
       @ Out, None
     """
     ### OPT POINT
     # submit opt point
     self.raiseADebug('* Submitting new opt and grad points *')
-    self._submitRun(opt, traj, step, 'opt')
+    self._submitRun(opt, traj, step, 'opt', moreInfo=moreInfo)
     # GRAD POINTS
     # collect grad points
     # HACK FIXME TODO adding constraints too
@@ -531,7 +591,16 @@ class GradientDescent(RavenSampled):
     constraints = {'boundary': self.distDict, 'functional': self._constraintFunctions, 'inputs': copy.deepcopy(self.constants), 'normalize': self.normalizeData, 'denormalize': self.denormalizeData}
     gradPoints, gradInfos = self._gradientInstance.chooseEvaluationPoints(opt, stepSize, constraints=constraints)
     for i, grad in enumerate(gradPoints):
-      self._submitRun(grad, traj, step, 'grad_{}'.format(i), moreInfo=gradInfos[i])
+      gradInfo = dict(gradInfos[i])
+      if moreInfo is not None:
+        gradInfo.update(moreInfo)
+      if gradInfo.get('reused', False):
+        # the gradient approximator provided an existing realization, so there is nothing to run
+        gradInfo.update({'traj': traj, 'step': step, 'purpose': 'grad_{}'.format(i)})
+        self.raiseADebug('Reusing realization as grad point: {} | {}'.format(self.denormalizeData(grad), gradInfo))
+        self._useRealization(gradInfo, grad)
+      else:
+        self._submitRun(grad, traj, step, 'grad_{}'.format(i), moreInfo=gradInfo)
 
   def _submitRun(self, point, traj, step, purpose, moreInfo=None):
     """
@@ -148,6 +148,15 @@ class SimulatedAnnealing(RavenSampled):
       for par,descr in param.items():
         sch.addSub(InputData.parameterInputFactory(par, contentType = InputTypes.FloatType,descr=descr))
       coolingSchedule.addSub(sch)
+
+    # population of candidates
+    specs.addSub(InputData.parameterInputFactory('candidates', contentType=InputTypes.IntegerType,
+        printPriority=109,
+        descr=r"""number of neighbours proposed, and evaluated concurrently, at each iteration of each trajectory.
+              Once all of them are collected, the best candidate is considered for the Metropolis acceptance
+              criterion (best-of-batch). Note that each candidate is a Model evaluation, thus the cooling
+              schedule progress ($\frac{iter}{\xmlNode{limit}}$) is multiplied by the number of candidates.
+              \default{1}"""))
     return specs
 
   @classmethod
@@ -187,6 +196,8 @@ class SimulatedAnnealing(RavenSampled):
     self.T = None                                               # current temperature
     self._coolingMethod = None                                  # initializing cooling method
     self._coolingParameters = {}                                # initializing the cooling schedule parameters
+    self._numCandidates = 1                                     # neighbours proposed (and evaluated concurrently) at each iteration
+    self._candidates = {}                                       # by traj, the collected candidates (info, rlz) of the current iteration
 
   def handleInput(self, paramInput):
     """
@@ -224,6 +235,13 @@ class SimulatedAnnealing(RavenSampled):
         for subSub in sub.subparts:
           self._coolingParameters = {subSub.name:subSub.value}
 
+    # population of candidates
+    candidatesNode = paramInput.findFirst('candidates')
+    if candidatesNode is not None:
+      self._numCandidates = candidatesNode.value
+      if self._numCandidates < 1:
+        self.raiseAnError(IOError, '<candidates> must be a positive integer! Got "{}"'.format(self._numCandidates))
+
     #defaults
     if not self._coolingMethod:
       self._coolingMethod = 'exponential'
@@ -259,6 +277,7 @@ class SimulatedAnnealing(RavenSampled):
     traj = RavenSampled.initializeTrajectory(self)
     self._acceptHistory[traj] = deque(maxlen=self._maxHistLen)
     self._acceptRerun[traj] = False
+    self._candidates[traj] = []
     self._convergenceInfo[traj] = {'persistence': 0}
     for criteria in self._convergenceCriteria:
       self._convergenceInfo[traj][criteria] = False
@@ -297,6 +316,14 @@ class SimulatedAnnealing(RavenSampled):
       @ Out, None
     """
     traj = info['traj']
+    if 'candidate' in info:
+      # population mode: wait for all the neighbours proposed at this iteration, then keep the best one
+      self._candidates[traj].append((info, rlz))
+      if len(self._candidates[traj]) < info['candidates']:
+        return
+      info, rlz = min(self._candidates[traj], key=lambda candidate: candidate[1][self._objectiveVar])
+      self._candidates[traj] = []
+      self.info.update(info['neighbour'])
     info['optVal'] = rlz[self._objectiveVar]
     self.incrementIteration(traj)
     self._resolveNewOptPoint(traj, rlz, rlz[self._objectiveVar], info)
@@ -307,11 +334,13 @@ class SimulatedAnnealing(RavenSampled):
       info['step'] = self.getIteration(traj)
       optVal = rlz[self._objectiveVar]
     iter = int(self.getIteration(traj) +1) # Is that ok or should we always keep the traj in case I have multiple trajectories in parallel?
-    fraction = iter/self.limit
+    fraction = iter*self._numCandidates/self.limit
     currentPoint = self._collectOptPoint(rlz)
     T0 = self._temperature(fraction)
     self.T = self._coolingSchedule(iter,T0)
-    if traj in self._activeTraj:
+    if traj in self._activeTraj and self._numCandidates > 1:
+      self._submitCandidates(traj, rlz, currentPoint, fraction)
+    elif traj in self._activeTraj:
       newPoint = self._nextNeighbour(rlz,fraction)
       # check new opt point against constraints
       try:
@@ -324,6 +353,33 @@ class SimulatedAnnealing(RavenSampled):
         return
       self._submitRun(suggested, traj, self.getIteration(traj))
 
+  def _submitCandidates(self, traj, rlz, currentPoint, fraction):
+    """
+      Proposes and submits the neighbours (candidates) of the current state for the next iteration
+      @ In, traj, int, trajectory identifier
+      @ In, rlz, dict, current realization
+      @ In, currentPoint, dict, current point (input space)
+      @ In, fraction, float, the current iteration divided by the iteration limit
+      @ Out, None
+    """
+    candidates = []
+    for _ in range(self._numCandidates):
+      newPoint = self._nextNeighbour(rlz,fraction)
+      try:
+        suggested, _ = self._handleExplicitConstraints(newPoint, currentPoint, 'opt')
+      except NoConstraintResolutionFound:
+        continue
+      candidates.append((suggested, dict(self.info)))
+    if not candidates:
+      # we've tried everything, but we just can't hack it
+      self.raiseAMessage('Optimizer "{}" trajectory {} was unable to continue due to functional or boundary constraints.'
+                        .format(self.name, traj))
+      self._closeTrajectory(traj, 'converge', 'no constraint resolution', rlz[self._objectiveVar])
+      return
+    for c, (suggested, neighbour) in enumerate(candidates):
+      self._submitRun(suggested, traj, self.getIteration(traj),
+                      moreInfo={'candidate': c, 'candidates': len(candidates), 'neighbour': neighbour})
+
   # * * * * * * * * * * * * * * * *
   # Convergence Checks
   convFormat = RavenSampled.convFormat
@@ -514,7 +570,7 @@ class SimulatedAnnealing(RavenSampled):
     """
     # meta variables
     toAdd = {'Temp': self.T,
-                'fraction': self.getIteration(traj)/self.limit
+                'fraction': self.getIteration(traj)*self._numCandidates/self.limit
                 }
 
     for var in self.toBeSampled:
@@ -23,6 +23,7 @@ from .GradientApproximater import GradientApproximater
 from .FiniteDifference import FiniteDifference
 from .CentralDifference import CentralDifference
 from .SPSA import SPSA
+from .LocalRegression import LocalRegression
 
 factory = EntityFactory('Gradient')
 factory.registerAllSubtypes(GradientApproximater)
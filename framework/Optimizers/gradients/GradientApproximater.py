@@ -102,6 +102,16 @@ class GradientApproximater(utils.metaclass_insert(abc.ABCMeta, object)):
       @ Out, evalInfo, list(dict), identifying information about points
     """
 
+  def recordRealization(self, rlz, objVar):
+    """
+      Collects a realization evaluated by the optimizer, for approximators that reuse them.
+      @ In, rlz, dict, collected realization (normalized)
+      @ In, objVar, string, objective variable
+      @ Out, None
+    """
+    # overload in inheriting classes at will
+    pass
+
   @abc.abstractmethod
   def numGradPoints(self):
     """
@@ -0,0 +1,341 @@
+# Copyright 2017 Battelle Energy Alliance, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+  Implementation of LocalRegression gradient approximation, reusing previously evaluated points
+"""
+import numpy as np
+from scipy import spatial
+
+from utils import InputData, InputTypes, randomUtils, mathUtils
+from .GradientApproximater import GradientApproximater
+
+class LocalRegression(GradientApproximater):
+  """
+    Approximates gradients by fitting a local model to the evaluated points around the opt point,
+    requesting new perturbation points only in the directions existing points do not cover
+  """
+  ##########################
+  # Initialization Methods #
+  ##########################
+  @classmethod
+  def getInputSpecification(cls):
+    """
+      Method to get a reference to a class that specifies the input data for class cls.
+      @ In, cls, the class for which we are retrieving the specification
+      @ Out, specs, InputData.ParameterInput, class to use for specifying input of cls.
+    """
+    specs = super(LocalRegression, cls).getInputSpecification()
+    specs.description = r"""if node is present, indicates that gradient approximation should be performed
+        by fitting a local model to the realizations surrounding the opt point. All the realizations
+        collected by the optimizer (previous opt points, gradient points of previous iterations, rejected
+        opt points, and points of other trajectories) are kept and indexed spatially. When the gradient at
+        a new opt point is needed, the existing realizations within \xmlNode{neighborhoodScalar} times the
+        perturbation distance are reused as gradient points, as long as each of them covers a new direction
+        of the input space. New perturbation points, as in FiniteDifference, are only requested for the
+        $M < N$ directions that are not covered, so that $N-M$ model evaluations are saved with respect to
+        FiniteDifference, where $N$ is the dimensionality of the input space. This is particularly useful
+        for expensive models, for instance when an opt point is rerun after a rejected step, since the
+        gradient points around it are reused entirely. The gradient is then obtained as the least squares
+        fit of the local model to all the realizations in the neighborhood. With no realizations nearby,
+        this is equivalent to FiniteDifference."""
+    modelEnum = InputTypes.makeEnumType('LocalRegressionModel', 'LocalRegressionModelType', ['linear', 'quadratic'])
+    specs.addSub(InputData.parameterInputFactory('model', contentType=modelEnum,
+        descr=r"""the local model to fit to the realizations in the neighborhood of the opt point. A
+        \xmlString{linear} model is fit through the opt point. A \xmlString{quadratic} model adds a
+        (diagonal) curvature term for each input, which reduces the truncation error when the realizations
+        surround the opt point; it is only used if enough realizations are available to determine it,
+        otherwise the \xmlString{linear} model is used. \default{linear}"""))
+    specs.addSub(InputData.parameterInputFactory('neighborhoodScalar', contentType=InputTypes.FloatType,
+        descr=r"""the radius of the neighborhood of the opt point in which existing realizations are
+        reused, as a multiple of the perturbation distance (see \xmlNode{gradDistanceScalar}). Larger
+        values save more model evaluations, at the cost of a larger truncation error. \default{2.0}"""))
+    specs.addSub(InputData.parameterInputFactory('coverage', contentType=InputTypes.FloatType,
+        descr=r"""the minimum sine of the angle between the displacement of an existing realization from
+        the opt point and the directions already covered by other realizations for it to be reused. Values
+        close to 1 only reuse realizations orthogonal to each other, values close to 0 accept realizations
+        nearly aligned with each other, which give poorly conditioned fits. \default{0.5}"""))
+    return specs
+
+  def __init__(self):
+    """
+      Constructor.
+      @ In, None
+      @ Out, None
+    """
+    GradientApproximater.__init__(self)
+    ## Instance Variable Initialization
+    # public
+    # _protected
+    self._model = 'linear'    # local model to fit, linear or quadratic
+    self._radius = 2.0        # neighborhood radius, as multiple of the perturbation distance
+    self._coverage = 0.5      # minimum sine of the angle from covered directions to reuse a point
+    self._minDistance = 0.1   # minimum distance of reused points, as fraction of the perturbation distance
+    self._points = []         # normalized coordinates of the recorded realizations
+    self._archive = []        # recorded realizations (opt variables and objective only)
+    self._tree = None         # spatial index of self._points, rebuilt after new records
+    # __private
+    # additional methods
+
+  def handleInput(self, specs):
+    """
+      Read input specs
+      @ In, specs, InputData.ParameterInput, parameter specs interpreted
+      @ Out, None
+    """
+    GradientApproximater.handleInput(self, specs)
+    model = specs.findFirst('model')
+    if model is not None:
+      self._model = model.value
+    radius = specs.findFirst('neighborhoodScalar')
+    if radius is not None:
+      self._radius = radius.value
+      if self._radius <= 0:
+        raise IOError('LocalRegression <neighborhoodScalar> must be positive! Got: {}'.format(self._radius))
+    coverage = specs.findFirst('coverage')
+    if coverage is not None:
+      self._coverage = coverage.value
+      if not 0 < self._coverage <= 1:
+        raise IOError('LocalRegression <coverage> must be in (0, 1]! Got: {}'.format(self._coverage))
+
+  def initialize(self, optVars):
+    """
+      After construction, finishes initialization of this approximator.
+      @ In, optVars, list(str), list of optimization variable names
+      @ Out, None
+    """
+    GradientApproximater.initialize(self, optVars)
+    self._points = []
+    self._archive = []
+    self._tree = None
+
+  ###############
+  # Run Methods #
+  ###############
+  def recordRealization(self, rlz, objVar):
+    """
+      Stores a collected realization, to be reused in later gradient evaluations.
+      @ In, rlz, dict, collected realization (normalized)
+      @ In, objVar, string, objective variable
+      @ Out, None
+    """
+    value = np.atleast_1d(rlz[objVar])[0]
+    if not np.isfinite(value):
+      return
+    record = dict((var, np.atleast_1d(rlz[var])[0]) for var in self._optVars)
+    record[objVar] = value
+    self._points.append(self._coordinates(record))
+    self._archive.append(record)
+    self._tree = None
+
+  def chooseEvaluationPoints(self, opt, stepSize, constraints=None):
+    """
+      Determines new point(s) needed to evaluate gradient
+      @ In, opt, dict, current opt point (normalized)
+      @ In, stepSize, float, distance from opt point to sample neighbors
+      @ In, constraints, dict, optional, boundary and functional constraints to respect when
+                                         choosing new sampling points
+      @ Out, evalPoints, list(dict), list of points that need sampling (or reused realizations)
+      @ Out, evalInfo, list(dict), identifying information about points
+    """
+    dh = self._proximity * stepSize
+    center = self._coordinates(opt)
+    evalPoints = []
+    evalInfo = []
+    # reuse existing realizations, closest first, as long as they cover new directions
+    covered = [] # orthonormal basis of the covered directions
+    for idx in self._neighbors(center, self._minDistance * dh, self._radius * dh):
+      if len(covered) == self.N:
+        break
+      displacement = self._points[idx] - center
+      residual = self._orthogonalResidual(displacement, covered)
+      residualMag = np.linalg.norm(residual)
+      if residualMag < self._coverage * np.linalg.norm(displacement):
+        continue
+      covered.append(residual / residualMag)
+      evalPoints.append(dict(self._archive[idx]))
+      evalInfo.append({'type': 'grad',
+                       'reused': True})
+    # perturb the opt point in the remaining directions
+    directions = np.atleast_1d(randomUtils.random(self.N) < 0.5) * 2 - 1
+    for d, direction in enumerate(self._uncoveredDirections(covered)):
+      delta = dh * directions[d] * direction # note this is NORMALIZED space delta
+      new = dict(opt)
+      new.update((var, center[v] + delta[v]) for v, var in enumerate(self._optVars))
+      # constraint handling
+      if constraints is not None:
+        new = self._handleConstraints(new, opt, delta, constraints)
+      evalPoints.append(new)
+      evalInfo.append({'type': 'grad',
+                       'reused': False})
+    return evalPoints, evalInfo
+
+  def evaluate(self, opt, grads, infos, objVar):
+    """
+      Approximates gradient based on evaluated points.
+      @ In, opt, dict, current opt point (normalized)
+      @ In, grads, list(dict), evaluated neighbor points
+      @ In, infos, list(dict), info about evaluated neighbor points
+      @ In, objVar, string, objective variable
+      @ Out, magnitude, float, magnitude of gradient
+      @ Out, direction, dict, versor (unit vector) for gradient direction
+      @ Out, foundInf, bool, if True then infinity calculations were used
+    """
+    center = self._coordinates(opt)
+    optVal = np.atleast_1d(opt[objVar])[0]
+    displacements = [self._coordinates(pt) - center for pt in grads]
+    values = [np.atleast_1d(pt[objVar])[0] for pt in grads]
+    # fit over all the recorded realizations in the neighborhood spanned by the grad points
+    distances = np.linalg.norm(displacements, axis=1)
+    known = set(tuple(self._coordinates(pt)) for pt in grads)
+    for idx in self._neighbors(center, self._minDistance * distances.min(), distances.max()):
+      if tuple(self._points[idx]) not in known:
+        known.add(tuple(self._points[idx]))
+        displacements.append(self._points[idx] - center)
+        values.append(self._archive[idx][objVar])
+    displacements = np.asarray(displacements)
+    distances = np.linalg.norm(displacements, axis=1)
+    lossDiff = np.array(list(mathUtils.diffWithInfinites(value, optVal) for value in values))
+    infinite = np.logical_not(np.isfinite(lossDiff))
+    if infinite.any():
+      # infinite differences dominate the gradient: point toward them
+      gradient = np.sum(np.sign(lossDiff[infinite])[:, np.newaxis] * displacements[infinite] / distances[infinite, np.newaxis], axis=0)
+      _, direction, _ = mathUtils.calculateMagnitudeAndVersor(gradient)
+      return np.inf, dict((var, float(direction[v])) for v, var in enumerate(self._optVars)), True
+    gradient = self._fit(displacements, distances, lossDiff)
+    magnitude, direction, foundInf = mathUtils.calculateMagnitudeAndVersor(gradient)
+    direction = dict((var, float(direction[v])) for v, var in enumerate(self._optVars))
+    return magnitude, direction, foundInf
+
+  def numGradPoints(self):
+    """
+      Returns the number of grad points required for the method
+    """
+    return self.N
+
+  ###################
+  # Utility Methods #
+  ###################
+  def _coordinates(self, point):
+    """
+      Extracts the (normalized) coordinates of a point.
+      @ In, point, dict, point with the optimization variables
+      @ Out, coordinates, np.array, values of the optimization variables, in order
+    """
+    return np.array(list(np.atleast_1d(point[var])[0] for var in self._optVars), dtype=float)
+
+  def _neighbors(self, center, minDistance, maxDistance):
+    """
+      Finds the recorded realizations in a spherical shell around a point.
+      @ In, center, np.array, coordinates of the center of the shell
+      @ In, minDistance, float, inner radius of the shell
+      @ In, maxDistance, float, outer radius of the shell
+      @ Out, neighbors, list(int), indices of the realizations in the shell, from the closest
+    """
+    if not self._points:
+      return []
+    if self._tree is None:
+      self._tree = spatial.cKDTree(np.asarray(self._points))
+    candidates = self._tree.query_ball_point(center, maxDistance)
+    distances = np.linalg.norm(np.asarray(self._points)[candidates] - center, axis=1) if candidates else []
+    return list(candidates[i] for i in np.argsort(distances) if distances[i] >= minDistance)
+
+  def _orthogonalResidual(self, vector, basis):
+    """
+      Removes from a vector its components along an orthonormal basis.
+      @ In, vector, np.array, vector to project
+      @ In, basis, list(np.array), orthonormal vectors
+      @ Out, residual, np.array, component of vector orthogonal to all the basis vectors
+    """
+    residual = np.array(vector, dtype=float)
+    for base in basis:
+      residual -= np.dot(residual, base) * base
+    return residual
+
+  def _uncoveredDirections(self, covered):
+    """
+      Completes an orthonormal basis of the input space, preferring the directions of the inputs.
+      @ In, covered, list(np.array), orthonormal directions already covered
+      @ Out, directions, list(np.array), orthonormal directions completing the basis
+    """
+    basis = list(covered)
+    axes = list(np.eye(self.N))
+    directions = []
+    while len(basis) < self.N:
+      residuals = list(self._orthogonalResidual(axis, basis) for axis in axes)
+      best = int(np.argmax(list(np.linalg.norm(residual) for residual in residuals)))
+      direction = residuals[best] / np.linalg.norm(residuals[best])
+      basis.append(direction)
+      directions.append(direction)
+      axes.pop(best)
+    return directions
+
+  def _fit(self, displacements, distances, lossDiff):
+    """
+      Fits the local model to the differences in the objective around the opt point.
+      @ In, displacements, np.array, displacements of the neighbors from the opt point
+      @ In, distances, np.array, distances of the neighbors from the opt point
+      @ In, lossDiff, np.array, differences of the objective at the neighbors from the opt point
+      @ Out, gradient, np.array, gradient of the local model at the opt point
+    """
+    # each row is a directional derivative, so that all neighbors weigh the same
+    design = displacements / distances[:, np.newaxis]
+    target = lossDiff / distances
+    if self._model == 'quadratic' and len(distances) >= 2 * self.N:
+      curvature = 0.5 * displacements ** 2 / distances[:, np.newaxis]
+      quadratic = np.hstack([design, curvature])
+      if np.linalg.matrix_rank(quadratic) == 2 * self.N:
+        design = quadratic
+    coeffs = np.linalg.lstsq(design, target, rcond=None)[0]
+    return coeffs[:self.N]
+
+  def _handleConstraints(self, newPoint, original, delta, constraints):
+    """
+      Moves a new grad point that violates constraints, first to the other side of the opt point,
+      then closer to it.
+      @ In, newPoint, dict, desired new sampling point (normalized)
+      @ In, original, dict, current opt point from which the new point is derived (normalized)
+      @ In, delta, np.array, displacement of the new point from the opt point (normalized)
+      @ In, constraints, dict, boundary and functional constraints passed through
+      @ Out, newPoint, dict, potentially-adjusted new gradient sampling point (normalized)
+    """
+    center = self._coordinates(original)
+    scale = 1.0
+    while scale >= 1e-2:
+      for side in (1.0, -1.0):
+        point = dict(newPoint)
+        point.update((var, center[v] + side * scale * delta[v]) for v, var in enumerate(self._optVars))
+        # all constraints speak DENORM space, not NORM space
+        if self._checkConstraints(constraints['denormalize'](point), constraints):
+          return point
+      scale /= 2
+    raise RuntimeError('Could not find acceptable gradient evaluation point around {}, rejected all options via constraints.'
+                       .format(constraints['denormalize'](original)))
+
+  def _checkConstraints(self, point, constraints):
+    """
+      Checks for constraint violations in point.
+      @ In, point, dict, proposed sampling point (denormalized)
+      @ In, constraints, dict, boundary and functional constraints passed through
+      @ Out, allOkay, bool, True if no constraints violated
+    """
+    for var in self._optVars:
+      dist = constraints['boundary'][var]
+      if not dist.lowerBound <= point[var] <= dist.upperBound:
+        return False
+    info = constraints['inputs'] # has constants and such
+    for constraint in constraints['functional']:
+      info.update(point)
+      if not constraint.evaluate('constrain', info):
+        return False
+    return True
@@ -51,6 +51,17 @@ class ConjugateGradient(StepManipulator):
       @ Out, specs, InputData.ParameterInput, class to use for specifying input of cls.
     """
     specs = super(ConjugateGradient, cls).getInputSpecification()
+    specs.addSub(InputData.parameterInputFactory('candidates', contentType=InputTypes.IntegerType,
+        descr=r"""the number of trial step lengths along the search vector to evaluate at once in each
+              line search round. If greater than 1, instead of proposing one trial step length at a time, a
+              geometric bracket of \xmlNode{candidates} step lengths is evaluated in parallel (each with its
+              gradient points), and the line search pivots to the candidate best satisfying the Wolfe
+              conditions; if none of them decreases the objective sufficiently, the bracket is shrunk and
+              evaluated again. This is convenient when \xmlNode{batchSize} allows running many samples at
+              once. \default{1}"""))
+    specs.addSub(InputData.parameterInputFactory('bracketFactor', contentType=InputTypes.FloatType,
+        descr=r"""if \xmlNode{candidates} is greater than 1, the ratio between consecutive trial step lengths
+              in the line search bracket. \default{2.0}"""))
     return specs
 
   @classmethod
@@ -76,6 +87,10 @@ class ConjugateGradient(StepManipulator):
     self.needsAccessToAcceptance = True # if True, then this stepManip may need to modify opt point acceptance criteria
     # _protected
     self._persistence = None     # consecutive line search converges until acceptance
+    self._numCandidates = 1      # number of step lengths to try at once in the line search
+    self._bracketFactor = 2.0    # ratio between consecutive candidate step lengths
+    self._ftol = 1e-4            # sufficient decrease (Armijo) Wolfe condition tolerance
+    self._gtol = 0.4             # curvature Wolfe condition tolerance
     # __private
     # additional methods
     self._minRotationAngle = 2.0 # how close to perpendicular should we try rotating towards?
@@ -94,6 +109,16 @@ class ConjugateGradient(StepManipulator):
     shrink = specs.findFirst('shrinkFactor')
     if shrink is not None:
       self._shrink = shrink.value
+    candidates = specs.findFirst('candidates')
+    if candidates is not None:
+      self._numCandidates = candidates.value
+      if self._numCandidates < 1:
+        raise IOError('ConjugateGradient <candidates> must be at least 1! Got: {}'.format(self._numCandidates))
+    bracketFactor = specs.findFirst('bracketFactor')
+    if bracketFactor is not None:
+      self._bracketFactor = bracketFactor.value
+      if self._bracketFactor <= 1:
+        raise IOError('ConjugateGradient <bracketFactor> must be greater than 1! Got: {}'.format(self._bracketFactor))
 
   def initialize(self, optVars, persistence=None, **kwargs):
     """
@@ -141,6 +166,9 @@ class ConjugateGradient(StepManipulator):
     # In the grad hist, we store only gradients around best-in-line points historically
     # In the step hist, we store line search information
 
+    if self._numCandidates > 1:
+      return self._speculativeStep(prevOpt, gradientHist, prevStepSize, objVar)
+
     lastStepInfo = prevStepSize[-1]['info']
     if lastStepInfo is None:
       # this MUST MEAN that this is the very very first step in this algorithm
@@ -419,6 +447,137 @@ class ConjugateGradient(StepManipulator):
 
     return lastStepInfo
 
+  def chooseCandidate(self, candidates, objVar, stepInfo):
+    """
+      Chooses among the speculative line search candidates: the lowest objective among the candidates
+      satisfying both Wolfe conditions, then among the ones satisfying the sufficient decrease only,
+      then among all of them.
+      @ In, candidates, list, (opt point, gradient magnitude, gradient versor) for each candidate
+      @ In, objVar, str, name of the objective variable
+      @ In, stepInfo, dict, line search information of the step that proposed the candidates
+      @ Out, choice, int, index of the chosen candidate
+    """
+    ranks = []
+    for opt, gradMag, gradVersor in candidates:
+      point = np.array(list(opt[v] for v in self._optVars))
+      grad = np.array(list(gradVersor[v] for v in self._optVars)) * gradMag
+      decrease, curvature = self._checkWolfe(stepInfo, point, opt[objVar], grad)
+      ranks.append((not decrease, not curvature, opt[objVar]))
+    return min(range(len(candidates)), key=lambda c: ranks[c])
+
+  def _speculativeStep(self, prevOpt, gradientHist, prevStepSize, objVar):
+    """
+      Line search step evaluating several trial step lengths at once.
+      @ In, prevOpt, dict, previous opt point (the chosen candidate of the last bracket)
+      @ In, gradientHist, deque, list of gradient dictionaries with 0 being oldest; versors
+      @ In, prevStepSize, deque, list of {'magnitude', 'versor', 'info'} steps with 0 being oldest
+      @ In, objVar, str, name of the objective variable
+      @ Out, newOpt, list(dict), candidate opt points
+      @ Out, stepSize, float, distance of the central candidate of the bracket from the pivot
+      @ Out, lastStepInfo, dict, line search information
+    """
+    curGradMag = gradientHist[-1][0]
+    curGrad = np.array(list(gradientHist[-1][1][v] for v in self._optVars)) * curGradMag
+    curPoint = np.array(list(prevOpt[v] for v in self._optVars))
+    curObjVal = prevOpt[objVar]
+    lastStepInfo = prevStepSize[-1]['info']
+    if lastStepInfo is None:
+      # first step for this trajectory
+      lastStepInfo = self._startSpeculativeLineSearch({}, curPoint, curObjVal, curGrad, curGradMag)
+      lastStepInfo['prev task'] = 'START'
+      stepSize = lastStepInfo['stepSize']
+    else:
+      decrease, curvature = self._checkWolfe(lastStepInfo, curPoint, curObjVal, curGrad)
+      alpha = self._lineStepLength(lastStepInfo, curPoint)
+      longest = max(lastStepInfo['bracket'])
+      # exponents of the shortest and longest step lengths in the bracket
+      low = (self._numCandidates - 1) // 2
+      high = self._numCandidates - 1 - low
+      if decrease and not curvature and alpha >= longest * (1.0 - 1e-10) and np.dot(curGrad, lastStepInfo['searchVector']) < 0:
+        # still going downhill at the longest step length, so look beyond it
+        lastStepInfo['prev task'] = 'FG'
+        stepSize = longest * self._bracketFactor ** (low + 1)
+      elif decrease or curObjVal < lastStepInfo['pivot']['objVal']:
+        # pivot into a new line search from the chosen candidate (also if it improves the
+        # objective without a sufficient decrease, which indicates a poor gradient at the pivot)
+        lastStepInfo['prev task'] = 'CONV'
+        lastStepInfo = self._startSpeculativeLineSearch(lastStepInfo, curPoint, curObjVal, curGrad, curGradMag)
+        stepSize = lastStepInfo['stepSize']
+      else:
+        # no candidate decreased the objective enough, so look below the shortest one
+        lastStepInfo['prev task'] = 'FG'
+        stepSize = min(lastStepInfo['bracket']) / self._bracketFactor ** (high + 1)
+        pivotPoint = lastStepInfo['pivot']['point']
+        if stepSize * lastStepInfo['searchVectorMag'] <= 1e-14 * (1.0 + mathUtils.calculateMultivectorMagnitude(pivotPoint)):
+          raise NoMoreStepsNeeded
+    # geometric bracket of step lengths around the suggested one
+    bracket = list(stepSize * self._bracketFactor ** (c - (self._numCandidates - 1) // 2) for c in range(self._numCandidates))
+    lastStepInfo['bracket'] = bracket
+    lastStepInfo['stepSize'] = stepSize
+    pivotPoint = lastStepInfo['pivot']['point']
+    searchVector = lastStepInfo['searchVector']
+    newOpt = list(dict((var, pivotPoint[v] + alpha * searchVector[v]) for v, var in enumerate(self._optVars)) for alpha in bracket)
+    # the optimizer expects the step size as a distance in the input space
+    return newOpt, stepSize * lastStepInfo['searchVectorMag'], lastStepInfo
+
+  def _startSpeculativeLineSearch(self, lastStepInfo, curPoint, curObjVal, curGrad, curGradMag):
+    """
+      Begins a new speculative line search, making sure the search vector is a descent direction.
+      @ In, lastStepInfo, dict, information about the last step taken
+      @ In, curPoint, np.array, new pivot point
+      @ In, curObjVal, float, objective value at curPoint
+      @ In, curGrad, np.array, gradient at curPoint
+      @ In, curGradMag, float, magnitude of curGrad
+      @ Out, lastStepInfo, dict, modified with new line search information
+    """
+    if 'pivot' in lastStepInfo:
+      # Polak-Ribiere uses the scalar product of the previous pivot gradient with itself
+      prevGrad = lastStepInfo['pivot']['gradient']
+      lastStepInfo['gradDotProduct'] = np.dot(prevGrad, prevGrad)
+    lastStepInfo = self._startLineSearch(lastStepInfo, curPoint, curObjVal, curGrad, curGradMag)
+    if lastStepInfo['pivot']['objDerivative'] >= 0:
+      # the candidates only satisfy the Wolfe conditions approximately, so the conjugate
+      # direction might go uphill; restart from the steepest descent
+      searchVector = -curGrad
+      objDerivative = np.dot(searchVector, curGrad)
+      prevObjVal = lastStepInfo['previous pivot']['objVal']
+      lastStepInfo['searchVector'] = searchVector
+      lastStepInfo['searchVectorMag'] = curGradMag
+      lastStepInfo['pivot']['objDerivative'] = objDerivative
+      lastStepInfo['line']['objDerivative'] = objDerivative
+      lastStepInfo['stepSize'] = min(1.0, 1.01 * 2 * (curObjVal - prevObjVal) / objDerivative)
+    if lastStepInfo['stepSize'] <= 0:
+      lastStepInfo['stepSize'] = 1.0
+    return lastStepInfo
+
+  def _checkWolfe(self, lastStepInfo, point, objVal, grad):
+    """
+      Checks the Wolfe conditions for a point along the current line search.
+      @ In, lastStepInfo, dict, line search information
+      @ In, point, np.array, point to check
+      @ In, objVal, float, objective value at point
+      @ In, grad, np.array, gradient at point
+      @ Out, decrease, bool, True if the sufficient decrease condition is satisfied
+      @ Out, curvature, bool, True if the (strong) curvature condition is satisfied
+    """
+    pivot = lastStepInfo['pivot']
+    searchVector = lastStepInfo['searchVector']
+    alpha = self._lineStepLength(lastStepInfo, point)
+    decrease = bool(alpha > 0 and objVal <= pivot['objVal'] + self._ftol * alpha * pivot['objDerivative'])
+    curvature = bool(abs(np.dot(grad, searchVector)) <= self._gtol * abs(pivot['objDerivative']))
+    return decrease, curvature
+
+  def _lineStepLength(self, lastStepInfo, point):
+    """
+      Step length of a point along the current line search.
+      @ In, lastStepInfo, dict, line search information
+      @ In, point, np.array, point to check
+      @ Out, alpha, float, step length, as multiple of the search vector
+    """
+    searchVector = lastStepInfo['searchVector']
+    # projecting on the search vector accounts for boundary modifications
+    return np.dot(point - lastStepInfo['pivot']['point'], searchVector) / np.dot(searchVector, searchVector)
+
   def _lineSearchStep(self, lastStepInfo, curObjVal):
     """
       Determine the next action to take in the line search process
@@ -19,6 +19,7 @@
 from .StepManipulator import StepManipulator
 from .GradientHistory import GradientHistory
 from .ConjugateGradient import ConjugateGradient
+from .LBFGS import LBFGS
 
 from EntityFactoryBase import EntityFactory
 factory = EntityFactory('StepSizer')
@@ -27,9 +27,8 @@ import numpy as np
 #External Modules End--------------------------------------------------------------------------------
 
 #Internal Modules------------------------------------------------------------------------------------
-from utils import InputData, InputTypes, mathUtils, randomUtils
+from utils import InputData, InputTypes, mathUtils
 from .StepManipulator import StepManipulator
-from . import NoConstraintResolutionFound
 #Internal Modules End--------------------------------------------------------------------------------
 
 class GradientHistory(StepManipulator):
@@ -99,8 +98,6 @@ class GradientHistory(StepManipulator):
     self._shrink = 1.15          # rate of step shrinking
     self._gradTerms = 1          # number of historical gradients to use, if available
     self._termDecay = 0.2        # rate at which historical gradients drop off
-    self._minRotationAngle = 2.0 # how close to perpendicular should we try rotating towards?
-    self._numRandomPerp = 10     # how many random perpendiculars should we try rotating towards?
     # __private
     # additional methods
 
@@ -182,66 +179,7 @@ class GradientHistory(StepManipulator):
       @ Out, stepSize, new step size taken # TODO need?
       @ Out, fixInfo, updated fixing info
     """
-    # DESIGN
-    # While not okay:
-    # 1. See if cutting the step will fix it.
-    # 2. If not, try rotating towards a random perpendicular. Repeat 1.
-    # 3. If not, try a new random perpendicular. Repeat 1. Repeat N times.
-    # TODO should this be specific to step manipulators, or something else?
-    # TODO updating opt point in place! Is this safe?
-    minStepSize = fixInfo['minStepSize']
-    stepVector = dict((var, proposed[var] - previous[var]) for var in self._optVars)
-    stepDistance, stepDirection, _ = mathUtils.calculateMagnitudeAndVersor(list(stepVector.values()))
-    if 'originalStepSize' not in fixInfo:
-      fixInfo['originalStepSize'] = stepDistance
-    if 'perpDir' in fixInfo:
-      perpDir = fixInfo['perpDir']
-    # if not done cutting step, start cutting
-    if stepDistance > minStepSize:
-      # cut step again
-      stepSize = 0.5 * stepDistance # TODO user option?
-      for v, var in enumerate(stepVector):
-        proposed[var] = previous[var] + stepSize * stepDirection[v]
-      print(' ... cutting step ...') # norm step to {}, new norm opt {}'.format(stepSize, proposed))
-      return proposed, stepSize, fixInfo
-    else:
-      ### rotate vector and restore full step size
-      stepSize = fixInfo['originalStepSize']
-      # store original direction
-      if 'originalDirection' not in fixInfo:
-        fixInfo['originalDirection'] = np.atleast_1d(stepDirection)
-      # if this isn't the first time, check if there's angle left to rotate through; reset if not
-      if 'perpDir' in fixInfo:
-        ang = mathUtils.angleBetweenVectors(stepDirection, fixInfo['perpDir'])
-        print(' ... trying angle:', ang)
-        if ang < self._minRotationAngle:
-          del fixInfo['perpDir']
-
-      if 'perpDir' not in fixInfo:
-        # find perpendicular vector
-        perp = randomUtils.randomPerpendicularVector(fixInfo['originalDirection'])
-        # NOTE we could return to point format, but no reason to
-        # normalize perpendicular to versor and resize
-        rotations = fixInfo.get('numRotations', 0)
-        if rotations > self._numRandomPerp:
-          raise NoConstraintResolutionFound
-        _, perpDir, _ = mathUtils.calculateMagnitudeAndVersor(perp)
-        fixInfo['perpDir'] = perpDir
-        fixInfo['numRotations'] = rotations + 1
-      # END fixing perpendicular direction
-      # rotate vector halfway towards perpendicular
-      perpDir = fixInfo['perpDir']
-
-      # rotate towards selected perpendicular
-      splitVector = {} # vector that evenly divides stepDirection and perp
-      for v, var in enumerate(self._optVars):
-        splitVector[var] = stepDirection[v] + perpDir[v]
-        #splitVector[var] = - stepDirection[v] + perpDir[v]
-      _, splitDir, _ = mathUtils.calculateMagnitudeAndVersor(list(splitVector.values()))
-      for v, var in enumerate(self._optVars):
-        proposed[var] = previous[var] + stepSize * splitDir[v]
-      print(' ... rotating step ...') #ed norm direction to {}, new norm opt {}'.format(splitDir, proposed))
-    return proposed, stepSize, fixInfo
+    return self._cutOrRotateStep(proposed, previous, fixInfo)
 
   def trajIsFollowing(self, traj, opt, info, dataObject, followers, tolerance):
     """
@@ -254,20 +192,7 @@ class GradientHistory(StepManipulator):
       @ In, tolerance, float, termination distance (in scaled space)
       @ Out, found, int, trajectory that traj is following (or None)
     """
-    if followers is None:
-      followers = []
-    # we define a trajectory as following if its current opt point is sufficiently near other opt
-    # points from other trajectories
-    matchDict = dict((var, opt[var]) for var in self._optVars)
-    # only look in accepted points #TODO would there be value in looking at others?
-    matchDict['accepted'] = 'accepted'
-    # only look at other trajectories that this trajectory hasn't killed
-    noMatchDict = {'trajID': [traj] + followers}
-
-    _, found = dataObject.realization(matchDict=matchDict, noMatchDict=noMatchDict, tol=tolerance)
-    if found is not None:
-      return found['trajID']
-    return None
+    return self._followedTrajectory(traj, opt, dataObject, followers, tolerance, {'accepted': 'accepted'})
 
   ###################
   # Utility Methods #
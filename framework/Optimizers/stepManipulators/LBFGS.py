@@ -0,0 +1,246 @@
+# Copyright 2017 Battelle Energy Alliance, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+  Step size manipulations based on a limited-memory quasi-Newton (L-BFGS) approximation
+  of the inverse Hessian
+
+  Created 2026-10
+"""
+#for future compatibility with Python 3--------------------------------------------------------------
+from __future__ import division, print_function, unicode_literals, absolute_import
+#End compatibility block for Python 3----------------------------------------------------------------
+
+#External Modules------------------------------------------------------------------------------------
+import numpy as np
+#External Modules End--------------------------------------------------------------------------------
+
+#Internal Modules------------------------------------------------------------------------------------
+from utils import InputData, InputTypes, mathUtils
+from .StepManipulator import StepManipulator
+from . import NoMoreStepsNeeded
+#Internal Modules End--------------------------------------------------------------------------------
+
+class LBFGS(StepManipulator):
+  """
+    Takes quasi-Newton steps, using the curvature collected along the optimization path
+  """
+  requiredInformation = ['gradientHist', 'prevStepSize']
+  optionalInformation = ['recommend']
+
+  ##########################
+  # Initialization Methods #
+  ##########################
+  @classmethod
+  def getInputSpecification(cls):
+    """
+      Method to get a reference to a class that specifies the input data for class cls.
+      @ In, cls, the class for which we are retrieving the specification
+      @ Out, specs, InputData.ParameterInput, class to use for specifying input of cls.
+    """
+    specs = super(LBFGS, cls).getInputSpecification()
+    specs.description = r"""if this node is present, indicates that the iterative steps in the gradient
+        descent algorithm should be determined by a limited-memory BFGS (L-BFGS) quasi-Newton method.
+        The changes in the opt point and in the gradient between the accepted opt points of the
+        trajectory are used to build an approximation of the (inverse) Hessian of the objective,
+        which gives both the direction and the size of the next step. No additional model evaluations
+        are needed with respect to the other stepping strategies, but far fewer iterations are usually
+        needed for ill-conditioned problems. The first step, taken before any curvature information is
+        available, follows the gradient with the size given by \xmlNode{initialStepScale}. If a
+        suggested opt point is rejected, the step is cut by \xmlNode{shrinkFactor} (backtracking)."""
+    specs.addSub(InputData.parameterInputFactory('memory', contentType=InputTypes.IntegerType,
+        descr=r"""the number of most recent (step, gradient change) pairs used to approximate the
+              inverse Hessian. Larger values describe the curvature better, but respond more slowly to
+              changes in it. \default{5}"""))
+    specs.addSub(InputData.parameterInputFactory('shrinkFactor', contentType=InputTypes.FloatType,
+        descr=r"""specifies the rate at which the quasi-Newton step is cut each time a suggested opt point
+              is rejected. For example, a shrink factor of 2 means the step is halved. \default{2.0}"""))
+    return specs
+
+  def __init__(self):
+    """
+      Constructor.
+      @ In, None
+      @ Out, None
+    """
+    StepManipulator.__init__(self)
+    ## Instance Variable Initialization
+    # public
+    # _protected
+    self._memory = 5             # number of curvature pairs to keep
+    self._shrink = 2.0           # rate of step cutting on rejection
+    self._curvatureTol = 1e-10   # minimum (relative) curvature for a pair to be used
+    self._boundaryTol = 1e-12    # normalized distance from a boundary to consider a variable on it
+    # __private
+    # additional methods
+
+  def handleInput(self, specs):
+    """
+      Read input specs
+      @ In, specs, InputData.ParameterInput, parameter specs interpreted
+      @ Out, None
+    """
+    StepManipulator.handleInput(self, specs)
+    memory = specs.findFirst('memory')
+    if memory is not None:
+      self._memory = memory.value
+      if self._memory < 1:
+        raise IOError('LBFGS <memory> must be at least 1! Got: {}'.format(self._memory))
+    shrink = specs.findFirst('shrinkFactor')
+    if shrink is not None:
+      self._shrink = shrink.value
+      if self._shrink <= 1:
+        raise IOError('LBFGS <shrinkFactor> must be greater than 1! Got: {}'.format(self._shrink))
+
+  def initialize(self, optVars, **kwargs):
+    """
+      initializes this object
+      @ In, optVars, list(str), list of optimization variables (e.g. input space)
+      @ In, kwargs, dict, additional unused arguments
+      @ Out, None
+    """
+    StepManipulator.initialize(self, optVars, **kwargs)
+
+  ###############
+  # Run Methods #
+  ###############
+  def initialStepSize(self, numOptVars=None, scaling=1.0, **kwargs):
+    """
+      Provides an initial step size
+      @ In, numOptVars, int, number of optimization variables
+      @ In, scaling, float, optional, scaling factor
+      @ Out, stepSize, float, initial step size
+    """
+    return mathUtils.hyperdiagonal(np.ones(numOptVars) * scaling) * self._initialStepScaling
+
+  def step(self, prevOpt, gradientHist=None, prevStepSize=None, recommend=None, **kwargs):
+    """
+      calculates the step size and direction to take
+      @ In, prevOpt, dict, previous opt point
+      @ In, gradientHist, deque, list of (magnitude, versor) gradients with -1 being most recent
+      @ In, prevStepSize, deque, list of {'magnitude', 'versor', 'info'} steps with -1 being most recent
+      @ In, recommend, str, optional, override to 'grow' or 'shrink' step size
+      @ In, kwargs, dict, keyword-based specifics as required by individual step sizers
+      @ Out, newOpt, dict, new opt point
+      @ Out, stepSize, float, new step size
+      @ Out, stepInfo, dict, curvature history to use in the next step
+    """
+    curPoint = np.array([prevOpt[var] for var in self._optVars], dtype=float)
+    gradMag, gradVersor = gradientHist[-1]
+    curGrad = gradMag * np.array([gradVersor[var] for var in self._optVars], dtype=float).ravel()
+    lastInfo = prevStepSize[-1]['info']
+    if lastInfo is None:
+      # first step for this trajectory
+      lastInfo = {'point': None, 'gradient': None, 'pairs': [], 'scale': 1.0}
+    pairs = list(lastInfo['pairs'])
+    # store the curvature between the last and the current opt point; this is skipped when
+    # the opt point did not move, as when a suggested point is rejected and the old one is rerun
+    if lastInfo['point'] is not None:
+      s = curPoint - lastInfo['point']
+      y = curGrad - lastInfo['gradient']
+      sy = np.dot(s, y)
+      # only positive curvature keeps the inverse Hessian approximation positive definite
+      if np.any(s != 0) and sy > self._curvatureTol * np.linalg.norm(s) * np.linalg.norm(y):
+        pairs.append((s, y, 1.0 / sy))
+        pairs = pairs[-self._memory:]
+    # step cutting after rejections, full quasi-Newton step otherwise
+    if recommend == 'shrink':
+      scale = lastInfo['scale'] / self._shrink
+    else:
+      scale = 1.0
+    # variables sitting on a boundary of the (normalized) input space cannot move further out,
+    # so the step is taken in the space of the free variables only
+    free = self._freeVariables(curPoint, curGrad)
+    if not free.any():
+      # the gradient only points out of the input space: constrained minimum
+      raise NoMoreStepsNeeded
+    direction = self._twoLoopRecursion(curGrad, pairs) * free
+    if pairs and np.dot(direction, curGrad) >= 0:
+      # not a descent direction (e.g. noisy gradients); restart from the gradient
+      pairs = []
+      direction = -curGrad * free
+    if pairs:
+      stepSize = scale * mathUtils.calculateMultivectorMagnitude(direction)
+      # do not step further than the size of the (normalized) input space
+      stepSize = min(stepSize, mathUtils.hyperdiagonal(np.ones(len(self._optVars))))
+    else:
+      # no curvature known yet, so follow the gradient with the initial step size
+      stepSize = scale * self.initialStepSize(numOptVars=len(self._optVars))
+    _, versor, _ = mathUtils.calculateMagnitudeAndVersor(direction)
+    newOpt = dict((var, curPoint[v] + stepSize * versor[v]) for v, var in enumerate(self._optVars))
+    stepInfo = {'point': curPoint, 'gradient': curGrad, 'pairs': pairs, 'scale': scale}
+    return newOpt, stepSize, stepInfo
+
+  def fixConstraintViolations(self, proposed, previous, fixInfo):
+    """
+      Given constraint violations, update the desired optimal point to consider.
+      The step is cut and, if needed, rotated (see StepManipulator._cutOrRotateStep).
+      @ In, proposed, dict, proposed new optimal point
+      @ In, previous, dict, previous optimal point
+      @ In, fixInfo, dict, contains record of progress in fixing search
+      @ Out, proposed, new proposed point
+      @ Out, stepSize, float, new step size taken
+      @ Out, fixInfo, dict, updated fixing info
+    """
+    return self._cutOrRotateStep(proposed, previous, fixInfo)
+
+  def trajIsFollowing(self, traj, opt, info, dataObject, followers, tolerance):
+    """
+      Determines if the current trajectory is following another trajectory.
+      @ In, traj, int, integer identifier for trajectory that needs to be checked
+      @ In, opt, dict, DENORMALIZED most recent optimal point for trajectory
+      @ In, info, dict, additional information about optimal point
+      @ In, dataObject, DataObject.DataSet, data collected through optimization so far (SolutionExport)
+      @ In, followers, list(int), trajectories that are following traj currently
+      @ In, tolerance, float, termination distance (in scaled space)
+      @ Out, found, int, trajectory that traj is following (or None)
+    """
+    return self._followedTrajectory(traj, opt, dataObject, followers, tolerance, {'accepted': 'accepted'})
+
+  ###################
+  # Utility Methods #
+  ###################
+  def _freeVariables(self, point, grad):
+    """
+      Determines which variables can move along the descent direction without leaving the
+      normalized input space.
+      @ In, point, np.array, current opt point in order of optimization variables
+      @ In, grad, np.array, current gradient in order of optimization variables
+      @ Out, free, np.array, 1 for free variables and 0 for variables held on a boundary
+    """
+    atLower = np.logical_and(point <= self._boundaryTol, grad > 0)
+    atUpper = np.logical_and(point >= 1.0 - self._boundaryTol, grad < 0)
+    return np.logical_not(np.logical_or(atLower, atUpper)).astype(float)
+
+  def _twoLoopRecursion(self, grad, pairs):
+    """
+      Applies the L-BFGS approximation of the inverse Hessian to the gradient.
+      See Nocedal and Wright, Numerical Optimization, algorithm 7.4.
+      @ In, grad, np.array, current gradient in order of optimization variables
+      @ In, pairs, list, (step, gradient change, 1 / curvature) pairs with -1 being most recent
+      @ Out, direction, np.array, quasi-Newton search direction (not unit vector)
+    """
+    q = np.array(grad, dtype=float)
+    alphas = []
+    for s, y, rho in reversed(pairs):
+      alpha = rho * np.dot(s, q)
+      q -= alpha * y
+      alphas.append(alpha)
+    if pairs:
+      # initial inverse Hessian scaling from the most recent pair
+      s, y, _ = pairs[-1]
+      q *= np.dot(s, y) / np.dot(y, y)
+    for (s, y, rho), alpha in zip(pairs, reversed(alphas)):
+      beta = rho * np.dot(y, q)
+      q += s * (alpha - beta)
+    return -q
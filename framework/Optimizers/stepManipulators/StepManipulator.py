@@ -27,7 +27,8 @@ import numpy as np
 #External Modules End--------------------------------------------------------------------------------
 
 #Internal Modules------------------------------------------------------------------------------------
-from utils import utils, InputData, InputTypes
+from utils import utils, InputData, InputTypes, mathUtils, randomUtils
+from . import NoConstraintResolutionFound
 #Internal Modules End--------------------------------------------------------------------------------
 
 
@@ -81,6 +82,8 @@ class StepManipulator(utils.metaclass_insert(abc.ABCMeta, object)):
     # _protected
     self._optVars = None                 # optimization variable names (e.g. input space vars)
     self._initialStepScaling = 0.05      # scale the size of the initial step, in % (where 1 is the length of hyperdiagonal of hypercube)
+    self._minRotationAngle = 2.0         # how close to perpendicular should we try rotating towards? (see _cutOrRotateStep)
+    self._numRandomPerp = 10             # how many random perpendiculars should we try rotating towards? (see _cutOrRotateStep)
     # __private
     # additional methods
 
@@ -120,7 +123,7 @@ class StepManipulator(utils.metaclass_insert(abc.ABCMeta, object)):
       Calculates a new step size to use in the optimization path.
       @ In, prevOpt, dict, previous optimal point
       @ In, kwargs, dict, keyword-based specifics as required by individual step sizers
-      @ Out, newOpt, dict, new optimal point
+      @ Out, newOpt, dict, new optimal point (or list(dict) of candidate optimal points, see chooseCandidate)
       @ Out, stepSize, float, new step size
       @ Out, stepInfo, dict, additional information about this step to store
     """
@@ -158,6 +161,18 @@ class StepManipulator(utils.metaclass_insert(abc.ABCMeta, object)):
     """
     pass
 
+  def chooseCandidate(self, candidates, objVar, stepInfo):
+    """
+      Chooses among speculative candidate opt points.
+      Note this is only called if "step" proposed a list of candidate points.
+      @ In, candidates, list, (opt point, gradient magnitude, gradient versor) for each candidate
+      @ In, objVar, str, name of the objective variable
+      @ In, stepInfo, dict, additional information about the step that proposed the candidates
+      @ Out, choice, int, index of the chosen candidate
+    """
+    # overload in inheriting classes at will
+    return int(np.argmin([opt[objVar] for opt, _, _ in candidates]))
+
   def needDenormalized(self):
     """
       Determines if this algorithm needs denormalized input spaces
@@ -177,3 +192,101 @@ class StepManipulator(utils.metaclass_insert(abc.ABCMeta, object)):
   ###################
   # Utility Methods #
   ###################
+  def _cutOrRotateStep(self, proposed, previous, fixInfo):
+    """
+      Fixes constraint violations by first cutting the step, then rotating it towards random perpendiculars.
+      Used by the inheriting classes in "fixConstraintViolations".
+      @ In, proposed, dict, proposed new optimal point
+      @ In, previous, dict, previous optimal point
+      @ In, fixInfo, dict, contains record of progress in fixing search
+      @ Out, proposed, new proposed point
+      @ Out, stepSize, new step size taken # TODO need?
+      @ Out, fixInfo, updated fixing info
+    """
+    # DESIGN
+    # While not okay:
+    # 1. See if cutting the step will fix it.
+    # 2. If not, try rotating towards a random perpendicular. Repeat 1.
+    # 3. If not, try a new random perpendicular. Repeat 1. Repeat N times.
+    # TODO should this be specific to step manipulators, or something else?
+    # TODO updating opt point in place! Is this safe?
+    minStepSize = fixInfo['minStepSize']
+    stepVector = dict((var, proposed[var] - previous[var]) for var in self._optVars)
+    stepDistance, stepDirection, _ = mathUtils.calculateMagnitudeAndVersor(list(stepVector.values()))
+    if 'originalStepSize' not in fixInfo:
+      fixInfo['originalStepSize'] = stepDistance
+    if 'perpDir' in fixInfo:
+      perpDir = fixInfo['perpDir']
+    # if not done cutting step, start cutting
+    if stepDistance > minStepSize:
+      # cut step again
+      stepSize = 0.5 * stepDistance # TODO user option?
+      for v, var in enumerate(stepVector):
+        proposed[var] = previous[var] + stepSize * stepDirection[v]
+      print(' ... cutting step ...') # norm step to {}, new norm opt {}'.format(stepSize, proposed))
+      return proposed, stepSize, fixInfo
+    else:
+      ### rotate vector and restore full step size
+      stepSize = fixInfo['originalStepSize']
+      # store original direction
+      if 'originalDirection' not in fixInfo:
+        fixInfo['originalDirection'] = np.atleast_1d(stepDirection)
+      # if this isn't the first time, check if there's angle left to rotate through; reset if not
+      if 'perpDir' in fixInfo:
+        ang = mathUtils.angleBetweenVectors(stepDirection, fixInfo['perpDir'])
+        print(' ... trying angle:', ang)
+        if ang < self._minRotationAngle:
+          del fixInfo['perpDir']
+
+      if 'perpDir' not in fixInfo:
+        # find perpendicular vector
+        perp = randomUtils.randomPerpendicularVector(fixInfo['originalDirection'])
+        # NOTE we could return to point format, but no reason to
+        # normalize perpendicular to versor and resize
+        rotations = fixInfo.get('numRotations', 0)
+        if rotations > self._numRandomPerp:
+          raise NoConstraintResolutionFound
+        _, perpDir, _ = mathUtils.calculateMagnitudeAndVersor(perp)
+        fixInfo['perpDir'] = perpDir
+        fixInfo['numRotations'] = rotations + 1
+      # END fixing perpendicular direction
+      # rotate vector halfway towards perpendicular
+      perpDir = fixInfo['perpDir']
+
+      # rotate towards selected perpendicular
+      splitVector = {} # vector that evenly divides stepDirection and perp
+      for v, var in enumerate(self._optVars):
+        splitVector[var] = stepDirection[v] + perpDir[v]
+        #splitVector[var] = - stepDirection[v] + perpDir[v]
+      _, splitDir, _ = mathUtils.calculateMagnitudeAndVersor(list(splitVector.values()))
+      for v, var in enumerate(self._optVars):
+        proposed[var] = previous[var] + stepSize * splitDir[v]
+      print(' ... rotating step ...') #ed norm direction to {}, new norm opt {}'.format(splitDir, proposed))
+    return proposed, stepSize, fixInfo
+
+  def _followedTrajectory(self, traj, opt, dataObject, followers, tolerance, optStatus):
+    """
+      Finds the trajectory (if any) that the current trajectory is following, i.e. whose opt points
+      are sufficiently near to the current opt point. Used by the inheriting classes in "trajIsFollowing".
+      @ In, traj, int, integer identifier for trajectory that needs to be checked
+      @ In, opt, dict, DENORMALIZED most recent optimal point for trajectory
+      @ In, dataObject, DataObject.DataSet, data collected through optimization so far (SolutionExport)
+      @ In, followers, list(int), trajectories that are following traj currently
+      @ In, tolerance, float, termination distance (in scaled space)
+      @ In, optStatus, dict, {variable: value} identifying the opt points in the dataObject
+      @ Out, found, int, trajectory that traj is following (or None)
+    """
+    if followers is None:
+      followers = []
+    # we define a trajectory as following if its current opt point is sufficiently near other opt
+    # points from other trajectories
+    matchDict = dict((var, opt[var]) for var in self._optVars)
+    # only look in the converged/accepted points, as identified by the inheriting class
+    matchDict.update(optStatus)
+    # only look at other trajectories that this trajectory hasn't killed
+    noMatchDict = {'trajID': [traj] + followers}
+
+    _, found = dataObject.realization(matchDict=matchDict, noMatchDict=noMatchDict, tol=tolerance)
+    if found is not None:
+      return found['trajID']
+    return None
@@ -36,5 +36,6 @@ class NoMoreStepsNeeded(RuntimeError):
 from .StepManipulator import StepManipulator
 from .GradientHistory import GradientHistory
 from .ConjugateGradient import ConjugateGradient
+from .LBFGS import LBFGS
 
 from .Factory import factory
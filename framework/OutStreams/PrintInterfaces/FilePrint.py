@@ -39,6 +39,8 @@ class FilePrint(PrintInterface):
     spec.addSub(InputData.parameterInputFactory('source', contentType=InputTypes.StringListType))
     spec.addSub(InputData.parameterInputFactory('what', contentType=InputTypes.StringListType))
     spec.addSub(InputData.parameterInputFactory('clusterLabel', contentType=InputTypes.StringType))
+    historyFormats = InputTypes.makeEnumType('HistoryFormat', 'HistoryFormatType', ['files', 'single'])
+    spec.addSub(InputData.parameterInputFactory('historyFormat', contentType=historyFormats))
 
     return spec
 
@@ -90,6 +92,10 @@ class FilePrint(PrintInterface):
     if cluster is not None:
       self.options['clusterLabel'] = cluster.value
 
+    historyFormat = spec.findFirst('historyFormat')
+    if historyFormat is not None:
+      self.options['historyFormat'] = historyFormat.value
+
     # checks
     if self.options['type'] == 'csv' and self.what is not None:
       for target in [x.lower() for x in self.what]:
@@ -158,6 +164,9 @@ class FilePrint(PrintInterface):
             self.raiseAWarning('Label clustering currently only works for PointSet data objects!  Skipping for',self.sourceData[index].name)
           else:
             dictOptions['clusterLabel'] = self.options['clusterLabel']
+        # historyFormat lets the user print all the histories of a HistorySet in a single file
+        if 'historyFormat' in self.options:
+          dictOptions['historyFormat'] = self.options['historyFormat']
         try:
           rlzIndex = self.sourceData[index].write(filename,style='CSV',**dictOptions)
         except AttributeError:
@@ -329,12 +329,13 @@ class AdaptiveDynamicEventTree(DynamicEventTree, LimitSurfaceSearch):
               'RAVEN_isEnding':True})
     # add the newer branch name to the map
     self.rootToJob[rname] = self.rootToJob[subGroup.get('parent')]
+    self.nodeIndex[rname] = subGroup
     # check if it is a preconditioned DET sampling, if so add the relative information
-    # it exists only in case an hybridDET strategy is activated
+    # it exists only in case an hybridDET strategy is activated (shared by the whole tree)
     precSampled = info['parentNode'].get('hybridsamplerCoordinate')
     if precSampled:
-      self.inputInfo['hybridsamplerCoordinate'  ] = copy.deepcopy(precSampled)
-      subGroup.add('hybridsamplerCoordinate', copy.copy(precSampled))
+      self.inputInfo['hybridsamplerCoordinate'  ] = precSampled
+      subGroup.add('hybridsamplerCoordinate', precSampled)
     # The probability Thresholds are stored here in the cdfValues dictionary... We are sure that they are whitin the ones defined in the grid
     # check is not needed
     self.inputInfo['initiatorDistribution' ] = [self.toBeSampled[key] for key in cdfValues.keys()]
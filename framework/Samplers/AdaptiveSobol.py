@@ -63,6 +63,7 @@ class AdaptiveSobol(Sobol, AdaptiveSparseGrid):
     convergenceInput.addSub(InputData.parameterInputFactory("progressParam", contentType=InputTypes.FloatType))
     convergenceInput.addSub(InputData.parameterInputFactory("logFile", contentType=InputTypes.StringType))
     convergenceInput.addSub(InputData.parameterInputFactory("subsetVerbosity", contentType=InputTypes.StringType))
+    convergenceInput.addSub(InputData.parameterInputFactory("refinementBatch", contentType=InputTypes.IntegerType))
 
     inputSpecification.addSub(convergenceInput)
 
@@ -98,6 +99,7 @@ class AdaptiveSobol(Sobol, AdaptiveSparseGrid):
     self.tweakParam      = 1.0     #ranges 0 (only polynomials) to 2 (only subsets)
     self.statesFile      = None    #file to log the progression of the adaptive sampling
     self.subVerbosity    = 'quiet' #verbosity level for the ROMs, samplers, dataobjects created within this sampler
+    self.refinementBatch = 1       #number of polynomials/subsets added at each adaptive step
 
     #assembly objects
     self.solns           = None    #solution database, PointSet data object
@@ -135,6 +137,7 @@ class AdaptiveSobol(Sobol, AdaptiveSparseGrid):
 
     #point lists
     self.sorted          = []       #points that have been sorted into appropriate objects
+    self.sortedSize      = 0        #number of realizations of the solutions already sorted
     self.submittedNotCollected = [] #list of points that have been generated but not collected
     self.inTraining      = []       #usually just one tuple, unless multiple items in simultaneous training
 
@@ -166,8 +169,12 @@ class AdaptiveSobol(Sobol, AdaptiveSparseGrid):
         self.statesFile = open(child.text,'w')
       elif child.tag == 'subsetVerbosity':
         self.subVerbosity = child.text.lower()
+      elif child.tag == 'refinementBatch':
+        self.refinementBatch = int(child.text)
     if not 0 <= self.tweakParam <= 2:
       self.raiseAnError(IOError,'progressParam must be between 0 (only add polynomials) and 2 (only add subsets) (default 1).  Input value was',self.tweakParam,'!')
+    if self.refinementBatch < 1:
+      self.raiseAnError(IOError,'refinementBatch must be at least 1!  Got',self.refinementBatch)
     if self.subVerbosity not in ['debug','all','quiet','silent']:
       self.raiseAWarning('subsetVerbosity parameter not recognized:',self.subVerbosity,' -> continuing with "quiet"')
       self.subVerbosity = 'quiet'
@@ -295,21 +302,17 @@ class AdaptiveSobol(Sobol, AdaptiveSparseGrid):
         return False
       #otherwise, we're not done...
       #  -> use the information from _getLargestImpact to add either a poly or a subset
-      if which == 'poly':
-        self.inTraining.append(('poly',toDoSub,self.samplers[toDoSub]._findHighestImpactIndex()))
-        samp = self.samplers[toDoSub]
-        #add the poly to the subset sampler's training queue
-        samp.inTraining.add(self.inTraining[-1][2])
-        #add new necessary points to subset sampler
-        samp._addNewPoints(samp._makeSparseQuad([self.inTraining[-1][2]]))
-        #get those new needed points and store them locally
-        self._retrieveNeededPoints(toDoSub)
-      elif which == 'subset':
-        self._makeSubsetRom(toDoSub)
-        self.ROMs[toDoSub] = self.romShell[toDoSub].supervisedContainer[0]
-        self.inTraining.append(('subset',toDoSub,self.romShell[toDoSub]))
-        #get initial needed points and store them locally
-        self._retrieveNeededPoints(toDoSub)
+      self._addRefinement(which,toDoSub)
+      #with batched refinement, also add the next most impactful polys or subsets (on other subsets)
+      error = self.error
+      for _ in range(self.refinementBatch-1):
+        nextImpact = self._getLargestImpact(required=False)
+        if nextImpact is None:
+          break
+        which, toDoSub, poly = nextImpact
+        self.raiseAMessage('  and: %6s %8s%12s' %(which,','.join(toDoSub),str(poly)))
+        self._addRefinement(which,toDoSub)
+      self.error = error
     #END while loop
     #if all the points we need are currently submitted but not collected, we have no points to offer
     if not self._havePointsToRun():
@@ -385,6 +388,29 @@ class AdaptiveSobol(Sobol, AdaptiveSparseGrid):
         self.inputInfo['ProbabilityWeight']*=self.inputInfo['ProbabilityWeight-'+dist]
     self.inputInfo['PointProbability'] = reduce(mul,self.inputInfo['SampledVarsPb'].values())
     self.inputInfo['SamplerType'] = 'Adaptive Sparse Grids for Sobol'
+  def _addRefinement(self,which,toDoSub):
+    """
+      Adds either the most impactful polynomial of a subset or a new subset to the training queue
+      @ In, which, str, either 'poly' or 'subset'
+      @ In, toDoSub, tuple(str), the subset to refine or add
+      @ Out, None
+    """
+    if which == 'poly':
+      self.inTraining.append(('poly',toDoSub,self.samplers[toDoSub]._findHighestImpactIndex()))
+      samp = self.samplers[toDoSub]
+      #add the poly to the subset sampler's training queue
+      samp.inTraining.add(self.inTraining[-1][2])
+      #add new necessary points to subset sampler
+      samp._addNewPoints(samp._makeSparseQuad([self.inTraining[-1][2]]))
+      #get those new needed points and store them locally
+      self._retrieveNeededPoints(toDoSub)
+    elif which == 'subset':
+      self._makeSubsetRom(toDoSub)
+      self.ROMs[toDoSub] = self.romShell[toDoSub].supervisedContainer[0]
+      self.inTraining.append(('subset',toDoSub,self.romShell[toDoSub]))
+      #get initial needed points and store them locally
+      self._retrieveNeededPoints(toDoSub)
+
   def _addPointToDataObject(self,subset,point):
     """
       Adds a cut point to the data object for the subset sampler.
@@ -394,7 +420,7 @@ class AdaptiveSobol(Sobol, AdaptiveSparseGrid):
     """
     pointSet = self.samplers[subset].solns
     #first, check if the output is in the subset's existing solution set already
-    _,inExisting = self.solns.realization(matchDict=self._tupleToDict(self._expandCutPoint(subset,point)))
+    inExisting = self._lookupSolution(self._expandCutPoint(subset,point))
     #add the point to the data set.
     rlz = dict((var,np.atleast_1d(inExisting[var])) for var in pointSet.getVars())
     pointSet.addRealization(rlz)
@@ -610,10 +636,10 @@ class AdaptiveSobol(Sobol, AdaptiveSparseGrid):
     for key, impact in toSort:
       self.subsetExpImpact[key] = impact
 
-  def _getLargestImpact(self):
+  def _getLargestImpact(self,required=True):
     """
       Looks through potential subsets and existing subsets for the most effective polynomial to add
-      @ In, None
+      @ In, required, bool, optional, if False returns None instead of erroring when no polynomial or subset with an impact is found
       @ Out, _getLargestImpact, (str, tuple(str), item ), either 'poly' or 'subset' along with the corresponding subset and either the poly or ''
     """
     #track the total error while we do this
@@ -654,6 +680,8 @@ class AdaptiveSobol(Sobol, AdaptiveSparseGrid):
         maxSubsetImpact = expImp
         maxSubset = subset
     #which champion (poly or subset) is more significant? Slightly favour polynomials as a tiebreaker
+    if not required and max(maxPolyImpact,maxSubsetImpact) <= 0:
+      return None
     if maxPolySubset is None and maxSubset is None:
       self.raiseAnError(RuntimeError,'No polynomials or subsets found to consider!')
     if maxPolyImpact >= maxSubsetImpact:
@@ -786,9 +814,6 @@ class AdaptiveSobol(Sobol, AdaptiveSparseGrid):
     #sort already-solved points
     for inp in self.sorted:
       if self._checkCutPoint(subset,inp):
-        #get the solution
-        _,inExisting = self.solns.realization(matchDict=self._tupleToDict(inp))
-        soln = self._dictToTuple(inExisting,output=True)
         #get the cut point
         cinp = self._extractCutPoint(subset,inp)
         self._addPointToDataObject(subset,cinp)
@@ -862,8 +887,7 @@ class AdaptiveSobol(Sobol, AdaptiveSparseGrid):
       cutpt = sampler.neededPoints.pop()
       fullPoint = self._expandCutPoint(subset,cutpt)
       #if this point already in local existing, put it straight into collected and sampler existing
-      _,inExisting = self.solns.realization(matchDict=self._tupleToDict(fullPoint))
-      if inExisting is not None:
+      if self._lookupSolution(fullPoint) is not None:
         self.pointsCollected[subset].append(cutpt)
         self._addPointToDataObject(subset,cutpt)
       #otherwise, this is a point that needs to be run!
@@ -879,8 +903,9 @@ class AdaptiveSobol(Sobol, AdaptiveSparseGrid):
     #if there's no solutions in the set, no work to do
     if len(self.solns) == 0:
       return
-    #update self.exisitng for adaptive sobol sampler (this class)
-    for i in range(len(self.solns)):
+    #update self.exisitng for adaptive sobol sampler (this class), only the realizations added since the last sort
+    #  can have been submitted but not collected
+    for i in range(self.sortedSize,len(self.solns)):
       existing = self.solns.realization(index=i)
       inp = self._dictToTuple(existing)
       soln = self._dictToTuple(existing,output=True)
@@ -906,6 +931,7 @@ class AdaptiveSobol(Sobol, AdaptiveSparseGrid):
           self.pointsCollected[subset].append(cutInp)
       self.sorted.append(inp)
       self.submittedNotCollected.remove(inp)
+    self.sortedSize = len(self.solns)
 
   def _updateSubset(self,subset):
     """
@@ -60,6 +60,7 @@ class AdaptiveSparseGrid(SparseGridCollocation, AdaptiveSampler):
     convergenceInput.addParam("target", InputTypes.StringType, True)
     convergenceInput.addParam("maxPolyOrder", InputTypes.IntegerType)
     convergenceInput.addParam("persistence", InputTypes.IntegerType)
+    convergenceInput.addParam("refinementBatch", InputTypes.IntegerType)
 
     inputSpecification.addSub(convergenceInput)
 
@@ -90,6 +91,7 @@ class AdaptiveSparseGrid(SparseGridCollocation, AdaptiveSampler):
     #input parameters
     self.maxPolyOrder            = 0      #max size of polynomials to allow
     self.persistence             = 0      #number of forced iterations, default 2
+    self.refinementBatch         = 1      #number of highest-impact indices added at each refinement step
     self.convType                = None   #convergence criterion to use
     self.logFile                 = None   #file to print log to, optional
     #convergence/training tools
@@ -113,6 +115,9 @@ class AdaptiveSparseGrid(SparseGridCollocation, AdaptiveSampler):
     self.done                    = False  #flipped when converged
     self.newSolutionSizeShouldBe = None   #used to track and debug intended size of solutions
     self.inTraining              = set()  #list of index set points for whom points are being run
+    self.solutionTable           = {}     #hashed table of the solutions, {point tuple: realization}
+    self.solutionTableSize       = 0      #number of realizations of the solutions already in the table
+    self.basisCache              = {}     #cached polynomial basis evaluations, {(poly index, point tuple): value}
 
   def localInputAndChecks(self,xmlNode, paramInput):
     """
@@ -131,6 +136,9 @@ class AdaptiveSparseGrid(SparseGridCollocation, AdaptiveSampler):
     self.convType     = convnode.attrib.get('target','variance')
     self.maxPolyOrder = int(convnode.attrib.get('maxPolyOrder',10))
     self.persistence  = int(convnode.attrib.get('persistence',2))
+    self.refinementBatch = int(convnode.attrib.get('refinementBatch',1))
+    if self.refinementBatch < 1:
+      self.raiseAnError(IOError,'refinementBatch must be at least 1!  Got',self.refinementBatch)
     maxRunsNode = xmlNode.find('maxRuns')
     if maxRunsNode is not None:
       self.maxRuns = int(maxRunsNode.text)
@@ -281,10 +289,16 @@ class AdaptiveSparseGrid(SparseGridCollocation, AdaptiveSampler):
         self.raiseADebug('No new polynomials to consider!')
         break
       #find the highest overall impact to run next
-      idx = self._findHighestImpactIndex()
-      #add it to the training list, and append its points to the requested ones
-      self.inTraining.add(idx)
-      newSG = self._makeSparseQuad([idx])
+      if self.refinementBatch == 1:
+        idx = self._findHighestImpactIndex()
+        newIndices = [idx]
+      else:
+        #several indices at once, to keep the parallel workers busy
+        newIndices = self._findHighImpactIndices(self.refinementBatch)
+        idx = newIndices if len(newIndices) > 1 else newIndices[0]
+      #add them to the training list, and append their points to the requested ones
+      self.inTraining.update(newIndices)
+      newSG = self._makeSparseQuad(newIndices)
       self._addNewPoints(newSG)
     #if we exited while loop without finding points, we must be done!
     if len(self.neededPoints)<1:
@@ -379,20 +393,20 @@ class AdaptiveSparseGrid(SparseGridCollocation, AdaptiveSampler):
       ]:
       self.pointsNeededToMakeROM.add(pt) #sets won't store redundancies
       #if pt isn't already in needed, and it hasn't already been solved, add it to the queue
-      if pt not in self.neededPoints and self.solns.realization(matchDict=self._tupleToDict(pt))[1] is None:
+      if pt not in self.neededPoints and self._lookupSolution(pt) is None:
         self.newSolutionSizeShouldBe+=1
         self.neededPoints.append(pt)
 
-  def _convergence(self,poly,rom,target):
+  def _convergence(self,poly,polyCoeffDict,target):
     """
       Checks the convergence of the adaptive index set via one of (someday) several ways, currently "variance"
       @ In, poly, list(int), the polynomial index to check convergence for
-      @ In, rom, supervisedContainer, the GaussPolynomialROM object with respect to which we check convergence
+      @ In, polyCoeffDict, dict, the polynomial expansion coefficients with respect to which we check convergence, [target][index]
       @ In, target, string, target to check convergence with respect to
       @ Out, impact, float, estimated impact factor for this index set and sparse grid
     """
     if self.convType.lower()=='variance':
-      impact = rom.polyCoeffDict[target][poly]**2 / sum(rom.polyCoeffDict[target][p]**2 for p in rom.polyCoeffDict[target].keys())
+      impact = polyCoeffDict[target][poly]**2 / sum(polyCoeffDict[target][p]**2 for p in polyCoeffDict[target].keys())
     #FIXME 'coeffs' has to be updated to fit in the new rework before it can be used.
     # elif self.convType.lower()=='coeffs':
     #   #new = self._makeARom(rom.sparseGrid,rom.indexSet).supervisedContainer[target]
@@ -481,6 +495,26 @@ class AdaptiveSparseGrid(SparseGridCollocation, AdaptiveSampler):
     else:
       return point
 
+  def _findHighImpactIndices(self,number):
+    """
+      Finds and returns the indices with the highest average expected impact factor across all targets
+      @ In, number, int, maximum number of indices to return
+      @ Out, points, list(tuple(int)), polynomial indices with greatest expected effect, the greatest first
+    """
+    prototype = self.expImpact[self.targets[0]]
+    impacts = []
+    for pt in sorted(prototype.keys()):
+      avg = sum(self.expImpact[t][pt] for t in self.targets)/len(self.targets)
+      if avg > 0:
+        impacts.append((avg,pt))
+    #the sort is stable, so ties are resolved as in _findHighestImpactIndex
+    impacts.sort(key=lambda item: -item[0])
+    points = list(pt for _,pt in impacts[:number])
+    if len(points) == 0:
+      points = [self._findHighestImpactIndex()]
+    self.raiseADebug('Highest impact points are',points)
+    return points
+
   def _integrateFunction(self,sg,r,i):
     """
       Uses the sparse grid sg to effectively integrate the r-th moment of the model.
@@ -492,12 +526,33 @@ class AdaptiveSparseGrid(SparseGridCollocation, AdaptiveSampler):
     tot=0
     for n in range(len(sg)):
       pt,wt = sg[n]
-      _,inExisting = self.solns.realization(matchDict=self._tupleToDict(pt))
+      inExisting = self._lookupSolution(pt)
       if inExisting is None:
         self.raiseAnError(RuntimeError,'Trying to integrate with point',pt,'but it is not in the solutions!')
-      tot+=inExisting['outputs'][self.targets[i]]**r*wt
+      tot+=inExisting[self.targets[i]]**r*wt
     return tot
 
+  def _lookupSolution(self,pt):
+    """
+      Finds the solution at a point through the hashed table of the solutions. The realizations added to
+      the solutions since the last call are hashed first; points that are not found exactly (e.g. if the
+      model perturbs its inputs) are searched for within tolerance and then hashed as well.
+      @ In, pt, tuple(float), point in the order of self.features
+      @ Out, soln, dict, the realization at the point (None if not solved yet)
+    """
+    pt = tuple(pt)
+    if pt not in self.solutionTable and self.solutionTableSize < len(self.solns):
+      for index in range(self.solutionTableSize,len(self.solns)):
+        rlz = self.solns.realization(index=index)
+        self.solutionTable.setdefault(tuple(float(rlz[var]) for var in self.features),rlz)
+      self.solutionTableSize = len(self.solns)
+    soln = self.solutionTable.get(pt,None)
+    if soln is None and len(self.solns) > 0:
+      _,soln = self.solns.realization(matchDict=self._tupleToDict(pt))
+      if soln is not None:
+        self.solutionTable[pt] = soln
+    return soln
+
   def _makeARom(self,grid,inset):
     """
       Generates a GaussPolynomialRom object using the passed in sparseGrid and indexSet,
@@ -538,6 +593,48 @@ class AdaptiveSparseGrid(SparseGridCollocation, AdaptiveSampler):
     sparseGrid.initialize(self.features,iset,self.dists,self.quadDict,self.jobHandler)
     return sparseGrid
 
+  def _polyBasisEval(self,poly,pt):
+    """
+      Evaluates the multidimensional polynomial basis at a solution point, as the GaussPolynomialRom does,
+      caching the value since neither the basis nor the point change during the adaptive sampling.
+      @ In, poly, tuple(int), polynomial index
+      @ In, pt, tuple(float), solution point in the order of the sparse grid variables
+      @ Out, value, float, the product of the polynomial evaluations
+    """
+    key = (poly,pt)
+    if key not in self.basisCache:
+      value = 1
+      for i,(o,p) in enumerate(zip(poly,pt)):
+        varName = self.sparseGrid.varNames[i]
+        value *= self.polyDict[varName](o,self.dists[varName].convertToQuad(self.quadDict[varName].type,p))
+      self.basisCache[key] = value
+    return self.basisCache[key]
+
+  def _projectCoefficients(self):
+    """
+      Computes the polynomial expansion coefficients of the targets on the current sparse grid and index set,
+      with the same quadrature as the training of the GaussPolynomialRom, but without copying and retraining a ROM:
+      the solutions and the basis evaluations are reused from the previous refinement steps.
+      @ In, None
+      @ Out, polyCoeffDict, dict, the polynomial expansion coefficients, [target][index]
+    """
+    norm = np.prod(list(self.dists[v].measureNorm(self.quadDict[v].type) for v in self.dists.keys()))
+    points = []
+    for pt in self.sparseGrid.points():
+      soln = self._lookupSolution(pt)
+      if soln is None:
+        self.raiseAnError(RuntimeError,'Trying to project with point',pt,'but it is not in the solutions!')
+      points.append((tuple(float(soln[var]) for var in self.sparseGrid.varNames),soln,self.sparseGrid.weights(pt)))
+    polyCoeffDict = {target: dict({}) for target in self.targets}
+    for poly in self.indexSet.points:
+      poly = tuple(poly)
+      for target in self.targets:
+        coeff = 0
+        for solnPt,soln,wt in points:
+          coeff += float(soln[target])*self._polyBasisEval(poly,solnPt)*wt
+        polyCoeffDict[target][poly] = coeff*norm
+    return polyCoeffDict
+
   def _printToLog(self):
     """
       Prints adaptive state of this sampler to the log file.
@@ -603,18 +700,19 @@ class AdaptiveSparseGrid(SparseGridCollocation, AdaptiveSampler):
       @ Out, None
     """
     #add active (finished) points to the sparse grid
-    for active in list(self.inTraining):
-      #add point to index set
-      self.indexSet.accept(active)
+    if len(self.inTraining) > 0:
+      for active in list(self.inTraining):
+        #add point to index set
+        self.indexSet.accept(active)
+        for t in self.targets:
+          del self.expImpact[t][active]
+        self.inTraining.remove(active)
       self.sparseGrid = self._makeSparseQuad()
-      for t in self.targets:
-        del self.expImpact[t][active]
-      self.inTraining.remove(active)
     #update all the impacts
-    rom = self._makeARom(self.sparseGrid,self.indexSet)
+    polyCoeffDict = self._projectCoefficients()
     for poly in self.indexSet.points:
       for t in self.targets:
-        impact = self._convergence(poly,rom.supervisedContainer[0],t)
+        impact = self._convergence(poly,polyCoeffDict,t)
         self.actImpact[t][poly] = impact
 
   # disabled until we determine a consistent way to do this without bypassing dataobjects
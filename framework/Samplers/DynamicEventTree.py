@@ -66,6 +66,7 @@ class DynamicEventTree(Grid):
     inputSpecification.addParam("printEndXmlSummary", InputTypes.StringType)
     inputSpecification.addParam("maxSimulationType", InputTypes.FloatType)
     inputSpecification.addParam("removeXmlBranchInfo", InputTypes.StringType)
+    inputSpecification.addParam("probabilityCutoff", InputTypes.FloatType)
 
     oldSub = inputSpecification.popSub("Distribution")
     newDistributionInput = InputData.parameterInputFactory("Distribution", baseNode=oldSub)
@@ -108,6 +109,15 @@ class DynamicEventTree(Grid):
     self.printEndXmlSummary                = False
     # flag to control if the branch info xml file needs to be removed after reading
     self.removeXmlBranchInfo               = True
+    # (optional) branches whose conditional probability is below this cutoff are not spawned
+    self.probabilityCutoff                 = None
+    # number of branches that have not been spawned because of the probability cutoff
+    self.prunedBranches                    = 0
+    # total probability of the branches that have not been spawned: the sum of their conditional
+    #   probabilities, each being the probability of the branch times the one of its parent
+    self.prunedProbability                 = 0.0
+    # number of pruned branches already reported (each pruned branch is reported only once)
+    self.reportedPrunedBranches            = 0
     # Dictionary of the probability bins for each distribution that have been
     #  inputted by the user ('distName':[Pb_Threshold_1, Pb_Threshold_2, ..., Pb_Threshold_n])
     self.branchProbabilities               = {}
@@ -142,6 +152,8 @@ class DynamicEventTree(Grid):
     self.RunQueue['queue']                 = []
     # mapping from jobID to rootname in TreeInfo {jobID:rootName}
     self.rootToJob                         = {}
+    # mapping from jobID to its node in TreeInfo {jobID:TreeStructure.HierarchicalNode}
+    self.nodeIndex                         = {}
     # dictionary of Hybrid Samplers available
     self.hybridSamplersAvail               = {'MonteCarlo':MonteCarlo,'Stratified':Stratified,'Grid':Grid}
     # dictionary of inputted hybridsamplers need to be applied
@@ -185,6 +197,9 @@ class DynamicEventTree(Grid):
         for treeNode in self.TreeInfo.values():
           treeNode.writeNodeTree(myFile)
         myFile.close()
+      if self.prunedBranches > self.reportedPrunedBranches:
+        self.raiseAMessage('{} branches below the probability cutoff have not been run (total probability {:.6e})'.format(self.prunedBranches, self.prunedProbability))
+        self.reportedPrunedBranches = self.prunedBranches
       ready = False
     return ready
 
@@ -194,10 +209,14 @@ class DynamicEventTree(Grid):
       @ In, idj, string, the identifier of a job object
       @ Out, parentNode, TreeStructure.Node, the parent node of the job linked to idj
     """
-    if(idj == self.TreeInfo[self.rootToJob[idj]].getrootnode().name):
-      parentNode = self.TreeInfo[self.rootToJob[idj]].getrootnode()
-    else:
-      parentNode = list(self.TreeInfo[self.rootToJob[idj]].getrootnode().iter(idj))[0]
+    parentNode = self.nodeIndex.get(idj)
+    if parentNode is None:
+      # not indexed (e.g. added to the tree by a derived sampler), walk the tree
+      if(idj == self.TreeInfo[self.rootToJob[idj]].getrootnode().name):
+        parentNode = self.TreeInfo[self.rootToJob[idj]].getrootnode()
+      else:
+        parentNode = list(self.TreeInfo[self.rootToJob[idj]].getrootnode().iter(idj))[0]
+      self.nodeIndex[idj] = parentNode
     return parentNode
 
   def localFinalizeActualSampling(self,jobObject,model,myInput,genRunQueue=True):
@@ -505,6 +524,7 @@ class DynamicEventTree(Grid):
 
     self.RunQueue['identifiers'].append(self.inputInfo['prefix'])
     self.rootToJob[self.inputInfo['prefix']] = rname
+    self.nodeIndex[self.inputInfo['prefix']] = rootnode
     del newInputs
     self.counter += 1
 
@@ -557,11 +577,16 @@ class DynamicEventTree(Grid):
       if forceEvent == True:
         self.branchCountOnLevel = 1
         nBranches -= 1
+    # the end info stored in the branches (without the parent node, that is already linked in the tree)
+    branchEndInfo = dict((key, value) for key, value in endInfo.items() if key != 'parentNode')
+    # check if it is a preconditioned DET sampling (the coordinate is shared by the whole tree)
+    precSampled = endInfo['parentNode'].get('hybridsamplerCoordinate')
+    spawned = 0
     # Loop over the branches for which the inputs must be created
     for _ in range(nBranches):
-      self.counter += 1
       self.branchCountOnLevel += 1
-      branchedLevel = copy.deepcopy(branchedLevelParent)
+      # the levels are integers => a shallow copy is enough
+      branchedLevel = dict(branchedLevelParent)
       # Get Parent node name => the branch name is creating appending to this name  a comma and self.branchCountOnLevel counter
       rname = endInfo['parentNode'].get('name') + '-' + str(self.branchCountOnLevel)
       # create a subgroup that will be appended to the parent element in the xml tree structure
@@ -606,6 +631,15 @@ class DynamicEventTree(Grid):
         subGroup.add('conditionalPb',condPbUn)
         subGroup.add('branchChangedParamValue',branchChangedParamValue)
         subGroup.add('branchChangedParamPb',branchChangedParamPb)
+      # do not spawn the branches that are not likely enough
+      if self.probabilityCutoff is not None and subGroup.get('conditionalPb') < self.probabilityCutoff:
+        self.raiseADebug('Branch ' + rname + ' not spawned: conditional probability ' + str(subGroup.get('conditionalPb')) + ' below the cutoff')
+        self.prunedBranches += 1
+        # the conditional probability is already weighted by the parent one (see computeConditionalProbability)
+        self.prunedProbability += subGroup.get('conditionalPb')
+        continue
+      self.counter += 1
+      spawned += 1
       # add initiator distribution info, start time, etc.
 
       subGroup.add('initiatorDistribution',self.toBeSampled[endInfo['branchDist']])
@@ -642,10 +676,10 @@ class DynamicEventTree(Grid):
       model.getAdditionalInputEdits(self.inputInfo)
       # add the newer branch name to the map
       self.rootToJob[rname] = self.rootToJob[subGroup.get('parent')]
-      # check if it is a preconditioned DET sampling, if so add the relative information
-      precSampled = endInfo['parentNode'].get('hybridsamplerCoordinate')
+      self.nodeIndex[rname] = subGroup
+      # if it is a preconditioned DET sampling, add the relative information
       if precSampled:
-        self.inputInfo['hybridsamplerCoordinate'] = copy.deepcopy(precSampled)
+        self.inputInfo['hybridsamplerCoordinate'] = precSampled
         subGroup.add('hybridsamplerCoordinate', precSampled)
       # Check if the distribution that just triggered hitted the last probability threshold .
       #  In this case there is not a probability threshold that needs to be added in the input
@@ -694,10 +728,11 @@ class DynamicEventTree(Grid):
       self.RunQueue['identifiers'].append(self.inputInfo['prefix'])
       for key,value in self.inputInfo.items():
         subGroup.add(key,copy.copy(value))
-      popped = endInfo.pop('parentNode')
-      subGroup.add('endInfo',copy.deepcopy(endInfo))
-      endInfo['parentNode'] = popped
+      subGroup.add('endInfo',copy.deepcopy(branchEndInfo))
       del branchedLevel
+    if nBranches and not spawned:
+      # all the continuations are below the probability cutoff => the history ends here
+      endInfo['parentNode'].add('completedHistory', True)
 
   def _createRunningQueue(self, model, myInput, forceEvent=False):
     """
@@ -761,18 +796,11 @@ class DynamicEventTree(Grid):
     jobInput  = self.RunQueue['queue'      ].pop(0)
     jobId     = self.RunQueue['identifiers'].pop(0)
     #set running flags in self.TreeInfo
-    root = self.TreeInfo[self.rootToJob[jobId]].getrootnode()
+    subElm = self._retrieveParentNode(jobId)
     # Update the run information flags
-    if (root.name == jobId):
-      root.add('runEnded',False)
-      root.add('running',True)
-      root.add('queue',False)
-    else:
-      subElm = list(root.iter(jobId))[0]
-      if(subElm):
-        subElm.add('runEnded',False)
-        subElm.add('running',True)
-        subElm.add('queue',False)
+    subElm.add('runEnded',False)
+    subElm.add('running',True)
+    subElm.add('queue',False)
 
     return jobInput
 
@@ -850,6 +878,13 @@ class DynamicEventTree(Grid):
     Grid.localInputAndChecks(self,xmlNode, paramInput)
     self.printEndXmlSummary = utils.stringIsTrue(xmlNode.attrib.get('printEndXmlSummary', None))
     self.removeXmlBranchInfo = utils.stringIsTrue(xmlNode.attrib.get('removeXmlBranchInfo', None))
+    if 'probabilityCutoff' in xmlNode.attrib.keys():
+      try:
+        self.probabilityCutoff = float(xmlNode.attrib['probabilityCutoff'])
+      except ValueError:
+        self.raiseAnError(IOError,'Can not convert probabilityCutoff in float number!!!')
+      if not 0.0 <= self.probabilityCutoff < 1.0:
+        self.raiseAnError(IOError,'probabilityCutoff must be in [0,1)! Got '+str(self.probabilityCutoff))
     if 'maxSimulationTime'   in xmlNode.attrib.keys():
       try:
         self.maxSimulTime = float(xmlNode.attrib['maxSimulationTime'])
@@ -27,7 +27,7 @@ import numpy as np
 import functools
 from scipy.linalg import solve_discrete_lyapunov
 from scipy import stats
-from scipy.signal import find_peaks
+from scipy.signal import find_peaks, lfilter
 from scipy.stats import rv_histogram
 
 #External Modules End--------------------------------------------------------------------------------
@@ -226,6 +226,13 @@ class ARMA(SupervisedLearning):
                     where $y$ is the cycle after the first and $g$ is the provided scaling factor.""")
     multicycle.addSub(growth)
     specs.addSub(multicycle)
+    specs.addSub(InputData.parameterInputFactory("numHistories", contentType=InputTypes.IntegerType,
+                                                 descr=r"""the number of independent synthetic histories the ARMA should
+                                                   produce each time it yields a sample. If more than one, the histories are
+                                                   synthesized all at once, which is much faster than taking the same number
+                                                   of samples one at a time. \nb As for \xmlNode{Multicycle}, the output must
+                                                   then be stored in a \xmlNode{DataSet}, as the targets will also depend on
+                                                   the history index, \xmlString{History}.""", default=1))
 
     specs.addSub(InputData.parameterInputFactory("nyquistScalar", contentType=InputTypes.IntegerType, default=1))
     ### ARMA zero filter
@@ -287,6 +294,7 @@ class ARMA(SupervisedLearning):
     self.multicycle = False # if True, then multiple cycles per sample are going to be taken
     self.numCycles = None # if self.multicycle, this is the number of cycles per sample
     self.growthFactors = collections.defaultdict(list) # by target, this is how to scale the signal over successive cycles
+    self.numHistories = 1 # number of independent histories synthesized by each sample
 
 
   def _handleInput(self, paramInput):
@@ -297,7 +305,7 @@ class ARMA(SupervisedLearning):
     """
     super()._handleInput(paramInput)
     settings, notFound = paramInput.findNodesAndExtractValues(['nyquistScalar', 'P', 'Q', 'reseedCopies', 'pivotParameter',
-                                                            'seed', 'preserveInputCDF', 'correlate'])
+                                                            'seed', 'preserveInputCDF', 'correlate', 'numHistories'])
     assert(not notFound)
     self.nyquistScalar     = settings.get('nyquistScalar')
     self.P                 = settings.get('P') # autoregressive lag
@@ -307,6 +315,9 @@ class ARMA(SupervisedLearning):
     self.pivotParameterID  = settings.get('pivotParameter')
     self.seed              = settings.get('seed')
     self.preserveInputCDF  = settings.get('preserveInputCDF') # if True, then CDF of the training data will be imposed on the final sampled signal
+    self.numHistories      = settings.get('numHistories')
+    if self.numHistories < 1:
+      self.raiseAnError(IOError, '"numHistories" must be at least 1, but got {}!'.format(self.numHistories))
     # get seed if provided
     ## FIXME only applies to VARMA sampling right now, since it has to be sampled through Numpy!
     ## see note under "check for correlation" below.
@@ -679,9 +690,13 @@ class ARMA(SupervisedLearning):
       @ In, featureVals, float, a scalar feature value is passed as scaling factor
       @ Out, returnEvaluation , dict, dictionary of values for each target (and pivot parameter)
     """
+    numHistories = self.numHistories
+    # leading (history) dimension, if any
+    historyShape = () if numHistories == 1 else (numHistories, )
+    historyIndex = [] if numHistories == 1 else ['History']
     if self.multicycle:
       ## create storage for the sampled result
-      finalResult = dict((target, np.zeros((self.numCycles, len(self.pivotParameterValues)))) for target in self.target if target != self.pivotParameterID)
+      finalResult = dict((target, np.zeros(historyShape + (self.numCycles, len(self.pivotParameterValues)))) for target in self.target if target != self.pivotParameterID)
       finalResult[self.pivotParameterID] = self.pivotParameterValues
       cycles = np.arange(self.numCycles)
       # calculate scaling factors for targets
@@ -692,19 +707,27 @@ class ARMA(SupervisedLearning):
       for y in cycles:
         self.raiseADebug('Evaluating cycle', y)
         vals = copy.deepcopy(featureVals) # without deepcopy, the vals are modified in-place -> why should this matter?
-        result = self._evaluateCycle(vals)
+        if numHistories == 1:
+          result = self._evaluateCycle(vals)
+        else:
+          result = self._evaluateHistories(vals, numHistories)
         for target, value in ((t, v) for (t, v) in result.items() if t != self.pivotParameterID): #, growthInfos in self.growthFactors.items():
-          finalResult[target][y][:] = value # [:] is a size checker
+          finalResult[target][..., y, :] = value # [:] is a size checker
       # apply growth factors
       for target in (t for t in finalResult if t != self.pivotParameterID):
         scaling = self._evaluateScales(self.growthFactors[target], cycles)
-        finalResult[target][:] = (finalResult[target].T * scaling).T # -> people say this is as fast as any way to multiply columns by a vector of scalars
+        finalResult[target][:] = finalResult[target] * scaling[:, np.newaxis]
       # high-dimensional indexing information
       finalResult['Cycle'] = cycles
-      finalResult['_indexMap'] = dict((target, ['Cycle', self.pivotParameterID]) for target in self.target if target != self.pivotParameterID)
-      return finalResult
-    else:
+      finalResult['_indexMap'] = dict((target, historyIndex + ['Cycle', self.pivotParameterID]) for target in self.target if target != self.pivotParameterID)
+    elif numHistories == 1:
       return self._evaluateCycle(featureVals)
+    else:
+      finalResult = self._evaluateHistories(featureVals, numHistories)
+      finalResult['_indexMap'] = dict((target, ['History', self.pivotParameterID]) for target in self.target if target != self.pivotParameterID)
+    if numHistories > 1:
+      finalResult['History'] = np.arange(numHistories)
+    return finalResult
 
   def _evaluateScales(self, growthInfos, cycles):
     """
@@ -867,6 +890,93 @@ class ARMA(SupervisedLearning):
     # END for target in targets
     return returnEvaluation
 
+  def _evaluateHistories(self, featureVals, numHistories):
+    """
+      Synthesizes several independent histories at once; this is the vectorized counterpart of "_evaluateCycle".
+      @ In, featureVals, float, a scalar feature value is passed as scaling factor
+      @ In, numHistories, int, number of histories to synthesize
+      @ Out, returnEvaluation, dict, dictionary of values for each target (and pivot parameter), where
+             each target has shape (numHistories, len(pivotParameterValues))
+    """
+    if featureVals.size > 1:
+      self.raiseAnError(ValueError, 'The input feature for ARMA for evaluation cannot have size greater than 1. ')
+    numPivots = len(self.pivotParameterValues)
+    returnEvaluation = {self.pivotParameterID:self.pivotParameterValues}
+    correlatedSample = None
+    for target in self.target:
+      # start with the random gaussian signals
+      if target in self.correlations:
+        corrIndex = self.correlations.index(target)
+        # zero-filtering with correlated targets
+        if len(self.varmaResult) > 1:
+          filterTargetIndex = self.correlations.index(self.zeroFilterTarget)
+          notZeroMask = self._masks[target]['notZeroFilterMask']
+          zeroMask = self._masks[target]['zeroFilterMask']
+          if correlatedSample is None:
+            unzeroedSample = self._generateVARMASignals(self.varmaResult[0], numHistories,
+                                                        numSamples=notZeroMask.sum(), rvsIndex=0)
+            ## zero sampling is dependent on whether the trained model is a VARMA or ARMA
+            if self.varmaNoise[1] is not None:
+              zeroedSample = self._generateVARMASignals(self.varmaResult[1], numHistories,
+                                                        numSamples=zeroMask.sum(), rvsIndex=1)
+            else:
+              zeroedSample = self._generateARMASignals(self.varmaResult[1], numHistories,
+                                                       numSamples=zeroMask.sum(),
+                                                       randEngine=self.randomEng)[:, :, np.newaxis]
+            correlatedSample = True # placeholder, signifies we've sampled the correlated distribution
+          # reconstruct base signals from samples
+          signal = np.zeros((numHistories, numPivots))
+          signal[:, self._masks[self.zeroFilterTarget]['notZeroFilterMask']] = unzeroedSample[:, :, corrIndex]
+          if target != self.zeroFilterTarget:
+            # fix offset since we didn't include zero-filter target in zeroed correlated arma
+            indexOffset = 0 if corrIndex < filterTargetIndex else -1
+            signal[:, self._masks[self.zeroFilterTarget]['zeroFilterMask']] = zeroedSample[:, :, corrIndex+indexOffset]
+        else:
+          if correlatedSample is None:
+            correlatedSample = self._generateVARMASignals(self.varmaResult[0], numHistories,
+                                                          numSamples=numPivots, rvsIndex=0)
+          signal = correlatedSample[:, :, corrIndex]
+      else:
+        result = self.armaResult[target] # ARMAResults object
+        if target == self.zeroFilterTarget:
+          notZeroMask = self._masks[target]['notZeroFilterMask']
+          signal = np.zeros((numHistories, numPivots))
+          signal[:, notZeroMask] = self._generateARMASignals(result, numHistories,
+                                                             numSamples=notZeroMask.sum(),
+                                                             randEngine=self.randomEng)
+        else:
+          signal = self._generateARMASignals(result, numHistories,
+                                             numSamples=numPivots,
+                                             randEngine=self.randomEng)
+      # END creating base signals
+      # denoise
+      signal = self._denormalizeThroughCDF(signal, self.cdfParams[target])
+      # Add fourier trends
+      if target in self.fourierParams:
+        signal += self.fourierResults[target]['predict']
+      # peaks and CDF preservation are specific to each history
+      if target in self.peaks:
+        for h in range(numHistories):
+          signal[h] = self._transformBackPeaks(signal[h], windowDict=self.peaks[target])
+      if self.preserveInputCDF:
+        for h in range(numHistories):
+          signal[h] = self._transformThroughInputCDF(signal[h], self._trainingCDF[target])
+      # Re-zero out zero filter target's zero regions
+      if target == self.zeroFilterTarget:
+        signal[:, self._masks[target]['zeroFilterMask']] = 0.0
+      # Domain limitations
+      for domain,requests in self.outTruncation.items():
+        if target in requests:
+          if domain == 'positive':
+            signal = np.absolute(signal)
+          elif domain == 'negative':
+            signal = -np.absolute(signal)
+      ## FIXME this is ASSUMING the input to ARMA is only ever a single scaling factor.
+      signal *= featureVals[0]
+      assert(signal.shape == (numHistories, numPivots))
+      returnEvaluation[target] = signal
+    return returnEvaluation
+
   def reseed(self, seed):
     """
       Used to set the underlying random seed.
@@ -896,7 +1006,12 @@ class ARMA(SupervisedLearning):
       @ In, params, dict, CDF parameters (as obtained by "generateCDF")
       @ Out, normed, np.array, normalized data
     """
-    denormed = self.normEngine.cdf(data)
+    if np.ndim(data) > 1:
+      # the Normal distribution evaluates one entry at a time; for many histories at once,
+      # use the (identical) standard normal CDF on the whole array instead
+      denormed = mathUtils.normalCdf(data)
+    else:
+      denormed = self.normEngine.cdf(data)
     denormed = self._sampleICDF(denormed, params)
     return denormed
 
@@ -923,6 +1038,27 @@ class ARMA(SupervisedLearning):
                                                     burnin = 2*max(self.P,self.Q)) # @alfoa, 2020
     return hist
 
+  def _generateARMASignals(self, model, numHistories, numSamples=None, randEngine=None):
+    """
+      Generates several independent synthetic histories from fitted parameters at once.
+      Equivalent to calling "_generateARMASignal" once for each history.
+      @ In, model, statsmodels.tsa.arima_model.ARMAResults, fitted ARMA such as otained from _trainARMA
+      @ In, numHistories, int, number of histories to generate
+      @ In, numSamples, int, optional, number of samples to take (default to pivotParameters length)
+      @ In, randEngine, instance, optional, random number generator
+      @ Out, hist, np.array(float), synthetic ARMA signals with shape (numHistories, numSamples)
+    """
+    if numSamples is None:
+      numSamples = len(self.pivotParameterValues)
+    if randEngine is None:
+      randEngine = self.randomEng
+    burnin = 2*max(self.P, self.Q)
+    # innovations for all the histories, drawn in the same order as the one-at-a-time generation
+    noise = randomUtils.randomNormal(size=(numHistories, numSamples + burnin), keepMatrix=True, engine=randEngine)
+    noise *= np.sqrt(model.sigma2)
+    hist = lfilter(np.append(1., model.maparams), np.append(1., -model.arparams), noise, axis=-1)
+    return hist[:, burnin:]
+
   def _generateFourierSignal(self, pivots, periods):
     """
       Generate fourier signal as specified by the input file
@@ -977,6 +1113,42 @@ class ARMA(SupervisedLearning):
     # add zeros back in for zeroed variable, if necessary? FIXME -> looks like no, this is done later in _evaluateCycle
     return obs
 
+  def _generateVARMASignals(self, model, numHistories, numSamples=None, rvsIndex=None):
+    """
+      Generates several independent sets of correlated synthetic histories at once.
+      The state space recursion of "model.ssm.simulate" is advanced for all the histories together.
+      @ In, model, statsmodels.tsa.statespace.VARMAX, fitted VARMA such as otained from _trainVARMA
+      @ In, numHistories, int, number of histories to generate
+      @ In, numSamples, int, optional, number of samples to take (default to pivotParameters length)
+      @ In, rvsIndex, int, optional, if provided then will take from list of varmaNoise and varmaInit distributions
+      @ Out, obs, np.array(float), synthetic VARMA signals with shape (numHistories, numSamples, # variables)
+    """
+    if numSamples is None:
+      numSamples = len(self.pivotParameterValues)
+    noiseDist = self.varmaNoise
+    initDist = self.varmaInit
+    if rvsIndex is not None:
+      noiseDist = noiseDist[rvsIndex]
+      initDist = initDist[rvsIndex]
+    # state shocks for all the histories, with NUMPY (see _generateVARMASignal)
+    mean = noiseDist.mu
+    cov = noiseDist.covariance.reshape([len(mean)]*2)
+    stateShocks = np.random.multivariate_normal(mean, cov, (numHistories, numSamples))
+    # intial states by sampling multinormal distribution
+    states = np.array([initDist.rvs() for _ in range(numHistories)])
+    # time-invariant state space representation; measurement shocks are always zero
+    ssm = model.ssm
+    design = ssm['design', :, :, 0]
+    obsIntercept = ssm['obs_intercept', :, 0]
+    transition = ssm['transition', :, :, 0]
+    stateIntercept = ssm['state_intercept', :, 0]
+    selection = ssm['selection', :, :, 0]
+    obs = np.zeros((numHistories, numSamples, design.shape[0]))
+    for t in range(numSamples):
+      obs[:, t, :] = obsIntercept + states @ design.T
+      states = stateIntercept + states @ transition.T + stateShocks[:, t, :] @ selection.T
+    return obs
+
   def _interpolateDist(self, x, y, Xlow, Xhigh, Ylow, Yhigh, inMask):
     """
       Interplotes values for samples "x" to get dependent values "y" given bins
@@ -2232,11 +2404,12 @@ class ARMA(SupervisedLearning):
           mySig = np.tile(sig, (self.numCycles, 1))
           mySig = (mySig.T * scales).T
           # TODO can we do this all at once with a vector operation? -> you betcha
-          evaluation[target][:, localPicker] += mySig
+          evaluation[target][..., localPicker] += mySig
         else:
           # if last segment is shorter than other clusters, just keep the part of the evaluation
           #     that makes sense? I guess? What about the "truncated" case above? - talbpaul 2020-10
-          evaluation[target][localPicker] += sig
+          # NOTE the leading "..." also covers multiple histories (see numHistories)
+          evaluation[target][..., localPicker] += sig
     return evaluation
 
   def finalizeGlobalRomSegmentEvaluation(self, settings, evaluation, weights=None, slicer=None):
@@ -2264,29 +2437,47 @@ class ARMA(SupervisedLearning):
       @ In, weights, np.array(float), optional, if included then gives weight to histories for CDF preservation
       @ Out, evaluation, dict, {target: np.ndarray} adjusted global evaluation
     """
-    # TODO FIXME
-    import scipy.stats as stats
     if self.preserveInputCDF:
       for target, dist in settings['input CDFs'].items():
-        if self.multicycle: #TODO check this gets caught correctly by the templateROM.
-          cycles = range(len(evaluation[target]))
-          scaling = self._evaluateScales(self.growthFactors[target], cycles)
-          # multicycle option
-          for y in range(len(evaluation[target])):
-            scale = scaling[y]
-            if scale != 1:
-              # apply it to the preserve CDF histogram BOUNDS (bin edges)
-              objectDist = dist[0]
-              histDist = tuple([dist[1][0], dist[1][1]*scale])
-              newObject = stats.rv_histogram(histDist)
-              newDist = tuple([newObject, histDist])
-              evaluation[target][y] = self._transformThroughInputCDF(evaluation[target][y], newDist, weights)
-            else:
-              evaluation[target][y] = self._transformThroughInputCDF(evaluation[target][y], dist, weights)
+        if self.numHistories > 1:
+          # each independent history is transformed on its own
+          for h in range(len(evaluation[target])):
+            evaluation[target][h] = self._preserveHistoryCDF(target, evaluation[target][h], dist, weights)
         else:
-          evaluation[target] = self._transformThroughInputCDF(evaluation[target], dist, weights)
+          evaluation[target] = self._preserveHistoryCDF(target, evaluation[target], dist, weights)
     return evaluation
 
+  def _preserveHistoryCDF(self, target, values, dist, weights):
+    """
+      Helper method for _finalizeGlobalRSE_preserveCDF, transforms a single (possibly multicycle)
+      history through the input CDF.
+      @ In, target, str, name of the target
+      @ In, values, np.ndarray, evaluated full (global) signal for the target
+      @ In, dist, tuple, input CDF of the target (as from getGlobalRomSegmentSettings)
+      @ In, weights, np.array(float), optional, if included then gives weight to histories for CDF preservation
+      @ Out, values, np.ndarray, transformed signal
+    """
+    # TODO FIXME
+    import scipy.stats as stats
+    if self.multicycle: #TODO check this gets caught correctly by the templateROM.
+      cycles = range(len(values))
+      scaling = self._evaluateScales(self.growthFactors[target], cycles)
+      # multicycle option
+      for y in range(len(values)):
+        scale = scaling[y]
+        if scale != 1:
+          # apply it to the preserve CDF histogram BOUNDS (bin edges)
+          objectDist = dist[0]
+          histDist = tuple([dist[1][0], dist[1][1]*scale])
+          newObject = stats.rv_histogram(histDist)
+          newDist = tuple([newObject, histDist])
+          values[y] = self._transformThroughInputCDF(values[y], newDist, weights)
+        else:
+          values[y] = self._transformThroughInputCDF(values[y], dist, weights)
+    else:
+      values = self._transformThroughInputCDF(values, dist, weights)
+    return values
+
   def _finalizeGlobalRSE_zeroFilter(self, settings, evaluation, weights, slicer):
     """
       Helper method for finalizeGlobalRomSegmentEvaluation,
@@ -2307,10 +2498,8 @@ class ARMA(SupervisedLearning):
         newMask = np.asarray(newMask)
       else:
         newMask = mask
-      if self.multicycle:
-        evaluation[self.zeroFilterTarget][:, newMask] = 0
-      else:
-        evaluation[self.zeroFilterTarget][newMask] = 0
+      # the mask applies to the last (pivot) dimensions, regardless of cycles and histories
+      evaluation[self.zeroFilterTarget][..., newMask] = 0
     return evaluation
 
 
@@ -100,6 +100,16 @@ class DMD(SupervisedLearning):
                                                  descr=r"""energy level ($0.0 < float < 1.0$) used to compute the rank such
                                                    as computed rank is the number of the biggest singular values needed to reach the energy identified by
                                                    \xmlNode{energyRankSVD}. This node has always priority over  \xmlNode{rankSVD}""", default=None))
+    specs.addSub(InputData.parameterInputFactory("svdSolver", contentType=InputTypes.makeEnumType("svdSolver", "svdSolverType", ["full", "randomized"]),
+                                                 descr=r"""the algorithm used to compute the truncated SVD. Available are:
+                                                  \begin{itemize}
+                                                    \item \textit{full}, the full SVD is computed and then truncated
+                                                    \item \textit{randomized}, only the leading singular vectors are computed,
+                                                          with a randomized range finder (Halko et al., 2011). Much faster for long
+                                                          histories (or high order DMD) when the truncation rank is small, at the cost of an
+                                                          approximation of the order of the discarded singular values. It is used only
+                                                          if \xmlNode{rankSVD} or \xmlNode{energyRankSVD} truncate the decomposition.
+                                                  \end{itemize}""", default="full"))
     specs.addSub(InputData.parameterInputFactory("rankTLSQ", contentType=InputTypes.IntegerType,
                                                  descr=r"""$int > 0$ that defines the truncation rank to be used for the total
                                                   least square problem. If not inputted, no truncation is applied""", default=None))
@@ -129,6 +139,7 @@ class DMD(SupervisedLearning):
     self.pivotValues                 = None                                 # pivot values (e.g. time)
     self.KDTreeFinder                = None                                 # kdtree weighting model
     self.timeScales                  = {}                                   # time-scales (training and dmd). {'training' and 'dmd':{t0:float,'dt':float,'intervals':int}}
+    self._reconstructedData          = {}                                   # cache of the reconstructed training data {'target1': matrix (n_samples,n_time_steps), etc.}
 
   def _handleInput(self, paramInput):
     """
@@ -138,7 +149,8 @@ class DMD(SupervisedLearning):
     """
     super()._handleInput(paramInput)
     settings, notFound = paramInput.findNodesAndExtractValues(['pivotParameter','rankSVD', 'energyRankSVD',
-                                                               'rankTLSQ','exactModes','optimized', 'dmdType'])
+                                                               'rankTLSQ','exactModes','optimized', 'dmdType',
+                                                               'svdSolver'])
     # notFound must be empty
     assert(not notFound)
     self.pivotParameterID            = settings.get("pivotParameter","time")  # pivot parameter
@@ -148,6 +160,7 @@ class DMD(SupervisedLearning):
     self.dmdParams['exactModes'    ] = settings.get('exactModes',True)        # True if the exact modes need to be computed (eigs and eigvs), otherwise the projected ones (using the left-singular matrix)
     self.dmdParams['optimized'     ] = settings.get('optimized',False)        # amplitudes computed minimizing the error between the mods and all the timesteps (True) or 1st timestep only (False)
     self.dmdParams['dmdType'       ] = settings.get('dmdType','dmd')          # the dmd type to be applied. Currently we support dmd and hdmd (high order dmd)
+    self.dmdParams['svdSolver'     ] = settings.get('svdSolver','full')       # full (svd then truncation) or randomized (leading singular vectors only)
 
     # some checks
     if self.dmdParams['rankSVD'] is not None and self.dmdParams['energyRankSVD'] is not None:
@@ -166,6 +179,8 @@ class DMD(SupervisedLearning):
     """
     self.__dict__.update(state)
     self.KDTreeFinder = spatial.KDTree(self.featureVals)
+    if '_reconstructedData' not in state:
+      self._reconstructedData = {}
 
   def _localNormalizeData(self,values,names,feat):
     """
@@ -208,6 +223,16 @@ class DMD(SupervisedLearning):
     data = self._modes[target].dot(self.__getTimeEvolution(target))
     return data
 
+  def _getReconstructedData(self, target):
+    """
+      Retrieve the (real part of the) reconstructed training data, computed once after the training
+      @ In, target, str, the target for which the data needs to be reconstructed
+      @ Out, data, numpy.ndarray, the matrix (nsamples,n_time_steps) containing the reconstructed data
+    """
+    if target not in self._reconstructedData:
+      self._reconstructedData[target] = self._reconstructData(target).real
+    return self._reconstructedData[target]
+
   def __trainLocal__(self,featureVals,targetVals):
     """
       Perform training on input database stored in featureVals.
@@ -216,6 +241,7 @@ class DMD(SupervisedLearning):
     """
     self.featureVals  = featureVals
     self.KDTreeFinder = spatial.KDTree(featureVals)
+    self._reconstructedData = {}
     pivotParamIndex   = self.target.index(self.pivotParameterID)
     self.pivotValues  = targetVals[0,:,pivotParamIndex]
     ts                = len(self.pivotValues)
@@ -233,7 +259,7 @@ class DMD(SupervisedLearning):
       if self.dmdParams['rankTLSQ'] is not None:
         X, Y = mathUtils.computeTruncatedTotalLeastSquare(X, Y, self.dmdParams['rankTLSQ'])
       rank = self.dmdParams['energyRankSVD'] if self.dmdParams['energyRankSVD'] is not None else (self.dmdParams['rankSVD'] if self.dmdParams['rankSVD'] is not None else -1)
-      U, s, V = mathUtils.computeTruncatedSingularValueDecomposition(X, rank)
+      U, s, V = mathUtils.computeTruncatedSingularValueDecomposition(X, rank, randomized=self.dmdParams['svdSolver'] == 'randomized')
       # lowrank operator from the SVD of matrices X and Y
       self.__Atilde[target] = U.T.conj().dot(Y).dot(V) * np.reciprocal(s)
       self._eigs[target], self._modes[target] = mathUtils.computeEigenvaluesAndVectorsFromLowRankOperator(self.__Atilde[target],
@@ -257,18 +283,21 @@ class DMD(SupervisedLearning):
       @ Out, returnEvaluation , dict, dictionary of values for each target (and pivot parameter)
     """
     returnEvaluation = {self.pivotParameterID:self.pivotValues}
+    # find the nearest data and compute weights (the same for all the targets)
+    nSamples = len(self.featureVals)
+    if nSamples > 1:
+      weights, indexes = self.KDTreeFinder.query(featureVals, k=min(2**len(self.features),nSamples))
+      # if 0 (perfect match), assign minimum possible distance
+      weights[weights == 0] = sys.float_info.min
+      weights =1./weights
+      # normalize to 1 (for each requested point)
+      weights = weights/weights.sum(axis=1, keepdims=True)
     for target in list(set(self.target) - set([self.pivotParameterID])):
-      reconstructData = self._reconstructData(target).real
-      # find the nearest data and compute weights
-      if len(reconstructData) > 1:
-        weights, indexes = self.KDTreeFinder.query(featureVals, k=min(2**len(self.features),len(reconstructData)))
-        # if 0 (perfect match), assign minimum possible distance
-        weights[weights == 0] = sys.float_info.min
-        weights =1./weights
-        # normalize to 1
-        weights = weights/weights.sum()
-        for point in range(len(weights)):
-          returnEvaluation[target] =  np.sum ((weights[point,:]*reconstructData[indexes[point,:]].T) , axis=1)
+      reconstructData = self._getReconstructedData(target)
+      if nSamples > 1:
+        # all the requested points at once, shape (n_requests, n_time_steps)
+        evaluation = np.einsum('pk,pkt->pt', weights, reconstructData[indexes])
+        returnEvaluation[target] = evaluation[0] if len(evaluation) == 1 else evaluation
       else:
         returnEvaluation[target] = reconstructData[0]
 
@@ -380,6 +409,7 @@ class DMD(SupervisedLearning):
     self.pivotValues  = None
     self.KDTreeFinder = None
     self.featureVals  = None
+    self._reconstructedData = {}
 
   def __returnInitialParametersLocal__(self):
     """
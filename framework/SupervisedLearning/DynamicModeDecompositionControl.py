@@ -400,7 +400,8 @@ class DMDC(DMD):
     # Omega Matrix, stack X1 and U
     omega = np.concatenate((X1, U), axis=0)
     # SVD
-    uTrucSVD, sTrucSVD, vTrucSVD = mathUtils.computeTruncatedSingularValueDecomposition(omega, rankSVD, False, False)
+    uTrucSVD, sTrucSVD, vTrucSVD = mathUtils.computeTruncatedSingularValueDecomposition(omega, rankSVD, False, False,
+                                                                                       self.dmdParams['svdSolver'] == 'randomized')
     # Find the truncation rank triggered by "s>=SminValue"
     rankTruc = sum(map(lambda x : x>=1e-6, sTrucSVD.tolist()))
     if rankTruc < uTrucSVD.shape[1]:
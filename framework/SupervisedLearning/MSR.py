@@ -339,20 +339,28 @@ class MSR(NDinterpolatorRom):
     #        SupervisedLearning, which requires features and targets by
     #        default, which we don't have here. When the NearestNeighbor is
     #        implemented in unSupervisedLearning switch to it.
+    if len(self.__amsc) != len(self.target):
+      self.__amsc = []
     for index in range(len(self.target)):
-      self.__amsc.append( AMSC_Object(X=self.X, Y=self.Y[:,index], w=weights, names=names,
-                                      graph=self.graph, gradient=self.gradient,
-                                      knn=self.knn, beta=self.beta,
-                                      normalization=None,
-                                      persistence=self.persistence) )
+      if len(self.__amsc) > index:
+        ## retraining (e.g. by an adaptive sampler): when the training set only
+        ## grew, just the new samples are added to the decomposition
+        self.__amsc[index].Update(self.X, self.Y[:,index], weights)
+      else:
+        self.__amsc.append( AMSC_Object(X=self.X, Y=self.Y[:,index], w=weights, names=names,
+                                        graph=self.graph, gradient=self.gradient,
+                                        knn=self.knn, beta=self.beta,
+                                        normalization=None,
+                                        persistence=self.persistence) )
       self.__amsc[index].Persistence(self.simplification)
       self.__amsc[index].BuildLinearModels(self.simplification)
 
     # We need a KD-Tree for querying neighbors
     self.kdTree = sklearn.neighbors.KDTree(self.X)
 
-    distances,_ = self.kdTree.query(self.X,k=self.knn)
-    distances = distances.flatten()
+    # The neighbor graph shared by the AMSC objects above already holds the
+    # distances to the knn nearest neighbors
+    distances = self.__amsc[0].neighborGraph.distances.flatten()
 
     # The following are a list of common kernels defined centered at zero with
     # either infinite support or a support defined over the interval [1,1].
@@ -29,11 +29,38 @@ import numpy as np
 import pandas as pd
 from scipy.interpolate import interp1d
 # internal libraries
-from utils import utils, mathUtils, xmlUtils, randomUtils
+from utils import utils, mathUtils, xmlUtils, randomUtils, parallelUtils
 from utils import InputData, InputTypes
 from .SupervisedLearning import SupervisedLearning
 # import pickle as pk # TODO remove me!
 import os
+
+# upper bound for the per-segment seeds drawn from the global random number stream
+_maxSegmentSeed = 2**31 - 2
+
+def _trainSegmentTask(index, subdiv, seed):
+  """
+    Trains one segment ROM; executed by the worker processes of the collection.
+    @ In, index, int, segment number
+    @ In, subdiv, tuple, (first index, last index) of the segment (inclusive)
+    @ In, seed, int, seed for this segment
+    @ Out, rom, SupervisedLearning instance, trained segment ROM
+  """
+  collection = parallelUtils.getShared('collection')
+  return collection._trainSegment(parallelUtils.getShared('templateROM'), index, subdiv,
+                                  parallelUtils.getShared('trainingSet'), seed)
+
+def _evaluateSegmentTask(index, seed):
+  """
+    Evaluates one segment ROM; executed by the worker processes of the collection.
+    @ In, index, int, index of the ROM in the shared list of ROMs
+    @ In, seed, int, seed for this segment
+    @ Out, result, dict, evaluation of the segment ROM
+  """
+  rom = parallelUtils.getShared('roms')[index]
+  randomUtils.randomSeed(seed, seedBoth=True)
+  rom.reseed(seed)
+  return rom.evaluate(parallelUtils.getShared('evaluationDict'))
 #
 #
 #
@@ -241,6 +268,12 @@ class Segments(Collection):
             subspace restarts at the value of the first segment. This is useful in the event subspace 0 is not
             a desirable value.""")
     segment.addSub(subspace)
+    segment.addSub(InputData.parameterInputFactory('numWorkers', contentType=InputTypes.IntegerType,
+        descr=r"""number of local processes among which the training and the evaluation of the segment
+        ROMs are distributed. If set to 1 the segments are handled one at a time; if set to 0 or a
+        negative number one process per available core is used. Each segment is seeded independently
+        from the global random number stream, so the results are reproducible and do not depend on the
+        number of processes.""", default=1))
     spec.addSub(segment)
 
     return spec
@@ -262,6 +295,8 @@ class Segments(Collection):
     # allow some ROM training to happen globally, seperate from individual segment training
     ## see design note for Clusters
     self._romGlobalAdjustments = None  # global ROM settings, provided by the templateROM before clustering
+    self._numWorkers = 1               # number of processes to distribute segment training/evaluation over
+    self._segmentTimings = {}          # wall time (s) of each segment, by action (training, evaluation)
 
   def _handleInput(self, paramInput):
     """
@@ -311,6 +346,9 @@ class Segments(Collection):
     self._divisionInstructions = divisionMode
     if len(self._divisionInstructions) > 1:
       self.raiseAnError(NotImplementedError, 'Segmented ROMs do not yet handle multiple subspaces!')
+    workersNode = inputSpecs.findFirst('numWorkers')
+    if workersNode is not None:
+      self._numWorkers = workersNode.value
 
   ###############
   # RUN METHODS #
@@ -420,9 +458,7 @@ class Segments(Collection):
     nextEntry = 0  # index to fill next data set into
     self.raiseADebug('Sampling from {} segments ...'.format(len(self._roms)))
     roms = self._getSequentialRoms()
-    for r, rom in enumerate(roms):
-      self.raiseADebug('Evaluating ROM segment', r)
-      subResults = rom.evaluate(evaluationDict)
+    for r, subResults in enumerate(self._evaluateSegmentRoms(roms, evaluationDict)):
       ## DEBUGGING OPTIONS
       # year = getattr(self, 'DEBUGGYEAR', 0)
       #This is the place have debugg file
@@ -501,6 +537,55 @@ class Segments(Collection):
       result['_indexMap'] = indexMap
     return result
 
+  def _evaluateSegmentRoms(self, roms, evaluationDict):
+    """
+      Evaluates each of the given ROMs, distributing the evaluations across processes if requested.
+      @ In, roms, list, ROMs to evaluate (may contain the same ROM multiple times)
+      @ In, evaluationDict, dict, realization to evaluate
+      @ Out, results, list(dict), evaluation of each ROM, in the same order as "roms"
+    """
+    numWorkers = parallelUtils.resolveNumWorkers(getattr(self, '_numWorkers', 1), len(roms))
+    seeds, resume = self._getSegmentSeeds(len(roms))
+    shared = {'roms': roms, 'evaluationDict': evaluationDict}
+    results, timings = parallelUtils.mapInParallel(_evaluateSegmentTask, zip(range(len(roms)), seeds),
+                                                   numWorkers=numWorkers, shared=shared)
+    randomUtils.randomSeed(resume, seedBoth=True)
+    self._reportSegmentTimings('evaluation', timings, numWorkers)
+    return results
+
+  def _getSegmentSeeds(self, numSegments):
+    """
+      Draws one seed per segment from the global stream. Each worker process holds its own copy of the
+      random number generators, so segments are seeded individually, whether they are handled in this
+      process or not, to keep results reproducible and independent of the number of workers.
+      The segments handled in this process leave the generators in a state that depends on the number
+      of workers, so one more seed is drawn to restart the global stream once they are all handled.
+      @ In, numSegments, int, number of segments to be handled
+      @ Out, seeds, list, seed for each segment
+      @ Out, resume, int, seed to restart the global stream with after the segments are handled
+    """
+    seeds = [randomUtils.randomIntegers(0, _maxSegmentSeed, self) for _ in range(numSegments + 1)]
+    return seeds[:-1], seeds[-1]
+
+  def _reportSegmentTimings(self, action, timings, numWorkers):
+    """
+      Stores and reports the time spent on each segment.
+      @ In, action, str, name of the timed action (e.g. "training")
+      @ In, timings, list(float), wall time in seconds spent on each segment
+      @ In, numWorkers, int, number of processes used
+      @ Out, None
+    """
+    if not timings:
+      return
+    if not hasattr(self, '_segmentTimings'):
+      self._segmentTimings = {}
+    self._segmentTimings[action] = np.asarray(timings)
+    for s, elapsed in enumerate(timings):
+      self.raiseADebug(f'Segment {s} {action} time: {elapsed:1.3e} s')
+    slowest = int(np.argmax(timings))
+    self.raiseADebug(f'Segment {action} for "{self._romName}": {len(timings)} segments on {numWorkers} process(es), ' +
+                     f'total {sum(timings):1.3e} s, slowest segment {slowest} ({timings[slowest]:1.3e} s)')
+
   def _getSequentialRoms(self):
     """
       Returns ROMs in sequential order. Trivial for Segmented.
@@ -604,34 +689,54 @@ class Segments(Collection):
     # TODO assumes only pivot param
     if pivotID not in self._indexValues:
       self._indexValues[pivotID] = trainingSet[pivotID][0]
-    # loop over clusters and train data
-    roms = []
-    for i, subdiv in enumerate(counter):
-      # slicer for data selection
-      picker = slice(subdiv[0], subdiv[-1] + 1)
-      ## TODO we need to be slicing all the data, not just one realization, once we support non-ARMA segmentation.
-      data = dict((var, [copy.deepcopy(trainingSet[var][0][picker])]) for var in trainingSet)
-      # renormalize the pivot if requested, e.g. by shifting values
-      norm = self._divisionPivotShift[pivotID]
-      if norm:
-        if norm == 'zero':
-          # left-shift pivot so subspace starts at 0 each time
-          delta = data[pivotID][0][0]
-        elif norm == 'first':
-          # left-shift so that first entry is equal to pivot's first value (maybe not zero)
-          delta = data[pivotID][0][0] - trainingSet[pivotID][0][0]
-        data[pivotID][0] -= delta
-      # create a new ROM and train it!
-      newROM = copy.deepcopy(templateROM)
-      newROM.name = '{}_seg{}'.format(self._romName, i)
-      newROM.adjustLocalRomSegment(self._romGlobalAdjustments, picker)
-      self.raiseADebug('Training segment', i, picker)
-      newROM.train(data)
-      roms.append(newROM)
+    # train the segments, possibly distributed across processes
+    numWorkers = parallelUtils.resolveNumWorkers(self._numWorkers, len(counter))
+    seeds, resume = self._getSegmentSeeds(len(counter))
+    shared = {'collection': self, 'templateROM': templateROM, 'trainingSet': trainingSet}
+    tasks = ((i, subdiv, seeds[i]) for i, subdiv in enumerate(counter))
+    roms, timings = parallelUtils.mapInParallel(_trainSegmentTask, tasks, numWorkers=numWorkers, shared=shared)
+    randomUtils.randomSeed(resume, seedBoth=True)
+    self._reportSegmentTimings('training', timings, numWorkers)
     # format array for future use
     roms = np.array(roms)
     return roms
 
+  def _trainSegment(self, templateROM, index, subdiv, trainingSet, seed):
+    """
+      Trains the ROM for a single subdomain.
+      @ In, templateROM, SupervisedLEarning.supervisedLearning instance, template ROM
+      @ In, index, int, segment number
+      @ In, subdiv, tuple, (first index, last index) of the subdomain (inclusive)
+      @ In, trainingSet, dict, data on which ROMs should be trained
+      @ In, seed, int, seed of the random number generators for the training
+      @ Out, newROM, SupervisedLearning instance, trained ROM for the subdomain
+    """
+    randomUtils.randomSeed(seed, seedBoth=True)
+    pivotID = templateROM.pivotParameterID
+    # slicer for data selection
+    picker = slice(subdiv[0], subdiv[-1] + 1)
+    ## TODO we need to be slicing all the data, not just one realization, once we support non-ARMA segmentation.
+    # subdomains are disjoint, so views of the training data are used rather than copies
+    data = dict((var, [trainingSet[var][0][picker]]) for var in trainingSet)
+    # renormalize the pivot if requested, e.g. by shifting values
+    norm = self._divisionPivotShift[pivotID]
+    if norm:
+      if norm == 'zero':
+        # left-shift pivot so subspace starts at 0 each time
+        delta = data[pivotID][0][0]
+      elif norm == 'first':
+        # left-shift so that first entry is equal to pivot's first value (maybe not zero)
+        delta = data[pivotID][0][0] - trainingSet[pivotID][0][0]
+      # not in place, the pivot values are a view of the training data
+      data[pivotID][0] = data[pivotID][0] - delta
+    # create a new ROM and train it!
+    newROM = copy.deepcopy(templateROM)
+    newROM.name = '{}_seg{}'.format(self._romName, index)
+    newROM.adjustLocalRomSegment(self._romGlobalAdjustments, picker)
+    self.raiseADebug('Training segment', index, picker)
+    newROM.train(data)
+    return newROM
+
   def _writeSegmentsRealization(self, writeTo):
     """
       Writes pointwise data about segmentation to a realization.
@@ -1043,6 +1148,7 @@ class Clusters(Segments):
     labelMap = self._clusterInfo['labels']
     clusters = sorted(list(set(labelMap)))
     pivotLen = 0
+    roms = []
     for cluster in clusters:
       # choose a ROM
       # TODO implement a distribution-based method for representative ROMs
@@ -1053,8 +1159,9 @@ class Clusters(Segments):
         ## option 2: choose randomly
         segmentIndex, clusterIndex = self._getSegmentIndexFromClusterIndex(cluster, labelMap, chooseRandom=True)
         rom = self._clusterInfo['map'][cluster][clusterIndex]
-      # evaluate the ROM
-      subResults = rom.evaluate(evaluationDict)
+      roms.append(rom)
+    # evaluate the ROMs
+    for cluster, subResults in zip(clusters, self._evaluateSegmentRoms(roms, evaluationDict)):
       # collect results
       newLen = len(subResults[pivotID])
       pivotLen += newLen
@@ -1429,6 +1536,10 @@ class Interpolated(SupervisedLearning):
             subspace restarts at the value of the first segment. This is useful in the event subspace 0 is not
             a desirable value.""")
     segment.addSub(subspace)
+    segment.addSub(InputData.parameterInputFactory('numWorkers', contentType=InputTypes.IntegerType,
+        descr=r"""number of local processes among which the training and the evaluation of the segment
+        ROMs of each macro step are distributed. See the \xmlNode{numWorkers} option of the segmented
+        ROMs.""", default=1))
     clusterEvalModeEnum = InputTypes.makeEnumType('clusterEvalModeEnum', 'clusterEvalModeType', ['clustered', 'truncated', 'full'])
     segment.addSub(InputData.parameterInputFactory('evalMode', strictMode=True, contentType=clusterEvalModeEnum,
         descr=r"""changes the structure of the samples for Clustered
@@ -21,13 +21,28 @@ import scipy as sp
 
 import Decorators
 
-from utils import InputData, InputTypes, randomUtils, xmlUtils, mathUtils, importerUtils
+from utils import InputData, InputTypes, randomUtils, xmlUtils, mathUtils, importerUtils, parallelUtils
 statsmodels = importerUtils.importModuleLazy('statsmodels', globals())
 
 import Distributions
 from .TimeSeriesAnalyzer import TimeSeriesGenerator, TimeSeriesCharacterizer
 
 
+def _fitARIMA(normed, order, lowMemory):
+  """
+    Fits an ARIMA model to a single signal; module-level so it can be distributed to worker processes.
+    @ In, normed, np.array, signal to fit
+    @ In, order, tuple, (P, d, Q) order of the model
+    @ In, lowMemory, bool, if True then use the lower memory fitting
+    @ Out, model, statsmodels.tsa.arima.model.ARIMA, ARIMA model
+    @ Out, res, statsmodels.tsa.arima.model.ARIMAResults, fitting results
+  """
+  import statsmodels.api
+  # TODO just use SARIMAX?
+  model = statsmodels.tsa.arima.model.ARIMA(normed, order=order)
+  res = model.fit(low_memory=lowMemory)
+  return model, res
+
 # utility methods
 class ARMA(TimeSeriesGenerator, TimeSeriesCharacterizer):
   r"""
@@ -125,18 +140,18 @@ class ARMA(TimeSeriesGenerator, TimeSeriesCharacterizer):
       @ In, settings, dict, settings for this ROM
       @ Out, params, dict, characteristic parameters
     """
-    # lazy import statsmodels
-    import statsmodels.api
     # settings:
     #   P: number of AR terms to use (signal lag)
     #   Q: number of MA terms to use (noise lag)
     #   gaussianize: whether to "whiten" noise before training
+    #   numWorkers: number of processes among which the targets are fit
     # set seed for training
     seed = settings['seed']
     if seed is not None:
       randomUtils.randomSeed(seed, engine=settings['engine'], seedBoth=True)
 
     params = {}
+    normedSignals = []
     for tg, target in enumerate(targets):
       params[target] = {}
       history = signal[:, tg]
@@ -149,13 +164,15 @@ class ARMA(TimeSeriesGenerator, TimeSeriesCharacterizer):
         normed = mathUtils.gaussianize(history, params[target]['cdf'])
       else:
         normed = history
-      # TODO correlation (VARMA) as well as singular -> maybe should be independent TSA algo?
-      P = settings['P']
-      Q = settings['Q']
-      d = settings.get('d', 0)
-      # TODO just use SARIMAX?
-      model = statsmodels.tsa.arima.model.ARIMA(normed, order=(P, d, Q))
-      res = model.fit(low_memory=settings['reduce_memory'])
+      normedSignals.append(normed)
+    # TODO correlation (VARMA) as well as singular -> maybe should be independent TSA algo?
+    P = settings['P']
+    Q = settings['Q']
+    d = settings.get('d', 0)
+    # the targets are independent, so the (expensive) fits can be performed concurrently
+    tasks = [(normed, (P, d, Q), settings['reduce_memory']) for normed in normedSignals]
+    fits, _ = parallelUtils.mapInParallel(_fitARIMA, tasks, numWorkers=settings.get('numWorkers', 1))
+    for target, (model, res) in zip(targets, fits):
       # NOTE on low_memory use, test using SyntheticHistory.ARMA test:
       #   case    | time used (s) | memory used (MiB)
       #   low mem | 2.570851      | 0.5
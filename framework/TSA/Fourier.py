@@ -15,10 +15,9 @@
   Fourier time series analysis
   Note this determines the fit of desired bases, not a fast fourier transform
 """
-import copy
 import collections
 import numpy as np
-import sklearn.linear_model
+import scipy.linalg
 
 from utils import InputData, InputTypes, randomUtils, xmlUtils, mathUtils, utils
 from .TimeSeriesAnalyzer import TimeSeriesGenerator, TimeSeriesCharacterizer
@@ -99,39 +98,19 @@ class Fourier(TimeSeriesGenerator, TimeSeriesCharacterizer):
     #                 3:   cos(2pi*t/period[1]), ...
     # check collinearity
     cond = np.linalg.cond(fourierSignals) if simultFit else 30
-    # fit
+    # fit; the Fourier bases are shared by all the targets, so all targets are fit together
+    if simultFit and cond < 30:
+      print(f'Fourier fitting condition number is {cond:1.1e} for "{", ".join(targets)}". ',
+                      ' Calculating all Fourier coefficients at once.')
+      intercepts, allCoeffs = self._fitSimultaneous(fourierSignals, signal)
+    else:
+      print(f'Fourier fitting condition number is {cond:1.1e} for "{", ".join(targets)}"! ',
+                      'Calculating iteratively instead of all at once.')
+      intercepts, allCoeffs = self._fitIterative(fourierSignals, signal)
     params = {}
     for tg, target in enumerate(targets):
-      history = signal[:, tg] # TODO need to keep in sync with SyntheticSignal ROM!
-      if simultFit and cond < 30:
-        print(f'Fourier fitting condition number is {cond:1.1e} for "{target}". ',
-                        ' Calculating all Fourier coefficients at once.')
-        fourierEngine = sklearn.linear_model.LinearRegression(normalize=False)
-        fourierEngine.fit(fourierSignals, history)
-        intercept = fourierEngine.intercept_
-        coeffs = fourierEngine.coef_
-      else:
-        print(f'Fourier fitting condition number is {cond:1.1e} for "{target}"! ',
-                        'Calculating iteratively instead of all at once.')
-        # fourierSignals has shape (H, 2F) where H is history len and F is number of Fourier periods
-        ## Fourier periods are in order from largest period to smallest, with sin then cos for each:
-        ## [S0, C0, S1, C1, ..., SN, CN]
-        H, F2 = fourierSignals.shape
-        signalToFit = copy.deepcopy(history) # will be modified during analysis
-        intercept = 0
-        coeffs = np.zeros(F2) # amplitude coeffs for sine, cosine
-        for fn in range(F2):
-          fSignal = fourierSignals[:,fn] # Fourier base signal for this waveform
-          eng = sklearn.linear_model.LinearRegression(normalize=False) # regressor
-          eng.fit(fSignal.reshape(H,1), signalToFit)
-          thisIntercept = eng.intercept_
-          thisCoeff = eng.coef_[0]
-          coeffs[fn] = thisCoeff
-          intercept += thisIntercept
-          # remove this signal from the signal to fit
-          thisSignal = thisIntercept + thisCoeff * fSignal
-          signalToFit -= thisSignal
-
+      intercept = intercepts[tg]
+      coeffs = allCoeffs[:, tg]
       # get coefficient map for A*sin(ft) + B*cos(ft)
       waveCoefMap = collections.defaultdict(dict) # {period: {sin:#, cos:#}}
       for c, coef in enumerate(coeffs):
@@ -200,12 +179,15 @@ class Fourier(TimeSeriesGenerator, TimeSeriesCharacterizer):
       @ Out, synthetic, np.array(float), synthetic ARMA signal
     """
     synthetic = np.zeros((len(pivot), len(params)))
-    for t, (target, data) in enumerate(params.items()):
-      synthetic[:, t] += data['intercept']
-      for period, coeffs in data['coeffs'].items():
-        C = coeffs['amplitude']
-        s = coeffs['phase']
-        synthetic[:, t] += mathUtils.evalFourier(period, C, s, pivot)
+    if not params:
+      return synthetic
+    # all the targets share the same periods, so evaluate each waveform for all targets at once
+    data = list(params.values())
+    synthetic += np.asarray([info['intercept'] for info in data], dtype=float)
+    for period in data[0]['coeffs']:
+      C = np.asarray([info['coeffs'][period]['amplitude'] for info in data])
+      s = np.asarray([info['coeffs'][period]['phase'] for info in data])
+      synthetic += mathUtils.evalFourier(period, C, s, pivot[:, np.newaxis])
     return synthetic
 
   def writeXML(self, writeTo, params):
@@ -229,6 +211,50 @@ class Fourier(TimeSeriesGenerator, TimeSeriesCharacterizer):
   #
   # Utility Methods
   #
+  def _fitSimultaneous(self, bases, signal):
+    """
+      Fits all the Fourier bases at once, for all the targets at once, with a single least squares
+      solve on the shared bases.
+      @ In, bases, np.array, Fourier bases with shape (H, 2F), see _generateBaseFourier
+      @ In, signal, np.array, signals to fit with shape (H, T), T is the number of targets
+      @ Out, intercepts, np.array, fit intercept for each target, shape (T,)
+      @ Out, coeffs, np.array, fit coefficients with shape (2F, T)
+    """
+    # center the data so the intercept is decoupled from the bases coefficients
+    baseMeans = bases.mean(axis=0)
+    signalMeans = signal.mean(axis=0)
+    coeffs = scipy.linalg.lstsq(bases - baseMeans, signal - signalMeans)[0]
+    intercepts = signalMeans - baseMeans @ coeffs
+    return intercepts, coeffs
+
+  def _fitIterative(self, bases, signal):
+    """
+      Fits the Fourier bases one at a time, each on the residual of the previous ones, for all the
+      targets at once.
+      @ In, bases, np.array, Fourier bases with shape (H, 2F), see _generateBaseFourier
+      @ In, signal, np.array, signals to fit with shape (H, T), T is the number of targets
+      @ Out, intercepts, np.array, fit intercept for each target, shape (T,)
+      @ Out, coeffs, np.array, fit coefficients with shape (2F, T)
+    """
+    # bases has shape (H, 2F) where H is history len and F is number of Fourier periods
+    ## Fourier periods are in order from largest period to smallest, with sin then cos for each:
+    ## [S0, C0, S1, C1, ..., SN, CN]
+    F2 = bases.shape[1]
+    signalToFit = np.array(signal, dtype=float) # will be modified during analysis
+    intercepts = np.zeros(signal.shape[1])
+    coeffs = np.zeros((F2, signal.shape[1])) # amplitude coeffs for sine, cosine
+    for fn in range(F2):
+      fSignal = bases[:, fn] # Fourier base signal for this waveform
+      # single-variable linear regression for every target at once
+      centered = fSignal - fSignal.mean()
+      thisCoeff = centered @ (signalToFit - signalToFit.mean(axis=0)) / (centered @ centered)
+      thisIntercept = signalToFit.mean(axis=0) - thisCoeff * fSignal.mean()
+      coeffs[fn] = thisCoeff
+      intercepts += thisIntercept
+      # remove this signal from the signal to fit
+      signalToFit -= thisIntercept + np.outer(fSignal, thisCoeff)
+    return intercepts, coeffs
+
   def _generateBaseFourier(self, pivots, periods):
     """
       Generate fourier signal as specified by the input file
@@ -75,7 +75,6 @@ class PolynomialRegression(TimeSeriesGenerator, TimeSeriesCharacterizer):
       @ Out, params, dict, characteristic parameters
     """
     from sklearn.preprocessing import PolynomialFeatures
-    import statsmodels.api as sm
 
     params = {target: {'model': {}} for target in targets}
 
@@ -83,12 +82,12 @@ class PolynomialRegression(TimeSeriesGenerator, TimeSeriesCharacterizer):
     features = PolynomialFeatures(degree=degree)
     xp = features.fit_transform(pivot.reshape(-1, 1))
 
-    for target in targets:
-      results = sm.OLS(signal, xp).fit()
-      params[target]['model']['intercept'] = results.params[0]
-      for i, value in enumerate(results.params[1:]):
+    # the polynomial features are shared by all targets, so solve for all of them at once
+    coeffs = np.linalg.lstsq(xp, signal, rcond=None)[0]
+    for t, target in enumerate(targets):
+      params[target]['model']['intercept'] = coeffs[0, t]
+      for i, value in enumerate(coeffs[1:, t]):
         params[target]['model'][f'coef{i+1}'] = value
-      params[target]['model']['object'] = results
     return params
 
   def getParamNames(self, settings):
@@ -115,8 +114,6 @@ class PolynomialRegression(TimeSeriesGenerator, TimeSeriesCharacterizer):
     for target, info in params.items():
       base = f'{self.name}__{target}'
       for name, value in info['model'].items():
-        if name == 'object':
-          continue
         rlz[f'{base}__{name}'] = value
     return rlz
 
@@ -135,8 +132,9 @@ class PolynomialRegression(TimeSeriesGenerator, TimeSeriesCharacterizer):
     xp = features.fit_transform(pivot.reshape(-1, 1))
 
     for t, (target, _) in enumerate(params.items()):
-      model = params[target]['model']['object']
-      synthetic[:, t] = model.predict(xp)
+      model = params[target]['model']
+      coeffs = [model['intercept']] + [model[f'coef{i}'] for i in range(1, degree + 1)]
+      synthetic[:, t] = xp @ np.asarray(coeffs, dtype=float)
 
     return synthetic
 
@@ -152,6 +150,4 @@ class PolynomialRegression(TimeSeriesGenerator, TimeSeriesCharacterizer):
       base = xmlUtils.newNode(target)
       writeTo.append(base)
       for name, value in info['model'].items():
-        if name == 'object':
-          continue
         base.append(xmlUtils.newNode(name, text=f'{float(value):1.9e}'))
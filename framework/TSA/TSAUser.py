@@ -41,6 +41,10 @@ class TSAUser:
     spec.addSub(InputData.parameterInputFactory('pivotParameter', contentType=InputTypes.StringType,
         descr=r"""If a time-dependent ROM is requested, please specifies the pivot
         variable (e.g. time, etc) used in the input HistorySet.""", default='time'))
+    spec.addSub(InputData.parameterInputFactory('numWorkers', contentType=InputTypes.IntegerType,
+        descr=r"""number of local processes among which the independent per-target fits of the TSA
+        algorithms (for example the ARMA fits) are distributed. If set to 0 or a negative number, one
+        process per available core is used.""", default=1))
     for typ in factory.knownTypes():
       c = factory.returnClass(typ)
       if subset == 'characterize' and not c.canCharacterize():
@@ -65,6 +69,7 @@ class TSAUser:
     self._paramNames = None          # cached list of parameter names
     self._paramRealization = None    # cached dict of param variables mapped to values
     self._tsaTargets = None          # cached list of targets
+    self._tsaNumWorkers = 1          # number of processes for per-target fits
     self.target = None
 
   def readTSAInput(self, spec):
@@ -75,6 +80,9 @@ class TSAUser:
     """
     if self.pivotParameterID is None: # might be handled by parent
       self.pivotParameterID = spec.findFirst('pivotParameter').value
+    workers = spec.findFirst('numWorkers')
+    if workers is not None:
+      self._tsaNumWorkers = workers.value
     for sub in spec.subparts:
       if sub.name in factory.knownTypes():
         algo = factory.returnInstance(sub.name)
@@ -156,13 +164,19 @@ class TSAUser:
       self._paramRealization = rlz
     return self._paramRealization
 
-  def trainTSASequential(self, targetVals):
+  def trainTSASequential(self, targetVals, numWorkers=None):
     """
       Train TSA algorithms using a sequential removal-and-residual approach.
+      Each algorithm characterizes all of its targets together; algorithms with shared bases
+      (e.g. Fourier) solve for all targets at once, while independent per-target fits (e.g. ARMA)
+      are distributed among "numWorkers" processes.
       @ In, targetVals, array, shape = [n_timeStep, n_dimensions], array of time series data
         NOTE: this should be a single history/realization, not an array of realizations
+      @ In, numWorkers, int, optional, number of processes for per-target fits (default from input)
       @ Out, None
     """
+    if numWorkers is None:
+      numWorkers = getattr(self, '_tsaNumWorkers', 1)
     pivotName = self.pivotParameterID
     # NOTE assumption: self.target exists!
     pivotIndex = self.target.index(pivotName)
@@ -176,7 +190,7 @@ class TSAUser:
       targets = settings['target']
       indices = tuple(self.target.index(t) for t in targets)
       signal = residual[0, :, indices].T # using tuple "indices" transposes, so transpose back
-      params = algo.characterize(signal, pivots, targets, settings)
+      params = algo.characterize(signal, pivots, targets, dict(settings, numWorkers=numWorkers))
       # store characteristics
       self._tsaTrainedParams[algo] = params
       # obtain residual; the part of the signal not characterized by this algo
@@ -122,9 +122,12 @@ class Wavelet(TimeSeriesGenerator, TimeSeriesCharacterizer):
     family = settings['family']
     params = {target: {'results': {}} for target in targets}
 
+    # decompose all the targets at once along the time axis
+    coeffA, coeffD = pywt.dwt(signal, family, axis=0)
     for i, target in enumerate(targets):
       results = params[target]['results']
-      results['coeff_a'], results['coeff_d'] = pywt.dwt(signal[:, i], family)
+      results['coeff_a'] = coeffA[:, i]
+      results['coeff_d'] = coeffD[:, i]
 
     return params
 
@@ -171,12 +174,13 @@ class Wavelet(TimeSeriesGenerator, TimeSeriesCharacterizer):
       raise ModuleNotFoundError
 
     synthetic = np.zeros((len(pivot), len(params)))
+    if not params:
+      return synthetic
     family = settings['family']
-    for t, (target, _) in enumerate(params.items()):
-      results = params[target]['results']
-      cA = results['coeff_a']
-      cD = results['coeff_d']
-      synthetic[:, t] = pywt.idwt(cA, cD, family)
+    # reconstruct all the targets at once along the time axis
+    cA = np.stack([info['results']['coeff_a'] for info in params.values()], axis=-1)
+    cD = np.stack([info['results']['coeff_d'] for info in params.values()], axis=-1)
+    synthetic[:, :] = pywt.idwt(cA, cD, family, axis=0)[:len(pivot)]
     return synthetic
 
 
@@ -39,6 +39,8 @@ import time
 import os
 import itertools
 import collections
+import hashlib
+import copy
 
 ####################################################
 # This is tenuous at best, if the the directory structure of RAVEN changes, this
@@ -88,6 +90,128 @@ def WeightedLinearModel(X,y,w):
 
   return (yIntercept,betaHat)
 
+class NeighborGraph(object):
+  """ The k-nearest neighbor graph used as the starting point of the
+      neighborhood graph of the AMSC. Computing it is the most expensive part of
+      building the AMSC, and it only depends on the (normalized) input samples,
+      so it is cached by GetNeighborGraph and shared by all of the AMSC objects
+      built on the same samples (e.g. different targets or persistence
+      measures). New samples can be added without recomputing the whole graph.
+  """
+  def __init__(self, X, knn):
+    """ Initialization method that computes the k-nearest neighbors of each of
+        the given samples.
+        @ In, X, an m-by-n array of values specifying m n-dimensional samples
+        @ In, knn, an integer value specifying the number of nearest neighbors
+          (including the sample itself) to retain for each sample; a
+          non-positive value means all of the samples.
+    """
+    import sklearn.neighbors
+    self.X = np.array(X, dtype=float)
+    self.fullyConnected = knn <= 0
+    self.knn = len(self.X)-1 if self.fullyConnected else knn
+    knnAlgorithm = sklearn.neighbors.NearestNeighbors(n_neighbors=self.knn,
+                                                      algorithm='kd_tree')
+    knnAlgorithm.fit(self.X)
+    self.distances, self.neighbors = knnAlgorithm.kneighbors(self.X)
+    self.edges = None
+
+  def AddSamples(self, X):
+    """ Appends new samples to the graph. Only the neighbors of the new samples
+        are searched; the neighbor lists of the existing samples are merged
+        with the new samples rather than recomputed.
+        @ In, X, a p-by-n array of values specifying p n-dimensional samples
+    """
+    import sklearn.neighbors
+    X = np.atleast_2d(np.array(X, dtype=float))
+    if self.fullyConnected:
+      ## every neighbor list changes size, nothing to reuse
+      self.__init__(np.vstack((self.X, X)), -1)
+      return
+    oldCount = len(self.X)
+    self.X = np.vstack((self.X, X))
+    k = min(self.knn, len(self.X))
+
+    ## neighbors of the new samples among all of the samples
+    knnAlgorithm = sklearn.neighbors.NearestNeighbors(n_neighbors=k,
+                                                      algorithm='kd_tree')
+    knnAlgorithm.fit(self.X)
+    newDistances, newNeighbors = knnAlgorithm.kneighbors(X)
+
+    ## the new samples can only replace the farthest neighbors of the old ones
+    newTree = sklearn.neighbors.NearestNeighbors(n_neighbors=min(k, len(X)),
+                                                 algorithm='kd_tree').fit(X)
+    candDistances, candNeighbors = newTree.kneighbors(self.X[:oldCount])
+    distances = np.hstack((self.distances, candDistances))
+    neighbors = np.hstack((self.neighbors, candNeighbors + oldCount))
+    order = np.argsort(distances, axis=1, kind='stable')[:, :k]
+    rows = np.arange(oldCount)[:, np.newaxis]
+
+    self.distances = np.vstack((distances[rows, order], newDistances))
+    self.neighbors = np.vstack((neighbors[rows, order], newNeighbors))
+    self.edges = None
+
+  def Edges(self):
+    """ Returns the undirected edges of the graph, ordered by their first
+        appearance in the neighbor lists and without self-loops or duplicates.
+        @ Out, a 2-by-e integer array, where each column holds the indices of
+          the two end points of an edge.
+    """
+    if self.edges is not None:
+      return self.edges
+    count = len(self.neighbors)
+    e1 = np.repeat(np.arange(count), self.neighbors.shape[1])
+    e2 = self.neighbors.ravel()
+    keep = e1 != e2
+    e1, e2 = e1[keep], e2[keep]
+    ## (i,j) and (j,i) are the same edge, keep the first one found
+    keys = np.minimum(e1, e2).astype(np.int64)*count + np.maximum(e1, e2)
+    _, first = np.unique(keys, return_index=True)
+    first.sort()
+    self.edges = np.vstack((e1[first], e2[first]))
+    return self.edges
+
+## Neighbor graphs indexed by a digest of the samples they were built from, the
+## least recently used are discarded when more than _graphCacheSize are stored.
+_graphCache = collections.OrderedDict()
+_graphCacheSize = 4
+
+def _GraphKey(X, knn):
+  """ Returns the key identifying the neighbor graph of a set of samples.
+      @ In, X, an m-by-n array of values specifying m n-dimensional samples
+      @ In, knn, an integer value specifying the number of nearest neighbors
+      @ Out, a hashable key
+  """
+  X = np.ascontiguousarray(X, dtype=float)
+  return (X.shape, hashlib.sha1(X.tobytes()).hexdigest(), int(knn) if knn > 0 else -1)
+
+def GetNeighborGraph(X, knn):
+  """ Returns the k-nearest neighbor graph of the given samples, computing it
+      only if it is not already cached.
+      @ In, X, an m-by-n array of values specifying m n-dimensional samples
+      @ In, knn, an integer value specifying the number of nearest neighbors,
+        a non-positive value means all of the samples.
+      @ Out, a NeighborGraph object
+  """
+  key = _GraphKey(X, knn)
+  if key in _graphCache:
+    _graphCache.move_to_end(key)
+  else:
+    StoreNeighborGraph(NeighborGraph(X, knn), key)
+  return _graphCache[key]
+
+def StoreNeighborGraph(graph, key=None):
+  """ Adds a neighbor graph to the cache.
+      @ In, graph, the NeighborGraph object to store
+      @ In, key, an optional key of the graph, computed from its samples if
+        not provided
+  """
+  if key is None:
+    key = _GraphKey(graph.X, -1 if graph.fullyConnected else graph.knn)
+  _graphCache[key] = graph
+  while len(_graphCache) > _graphCacheSize:
+    _graphCache.popitem(last=False)
+
 class AMSC_Object(object):
   """ A wrapper class for the C++ approximate Morse-Smale complex Object that
       also communicates with the UI via Qt's signal interface
@@ -180,6 +304,7 @@ class AMSC_Object(object):
     self.names = []
     self.Xnorm = []
     self.Ynorm = []
+    self.neighborGraph = None
 
     self.__amsc = None
 
@@ -263,6 +388,7 @@ class AMSC_Object(object):
     self.gradient = gradient
     self.knn = knn
     self.beta = beta
+    self.persistenceType = persistence
 
     if self.X is None or self.Y is None:
       print('There is no data to process, what would the Maker have me do?')
@@ -290,43 +416,29 @@ class AMSC_Object(object):
       self.Xnorm = np.array(self.X)
       self.Ynorm = np.array(self.Y)
 
-    if knn <= 0:
-      knn = len(self.Xnorm)-1
-
     if debug:
       sys.stderr.write('Graph Preparation: ')
       start = time.clock()
 
-    if knn <= 0:
-      knn = len(self.Y)-1
-
     if edges is None:
-      knnAlgorithm = sklearn.neighbors.NearestNeighbors(n_neighbors=knn,
-                                                        algorithm='kd_tree')
-      knnAlgorithm.fit(self.Xnorm)
-      edges = knnAlgorithm.kneighbors(self.Xnorm, return_distance=False)
+      ## the neighbor graph only depends on the samples, so it is shared with
+      ## any other AMSC built on the same samples
+      self.neighborGraph = GetNeighborGraph(self.Xnorm, knn)
+      edgesToPrune = self.neighborGraph.Edges().T.ravel().tolist()
       if debug:
         end = time.clock()
         sys.stderr.write('%f s\n' % (end-start))
-
-      pairs = []                              # prevent duplicates with this guy
-      for e1 in range(0,edges.shape[0]):
-        for col in range(0,edges.shape[1]):
-          e2 = edges.item(e1,col)
-          if e1 != e2:
-            pairs.append((e1,e2))
     else:
-      pairs = edges
-
-    # As seen here:
-    #  http://stackoverflow.com/questions/480214/how-do-you-remove-duplicates-from-a-list-in-python-whilst-preserving-order
-    seen = set()
-    pairs = [ x for x in pairs if not (x in seen or x[::-1] in seen
-                                       or seen.add(x))]
-    edgesToPrune = []
-    for edge in pairs:
-      edgesToPrune.append(edge[0])
-      edgesToPrune.append(edge[1])
+      self.neighborGraph = None
+      # As seen here:
+      #  http://stackoverflow.com/questions/480214/how-do-you-remove-duplicates-from-a-list-in-python-whilst-preserving-order
+      seen = set()
+      pairs = [ x for x in edges if not (x in seen or x[::-1] in seen
+                                         or seen.add(x))]
+      edgesToPrune = []
+      for edge in pairs:
+        edgesToPrune.append(edge[0])
+        edgesToPrune.append(edge[1])
 
     if debug:
       end = time.clock()
@@ -367,6 +479,71 @@ class AMSC_Object(object):
     self.minIdxs = np.unique(cellIdxs[:,0])
     self.maxIdxs = np.unique(cellIdxs[:,1])
 
+  def AddSamples(self, X, Y, w=None):
+    """ Adds new samples to the data and recomputes the decomposition. Without
+        normalization, the neighbor graph of the current samples is extended
+        with the new ones rather than being recomputed from scratch.
+        @ In, X, a p-by-n array of values specifying p n-dimensional samples
+        @ In, Y, a p vector of values specifying the output responses
+          corresponding to the p samples specified by X
+        @ In, w, an optional p vector of values specifying the weights of the
+          new samples. Default of None means all points will be equally
+          weighted.
+    """
+    if self.__amsc is None:
+      return self.Reinitialize(X, Y, w, self.names, self.graph, self.gradient,
+                               self.knn, self.beta, self.normalization,
+                               self.persistenceType)
+    X = np.atleast_2d(X)
+    if w is not None:
+      w = np.hstack((self.w, w))
+    elif not np.allclose(self.w, self.w[0]):
+      raise ValueError('The weights of the new samples are required, since the '
+                       + 'current samples are not equally weighted.')
+    allX = np.vstack((self.X, X))
+    allY = np.hstack((self.Y, Y))
+
+    if self.neighborGraph is not None and self.normalization not in ['feature', 'zscore']:
+      ## the normalized samples are the samples themselves, thus the graph can
+      ## be extended (a copy, the cached one still describes the old samples)
+      extended = copy.deepcopy(self.neighborGraph)
+      extended.AddSamples(X)
+      StoreNeighborGraph(extended)
+
+    self.Reinitialize(allX, allY, w, self.names, self.graph, self.gradient,
+                      self.knn, self.beta, self.normalization,
+                      self.persistenceType)
+
+  def Update(self, X, Y, w=None):
+    """ Sets the data to the given samples, keeping the current settings. When
+        the current samples are the first ones of the given samples (e.g. a
+        training set that grew since the last time), only the new samples are
+        added through AddSamples, otherwise the decomposition starts over.
+        @ In, X, an m-by-n array of values specifying m n-dimensional samples
+        @ In, Y, a m vector of values specifying the output responses
+          corresponding to the m samples specified by X
+        @ In, w, an optional m vector of values specifying the weights
+          associated to each of the m samples used. Default of None means all
+          points will be equally weighted
+    """
+    X = np.atleast_2d(X)
+    Y = np.asarray(Y)
+    count = len(self.X)
+    extends = (self.__amsc is not None and count <= len(X)
+               and np.shape(X)[1:] == np.shape(self.X)[1:]
+               and np.array_equal(X[:count], self.X)
+               and np.array_equal(Y[:count], self.Y))
+    if extends and w is not None:
+      extends = np.allclose(np.asarray(w)[:count], self.w)
+    elif extends:
+      extends = np.allclose(self.w, self.w[0])
+    if not extends:
+      self.Reinitialize(X, Y, w, self.names, self.graph, self.gradient,
+                        self.knn, self.beta, self.normalization,
+                        self.persistenceType)
+    elif count < len(X):
+      self.AddSamples(X[count:], Y[count:], None if w is None else w[count:])
+
   def SetWeights(self, w=None):
     """ Sets the weights associated to the m input samples
         @ In, w, optional m vector specifying the new weights to use for the
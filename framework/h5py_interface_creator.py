@@ -33,6 +33,8 @@ from BaseClasses import InputDataUser, MessageUser
 # everytime a new modification of the internal
 # structure of the data is performed
 _hdf5DatabaseVersion = "v2.1"
+# number of entries in each chunk of the datasets of the columnar layout
+_columnarChunkLength = 4096
 
 def _dumps(val, void = True):
   """
@@ -86,6 +88,8 @@ class hdf5Database(InputDataUser, MessageUser):
   """
     class to create a h5py (hdf5) database
   """
+  layout = 'groups'
+
   def __init__(self,name, databaseDir, filename, exist, variables=None):
     """
       Constructor
@@ -649,3 +653,404 @@ class hdf5Database(InputDataUser, MessageUser):
 
 
 
+
+#
+#  ***********************************
+#  *  HDF5 COLUMNAR DATABASE CLASS  *
+#  ***********************************
+#
+
+def databaseLayout(filenameAndPath):
+  """
+    Reads the layout of an existing RAVEN HDF5 database
+    @ In, filenameAndPath, string, database file (full path)
+    @ Out, layout, string, "groups" (one group per realization) or "columnar" (one dataset per variable)
+  """
+  with h5.File(filenameAndPath, 'r') as fh5:
+    layout = utils.toString(fh5.attrs.get('layout', 'groups'))
+  return layout
+
+def _columnKind(values):
+  """
+    Local utility function to find how the values of a variable are stored in the columnar layout
+    @ In, values, np.ndarray, the values to check
+    @ Out, kind, string, "float" (numbers), "str" (strings) or "object" (anything else, pickled)
+  """
+  if values.dtype.kind in 'iuf':
+    return 'float'
+  if values.dtype.kind in 'US':
+    return 'str'
+  if values.dtype == object and len(values) > 0:
+    if all(isinstance(v, (int, float, np.integer, np.floating)) and not isinstance(v, (bool, np.bool_)) for v in values):
+      return 'float'
+    if all(isinstance(v, str) for v in values):
+      return 'str'
+  return 'object'
+
+class hdf5ColumnarDatabase(InputDataUser, MessageUser):
+  """
+    class to create a h5py (hdf5) database with a columnar layout.
+    Each variable is stored in a single resizable, chunked dataset containing the values of all the realizations,
+    one after the other. The time-dependent variables have an additional offset dataset, such that the values
+    of realization "r" are values[offsets[r]:offsets[r+1]].
+    Realizations can be added and read in bulk. Hierarchical (DET) data requires the "groups" layout (see hdf5Database).
+  """
+  layout = 'columnar'
+
+  def __init__(self, name, databaseDir, filename, exist, variables=None):
+    """
+      Constructor
+      @ In, name, string, name of this database
+      @ In, databaseDir, string, database directory (full path)
+      @ In, filename, string, the database filename
+      @ In, exist, bool, does it exist?
+      @ In, variables, list, the user wants to store just some specific variables (default =None => all variables are stored)
+      @ Out, None
+    """
+    super().__init__()
+    self.name = name
+    self.variables = variables
+    # only the parallel (MonteCarlo) structure can be stored
+    self.type = 'MC'
+    self.printTag = 'DATABASE HDF5'
+    self.fileExist = exist
+    self.onDiskFile = filename
+    self.databaseDir = databaseDir
+    self.filenameAndPath = os.path.join(self.databaseDir,self.onDiskFile)
+    self.fileOpen = False
+    self._nRealizations = 0 # number of realizations stored
+    self._nameIndex = None  # {realization name: index}, built when a realization is requested by name
+    if self.fileExist:
+      if not os.path.exists(self.filenameAndPath):
+        self.raiseAnError(IOError,'database file has not been found, searched Path is: ' + self.filenameAndPath )
+      self.h5FileW = self.openDatabaseW(self.filenameAndPath,'r+')
+      version = self.h5FileW.attrs.get("version","None")
+      if version != _hdf5DatabaseVersion:
+        self.raiseAnError(IOError,'HDF5 RAVEN version (read mode) is outdated. ' +
+                          'Current version is "{}". '.format(_hdf5DatabaseVersion) +
+                          'Version in HDF5 is "{}".'.format(version))
+      self._nRealizations = int(self.h5FileW.attrs.get('nRealizations', 0))
+      self.raiseAMessage('TOTAL NUMBER OF REALIZATIONS = ' + str(self._nRealizations))
+    else:
+      self.h5FileW = self.openDatabaseW(self.filenameAndPath,'w')
+      self.h5FileW.attrs['version'] = _hdf5DatabaseVersion
+      self.h5FileW.attrs['layout'] = self.layout
+      self.h5FileW.attrs['nRealizations'] = 0
+      self.h5FileW.create_group('columns')
+      self.h5FileW.create_group('offsets')
+
+  def __len__(self):
+    """
+      Overload len method
+      @ In, None
+      @ Out, __len__, length
+    """
+    return self._nRealizations
+
+  def addExpectedMeta(self, keys, params={}):
+    """
+      Store expected metadata
+      @ In, keys, set(), the metadata list
+      @ In, params, dict, optional, {key:[indexes]}, keys of the dictionary are the variable names,
+        values of the dictionary are lists of the corresponding indexes/coordinates of given variable
+      @ Out, None
+    """
+    self.__checkOpen()
+    self.h5FileW.attrs['expectedMetadata'] = _dumps(list(keys))
+
+  def provideExpectedMetaKeys(self):
+    """
+      Provides the registered list of metadata keys for this entity.
+      @ In, None
+      @ Out, meta, tuple, (set(str),dict), expected keys (empty if none) and dictionary of expected keys corresponding to their indexes
+        i.e. {keys, [indexes]}
+    """
+    self.__checkOpen()
+    meta = set()
+    gotMeta = self.h5FileW.attrs.get('expectedMetadata',None)
+    if gotMeta is not None:
+      meta = set(_loads(gotMeta))
+    return meta,{}
+
+  def addGroupInit(self,groupName,attributes=None):
+    """
+      Function to add the root information to the database.
+      Since the columnar layout has no groups, the name and the attributes are stored at the file level.
+      @ In, groupName, string, root name
+      @ In, attributes, dict, optional, dictionary of attributes that must be added as metadata (None by default)
+      @ Out, None
+    """
+    self.__checkOpen()
+    self.h5FileW.attrs.update({} if attributes is None else attributes)
+    self.h5FileW.attrs['rootname'] = groupName
+    self.h5FileW.flush()
+
+  def addGroup(self,rlz):
+    """
+      Function to add a single realization to the database
+      @ In, rlz, dict, dictionary with the data and metadata to add
+      @ Out, None
+    """
+    if rlz.get("RAVEN_parentID",[None])[0]:
+      self.__hierarchicalError()
+    # variables depending on an index (and the indexes) are time-dependent, even if they have a single value
+    indexMap = rlz['_indexMap'][0] if '_indexMap' in rlz else {}
+    indexes = set(dim for dims in indexMap.values() for dim in dims)
+    columns = {}
+    for var, value in rlz.items():
+      value = np.atleast_1d(value).ravel()
+      vector = var in indexMap or var in indexes or value.size != 1
+      columns[var] = (value, np.array([value.size]) if vector else None)
+    self.addColumns(columns, 1)
+
+  def addColumns(self, columns, numRlz):
+    """
+      Function to append realizations to the database, in bulk
+      @ In, columns, dict, {var:(values, lengths)} where "values" are the values of all the realizations,
+                           one after the other, and "lengths" is None for scalar variables or the
+                           number of values of each realization for time-dependent variables
+      @ In, numRlz, int, number of realizations
+      @ Out, None
+    """
+    if 'RAVEN_parentID' in columns and any(columns['RAVEN_parentID'][0]):
+      self.__hierarchicalError()
+    if self.variables is not None:
+      # check if all variables are contained in the columns
+      if not set(self.variables).issubset(columns.keys()):
+        self.raiseAnError(IOError, "Not all the requested variables have been passed in the realization. Missing are: "+
+                          ",".join(list(set(self.variables).symmetric_difference(set(columns.keys())))))
+    self.__checkOpen()
+    if 'prefix' in columns:
+      # the prefix provides the realization names
+      values, lengths = columns['prefix']
+      columns['prefix'] = (np.asarray([str(v) for v in values], dtype=object), lengths)
+    stored = self.h5FileW['columns']
+    added = set()
+    for var, (values, lengths) in columns.items():
+      values = np.asarray(values)
+      kind = _columnKind(values)
+      if self.variables is not None and kind == 'float' and var not in self.variables:
+        continue
+      if var not in stored:
+        self.__createColumn(var, kind, lengths is not None)
+      self.__appendColumn(var, kind, values, lengths, numRlz)
+      added.add(var)
+    # the variables missing from these realizations are filled, as empty or not-a-number values
+    for var in set(stored.keys()) - added:
+      kind = utils.toString(stored[var].attrs['kind'])
+      if var in self.h5FileW['offsets']:
+        self.__appendColumn(var, kind, np.zeros(0), np.zeros(numRlz, dtype=int), numRlz)
+      else:
+        self.__appendColumn(var, kind, self.__fillValues(kind, numRlz), None, numRlz)
+    self._nRealizations += numRlz
+    self.h5FileW.attrs['nRealizations'] = self._nRealizations
+    self._nameIndex = None
+    self.h5FileW.flush()
+
+  def __hierarchicalError(self):
+    """
+      Raises the error for hierarchical data, that cannot be stored in the columnar layout
+      @ In, None
+      @ Out, None
+    """
+    self.raiseAnError(IOError, 'Database "{}" has a "columnar" layout, that cannot store '.format(self.name) +
+                      'hierarchical (DET) data; use the "groups" layout instead!')
+
+  def __fillValues(self, kind, number):
+    """
+      Provides the values used for the realizations missing a scalar variable
+      @ In, kind, string, storage kind of the variable
+      @ In, number, int, number of values
+      @ Out, values, np.ndarray, the fill values
+    """
+    if kind == 'float':
+      return np.full(number, np.nan)
+    values = np.empty(number, dtype=object)
+    values[:] = '' if kind == 'str' else None
+    return values
+
+  def __createColumn(self, var, kind, vector):
+    """
+      Creates the dataset(s) of a variable. The realizations already stored miss this variable.
+      @ In, var, string, variable name
+      @ In, kind, string, storage kind of the variable ("float", "str" or "object")
+      @ In, vector, bool, True if the variable is time-dependent
+      @ Out, None
+    """
+    dtype = {'float': float,
+             'str': h5.special_dtype(vlen=str),
+             'object': h5.special_dtype(vlen=np.dtype('uint8'))}[kind]
+    dataset = self.h5FileW['columns'].create_dataset(var, shape=(0,), maxshape=(None,), chunks=(_columnarChunkLength,), dtype=dtype)
+    dataset.attrs['kind'] = kind
+    if vector:
+      # offsets are initialized to zero, i.e. no values for the realizations already stored
+      self.h5FileW['offsets'].create_dataset(var, shape=(self._nRealizations + 1,), maxshape=(None,),
+                                             chunks=(_columnarChunkLength,), dtype=np.int64)
+    elif self._nRealizations > 0:
+      self.__appendColumn(var, kind, self.__fillValues(kind, self._nRealizations), None, 0)
+
+  def __appendColumn(self, var, kind, values, lengths, numRlz):
+    """
+      Appends the values of a variable
+      @ In, var, string, variable name
+      @ In, kind, string, storage kind of the values
+      @ In, values, np.ndarray, the values of all the realizations, one after the other
+      @ In, lengths, np.ndarray, number of values of each realization (None if scalar)
+      @ In, numRlz, int, number of realizations
+      @ Out, None
+    """
+    dataset = self.h5FileW['columns'][var]
+    storedKind = utils.toString(dataset.attrs['kind'])
+    if storedKind != kind and storedKind != 'object' and len(values) > 0:
+      self.raiseAnError(TypeError, 'Variable "{}" is stored as "{}" in database "{}", '.format(var, storedKind, self.name) +
+                        'but received values of type "{}"!'.format(kind))
+    if var in self.h5FileW['offsets']:
+      if lengths is None:
+        lengths = np.ones(numRlz, dtype=int)
+    elif lengths is not None:
+      if np.any(np.asarray(lengths) != 1):
+        self.raiseAnError(IOError, 'Variable "{}" is stored as a scalar in database "{}", '.format(var, self.name) +
+                          'but received time-dependent values!')
+      lengths = None
+    size = dataset.shape[0]
+    if len(values) > 0:
+      dataset.resize((size + len(values),))
+      if storedKind == 'float':
+        dataset[size:] = np.asarray(values, dtype=float)
+      elif storedKind == 'str':
+        encoded = np.empty(len(values), dtype=object)
+        encoded[:] = [str(v) for v in values]
+        dataset[size:] = encoded
+      else:
+        # pickled objects are written one at a time, since h5py takes equal-size byte arrays for a 2D block
+        for i, v in enumerate(values):
+          dataset[size + i] = np.frombuffer(pk.dumps(v), dtype=np.uint8)
+    if lengths is not None:
+      offsets = self.h5FileW['offsets'][var]
+      offsets.resize((self._nRealizations + numRlz + 1,))
+      offsets[self._nRealizations + 1:] = size + np.cumsum(lengths)
+
+  def __readValues(self, dataset, selection):
+    """
+      Reads and decodes values of a variable
+      @ In, dataset, h5py.Dataset, the dataset of the variable
+      @ In, selection, slice, the values to read
+      @ Out, values, np.ndarray, the values
+    """
+    kind = utils.toString(dataset.attrs['kind'])
+    if kind == 'float':
+      return dataset[selection]
+    if kind == 'str':
+      return np.asarray(dataset.asstr()[selection] if hasattr(dataset, 'asstr') else dataset[selection], dtype=object)
+    raw = dataset[selection]
+    values = np.empty(len(raw), dtype=object)
+    values[:] = [pk.loads(v.tobytes()) for v in raw]
+    return values
+
+  def vectorVariables(self):
+    """
+      Provides the time-dependent variables stored in the database
+      @ In, None
+      @ Out, vectorVariables, set(str), names of the time-dependent variables
+    """
+    self.__checkOpen()
+    return set(self.h5FileW['offsets'].keys())
+
+  def readColumns(self, variables=None):
+    """
+      Reads the values of all the realizations, in bulk
+      @ In, variables, list(str), optional, variables to read (default: all)
+      @ Out, columns, dict, {var:np.ndarray} with one entry per realization; for the time-dependent variables
+                            the entries are the np.ndarray of values of each realization
+    """
+    self.__checkOpen()
+    offsets = self.h5FileW['offsets']
+    columns = {}
+    for var, dataset in self.h5FileW['columns'].items():
+      if variables is not None and var not in variables:
+        continue
+      values = self.__readValues(dataset, slice(None))
+      if var in offsets:
+        bounds = offsets[var][()]
+        split = np.empty(len(bounds) - 1, dtype=object)
+        for r, part in enumerate(np.split(values, bounds[1:-1])):
+          split[r] = part
+        values = split
+      columns[var] = values
+    return columns
+
+  def realization(self, index):
+    """
+      Reads a single realization
+      @ In, index, int, index of the realization
+      @ Out, rlz, dict, {var:np.ndarray} the realization
+    """
+    self.__checkOpen()
+    offsets = self.h5FileW['offsets']
+    rlz = {}
+    for var, dataset in self.h5FileW['columns'].items():
+      if var in offsets:
+        start, end = offsets[var][index:index + 2]
+        rlz[var] = self.__readValues(dataset, slice(start, end))
+      else:
+        rlz[var] = self.__readValues(dataset, slice(index, index + 1))
+    return rlz
+
+  def retrieveAllHistoryNames(self,rootName=None):
+    """
+      Function to create a list of all the realization names (prefixes) present in the database, in storage order
+      @ In, rootName, string, optional, not used (the columnar layout has no hierarchy)
+      @ Out, workingList, list, List of the realization names
+    """
+    self.__checkOpen()
+    if 'prefix' in self.h5FileW['columns']:
+      workingList = list(self.__readValues(self.h5FileW['columns']['prefix'], slice(None)))
+    else:
+      workingList = [str(r) for r in range(self._nRealizations)]
+    return workingList
+
+  def _getRealizationByName(self,name,options = {}):
+    """
+      Function to retrieve the realization whose name (prefix) is "name"
+      @ In, name, string, realization name
+      @ In, options, dict, dictionary of options (not used, the columnar layout has no hierarchy to reconstruct)
+      @ Out, (newData,attrs), tuple, tuple where position 0 = dict containing the realization, 1 = dictionary of some attributes
+    """
+    if self._nameIndex is None:
+      names = self.retrieveAllHistoryNames()
+      self._nameIndex = dict((n, r) for r, n in reversed(list(enumerate(names))))
+    index = self._nameIndex.get(utils.toString(name))
+    if index is None:
+      self.raiseAnError(IOError,'Realization named ' + str(name) + ' not found in database "'+self.name+'"!')
+    newData = self.realization(index)
+    attrs = {'nVars':len(newData.keys()),'varKeys':newData.keys()}
+    return(newData,attrs)
+
+  def __checkOpen(self):
+    """
+      Reopens the database file if it has been closed (e.g. for pickling)
+      @ In, None
+      @ Out, None
+    """
+    if not self.fileOpen:
+      self.h5FileW = self.openDatabaseW(self.filenameAndPath,'a')
+
+  def closeDatabaseW(self):
+    """
+      Function to close the database
+      @ In,  None
+      @ Out, None
+    """
+    self.h5FileW.close()
+    self.fileOpen = False
+
+  def openDatabaseW(self,filename,mode='w'):
+    """
+      Function to open the database
+      @ In, filename, string, name of the file (string)
+      @ In, mode, string, open mode (default "w=write")
+      @ Out, fh5, hdf5 object, instance of hdf5
+    """
+    fh5 = h5.File(filename,mode)
+    self.fileOpen = True
+    return fh5
@@ -28,6 +28,7 @@ from __future__ import division, print_function, unicode_literals, absolute_impo
 
 #External Modules---------------------------------------------------------------
 import scipy.cluster as hier
+from scipy.optimize import linear_sum_assignment
 import numpy as np
 import abc
 import ast
@@ -37,6 +38,7 @@ import platform
 #Internal Modules---------------------------------------------------------------
 from utils import utils
 from utils import mathUtils
+from utils import parallelUtils
 from BaseClasses import MessageUser
 from EntityFactoryBase import EntityFactory
 #Internal Modules End-----------------------------------------------------------
@@ -750,6 +752,20 @@ class SciKitLearn(unSupervisedLearning):
 #
 #
 
+def _fitTemporalSteps(steps):
+  """
+    Trains the engine of the shared temporalSciKitLearn instance on a block of time steps.
+    Module-level to be used as worker of parallelUtils.mapInParallel.
+    @ In, steps, list(int), time step indices
+    @ Out, states, list(dict), trained engine state for each step
+  """
+  model = parallelUtils.getShared('temporalModel')
+  states = []
+  for t in steps:
+    model.__fitTimeStep__(t, None)
+    states.append(model.__engineState__())
+  return states
+
 class temporalSciKitLearn(unSupervisedLearning):
   """
     Data mining library to perform SciKitLearn algorithms along temporal data
@@ -772,6 +788,9 @@ class temporalSciKitLearn(unSupervisedLearning):
 
     #Pop necessary to keep from confusing SciKitLearn with extra option
     self.reOrderStep = int(self.initOptionDict.pop('reOrderStep', 5))
+    # number of processes used to fit the time steps, and whether each fit starts from the previous one
+    self.numWorkers = int(self.initOptionDict.pop('numWorkers', 1))
+    self.warmStart = utils.interpretBoolean(self.initOptionDict.pop('warmStart', False))
 
     # return a SciKitLearn instance as engine for SKL data mining
     self.SKLEngine = factory.returnInstance('SciKitLearn', **self.initOptionDict)
@@ -905,183 +924,288 @@ class temporalSciKitLearn(unSupervisedLearning):
     ## around and maybe never be used
     self.metaDict = {}
 
-    for t in range(self.numberOfHistoryStep):
-      sklInput = {}
-      for feat in self.features:
-        sklInput[feat] = self.inputDict[feat][:,t]
+    numWorkers = parallelUtils.resolveNumWorkers(self.numWorkers, self.numberOfHistoryStep - 1)
+    if numWorkers > 1 and self.warmStart:
+      ## each step starts from the centers of the previous one, thus the steps can only be fit in
+      ## sequence (fitting blocks of steps in parallel would make the results depend on numWorkers)
+      self.raiseAWarning('The time steps are fit in sequence when "warmStart" is requested, "numWorkers" is ignored!')
+      numWorkers = 1
+    if numWorkers == 1:
+      initCenters = None
+      for t in range(self.numberOfHistoryStep):
+        sklInput = self.__fitTimeStep__(t, initCenters)
+        initCenters = self.__engineCenters__()
+        self.__collectTimeStep__(t, sklInput)
+    else:
+      ## the first step is fit here, so that the options the engine derives from the data on its
+      ## first training (e.g. the MeanShift bandwidth) are shared by all the workers
+      sklInput = self.__fitTimeStep__(0, None)
+      self.__collectTimeStep__(0, sklInput)
+      ## without warm start the steps are independent, each worker fits a block of them
+      blocks = np.array_split(np.arange(1, self.numberOfHistoryStep), numWorkers)
+      tasks = [(list(block),) for block in blocks if len(block)]
+      self.raiseADebug('Fitting {} time steps on {} processes'.format(self.numberOfHistoryStep - 1, len(tasks)))
+      results, _ = parallelUtils.mapInParallel(_fitTemporalSteps, tasks, numWorkers=numWorkers, shared={'temporalModel': self})
+      ## remapping the clusters is sequential in time, so the steps are collected in order
+      for (block,), states in zip(tasks, results):
+        for t, state in zip(block, states):
+          sklInput = self.__restoreEngineState__(t, state)
+          self.__collectTimeStep__(t, sklInput)
+
+  def __fitTimeStep__(self, t, initCenters):
+    """
+      Trains the SciKitLearn engine on the data of a single time step.
+      @ In, t, int, time step index
+      @ In, initCenters, np.array, denormalized cluster centers (or component means) used to warm
+            start the training, None to use the initialization of the engine
+      @ Out, sklInput, dict, the data used for training, {feature: np.array(numberOfSample)}
+    """
+    sklInput = {}
+    for feat in self.features:
+      sklInput[feat] = self.inputDict[feat][:,t]
+
+    if self.warmStart and initCenters is not None:
+      self.__warmStartEngine__(t, initCenters)
+    self.SKLEngine.features = sklInput
+    self.SKLEngine.train(sklInput)
+    self.SKLEngine.confidence()
+    return sklInput
+
+  def __engineCenters__(self):
+    """
+      Returns the denormalized cluster centers (or component means) of the last training of the
+      SciKitLearn engine, to be used as the initial guess of the next time step.
+      @ In, None
+      @ Out, centers, np.array, shape = [no_clusters, no_features], None if not available
+    """
+    if self.SKLtype not in ['cluster', 'mixture']:
+      return None
+    centers = self.SKLEngine.metaDict.get('clusterCenters' if self.SKLtype == 'cluster' else 'means', None)
+    return None if centers is None else np.array(centers, dtype=float)
 
-      self.SKLEngine.features = sklInput
-      self.SKLEngine.train(sklInput)
-      self.SKLEngine.confidence()
+  def __warmStartEngine__(self, t, initCenters):
+    """
+      Sets the initial cluster centers (or component means) of the SciKitLearn engine, if the
+      algorithm supports an explicit initialization (e.g. KMeans, MiniBatchKMeans, GMM).
+      @ In, t, int, time step index the engine is going to be trained on
+      @ In, initCenters, np.array, denormalized cluster centers (or component means)
+      @ Out, None
+    """
+    mu = np.array([self.muAndSigmaFeatures[feat][0,t] for feat in self.features])
+    sigma = np.array([self.muAndSigmaFeatures[feat][1,t] for feat in self.features])
+    init = (initCenters - mu) / sigma
+    params = self.SKLEngine.Method.get_params()
+    if 'init' in params and params.get('n_clusters', None) == init.shape[0]:
+      warmParams = {'init': init}
+      if 'n_init' in params:
+        warmParams['n_init'] = 1
+      self.SKLEngine.Method.set_params(**warmParams)
+    elif 'means_init' in params and params.get('n_components', None) == init.shape[0]:
+      self.SKLEngine.Method.set_params(means_init=init)
+
+  def __engineState__(self):
+    """
+      Returns the state of the SciKitLearn engine after its training on a time step, so that the
+      results can be collected by another process.
+      @ In, None
+      @ Out, state, dict, the trained engine state
+    """
+    engine = self.SKLEngine
+    ## the engine replaces the entries of its outputDict at each training, so a shallow copy suffices
+    return {'Method': copy.deepcopy(engine.Method),
+            'outputDict': dict(engine.outputDict),
+            'metaDict': engine.metaDict,
+            'normValues': engine.normValues,
+            'muAndSigmaFeatures': dict(engine.muAndSigmaFeatures)}
+
+  def __restoreEngineState__(self, t, state):
+    """
+      Restores the state of the SciKitLearn engine trained on a time step by a worker process.
+      @ In, t, int, time step index
+      @ In, state, dict, the trained engine state (see __engineState__)
+      @ Out, sklInput, dict, the data used for training, {feature: np.array(numberOfSample)}
+    """
+    sklInput = {}
+    for feat in self.features:
+      sklInput[feat] = self.inputDict[feat][:,t]
+    engine = self.SKLEngine
+    engine.features = sklInput
+    engine.Method = state['Method']
+    engine.outputDict = state['outputDict']
+    engine.metaDict = state['metaDict']
+    engine.normValues = state['normValues']
+    engine.muAndSigmaFeatures = state['muAndSigmaFeatures']
+    return sklInput
+
+  def __collectTimeStep__(self, t, sklInput):
+    """
+      Stores the results of the SciKitLearn engine trained on time step t, re-ordering the
+      clusters (components) to keep the labels consistent with the previous time steps.
+      @ In, t, int, time step index
+      @ In, sklInput, dict, the data used for training, {feature: np.array(numberOfSample)}
+      @ Out, None
+    """
+    ## Store everything from the specific timestep's SKLEngine into a running
+    ## list
+    for key,val in self.SKLEngine.outputDict['outputs'].items():
+      if key not in self.outputDict['outputs']:
+        self.outputDict['outputs'][key] = {} # [None]*self.numberOfHistoryStep
+      self.outputDict['outputs'][key][t] = val
 
-      ## Store everything from the specific timestep's SKLEngine into a running
-      ## list
-      for key,val in self.SKLEngine.outputDict['outputs'].items():
-        if key not in self.outputDict['outputs']:
-          self.outputDict['outputs'][key] = {} # [None]*self.numberOfHistoryStep
-        self.outputDict['outputs'][key][t] = val
+    for key,val in self.SKLEngine.metaDict.items():
+      if key not in self.metaDict:
+        self.metaDict[key] = {} # [None]*self.numberOfHistoryStep
+      self.metaDict[key][t] = val
 
-      for key,val in self.SKLEngine.metaDict.items():
-        if key not in self.metaDict:
-          self.metaDict[key] = {} # [None]*self.numberOfHistoryStep
-        self.metaDict[key][t] = val
+    if self.SKLtype in ['cluster']:
 
-      if self.SKLtype in ['cluster']:
+      if 'clusterCenters' not in self.metaDict.keys():
+        self.metaDict['clusterCenters'] = {}
 
-        if 'clusterCenters' not in self.metaDict.keys():
-          self.metaDict['clusterCenters'] = {}
+      if 'clusterCentersIndices' not in self.metaDict.keys():
+        self.metaDict['clusterCentersIndices'] = {}
 
-        if 'clusterCentersIndices' not in self.metaDict.keys():
-          self.metaDict['clusterCentersIndices'] = {}
+      # # collect labels
+      # if hasattr(self.SKLEngine.Method, 'labels_'):
+      #   self.outputDict['labels'][t] = self.SKLEngine.Method.labels_
 
-        # # collect labels
-        # if hasattr(self.SKLEngine.Method, 'labels_'):
-        #   self.outputDict['labels'][t] = self.SKLEngine.Method.labels_
+      # # collect cluster centers
+      if hasattr(self.SKLEngine.Method, 'cluster_centers_'):
+        self.metaDict['clusterCenters'][t] = np.zeros(shape=self.SKLEngine.metaDict['clusterCenters'].shape)
+        for cnt, feat in enumerate(self.features):
+          self.metaDict['clusterCenters'][t][:,cnt] = self.SKLEngine.metaDict['clusterCenters'][:,cnt]
+      else:
+        self.metaDict['clusterCenters'][t] = self.__computeCenter__(sklInput, self.outputDict['outputs']['labels'][t])
 
-        # # collect cluster centers
-        if hasattr(self.SKLEngine.Method, 'cluster_centers_'):
-          self.metaDict['clusterCenters'][t] = np.zeros(shape=self.SKLEngine.metaDict['clusterCenters'].shape)
-          for cnt, feat in enumerate(self.features):
-            self.metaDict['clusterCenters'][t][:,cnt] = self.SKLEngine.metaDict['clusterCenters'][:,cnt]
-        else:
-          self.metaDict['clusterCenters'][t] = self.__computeCenter__(sklInput, self.outputDict['outputs']['labels'][t])
+      # collect number of clusters
+      if hasattr(self.SKLEngine.Method, 'n_clusters'):
+        noClusters = self.SKLEngine.Method.n_clusters
+      else:
+        noClusters = self.metaDict['clusterCenters'][t].shape[0]
+
+      # collect cluster indices
+      # if hasattr(self.SKLEngine.Method, 'cluster_centers_indices_'):
+      #   self.metaDict['clusterCentersIndices'][t] = self.SKLEngine.Method.cluster_centers_indices_
+      #   self.metaDict['clusterCentersIndices'][t] = range(noClusters)
+      # else:
+      #   self.metaDict['clusterCentersIndices'][t] = range(noClusters)  # use list(set(self.SKLEngine.Method.labels_)) to collect outliers
+      self.metaDict['clusterCentersIndices'][t] = list(range(noClusters))
+
+      # # collect optional output
+      # if hasattr(self.SKLEngine.Method, 'inertia_'):
+      #   if 'inertia' not in self.outputDict.keys(): self.outputDict['inertia'] = {}
+      #   self.outputDict['inertia'][t] = self.SKLEngine.Method.inertia_
+
+      # re-order clusters
+      if t > 0:
+        remap = self.__reMapCluster__(t, self.metaDict['clusterCenters'], self.metaDict['clusterCentersIndices'])
+        self.metaDict['clusterCentersIndices'][t] = [remap[index] for index in self.metaDict['clusterCentersIndices'][t]]
+        self.__reMapLabels__(remap, self.outputDict['outputs']['labels'][t], self.SKLEngine.Method.labels_)
+        ## TODO: Remap the cluster centers now...
+    elif self.SKLtype in ['mixture']:
+      if 'means' not in self.metaDict.keys():
+        self.metaDict['means'] = {}
+      if 'componentMeanIndices' not in self.metaDict.keys():
+        self.metaDict['componentMeanIndices'] = {}
+
+      # # collect component membership
+      if 'labels' not in self.outputDict['outputs']:
+        self.outputDict['outputs']['labels'] = {}
+      self.outputDict['outputs']['labels'][t] = self.SKLEngine.evaluate(sklInput)
+
+      # # collect component means
+      if hasattr(self.SKLEngine.Method, 'means_'):
+        self.metaDict['means'][t] = np.zeros(shape=self.SKLEngine.Method.means_.shape)
+        for cnt, feat in enumerate(self.features):
+          self.metaDict['means'][t][:,cnt] = self.__deNormalizeData__(feat,t,self.SKLEngine.Method.means_[:,cnt])
+      else:
+        self.metaDict['means'][t] = self.__computeCenter__(Input['Features'], self.outputDict['labels'][t])
 
-        # collect number of clusters
-        if hasattr(self.SKLEngine.Method, 'n_clusters'):
-          noClusters = self.SKLEngine.Method.n_clusters
-        else:
-          noClusters = self.metaDict['clusterCenters'][t].shape[0]
-
-        # collect cluster indices
-        # if hasattr(self.SKLEngine.Method, 'cluster_centers_indices_'):
-        #   self.metaDict['clusterCentersIndices'][t] = self.SKLEngine.Method.cluster_centers_indices_
-        #   self.metaDict['clusterCentersIndices'][t] = range(noClusters)
-        # else:
-        #   self.metaDict['clusterCentersIndices'][t] = range(noClusters)  # use list(set(self.SKLEngine.Method.labels_)) to collect outliers
-        self.metaDict['clusterCentersIndices'][t] = list(range(noClusters))
-
-        # # collect optional output
-        # if hasattr(self.SKLEngine.Method, 'inertia_'):
-        #   if 'inertia' not in self.outputDict.keys(): self.outputDict['inertia'] = {}
-        #   self.outputDict['inertia'][t] = self.SKLEngine.Method.inertia_
-
-        # re-order clusters
-        if t > 0:
-          remap = self.__reMapCluster__(t, self.metaDict['clusterCenters'], self.metaDict['clusterCentersIndices'])
-          for n in range(len(self.metaDict['clusterCentersIndices'][t])):
-            self.metaDict['clusterCentersIndices'][t][n] = remap[self.metaDict['clusterCentersIndices'][t][n]]
-          for n in range(len(self.outputDict['outputs']['labels'][t])):
-            if self.outputDict['outputs']['labels'][t][n] >=0:
-              self.outputDict['outputs']['labels'][t][n] = remap[self.SKLEngine.Method.labels_[n]]
-          ## TODO: Remap the cluster centers now...
-      elif self.SKLtype in ['mixture']:
-        if 'means' not in self.metaDict.keys():
-          self.metaDict['means'] = {}
-        if 'componentMeanIndices' not in self.metaDict.keys():
-          self.metaDict['componentMeanIndices'] = {}
-
-        # # collect component membership
-        if 'labels' not in self.outputDict['outputs']:
-          self.outputDict['outputs']['labels'] = {}
-        self.outputDict['outputs']['labels'][t] = self.SKLEngine.evaluate(sklInput)
-
-        # # collect component means
-        if hasattr(self.SKLEngine.Method, 'means_'):
-          self.metaDict['means'][t] = np.zeros(shape=self.SKLEngine.Method.means_.shape)
-          for cnt, feat in enumerate(self.features):
-            self.metaDict['means'][t][:,cnt] = self.__deNormalizeData__(feat,t,self.SKLEngine.Method.means_[:,cnt])
-        else:
-          self.metaDict['means'][t] = self.__computeCenter__(Input['Features'], self.outputDict['labels'][t])
+      # # collect number of components
+      if hasattr(self.SKLEngine.Method, 'n_components'):
+        numComponents = self.SKLEngine.Method.n_components
+      else:
+        numComponents = self.metaDict['means'][t].shape[0]
+
+      # # collect component indices
+      self.metaDict['componentMeanIndices'][t] = list(range(numComponents))
+
+      # # collect optional output
+      if hasattr(self.SKLEngine.Method, 'weights_'):
+        if 'weights' not in self.metaDict.keys():
+          self.metaDict['weights'] = {}
+        self.metaDict['weights'][t] = self.SKLEngine.Method.weights_
+
+      if 'covars' in self.SKLEngine.metaDict:
+        if 'covars' not in self.metaDict.keys():
+          self.metaDict['covars'] = {}
+        self.metaDict['covars'][t] = self.SKLEngine.metaDict['covars']
+
+      if hasattr(self.SKLEngine.Method, 'precs_'):
+        if 'precs' not in self.metaDict.keys():
+          self.metaDict['precs'] = {}
+        self.metaDict['precs'][t] = self.SKLEngine.Method.precs_
+
+      # if hasattr(self.SKLEngine.Method, 'converged_'):
+      #   if 'converged' not in self.outputDict.keys():
+      #     self.outputDict['converged'] = {}
+      #   self.outputDict['converged'][t] = self.SKLEngine.Method.converged_
+
+      # re-order components
+      if t > 0:
+        remap = self.__reMapCluster__(t, self.metaDict['means'], self.metaDict['componentMeanIndices'])
+        self.metaDict['componentMeanIndices'][t] = [remap[index] for index in self.metaDict['componentMeanIndices'][t]]
+        self.__reMapLabels__(remap, self.outputDict['outputs']['labels'][t], self.outputDict['outputs']['labels'][t])
+    elif 'manifold' == self.SKLtype:
+      # if 'noComponents' not in self.outputDict.keys():
+      #   self.outputDict['noComponents'] = {}
 
-        # # collect number of components
-        if hasattr(self.SKLEngine.Method, 'n_components'):
-          numComponents = self.SKLEngine.Method.n_components
-        else:
-          numComponents = self.metaDict['means'][t].shape[0]
-
-        # # collect component indices
-        self.metaDict['componentMeanIndices'][t] = list(range(numComponents))
-
-        # # collect optional output
-        if hasattr(self.SKLEngine.Method, 'weights_'):
-          if 'weights' not in self.metaDict.keys():
-            self.metaDict['weights'] = {}
-          self.metaDict['weights'][t] = self.SKLEngine.Method.weights_
-
-        if 'covars' in self.SKLEngine.metaDict:
-          if 'covars' not in self.metaDict.keys():
-            self.metaDict['covars'] = {}
-          self.metaDict['covars'][t] = self.SKLEngine.metaDict['covars']
-
-        if hasattr(self.SKLEngine.Method, 'precs_'):
-          if 'precs' not in self.metaDict.keys():
-            self.metaDict['precs'] = {}
-          self.metaDict['precs'][t] = self.SKLEngine.Method.precs_
-
-        # if hasattr(self.SKLEngine.Method, 'converged_'):
-        #   if 'converged' not in self.outputDict.keys():
-        #     self.outputDict['converged'] = {}
-        #   self.outputDict['converged'][t] = self.SKLEngine.Method.converged_
-
-        # re-order components
-        if t > 0:
-          remap = self.__reMapCluster__(t, self.metaDict['means'], self.metaDict['componentMeanIndices'])
-          for n in range(len(self.metaDict['componentMeanIndices'][t])):
-            self.metaDict['componentMeanIndices'][t][n] = remap[self.metaDict['componentMeanIndices'][t][n]]
-
-          for n in range(len(self.outputDict['outputs']['labels'][t])):
-            if self.outputDict['outputs']['labels'][t][n] >=0:
-              self.outputDict['outputs']['labels'][t][n] = remap[self.outputDict['outputs']['labels'][t][n]]
-      elif 'manifold' == self.SKLtype:
-        # if 'noComponents' not in self.outputDict.keys():
-        #   self.outputDict['noComponents'] = {}
-
-        if 'embeddingVectors' not in self.outputDict['outputs']:
-          self.outputDict['outputs']['embeddingVectors'] = {}
-
-        if hasattr(self.SKLEngine.Method, 'embedding_'):
-          self.outputDict['outputs']['embeddingVectors'][t] = self.SKLEngine.Method.embedding_
+      if 'embeddingVectors' not in self.outputDict['outputs']:
+        self.outputDict['outputs']['embeddingVectors'] = {}
+
+      if hasattr(self.SKLEngine.Method, 'embedding_'):
+        self.outputDict['outputs']['embeddingVectors'][t] = self.SKLEngine.Method.embedding_
+
+      if 'transform' in dir(self.SKLEngine.Method):
+        self.outputDict['outputs']['embeddingVectors'][t] = self.SKLEngine.Method.transform(self.SKLEngine.normValues)
+      elif 'fit_transform' in dir(self.SKLEngine.Method):
+        self.outputDict['outputs']['embeddingVectors'][t] = self.SKLEngine.Method.fit_transform(self.SKLEngine.normValues)
 
+      # if hasattr(self.SKLEngine.Method, 'reconstruction_error_'):
+      #   if 'reconstructionError_' not in self.outputDict.keys():
+      #     self.outputDict['reconstructionError_'] = {}
+      #   self.outputDict['reconstructionError_'][t] = self.SKLEngine.Method.reconstruction_error_
+    elif 'decomposition' == self.SKLtype:
+      for var in ['explainedVarianceRatio','means','explainedVariance',
+                  'components']:
+        if var not in self.metaDict:
+          self.metaDict[var] = {}
+
+      if hasattr(self.SKLEngine.Method, 'components_'):
+        self.metaDict['components'][t] = self.SKLEngine.Method.components_
+
+      ## This is not the same thing as the components above! This is the
+      ## transformed data, the other composes the transformation matrix to get
+      ## this. Whoever designed this, you are causing me no end of headaches
+      ## with this code... I am pretty sure this can all be handled within the
+      ## post-processor rather than adding this frankenstein of code just to
+      ## gain access to the skl techniques.
+      if 'embeddingVectors' not in self.outputDict['outputs']:
         if 'transform' in dir(self.SKLEngine.Method):
-          self.outputDict['outputs']['embeddingVectors'][t] = self.SKLEngine.Method.transform(self.SKLEngine.normValues)
+          embeddingVectors = self.SKLEngine.Method.transform(self.SKLEngine.normValues)
         elif 'fit_transform' in dir(self.SKLEngine.Method):
-          self.outputDict['outputs']['embeddingVectors'][t] = self.SKLEngine.Method.fit_transform(self.SKLEngine.normValues)
-
-        # if hasattr(self.SKLEngine.Method, 'reconstruction_error_'):
-        #   if 'reconstructionError_' not in self.outputDict.keys():
-        #     self.outputDict['reconstructionError_'] = {}
-        #   self.outputDict['reconstructionError_'][t] = self.SKLEngine.Method.reconstruction_error_
-      elif 'decomposition' == self.SKLtype:
-        for var in ['explainedVarianceRatio','means','explainedVariance',
-                    'components']:
-          if var not in self.metaDict:
-            self.metaDict[var] = {}
-
-        if hasattr(self.SKLEngine.Method, 'components_'):
-          self.metaDict['components'][t] = self.SKLEngine.Method.components_
-
-        ## This is not the same thing as the components above! This is the
-        ## transformed data, the other composes the transformation matrix to get
-        ## this. Whoever designed this, you are causing me no end of headaches
-        ## with this code... I am pretty sure this can all be handled within the
-        ## post-processor rather than adding this frankenstein of code just to
-        ## gain access to the skl techniques.
-        if 'embeddingVectors' not in self.outputDict['outputs']:
-          if 'transform' in dir(self.SKLEngine.Method):
-            embeddingVectors = self.SKLEngine.Method.transform(self.SKLEngine.normValues)
-          elif 'fit_transform' in dir(self.SKLEngine.Method):
-            embeddingVectors = self.SKLEngine.Method.fit_transform(self.SKLEngine.normValues)
-          self.outputDict['outputs']['embeddingVectors'][t] = embeddingVectors
-
-        if hasattr(self.SKLEngine.Method, 'means_'):
-          self.metaDict['means'][t] = self.SKLEngine.Method.means_
-        if hasattr(self.SKLEngine.Method, 'explained_variance_'):
-          self.metaDict['explainedVariance'][t] = self.SKLEngine.Method.explained_variance_
-        if hasattr(self.SKLEngine.Method, 'explained_variance_ratio_'):
-          self.metaDict['explainedVarianceRatio'][t] = self.SKLEngine.Method.explained_variance_ratio_
+          embeddingVectors = self.SKLEngine.Method.fit_transform(self.SKLEngine.normValues)
+        self.outputDict['outputs']['embeddingVectors'][t] = embeddingVectors
 
-      else:
-        self.raiseAnError(IOError, 'Unknown type: ' + str(self.SKLtype))
+      if hasattr(self.SKLEngine.Method, 'means_'):
+        self.metaDict['means'][t] = self.SKLEngine.Method.means_
+      if hasattr(self.SKLEngine.Method, 'explained_variance_'):
+        self.metaDict['explainedVariance'][t] = self.SKLEngine.Method.explained_variance_
+      if hasattr(self.SKLEngine.Method, 'explained_variance_ratio_'):
+        self.metaDict['explainedVarianceRatio'][t] = self.SKLEngine.Method.explained_variance_ratio_
+
+    else:
+      self.raiseAnError(IOError, 'Unknown type: ' + str(self.SKLtype))
 
   def __computeCenter__(self, data, labels):
     """
@@ -1197,10 +1321,13 @@ class temporalSciKitLearn(unSupervisedLearning):
     N1 = dataCenter[t-1].shape[0]
     N2 = dataCenter[t].shape[0]
 
+    ## 'DistanceWithDecay' (see __computeDist__) between all the pairs of centers at once
     dMatrix = np.zeros(shape=(N1,N2))
-    for n1 in range(N1):
-      for n2 in range(N2):
-        dMatrix[n1,n2] = self.__computeDist__(t,n1,n2,dataCenter,'DistanceWithDecay')
+    decR = 1
+    for k in range(1, min(self.reOrderStep, t)+1):
+      previous = dataCenter[t-k][:N1]
+      diff = previous[:,np.newaxis,:] - dataCenter[t][np.newaxis,:,:]
+      dMatrix[:previous.shape[0]] += np.sqrt(np.sum(diff*diff, axis=-1))*np.exp(-(k-1)*decR)
     _, mapping = self.__localReMap__(dMatrix, (list(range(N1)), list(range(N2))))
 
     remap = {}
@@ -1226,42 +1353,36 @@ class temporalSciKitLearn(unSupervisedLearning):
   def __localReMap__(self, dMatrix,loc):
     """
       Method to return the mapping based on distance stored in dMatrix, the returned mapping shall minimize the global sum of distance
-      This function is recursively called to find the global minimum, so is computationally expensive --- FIXME
+      The problem is solved as a linear assignment (Hungarian algorithm); if the number of clusters differs between the
+      two time steps, only the smallest number of them is mapped
       @In, dMatrix, array, shape = (no_clusterAtPreviousTimeStep, no_clusterAtCurrentTimeStep)
       @In, loc, tuple, the first element is the cluster indeces for previous time step and the second one is for the current time step
       @Out, sumDist, float, global sum of distance
       @Out, localReMap, list, remapping relation between the row and column identifier of dMatrix
     """
-    if len(loc[0]) == 1:
-      sumDist, localReMap = np.inf, -1
-      n1 = loc[0][0]
-      for n2 in loc[1]:
-        if dMatrix[n1,n2] < sumDist:
-          sumDist = dMatrix[n1,n2]
-          localReMap = n2
-      return sumDist, [(n1,localReMap)]
-    elif len(loc[1]) == 1:
-      sumDist, localReMap = np.inf, -1
-      n2 = loc[1][0]
-      for n1 in loc[0]:
-        if dMatrix[n1,n2] < sumDist:
-          sumDist = dMatrix[n1,n2]
-          localReMap = n1
-      return sumDist, [(localReMap,n2)]
-    else:
-      sumDist, i1, i2, localReMap = np.inf, -1, -1, []
-      n1 = loc[0][0]
-      temp1 = copy.deepcopy(loc[0])
-      temp1.remove(n1)
-      for n2 in loc[1]:
-        temp2 = copy.deepcopy(loc[1])
-        temp2.remove(n2)
-        d_temp, l = self.__localReMap__(dMatrix, (temp1,temp2))
-        if dMatrix[n1,n2] + d_temp < sumDist:
-          sumDist = dMatrix[n1,n2] + d_temp
-          i1, i2, localReMap = n1, n2, l
-      localReMap.append((i1,i2))
-      return sumDist, localReMap
+    rows, cols = np.asarray(loc[0]), np.asarray(loc[1])
+    subMatrix = dMatrix[np.ix_(rows, cols)]
+    i1, i2 = linear_sum_assignment(subMatrix)
+    sumDist = subMatrix[i1, i2].sum()
+    localReMap = list(zip(rows[i1].tolist(), cols[i2].tolist()))
+    return sumDist, localReMap
+
+  @staticmethod
+  def __reMapLabels__(remap, labels, source):
+    """
+      Relabels, in place, the samples with a non-negative (i.e. not outlier) label
+      @In, remap, dict, remapping relation between the current time step cluster and the previous time step
+      @In, labels, np.array, labels to overwrite
+      @In, source, np.array, labels (before the remapping) the new labels are computed from
+      @Out, None
+    """
+    mask = np.asarray(labels) >= 0
+    if not mask.any():
+      return
+    keys = np.fromiter(remap.keys(), dtype=int, count=len(remap))
+    lookup = np.zeros(max(keys.max(), np.max(source)) + 1, dtype=int)
+    lookup[keys] = np.fromiter(remap.values(), dtype=int, count=len(remap))
+    labels[mask] = lookup[np.asarray(source)[mask]]
 
   def __evaluateLocal__(self, featureVals):
     """
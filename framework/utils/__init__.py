@@ -18,7 +18,8 @@ Created on September 16, 2015
 from __future__ import absolute_import
 
 __all__ = ['InputData', 'InputTypes', 'RAVENiterators','TreeStructure', 'cached_ndarray',
-           'graphStructure', 'mathUtils', 'randomUtils', 'utils', 'xmlUtils', 'frontUtils']
+           'graphStructure', 'mathUtils', 'randomUtils', 'utils', 'xmlUtils', 'frontUtils',
+           'parallelUtils']
 # This file is necessary so that the sub-modules understand the correct hierarchy
 # of things. Once everything is in sub-modules we can possibly do some things
 # with RAVEN in its entirety as a module, but for now this file can remain
@@ -520,11 +520,12 @@ def numBinsDraconis(data, low=None, alternateOkay=True, binOps=None):
   # default option: try draconis, then fall back on square root rule
   else:
     try:
-      iqr = np.percentile(data, 75) - np.percentile(data, 25)
+      upper, lower = np.percentile(data, [75, 25])
+      iqr = upper - lower
     # Freedman Diaoconis assumes there's a difference between the 75th and 25th percentile (there usually is)
       if iqr > 0.0:
         size = 2.0 * iqr / np.cbrt(data.size)
-        numBins = int(np.ceil((max(data) - min(data))/size))
+        numBins = int(np.ceil((np.max(data) - np.min(data))/size))
       else:
         raise TypeError
     except:
@@ -574,7 +575,7 @@ def computeTruncatedTotalLeastSquare(X, Y, truncationRank):
   dY = Y.dot(VV)
   return dX, dY
 
-def computeTruncatedSingularValueDecomposition(X, truncationRank, full = False, conj = True):
+def computeTruncatedSingularValueDecomposition(X, truncationRank, full = False, conj = True, randomized = False):
   """
     Compute Singular Value Decomposition and truncate it till a rank = truncationRank
     @ In, X, numpy.ndarray, the 2D matrix on which the SVD needs to be performed
@@ -585,24 +586,78 @@ def computeTruncatedSingularValueDecomposition(X, truncationRank, full = False,
                                                   *  >0. and < 1. computed rank is the number of the biggest sv needed to reach the energy identified by truncationRank
     @ In, full, bool, optional, compute svd returning full matrices
     @ In, conj, bool, optional, compute conjugate of right-singular vectors matrix)
+    @ In, randomized, bool, optional, compute the truncated singular vectors with a randomized range finder
+                                      (only used if the truncation rank is much lower than the matrix dimensions)
     @ Out, (U, s, V), tuple of numpy.ndarray, (left-singular vectors matrix, singular values, right-singular vectors matrix)
   """
+  if randomized and not full and truncationRank != -1:
+    if truncationRank >= 1 and isinstance(truncationRank, int):
+      rank = min(truncationRank, min(X.shape))
+    else:
+      # the singular values alone are much cheaper than the full decomposition
+      rank = _computeTruncationRank(np.linalg.svd(X, compute_uv=False), X.shape, truncationRank, min(X.shape))
+    decomposition = computeRandomizedSingularValueDecomposition(X, rank)
+    if decomposition is not None:
+      U, s, V = decomposition
+      V = V.conj().T if conj else V.T
+      return U, s, V
   U, s, V = np.linalg.svd(X, full_matrices=full)
   V = V.conj().T if conj else V.T
+  rank = _computeTruncationRank(s, X.shape, truncationRank, U.shape[1])
+  U = U[:, :rank]
+  V = V[:, :rank]
+  s = np.diag(s)[:rank, :rank] if full else s[:rank]
+  return U, s, V
 
+def _computeTruncationRank(s, shape, truncationRank, maxRank):
+  """
+    Compute the rank of a truncated Singular Value Decomposition
+    @ In, s, numpy.ndarray, the singular values (in descending order)
+    @ In, shape, tuple, the shape of the decomposed matrix
+    @ In, truncationRank, int or float, the truncation rank (see computeTruncatedSingularValueDecomposition)
+    @ In, maxRank, int, the rank if no truncation is performed
+    @ Out, rank, int, the rank
+  """
   if truncationRank is 0:
     omeg = lambda x: 0.56 * x**3 - 0.95 * x**2 + 1.82 * x + 1.43
-    rank = np.sum(s > np.median(s) * omeg(np.divide(*sorted(X.shape))))
+    rank = np.sum(s > np.median(s) * omeg(np.divide(*sorted(shape))))
   elif truncationRank > 0 and truncationRank < 1:
     rank = np.searchsorted(np.cumsum(s / s.sum()), truncationRank) + 1
   elif truncationRank >= 1 and isinstance(truncationRank, int):
-    rank = min(truncationRank, U.shape[1])
+    rank = min(truncationRank, maxRank)
   else:
-    rank = U.shape[1]
-  U = U[:, :rank]
-  V = V[:, :rank]
-  s = np.diag(s)[:rank, :rank] if full else s[:rank]
-  return U, s, V
+    rank = maxRank
+  return rank
+
+def computeRandomizedSingularValueDecomposition(X, rank, oversampling = 10, powerIterations = 4, seed = 42):
+  """
+    Compute the leading singular triplets with the randomized range finder of
+    Halko, Martinsson and Tropp, "Finding structure with randomness", SIAM Review 53.2 (2011), 217-288.
+    The cost is O(m n rank) instead of the O(m n min(m,n)) of the full decomposition.
+    @ In, X, numpy.ndarray, the 2D matrix (m, n) on which the SVD needs to be performed
+    @ In, rank, int, number of singular triplets to compute
+    @ In, oversampling, int, optional, number of additional random samples of the range
+    @ In, powerIterations, int, optional, number of (re-orthonormalized) power iterations that sharpen the spectrum decay
+    @ In, seed, int, optional, seed of the (local) random number generator, so that the result is reproducible
+    @ Out, (U, s, Vh), tuple of numpy.ndarray, (left-singular vectors matrix (m, rank), singular values (rank),
+            conjugate transposed right-singular vectors matrix (rank, n)), or None if the rank is too large
+            for the randomized decomposition to be convenient (the full one should be used)
+  """
+  samples = rank + oversampling
+  # each power iteration costs as much as the range finding => not convenient for ranks close to the matrix dimensions
+  if rank < 1 or samples * (powerIterations + 1) > min(X.shape):
+    return None
+  # the generator is local, not to alter the random stream of the sampling
+  omega = np.random.RandomState(seed).standard_normal((X.shape[1], samples))
+  Q = np.linalg.qr(X.dot(omega))[0]
+  XH = X.conj().T
+  for _ in range(powerIterations):
+    Q = np.linalg.qr(XH.dot(Q))[0]
+    Q = np.linalg.qr(X.dot(Q))[0]
+  # exact SVD of the small projected matrix
+  Ub, s, Vh = np.linalg.svd(Q.conj().T.dot(X), full_matrices=False)
+  U = Q.dot(Ub[:, :rank])
+  return U, s[:rank], Vh[:rank, :]
 
 def computeEigenvaluesAndVectorsFromLowRankOperator(lowOperator, Y, U, s, V, exactModes=True):
   """
@@ -1118,16 +1173,47 @@ def computeCrowdingDistance(trainSet):
 def rankData(x, w=None):
   """
     Method to rank the data (weighted and unweighted)
-    @ In, x, numpy.array (or array-like), array containing values to rank
-    @ In, w, numpy.array (or array-like), optional, array containing weights (if None, equally-weighted)
+    @ In, x, numpy.array (or array-like), array containing values to rank; if 2D, [#samples, #variables],
+      each column is ranked independently
+    @ In, w, numpy.array (or array-like), optional, array containing weights (if None, equally-weighted);
+      if x is 2D, either the weights of all the columns or [#samples, #variables] weights of each column
     @ Out, rank, numpy.array, the ranked features
   """
+  if np.ndim(x) == 2:
+    return _rankColumns(np.asarray(x), w)
   weights = w if w is not None else np.ones(len(x))
   _, inverseArray, num = np.unique(stats.rankdata(x), return_counts = True, return_inverse = True )
   A = np.bincount(inverseArray, weights)
   rank = (np.cumsum(A) - A)[inverseArray]+((num + 1)/2 * (A/num))[inverseArray]
   return rank
 
+def _rankColumns(x, w=None):
+  """
+    Ranks (weighted and unweighted) each column of a matrix at once, see "rankData"
+    @ In, x, numpy.array, [#samples, #variables] values to rank
+    @ In, w, numpy.array, optional, [#samples] or [#samples, #variables] weights (if None, equally-weighted)
+    @ Out, rank, numpy.array, [#samples, #variables] the ranks of each column
+  """
+  numSamples, numVars = x.shape
+  weights = np.ones(x.shape) if w is None else np.broadcast_to(np.asarray(w, dtype=float).reshape(numSamples, -1), x.shape)
+  order = np.argsort(x, axis=0, kind='mergesort')
+  sortedX = np.take_along_axis(x, order, axis=0)
+  sortedW = np.take_along_axis(weights, order, axis=0)
+  # tied values form a group; the groups of column j are numbered after those of column j-1
+  newGroup = np.ones(x.shape, dtype=bool)
+  newGroup[1:] = sortedX[1:] != sortedX[:-1]
+  groups = np.cumsum(newGroup.T.ravel()) - 1
+  A = np.bincount(groups, sortedW.T.ravel())
+  num = np.bincount(groups)
+  # cumulative weight of the groups preceding each group, within its column
+  first = np.cumsum(newGroup.sum(axis=0)) - newGroup.sum(axis=0)
+  cumA = np.cumsum(A) - A
+  cumA -= np.repeat(cumA[first], newGroup.sum(axis=0))
+  sortedRank = (cumA + (num + 1)/2 * (A/num))[groups].reshape(numVars, numSamples).T
+  rank = np.empty(x.shape)
+  np.put_along_axis(rank, order, sortedRank, axis=0)
+  return rank
+
 def getBuiltinTypes(typ):
   """
     Method to get a dictionary of builtin types
@@ -0,0 +1,112 @@
+# Copyright 2017 Battelle Energy Alliance, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+ This file contains utilities to distribute independent, in-process work (e.g. the training of
+ the segments of a ROM) across a pool of local worker processes.
+ These are intended for work performed INSIDE a single RAVEN entity; work that is scheduled by
+ the Steps should keep going through the JobHandler.
+ created on 10/18/2026
+"""
+import os
+import time
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+# read-only data shared with the worker processes, see "getShared"
+_shared = {}
+
+def resolveNumWorkers(requested, numTasks=None):
+  """
+    Determines how many worker processes should be used.
+    @ In, requested, int, requested number of workers; None or 1 means serial,
+          0 or negative means one worker per available core
+    @ In, numTasks, int, optional, number of tasks that will be distributed
+    @ Out, numWorkers, int, number of workers to use (1 means serial)
+  """
+  if requested is None:
+    return 1
+  requested = int(requested)
+  if requested <= 0:
+    requested = os.cpu_count() or 1
+  if numTasks is not None:
+    requested = min(requested, numTasks)
+  # daemonic processes (e.g. multiprocessing pool workers) are not allowed to have children
+  if multiprocessing.current_process().daemon:
+    requested = 1
+  return max(requested, 1)
+
+def getShared(key):
+  """
+    Retrieves data shared by "mapInParallel" with the worker functions.
+    With the "fork" start method this data is inherited by the workers without being copied or
+    pickled, so large training arrays can be sliced by the workers for free.
+    @ In, key, str, identifier of the shared entry
+    @ Out, getShared, object, shared entry
+  """
+  return _shared[key]
+
+def _setShared(shared):
+  """
+    Sets the shared data; used as the initializer of worker processes.
+    @ In, shared, dict, data to share
+    @ Out, None
+  """
+  global _shared
+  _shared = shared
+
+def _timedCall(function, task):
+  """
+    Calls function on the task, timing the call.
+    @ In, function, callable, function to call
+    @ In, task, tuple, arguments to pass to function
+    @ Out, result, object, result of function(*task)
+    @ Out, elapsed, float, wall time in seconds spent in the call
+  """
+  start = time.time()
+  result = function(*task)
+  return result, time.time() - start
+
+def mapInParallel(function, tasks, numWorkers=1, shared=None):
+  """
+    Applies "function" to each entry in "tasks", distributing the calls across a pool of worker
+    processes if more than one worker is requested. Results are always returned in task order.
+    @ In, function, callable, module-level (picklable) function called as function(*task)
+    @ In, tasks, list(tuple), arguments for each call
+    @ In, numWorkers, int, optional, number of worker processes (see "resolveNumWorkers")
+    @ In, shared, dict, optional, read-only data accessible from "function" through "getShared"
+    @ Out, results, list, result of each call, in the same order as "tasks"
+    @ Out, timings, list(float), wall time in seconds spent on each task
+  """
+  tasks = list(tasks)
+  numWorkers = resolveNumWorkers(numWorkers, len(tasks))
+  previous = _shared
+  _setShared(previous if shared is None else dict(previous, **shared))
+  try:
+    if numWorkers == 1:
+      out = [_timedCall(function, task) for task in tasks]
+    else:
+      context = multiprocessing.get_context()
+      if context.get_start_method() == 'fork':
+        # workers inherit the shared data from this process
+        initializer, initargs = None, ()
+      else:
+        initializer, initargs = _setShared, (_shared,)
+      with ProcessPoolExecutor(max_workers=numWorkers, mp_context=context,
+                               initializer=initializer, initargs=initargs) as pool:
+        out = list(pool.map(_timedCall, [function]*len(tasks), tasks))
+  finally:
+    _setShared(previous)
+  results = [o[0] for o in out]
+  timings = [o[1] for o in out]
+  return results, timings
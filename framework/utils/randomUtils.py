@@ -59,6 +59,35 @@ class BoxMullerGenerator:
       val = self.queue[engine].pop()
     return val
 
+  def generateMany(self, size, engine=None):
+    """
+      Provides several normally-distributed pseudorandom values at once.
+      The values (and the state of the queue afterwards) are the same as calling "generate" "size" times,
+      but the transform is applied to all the uniform samples at once.
+      @ In, size, int, number of values to provide
+      @ In, engine, instance, optional, random number generator
+      @ Out, vals, np.array, random values
+    """
+    vals = np.zeros(size)
+    with self.__queueLock:
+      queue = self.queue[engine]
+      # first use up any value left over from previous calls
+      start = 0
+      while start < size and len(queue) > 0:
+        vals[start] = queue.pop()
+        start += 1
+      remaining = size - start
+      if remaining > 0:
+        numPairs = (remaining + 1) // 2
+        u1, u2 = random(2, samples=numPairs, keepMatrix=True, engine=engine).T
+        z1 = np.sqrt(-2.*np.log(u1))*np.cos(2.*np.pi*u2)
+        z2 = np.sqrt(-2.*np.log(u1))*np.sin(2.*np.pi*u2)
+        # "generate" pops z2 before z1
+        vals[start:] = np.column_stack((z2, z1)).ravel()[:remaining]
+        if remaining % 2:
+          queue.append(z1[-1])
+    return vals
+
   def createSamples(self,engine=None):
     """
       Sample calculator.  Because Box Muller does batches of 2, add them to a queue.
@@ -92,10 +121,28 @@ else:
   distStochEnv = findCrowModule('distribution1D').DistributionContainer.instance()
   boxMullerGen = BoxMullerGenerator()
 
+# seed the global crow engines start from (default seed of the mt19937 engine)
+_defaultSeed = 5489
+
 #
 # Utilities
 #
 #
+def resetGlobalEngines():
+  """
+    Restores the global random number generators, and the values cached by the Box-Muller generator,
+    to their state right after this module is imported. This makes a run done in an already used
+    process (e.g. a persistent RAVEN worker) independent of the previous runs.
+    @ In, None
+    @ Out, None
+  """
+  if stochasticEnv == 'numpy':
+    global npStochEnv
+    npStochEnv = np.random.RandomState()
+  else:
+    randomSeed(_defaultSeed)
+    boxMullerGen.queue.clear()
+
 def randomSeed(value, seedBoth=False, engine=None):
   """
     Function to get a random seed
@@ -169,9 +216,7 @@ def randomNormal(size=(1,), keepMatrix=False, engine=None):
   if isinstance(engine, np.random.RandomState):
     vals = engine.randn(*size)
   elif isinstance(engine, findCrowModule('randomENG').RandomClass):
-    vals = np.zeros(np.prod(size))
-    for i in range(len(vals)):
-      vals[i] = boxMullerGen.generate(engine=engine)
+    vals = boxMullerGen.generateMany(int(np.prod(size)), engine=engine)
     vals.shape = size
   if keepMatrix:
     return vals
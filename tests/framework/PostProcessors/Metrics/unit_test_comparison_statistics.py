@@ -100,6 +100,44 @@ pdfCommonArea = MetricUtilities._getPDFCommonArea(dist1, dist2)
 print("pdfCommonArea different",pdfCommonArea)
 assert 0.60 < pdfCommonArea < 0.62
 
+#Test data (integrated exactly) against the quadrature of the same interpolated CDF and PDF
+import numpy as np
+import scipy.integrate
+data1 = np.sin(np.arange(200.0))
+data2 = 0.5 + np.cos(np.arange(100.0))
+stats1, cdf1, pdf1 = MetricUtilities._convertToCommonFormat(data1)
+stats2, cdf2, pdf2 = MetricUtilities._convertToCommonFormat(data2)
+low, high = MetricUtilities._getBounds(stats1, stats2)
+breaks = sorted(set([low, high] + [x for x in list(stats1["cdfTable"][0]) + list(stats2["cdfTable"][0]) if low < x < high]))
+cdfQuad = sum(scipy.integrate.quad(lambda x:abs(cdf1(x)-cdf2(x)), a, b)[0] for a, b in zip(breaks[:-1], breaks[1:]))
+pdfQuad = sum(scipy.integrate.quad(lambda x:min(pdf1(x),pdf2(x)), a, b)[0] for a, b in zip(breaks[:-1], breaks[1:]))
+
+cdfAreaDifference = MetricUtilities._getCDFAreaDifference(data1, data2)
+print("cdfAreaDifference data",cdfAreaDifference,cdfQuad)
+assert abs(cdfAreaDifference - cdfQuad) < 1e-8
+
+pdfCommonArea = MetricUtilities._getPDFCommonArea(data1, data2)
+print("pdfCommonArea data",pdfCommonArea,pdfQuad)
+assert abs(pdfCommonArea - pdfQuad) < 1e-8
+
+#The empirical CDF and PDF of the same data are only built once
+assert MetricUtilities._convertToCommonFormat(np.sin(np.arange(200.0)))[1] is cdf1
+
+#The pairs evaluated together (data integrated exactly, distributions by quadrature) give the same
+#results as the pairs evaluated one at a time
+data3 = (np.arange(50.0)**0.5, np.linspace(1.0, 2.0, 50))
+pairs = [(data1, data2), (data2, data1), (data1, data3), (data1, data1), (dist1, data2), (data3, dist2), (dist1, dist2)]
+cdfAreaDifferences = MetricUtilities._getCDFAreaDifferences(pairs)
+pdfCommonAreas = MetricUtilities._getPDFCommonAreas(pairs)
+print("cdfAreaDifferences",cdfAreaDifferences)
+print("pdfCommonAreas",pdfCommonAreas)
+for cnt, (first, second) in enumerate(pairs):
+  assert abs(cdfAreaDifferences[cnt] - MetricUtilities._getCDFAreaDifference(first, second)) < 1e-12
+  assert abs(pdfCommonAreas[cnt] - MetricUtilities._getPDFCommonArea(first, second)) < 1e-12
+assert abs(cdfAreaDifferences[0] - cdfQuad) < 1e-8
+assert abs(cdfAreaDifferences[0] - cdfAreaDifferences[1]) < 1e-12
+assert cdfAreaDifferences[3] == 0.0
+
 """
   <TestInfo>
     <name>framework.test_distributions</name>
@@ -112,6 +150,8 @@ assert 0.60 < pdfCommonArea < 0.62
     </description>
     <revisions>
       <revision author="alfoa" date="2018-05-10">Added Log Uniform distribution unit test</revision>
+      <revision author="agent" date="2026-10-18">Added exact integration and caching of the empirical CDF and PDF</revision>
+      <revision author="agent" date="2026-10-19">Added the evaluation of several pairs together</revision>
     </revisions>
   </TestInfo>
 """
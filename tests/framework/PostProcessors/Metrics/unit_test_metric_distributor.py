@@ -0,0 +1,228 @@
+# Copyright 2017 Battelle Energy Alliance, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+  This Module performs Unit Tests for the MetricDistributor evaluation of several paired data together,
+  reading the history steps chunk by chunk.
+"""
+import xml.etree.ElementTree as ET
+import sys, os
+import shutil
+import tempfile
+import numpy as np
+import xarray as xr
+
+# find location of crow, message handler
+frameworkDir = os.path.abspath(os.path.join(*([os.path.dirname(__file__)]+[os.pardir]*4+['framework'])))
+
+sys.path.append(frameworkDir)
+
+from utils.utils import find_crow
+find_crow(frameworkDir)
+
+import MessageHandler
+
+# message handler
+mh = MessageHandler.MessageHandler()
+mh.initialize({'verbosity':'quiet', 'callerLength':10, 'tagLength':10})
+
+import Distributions
+import Metrics
+import MetricDistributor
+
+print('Module undergoing testing:')
+print(MetricDistributor.MetricDistributor)
+print('')
+
+results = {"pass":0,"fail":0}
+
+def checkTrue(comment, value):
+  """
+    This method checks that a condition holds
+    @ In, comment, string, a comment printed out if it fails
+    @ In, value, bool, the condition
+    @ Out, value, bool, the condition
+  """
+  if value:
+    results["pass"] += 1
+  else:
+    print("checking condition", comment, "failed!")
+    results["fail"] += 1
+  return value
+
+def checkArray(comment, value, expected, tol=1e-12):
+  """
+    This method compares two arrays of floats given a certain tolerance
+    @ In, comment, string, a comment printed out if it fails
+    @ In, value, np.array, the values to compare
+    @ In, expected, np.array, the expected values
+    @ In, tol, float, optional, the tolerance
+    @ Out, res, bool, True if same
+  """
+  value = np.asarray(value, dtype=float)
+  expected = np.asarray(expected, dtype=float)
+  res = value.shape == expected.shape and np.allclose(value, expected, rtol=tol, atol=tol)
+  if res:
+    results["pass"] += 1
+  else:
+    print("checking answer", comment, value, "!=", expected)
+    results["fail"] += 1
+  return res
+
+class StepRecorder:
+  """
+    Array wrapper recording the history steps read from it
+  """
+  def __init__(self, values):
+    """
+      Constructor
+      @ In, values, np.array, the (numRealizations, numHistorySteps) values
+      @ Out, None
+    """
+    self.values = values
+    self.shape = values.shape
+    self.reads = []
+
+  def __getitem__(self, key):
+    """
+      Reads the values, recording the number of history steps read
+      @ In, key, tuple, the numpy index
+      @ Out, values, np.array, the values read
+    """
+    read = self.values[key]
+    self.reads.append(read.shape[1] if len(read.shape) > 1 else 1)
+    return read
+
+def makeMetric(xml):
+  """
+    Creates a metric distributor from the given xml
+    @ In, xml, str, the xml of the metric
+    @ Out, metricEngine, MetricDistributor, the distributor of the metric
+  """
+  metric = Metrics.factory.returnInstance('Metric')
+  metric.setMessageHandler(mh)
+  metric.readXML(ET.fromstring(xml))
+  metricEngine = MetricDistributor.factory.returnInstance('MetricDistributor', metric)
+  metricEngine.setMessageHandler(mh)
+  return metricEngine
+
+def evaluateOneByOne(metricEngine, pairedDataList, multiOutput):
+  """
+    Evaluates the paired data one at a time, with the full histories in memory
+    @ In, metricEngine, MetricDistributor, the metric
+    @ In, pairedDataList, list, the paired data
+    @ In, multiOutput, str, the aggregation of the history steps
+    @ Out, outputs, list, the output for each paired data
+  """
+  outputs = []
+  for pairedData in pairedDataList:
+    full = []
+    for pData in pairedData:
+      if isinstance(pData, Distributions.Distribution):
+        full.append(pData)
+      else:
+        values = pData[0].values if isinstance(pData[0], StepRecorder) else pData[0]
+        full.append((values.reshape(values.shape[0], -1), pData[1]))
+    outputs.append(metricEngine.evaluate(tuple(full), multiOutput=multiOutput))
+  return outputs
+
+normal = Distributions.Normal(0.0, 1.0)
+normal.initializeDistribution()
+
+numSamples, numSteps, chunkSize = 20, 13, 4
+time = np.linspace(0.0, 1.0, numSteps)
+samples = np.arange(numSamples)
+x = np.sin(np.outer(samples + 1.0, time + 1.0))
+y = np.cos(np.outer(samples + 2.0, time)) + 0.1 * time
+z = np.outer(np.sqrt(samples), time)
+weights = np.linspace(1.0, 2.0, numSamples)
+weights /= weights.sum()
+
+cdf = makeMetric('<Metric name="cdf" subType="CDFAreaDifference"/>')
+pdf = makeMetric('<Metric name="pdf" subType="PDFCommonArea"/>')
+minkowski = makeMetric('<Metric name="minkowski" subType="ScipyMetric"><metricType>paired_distance|minkowski</metricType></Metric>')
+# the SKL metrics handle the time-dependent data on their own
+mae = makeMetric('<Metric name="mae" subType="SKL"><metricType>regression|mean_absolute_error</metricType></Metric>')
+
+######################################
+#   BATCHED AND CHUNKED EVALUATION   #
+######################################
+for metricEngine in [cdf, pdf, minkowski, mae]:
+  name = metricEngine.estimator.name
+  for multiOutput in ['raw_values', 'mean']:
+    pairedDataList = [((StepRecorder(x), weights), (StepRecorder(y), weights)),
+                      ((StepRecorder(z), weights), (StepRecorder(x), weights)),
+                      ((StepRecorder(x[:, 3]), weights), (StepRecorder(z[:, 5]), weights))]
+    if metricEngine.estimator.acceptsDistribution:
+      pairedDataList.append((normal, (StepRecorder(y), weights)))
+    expected = evaluateOneByOne(metricEngine, pairedDataList, multiOutput)
+    for pairedData in pairedDataList:
+      for pData in pairedData:
+        if isinstance(pData, tuple):
+          pData[0].reads.clear()
+    # all the history steps at once
+    outputs = metricEngine.evaluateBatch(pairedDataList, multiOutput=multiOutput)
+    checkTrue(name + ' ' + multiOutput + ' number of outputs', len(outputs) == len(pairedDataList))
+    for cnt, output in enumerate(outputs):
+      checkArray(name + ' ' + multiOutput + ' batch output ' + str(cnt), output, expected[cnt])
+    # chunkSize history steps at a time
+    for pairedData in pairedDataList:
+      for pData in pairedData:
+        if isinstance(pData, tuple):
+          pData[0].reads.clear()
+    outputs = metricEngine.evaluateBatch(pairedDataList, multiOutput=multiOutput, chunkSize=chunkSize)
+    for cnt, output in enumerate(outputs):
+      checkArray(name + ' ' + multiOutput + ' chunked output ' + str(cnt), output, expected[cnt])
+    # the histories are read chunkSize steps at a time, once (or at once, if the metric needs the full histories)
+    reads = [pData[0].reads for pData in pairedDataList[0] + pairedDataList[1] if isinstance(pData, tuple)]
+    expectedReads = [4, 4, 4, 1] if metricEngine is not mae else [13]
+    checkTrue(name + ' ' + multiOutput + ' chunked reads', all(read == expectedReads for read in reads))
+
+# the time-dependent metrics are evaluated on the full histories
+dtw = makeMetric('<Metric name="dtw" subType="DTW"><order>0</order><localDistance>euclidean</localDistance></Metric>')
+pairedDataList = [((x, weights), (y, weights)), ((z, weights), (x, weights))]
+expected = evaluateOneByOne(dtw, pairedDataList, 'mean')
+outputs = dtw.evaluateBatch(pairedDataList, multiOutput='mean', chunkSize=chunkSize)
+for cnt, output in enumerate(outputs):
+  checkArray('dtw chunked output ' + str(cnt), output, expected[cnt])
+
+######################################
+#   STREAMING FROM A NETCDF FILE     #
+######################################
+workingDir = tempfile.mkdtemp()
+fileName = os.path.join(workingDir, 'histories.nc')
+xr.Dataset({'x':(('RAVEN_sample_ID', 'time'), x), 'y':(('RAVEN_sample_ID', 'time'), y)},
+           coords={'RAVEN_sample_ID':samples, 'time':time}).to_netcdf(fileName)
+expected = evaluateOneByOne(cdf, [((x, weights), (y, weights))], 'raw_values')[0]
+with xr.open_dataset(fileName) as histories:
+  outputs = cdf.evaluateBatch([((histories['x'], weights), (histories['y'], weights))], multiOutput='raw_values', chunkSize=chunkSize)
+  checkArray('netCDF chunked output', outputs[0], expected)
+  # only the chunks have been read, the variables have not been loaded
+  checkTrue('netCDF not loaded', not histories['x'].variable._in_memory and not histories['y'].variable._in_memory)
+shutil.rmtree(workingDir)
+
+print(results)
+
+sys.exit(results["fail"])
+"""
+  <TestInfo>
+    <name>framework.metricDistributor</name>
+    <author>wangc</author>
+    <created>2026-10-19</created>
+    <classesTested>MetricDistributor</classesTested>
+    <description>
+       This test checks that the MetricDistributor gives the same results evaluating several paired data together,
+       reading the history steps chunk by chunk, as evaluating them one at a time with the full histories.
+    </description>
+  </TestInfo>
+"""
@@ -0,0 +1,165 @@
+# Copyright 2017 Battelle Energy Alliance, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+  Unit test for the PPDSS validation post-processor and the DSS metric.
+  The stacked-array implementation is compared with a reference history-by-history,
+  step-by-step implementation of the same algorithm.
+"""
+import os
+import sys
+import xml.etree.ElementTree as ET
+import numpy as np
+import xarray as xr
+from scipy.integrate import simps
+
+# add RAVEN to path
+frameworkDir = os.path.abspath(os.path.join(*([os.path.dirname(__file__)] + [os.pardir]*4 + ['framework'])))
+if frameworkDir not in sys.path:
+  sys.path.append(frameworkDir)
+
+from utils.utils import find_crow
+find_crow(frameworkDir)
+
+import MetricDistributor
+import MessageHandler
+from Metrics import Metric
+from Models.PostProcessors.Validations.PPDSS import PPDSS
+
+# message handler
+mh = MessageHandler.MessageHandler()
+mh.initialize({'verbosity':'quiet', 'callerLength':10, 'tagLength':10})
+
+def createHistories(numHistories, numSteps, seed=42):
+  """
+    Creates the feature and target datasets.
+    @ In, numHistories, int, number of histories
+    @ In, numSteps, int, number of time steps in each history
+    @ In, seed, int, optional, seed for the random data
+    @ Out, datasets, list(xarray.Dataset), feature and target datasets
+  """
+  rng = np.random.RandomState(seed)
+  pivot = np.linspace(0., 10., numSteps)
+  rate = 1. + 0.1 * rng.rand(numHistories, 1)
+  feature = 1. + np.sin(rate * pivot) * np.exp(-0.1 * pivot) + 0.01 * rng.rand(numHistories, numSteps)
+  target = 1. + np.sin(1.05 * rate * pivot) * np.exp(-0.1 * pivot)
+  # flat segments in some targets, where the displacement rate is not finite
+  target[:numHistories // 4, numSteps // 4:numSteps // 3] = 1.
+  featureSet = xr.Dataset({'x': (('RAVEN_sample_ID', 'time1'), feature)}, coords={'time1': pivot})
+  targetSet = xr.Dataset({'y': (('RAVEN_sample_ID', 'time2'), target)}, coords={'time2': pivot})
+  return [featureSet, targetSet]
+
+def referenceQuantities(beta, grid):
+  """
+    Reference (history by history, step by step) DSS process quantities.
+    @ In, beta, numpy.ndarray, (numHistories, numTimeSteps) values of the parameter of interest
+    @ In, grid, numpy.ndarray, (numTimeSteps) time grid
+    @ Out, omegaNorm, numpy.ndarray, normalized agents of change
+    @ Out, D, numpy.ndarray, temporal displacement rates
+  """
+  omegaNorm = np.zeros(beta.shape)
+  D = np.zeros(beta.shape)
+  for cnt in range(beta.shape[0]):
+    omega = np.gradient(beta[cnt], grid)
+    with np.errstate(divide='ignore', invalid='ignore'):
+      D[cnt] = -beta[cnt] / omega**2 * np.gradient(omega, grid)
+    valid = [i for i in range(beta.shape[1]) if not np.isnan(D[cnt][i]) and not np.isinf(D[cnt][i])]
+    action = simps(D[cnt][valid] + 1, grid[valid])
+    for i in range(beta.shape[1]):
+      if i not in valid:
+        D[cnt][i] = 0
+    omegaNorm[cnt] = action * omega
+  return omegaNorm, D
+
+def referenceDistance(feature, target, grid):
+  """
+    Reference (step by step) DSS distance for the identity scaling.
+    @ In, feature, numpy.ndarray, (numHistories, numTimeSteps) feature histories
+    @ In, target, numpy.ndarray, (numHistories, numTimeSteps) target histories
+    @ In, grid, numpy.ndarray, (numTimeSteps) time grid
+    @ Out, distance, numpy.ndarray, (numHistories, numTimeSteps) DSS distance
+  """
+  featureOmega, _ = referenceQuantities(feature, grid)
+  targetOmega, targetD = referenceQuantities(target, grid)
+  distance = np.zeros(feature.shape)
+  for cnt in range(feature.shape[0]):
+    for cnt2 in range(feature.shape[1]):
+      if targetD[cnt][cnt2] == 0 or featureOmega[cnt][cnt2] == 0 or targetOmega[cnt][cnt2] == 0:
+        continue
+      distance[cnt][cnt2] = feature[cnt][cnt2] * abs(targetD[cnt][cnt2])**0.5 * (1 / featureOmega[cnt][cnt2] - 1 / targetOmega[cnt][cnt2])
+      if np.isnan(distance[cnt][cnt2]):
+        distance[cnt][cnt2] = 0
+  return distance
+
+def evaluatePPDSS(datasets):
+  """
+    Evaluates the PPDSS post-processor.
+    @ In, datasets, list(xarray.Dataset), feature and target datasets
+    @ Out, distance, numpy.ndarray, (numHistories, numTimeSteps) DSS distance
+  """
+  metric = Metric()
+  metric.messageHandler = mh
+  metric.name = 'dss'
+  metric._readMoreXML(ET.fromstring('<Metric name="dss" subType="DSS"/>'))
+  pp = PPDSS()
+  pp.metrics = [MetricDistributor.factory.returnInstance('MetricDistributor', metric)]
+  pp.features = ['featureSet|x']
+  pp.targets = ['targetSet|y']
+  pp.scaleType = 'identity'
+  pp.scaleRatioBeta = [1.]
+  pp.scaleRatioOmega = [1.]
+  pp.pivotParameterFeature = 'time1'
+  pp.pivotParameterTarget = 'time2'
+  realizations = pp._evaluate(datasets)
+  return np.asarray([rlz['dss_y_x'] for rlz in realizations])
+
+results = {"pass":0,"fail":0}
+
+def checkArray(comment, value, expected, tol=1e-10):
+  """
+    This method compares two arrays of floats given a certain relative tolerance
+    @ In, comment, string, a comment printed out if it fails
+    @ In, value, np.array, the values to compare
+    @ In, expected, np.array, the expected values
+    @ In, tol, float, optional, the relative tolerance
+    @ Out, res, bool, True if same
+  """
+  res = value.shape == expected.shape and np.allclose(value, expected, rtol=tol, atol=0.)
+  if res:
+    results["pass"] += 1
+  else:
+    print("checking array", comment, "failed! Max difference:", np.max(np.abs(value - expected)))
+    results["fail"] += 1
+  return res
+
+datasets = createHistories(20, 200)
+reference = np.abs(referenceDistance(datasets[0]['x'].values, datasets[1]['y'].values, datasets[0]['time1'].values))
+distance = evaluatePPDSS(datasets)
+checkArray('PPDSS distance against the reference implementation', distance, reference)
+
+print(results)
+
+sys.exit(results["fail"])
+"""
+  <TestInfo>
+    <name>framework.PostProcessors.Validation.ppdssReference</name>
+    <author>yoshrk</author>
+    <created>2026-10-19</created>
+    <classesTested>PostProcessors.Validations.PPDSS, Metrics.DSS</classesTested>
+    <description>
+       This test checks the DSS distances computed by the PPDSS post-processor, which processes all the histories
+       at once, against a reference history-by-history, step-by-step implementation of the same algorithm,
+       including histories whose displacement rate is not finite at some time steps.
+    </description>
+  </TestInfo>
+"""
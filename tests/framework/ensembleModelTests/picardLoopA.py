@@ -0,0 +1,46 @@
+# Copyright 2017 Battelle Energy Alliance, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+  First model of an analytic fixed-point loop, y = x + z, closed by picardLoopB (z = 0.9 y - 1).
+  The loop converges to y = 10 (x - 1), z = 9 x - 10.
+  The number of evaluations is counted for each "scheme" (an input tagging the acceleration scheme
+  of the ensemble running this model) and dumped in evaluations.csv, in the working directory.
+"""
+import os
+
+evaluations = {}
+
+def initialize(self, runInfo, inputs):
+  """
+    Method to initialize the model
+    @ In, runInfo, dict, the run info of the simulation
+    @ In, inputs, list, the inputs of the model
+    @ Out, None
+  """
+  global counterFile
+  counterFile = os.path.join(runInfo['WorkingDir'], 'evaluations.csv')
+
+def run(self, Input):
+  """
+    Method to evaluate the model
+    @ In, Input, dict, the inputs of the model
+    @ Out, None
+  """
+  self.y = self.x + self.z
+  scheme = int(self.scheme)
+  evaluations[scheme] = evaluations.get(scheme, 0) + 1
+  with open(counterFile, 'w') as counts:
+    counts.write('scheme,evaluations\n')
+    for key in sorted(evaluations):
+      counts.write('{},{}\n'.format(key, evaluations[key]))
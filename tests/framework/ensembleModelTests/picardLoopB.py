@@ -0,0 +1,24 @@
+# Copyright 2017 Battelle Energy Alliance, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+  Second model of an analytic fixed-point loop, z = 0.9 y - 1 (see picardLoopA).
+"""
+
+def run(self, Input):
+  """
+    Method to evaluate the model
+    @ In, Input, dict, the inputs of the model
+    @ Out, None
+  """
+  self.z = 0.9*self.y - 1.
@@ -602,6 +602,30 @@ os.remove(csvname+'_1.csv')
 os.remove(csvname+'_2.csv')
 os.remove(csvname+'_3.csv')
 
+### write all the histories in a single file
+data.write(csvname,style='CSV',**{'what':'a,b,c,x,y,z,RAVEN_sample_ID,prefix'.split(','),'historyFormat':'single'})
+checkTrue('CSV single file, no history files',not os.path.isfile(csvname+'_0.csv'))
+checkTrue('CSV single file, histories file',os.path.isfile(csvname+'_histories.csv'))
+dataSingle = DataObjects.HistorySet()
+dataSingle.messageHandler = mh
+dataSingle._readMoreXML(xml)
+dataSingle.load(csvname,style='CSV')
+for var in data.getVars():
+  if isinstance(data.getVarValues(var).item(0),(float,int)):
+    checkTrue('CSV single var {}'.format(var),(dataSingle._data[var] - data._data[var]).sum()<1e-20) #necessary due to roundoff
+  else:
+    checkTrue('CSV single var {}'.format(var),bool((dataSingle._data[var] == data._data[var]).prod()))
+### append the last two realizations again; the offsets continue in the same histories file
+data.write(csvname,style='CSV',**{'what':'a,b,c,x,y,z,RAVEN_sample_ID,prefix'.split(','),'historyFormat':'single','firstIndex':2})
+dataSingle.reset()
+dataSingle.load(csvname,style='CSV')
+checkSame('CSV single append size',len(dataSingle),len(data)+2)
+checkRlz('CSV single append idx 4',dataSingle.realization(index=4),rlz2,skip=['Timelike', '_indexMap'])
+checkRlz('CSV single append idx 5',dataSingle.realization(index=5),rlz3,skip=['Timelike', '_indexMap'])
+os.remove(csvname+'.csv')
+os.remove(csvname+'.xml')
+os.remove(csvname+'_histories.csv')
+
 
 ######################################
 #        ACCESS USING GETTERS        #
@@ -832,5 +856,8 @@ sys.exit(results["fail"])
     <description>
        This test is a Unit Test for the HistorySet classes.
     </description>
+    <revisions>
+      <revision author="agent" date="2026-10-18">Added the single-file history CSV</revision>
+    </revisions>
   </TestInfo>
 """
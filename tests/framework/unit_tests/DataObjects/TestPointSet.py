@@ -384,6 +384,13 @@ rlz3 = {'a': 31.0,
 formatRealization(rlz3)
 data.addRealization(rlz3)
 checkRlz('PointSet append 2 idx 0',data.realization(index=3),rlz3)
+# all the matches, when they are only in the collector
+idx, match = data.realization(matchDict={'a':31.0}, asDataSet=True, first=False)
+checkSame('PointSet all matches in collector number', len(match['RAVEN_sample_ID']), 1)
+checkArray('PointSet all matches in collector "a"', match['a'].values, [31.0], float)
+idx, match = data.realization(matchDict={'a':-1.0}, asDataSet=True, first=False)
+checkSame('PointSet find bogus matches index', idx, 4)
+checkNone('PointSet find bogus matches', match)
 # TODO test reading from both main and collector
 
 data.asDataset()
@@ -0,0 +1,184 @@
+# Copyright 2017 Battelle Energy Alliance, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+  This Module performs Unit Tests for the HDF5 database layouts.
+  It can not be considered part of the active code but of the regression test system
+"""
+import xml.etree.ElementTree as ET
+import sys, os
+import numpy as np
+
+# find location of crow, message handler
+frameworkDir = os.path.abspath(os.path.join(*([os.path.dirname(__file__)]+[os.pardir]*4+['framework'])))
+sys.path.append(frameworkDir)
+
+from utils.utils import find_crow
+find_crow(frameworkDir)
+import MessageHandler
+
+import DataObjects
+from Databases.HDF5 import HDF5
+
+mh = MessageHandler.MessageHandler()
+mh.initialize({'verbosity':'quiet', 'callerLength':10, 'tagLength':10})
+
+testDir = os.path.abspath(os.path.dirname(__file__))
+
+results = {"pass":0,"fail":0}
+
+def checkTrue(comment,res):
+  """
+    Takes a boolean and checks it against True.
+    @ In, comment, string, a comment printed out if it fails
+    @ In, res, bool, the tested value
+    @ Out, res, bool, True if test
+  """
+  if res:
+    results["pass"] += 1
+  else:
+    print("checking bool",comment,'|',res,'is not True!')
+    results["fail"] += 1
+  return res
+
+def createDatabase(name, readMode, layout=None):
+  """
+    Creates an HDF5 database from its XML input.
+    @ In, name, str, name of the database (and of its file)
+    @ In, readMode, str, "overwrite" or "read"
+    @ In, layout, str, optional, the database layout
+    @ Out, db, HDF5, the database
+  """
+  attrib = {'name':name, 'readMode':readMode, 'directory':testDir}
+  if layout is not None:
+    attrib['layout'] = layout
+  db = HDF5()
+  db.messageHandler = mh
+  db.applyRunInfo({'WorkingDir':testDir})
+  db.handleInput(db.parseXML(ET.Element('HDF5', attrib)))
+  return db
+
+def createHistorySet(name):
+  """
+    Creates an empty HistorySet, with inputs a,b and outputs x,y over "time".
+    @ In, name, str, name of the data object
+    @ Out, data, HistorySet, the data object
+  """
+  xml = ET.Element('HistorySet', {'name':name})
+  ET.SubElement(xml, 'Input').text = 'a,b'
+  ET.SubElement(xml, 'Output').text = 'x,y'
+  data = DataObjects.HistorySet()
+  data.messageHandler = mh
+  data._readMoreXML(xml)
+  data.addExpectedMeta(['prefix'])
+  return data
+
+def createPointSet(name):
+  """
+    Creates an empty PointSet, with input a and output x (last row of the histories).
+    @ In, name, str, name of the data object
+    @ Out, data, PointSet, the data object
+  """
+  xml = ET.Element('PointSet', {'name':name})
+  ET.SubElement(xml, 'Input').text = 'a'
+  ET.SubElement(xml, 'Output').text = 'x'
+  data = DataObjects.PointSet()
+  data.messageHandler = mh
+  data._readMoreXML(xml)
+  return data
+
+def sameData(first, second):
+  """
+    Checks that two data objects contain the same realizations, in the same order.
+    @ In, first, DataObject, the first data object
+    @ In, second, DataObject, the second data object
+    @ Out, same, bool, True if same
+  """
+  if len(first) != len(second):
+    return False
+  for r in range(len(first)):
+    rlz1 = first.realization(index=r, unpackXArray=True)
+    rlz2 = second.realization(index=r, unpackXArray=True)
+    for var in first.getVars() + first.indexes:
+      if not np.array_equal(np.atleast_1d(rlz1[var]), np.atleast_1d(rlz2[var])):
+        return False
+  return True
+
+# source histories, with different lengths and a string input
+source = createHistorySet('source')
+for i in range(6):
+  time = np.arange(3 + i % 3, dtype=float)
+  source.addRealization({'a':np.array([float(i)]), 'b':np.array(['label%d' %i], dtype=object),
+                         'prefix':np.array([str(i + 1)]), 'time':time,
+                         'x':np.sin(time + i), 'y':np.cos(time + i)})
+
+# write the same data with both layouts: bulk from the data object and one realization at a time
+for layout in ['groups', 'columnar']:
+  db = createDatabase('hs_' + layout, 'overwrite', layout)
+  checkTrue(layout + ' layout', db.layout == layout)
+  db.saveDataToFile(source)
+  db.database.closeDatabaseW()
+  single = createDatabase('rlz_' + layout, 'overwrite', layout)
+  for r in range(len(source)):
+    rlz = source.realization(index=r, unpackXArray=True)
+    single.addRealization(dict((var, np.atleast_1d(val)) for var, val in rlz.items()))
+  single.database.closeDatabaseW()
+
+# the layout of an existing database is read from the file
+for name in ['hs_columnar', 'rlz_columnar']:
+  db = createDatabase(name, 'read')
+  checkTrue(name + ' layout on read', db.layout == 'columnar')
+  checkTrue(name + ' names', db.getEndingGroupNames() == [str(i + 1) for i in range(6)])
+  # bulk load into a HistorySet
+  hs = createHistorySet('loaded')
+  db.loadIntoData(hs)
+  checkTrue(name + ' HistorySet', sameData(source, hs))
+  # realizations by name
+  rlz = db.realization('3')
+  checkTrue(name + ' realization x', np.allclose(rlz['x'], source.realization(index=2, unpackXArray=True)['x']))
+  checkTrue(name + ' realization b', rlz['b'][0] == 'label2')
+  # the PointSet takes the last value of the histories, as for the groups layout
+  ps = createPointSet('columnar')
+  db.loadIntoData(ps)
+  psGroups = createPointSet('groups')
+  createDatabase(name.replace('columnar', 'groups'), 'read').loadIntoData(psGroups)
+  checkTrue(name + ' PointSet', sameData(psGroups, ps))
+  db.database.closeDatabaseW()
+
+# appending to an existing columnar database
+db = createDatabase('hs_columnar', 'read')
+db.saveDataToFile(source)
+hs = createHistorySet('appended')
+db.loadIntoData(hs)
+checkTrue('append size', len(hs) == 2 * len(source))
+checkTrue('append values', np.allclose(hs.realization(index=7, unpackXArray=True)['y'], source.realization(index=1, unpackXArray=True)['y']))
+db.database.closeDatabaseW()
+
+for layout in ['groups', 'columnar']:
+  os.remove(os.path.join(testDir, 'hs_' + layout + '.h5'))
+  os.remove(os.path.join(testDir, 'rlz_' + layout + '.h5'))
+
+print(results)
+
+sys.exit(results["fail"])
+"""
+  <TestInfo>
+    <name>framework.test_hdf5_layouts</name>
+    <author>agent</author>
+    <created>2026-10-18</created>
+    <classesTested>Databases.HDF5</classesTested>
+    <description>
+       This test is a Unit Test for the "groups" and "columnar" layouts of the HDF5 database.
+    </description>
+  </TestInfo>
+"""
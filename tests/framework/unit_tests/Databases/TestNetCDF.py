@@ -0,0 +1,211 @@
+# Copyright 2017 Battelle Energy Alliance, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+  This Module performs Unit Tests for the appends to the NetCDF database.
+  It can not be considered part of the active code but of the regression test system
+"""
+import xml.etree.ElementTree as ET
+import sys, os
+import numpy as np
+import xarray as xr
+
+# find location of crow, message handler
+frameworkDir = os.path.abspath(os.path.join(*([os.path.dirname(__file__)]+[os.pardir]*4+['framework'])))
+sys.path.append(frameworkDir)
+
+from utils.utils import find_crow
+find_crow(frameworkDir)
+import MessageHandler
+
+import DataObjects
+from Databases.NetCDF import NetCDF
+
+mh = MessageHandler.MessageHandler()
+mh.initialize({'verbosity':'quiet', 'callerLength':10, 'tagLength':10})
+
+testDir = os.path.abspath(os.path.dirname(__file__))
+
+results = {"pass":0,"fail":0}
+
+def checkTrue(comment,res):
+  """
+    Takes a boolean and checks it against True.
+    @ In, comment, string, a comment printed out if it fails
+    @ In, res, bool, the tested value
+    @ Out, res, bool, True if test
+  """
+  if res:
+    results["pass"] += 1
+  else:
+    print("checking bool",comment,'|',res,'is not True!')
+    results["fail"] += 1
+  return res
+
+def createDatabase(name, readMode):
+  """
+    Creates a NetCDF database from its XML input, recording if the samples are appended in place.
+    @ In, name, str, name of the database (and of its file)
+    @ In, readMode, str, "overwrite" or "read"
+    @ Out, db, NetCDF, the database
+  """
+  db = NetCDF()
+  db.messageHandler = mh
+  db.applyRunInfo({'WorkingDir':testDir})
+  db.handleInput(db.parseXML(ET.Element('NetCDF', {'name':name, 'readMode':readMode, 'directory':testDir})))
+  # record the outcome of the in-place appends
+  db.inPlace = []
+  appendInPlace = db._appendInPlace
+  def recordAppend(path, ds):
+    """
+      Appends in place, recording if it was possible
+      @ In, path, str, full path to the database file
+      @ In, ds, xr.Dataset, the new samples
+      @ Out, appended, bool, False if the samples could not be appended in place
+    """
+    appended = appendInPlace(path, ds)
+    db.inPlace.append(appended)
+    return appended
+  db._appendInPlace = recordAppend
+  return db
+
+def createDataObject(cls, name, inputs, outputs):
+  """
+    Creates an empty data object.
+    @ In, cls, type, the data object class
+    @ In, name, str, name of the data object
+    @ In, inputs, str, the comma-separated inputs
+    @ In, outputs, str, the comma-separated outputs
+    @ Out, data, DataObject, the data object
+  """
+  xml = ET.Element(cls.__name__, {'name':name})
+  ET.SubElement(xml, 'Input').text = inputs
+  ET.SubElement(xml, 'Output').text = outputs
+  data = cls()
+  data.messageHandler = mh
+  data._readMoreXML(xml)
+  return data
+
+def loadFile(name):
+  """
+    Reads the database file
+    @ In, name, str, name of the database
+    @ Out, ds, xr.Dataset, the content of the file
+  """
+  return xr.load_dataset(os.path.join(testDir, name + '.nc'))
+
+######################################
+#   SCALAR, STRING, INTEGER APPENDS  #
+######################################
+db = createDatabase('points', 'overwrite')
+numSamples = 5
+for i in range(numSamples):
+  db.addRealization({'a':np.array([0.5 * i]), 'label':np.array(['sample%d' %i], dtype=object),
+                     'n':np.array([10 * i]), 'x':np.array([np.sin(i)])})
+# the file is created by the first sample, then the others are appended in place
+checkTrue('points appended in place', db.inPlace == [True] * (numSamples - 1))
+ds = loadFile('points')
+checkTrue('points sample IDs', list(ds['RAVEN_sample_ID'].values) == list(range(numSamples)))
+checkTrue('points float', np.allclose(ds['a'].values, 0.5 * np.arange(numSamples)))
+checkTrue('points string', list(ds['label'].values) == ['sample%d' %i for i in range(numSamples)])
+checkTrue('points integer type', ds['n'].dtype.kind == 'i')
+checkTrue('points integer', list(ds['n'].values) == [10 * i for i in range(numSamples)])
+checkTrue('points output', np.allclose(ds['x'].values, np.sin(np.arange(numSamples))))
+# read back into a data object
+ps = createDataObject(DataObjects.PointSet, 'points', 'a,label,n', 'x')
+createDatabase('points', 'read').loadIntoData(ps)
+checkTrue('points loaded size', len(ps) == numSamples)
+rlz = ps.realization(index=3, unpackXArray=True)
+checkTrue('points loaded values', rlz['a'] == 1.5 and rlz['label'] == 'sample3' and rlz['n'] == 30 and np.isclose(rlz['x'], np.sin(3)))
+# a data object is appended in bulk, after the existing samples
+source = createDataObject(DataObjects.PointSet, 'source', 'a,label,n', 'x')
+for i in range(3):
+  source.addRealization({'a':np.array([-1.0 - i]), 'label':np.array(['bulk%d' %i], dtype=object),
+                         'n':np.array([-i]), 'x':np.array([2.0 * i])})
+db = createDatabase('points', 'read')
+db.saveDataToFile(source)
+db.saveDataToFile(source)
+checkTrue('points bulk appended in place', db.inPlace == [True, True])
+ds = loadFile('points')
+checkTrue('points bulk sample IDs', list(ds['RAVEN_sample_ID'].values) == list(range(numSamples + 6)))
+checkTrue('points bulk string', list(ds['label'].values[numSamples:]) == ['bulk0', 'bulk1', 'bulk2'] * 2)
+checkTrue('points bulk integer', ds['n'].dtype.kind == 'i' and list(ds['n'].values[numSamples:]) == [0, -1, -2] * 2)
+checkTrue('points bulk unchanged', np.allclose(ds['a'].values[:numSamples], 0.5 * np.arange(numSamples)))
+# a float into the integer variable can not be stored in place, so the file is rewritten
+db.addRealization({'a':np.array([9.0]), 'label':np.array(['float'], dtype=object), 'n':np.array([2.5]), 'x':np.array([9.0])})
+checkTrue('points new type rewritten', db.inPlace[-1] is False)
+ds = loadFile('points')
+checkTrue('points new type size', list(ds['RAVEN_sample_ID'].values) == list(range(numSamples + 7)))
+checkTrue('points new type values', ds['n'].dtype.kind == 'f' and list(ds['n'].values) == [0, 10, 20, 30, 40] + [0, -1, -2] * 2 + [2.5])
+checkTrue('points new type string', ds['label'].values[-1] == 'float')
+
+######################################
+#   HISTORY APPENDS AND FALLBACK     #
+######################################
+def history(i, length):
+  """
+    Creates the realization of a history
+    @ In, i, int, the history number
+    @ In, length, int, the number of time steps
+    @ Out, rlz, dict, the realization
+  """
+  time = np.arange(length, dtype=float)
+  return {'a':np.array([float(i)]), 'time':time, 'x':np.sin(time + i), 'y':np.cos(time + i),
+          '_indexMap':[{'x':['time'], 'y':['time']}]}
+
+db = createDatabase('histories', 'overwrite')
+for i in range(4):
+  db.addRealization(history(i, 4))
+checkTrue('histories appended in place', db.inPlace == [True] * 3)
+# the time index changes, so the existing data is merged with the new history and the file is rewritten
+db.addRealization(history(4, 6))
+checkTrue('histories new time rewritten', db.inPlace[-1] is False)
+# the next histories over the new time index are appended in place again
+db.addRealization(history(5, 6))
+db.addRealization(history(6, 6))
+checkTrue('histories appended after rewrite', db.inPlace[-2:] == [True, True])
+ds = loadFile('histories')
+checkTrue('histories sample IDs', list(ds['RAVEN_sample_ID'].values) == list(range(7)))
+checkTrue('histories time', list(ds['time'].values) == list(range(6)))
+for i in range(7):
+  length = 4 if i < 4 else 6
+  x = ds['x'].values[i]
+  checkTrue('histories values %d' %i, np.allclose(x[:length], np.sin(np.arange(length) + i)) and np.isnan(x[length:]).all())
+  checkTrue('histories input %d' %i, ds['a'].values[i] == float(i))
+# read back into a data object
+hs = createDataObject(DataObjects.DataSet, 'histories', 'a', 'x,y')
+hs.setPivotParams({'x':['time'], 'y':['time']})
+createDatabase('histories', 'read').loadIntoData(hs)
+checkTrue('histories loaded size', len(hs) == 7)
+rlz = hs.realization(index=5, unpackXArray=True)
+checkTrue('histories loaded values', np.allclose(rlz['y'], np.cos(np.arange(6) + 5)))
+
+for name in ['points', 'histories']:
+  os.remove(os.path.join(testDir, name + '.nc'))
+
+print(results)
+
+sys.exit(results["fail"])
+"""
+  <TestInfo>
+    <name>framework.test_netcdf_appends</name>
+    <author>talbpaul</author>
+    <created>2026-10-19</created>
+    <classesTested>Databases.NetCDF</classesTested>
+    <description>
+       This test is a Unit Test for the appends to the NetCDF database: scalar, string and integer samples
+       appended in place, the full rewrite of the file when a variable type or the time index change, and
+       the reading of the database after several appends.
+    </description>
+  </TestInfo>
+"""
@@ -0,0 +1,117 @@
+# Copyright 2017 Battelle Energy Alliance, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+  Testing for the cell indexing of GridEntity and MultiGridEntity
+"""
+import os
+import sys
+
+import numpy as np
+
+ravenPath = os.path.abspath(os.path.join(__file__, *['..'] * 5, 'framework'))
+print('... located RAVEN at:', ravenPath)
+sys.path.append(ravenPath)
+import Driver
+
+from GridEntities import factory
+
+#
+#
+# checkers
+#
+def checkSame(comment, value, expected, update=True):
+  """
+    This method compares two identical things
+    @ In, comment, string, a comment printed out if it fails
+    @ In, value, float, the value to compare
+    @ In, expected, float, the expected value
+    @ In, update, bool, optional, if False then don't update results counter
+    @ Out, res, bool, True if same
+  """
+  res = value == expected
+  if update:
+    if res:
+      results["pass"] += 1
+    else:
+      print("checking string", comment, '|', value, "!=", expected)
+      results["fail"] += 1
+  return res
+
+results = {'pass': 0, 'fail': 0}
+
+def initDict(startingCellId=1):
+  """
+    Initialization dictionary of a 5x3x4 nodes grid
+    @ In, startingCellId, int, optional, id of the first cell
+    @ Out, initDict, dict, the initialization dictionary
+  """
+  return {'dimensionNames': ['a', 'b', 'c'],
+          'lowerBounds': {'a': 0.0, 'b': -1.0, 'c': 2.0},
+          'upperBounds': {'a': 1.0, 'b': 1.0, 'c': 3.0},
+          'stepLength': {'a': [0.25], 'b': [1.0], 'c': [1.0 / 3.0]},
+          'computeCells': True,
+          'constructTensor': True,
+          'startingCellId': startingCellId}
+
+#
+#
+# grid coordinates
+#
+grid = factory.returnInstance('GridEntity')
+grid.initialize(initDict(5))
+checkSame('grid shape', grid.returnParameter('gridShape'), (5, 3, 4))
+coords = grid.returnGridAsArrayOfCoordinates()
+checkSame('coordinates, first', coords[0].tolist(), [0.0, -1.0, 2.0])
+checkSame('coordinates, second', coords[1].tolist(), [0.0, -1.0, 2.0 + 1.0 / 3.0])
+checkSame('coordinates, last', coords[-1].tolist(), [1.0, 1.0, 3.0])
+
+#
+#
+# cells follow the C-ordering of their lowest vertex
+#
+checkSame('cell ids', list(grid.returnCellIds()), list(range(5, 5 + 4 * 2 * 3)))
+checkSame('first cell corners', grid.returnCellCorners(5), ((0, 0, 0), (1, 1, 1)))
+checkSame('second cell corners', grid.returnCellCorners(6), ((0, 0, 1), (1, 1, 2)))
+checkSame('last cell corners', grid.returnCellCorners(28), ((3, 1, 2), (4, 2, 3)))
+checkSame('cell verteces', grid.returnCellVerteces(12),
+          [(1, 0, 1), (1, 0, 2), (1, 1, 1), (1, 1, 2), (2, 0, 1), (2, 0, 2), (2, 1, 1), (2, 1, 2)])
+
+#
+#
+# cells sharing verteces
+#
+checkSame('corner vertex', sorted(grid.retrieveCellIds([[(0, 0, 0)]])), [5])
+checkSame('inner vertex', sorted(grid.retrieveCellIds([[(1, 1, 1)]])), [5, 6, 8, 9, 11, 12, 14, 15])
+checkSame('touching', sorted(grid.retrieveCellIds([[(0, 0, 0)], [(4, 2, 3)]])), [5, 28])
+checkSame('contained', sorted(grid.retrieveCellIds([[(1, 1, 1)], [(2, 1, 1)]], containedOnly=True)), [11, 12, 14, 15])
+
+#
+#
+# refined sub-grids continue the cell numbering
+#
+multi = factory.returnInstance('MultiGridEntity')
+multi.initialize(dict(initDict(), rootName='root'))
+multi.refineGrid({'cellIDs': [1, 24], 'refiningNumSteps': 2})
+checkSame('refined nodes', sorted(multi.getAllNodesNames('root')), ['root', 'root_cell:1', 'root_cell:24'])
+subGrid = multi.grid.find('root_cell:24').get('grid')
+lowerBounds = subGrid.returnParameter('bounds')['lowerBounds']
+checkSame('refined bounds, lower', bool(np.allclose([lowerBounds[v] for v in 'abc'], [0.75, 0.0, 2.0 + 2.0 / 3.0])), True)
+checkSame('refined cells', len(subGrid.returnCellIds()), 8)
+checkSame('max cell id', multi._getMaxCellIds(), 24 + 8 + 8)
+
+#
+# end
+#
+print('Results:', results)
+sys.exit(results['fail'])
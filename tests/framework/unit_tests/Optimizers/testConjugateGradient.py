@@ -0,0 +1,156 @@
+# Copyright 2017 Battelle Energy Alliance, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+  Testing for the speculative (parallel) line search of the ConjugateGradient step manipulator
+"""
+import os
+import sys
+from collections import deque
+
+import numpy as np
+
+ravenPath = os.path.abspath(os.path.join(__file__, *['..'] * 5, 'framework'))
+print('... located RAVEN at:', ravenPath)
+sys.path.append(ravenPath)
+import Driver
+
+from Optimizers.stepManipulators import factory
+
+cg = factory.returnInstance('ConjugateGradient')
+
+#
+#
+# checkers
+#
+def checkFloat(comment, value, expected, tol=1e-10, update=True):
+  """
+    This method compares two floats given a certain tolerance
+    @ In, comment, string, a comment printed out if it fails
+    @ In, value, float, the value to compare
+    @ In, expected, float, the expected value
+    @ In, tol, float, optional, the tolerance
+    @ In, update, bool, optional, if False then don't update results counter
+    @ Out, res, bool, True if same
+  """
+  if np.isnan(value) and np.isnan(expected):
+    res = True
+  elif np.isnan(value) or np.isnan(expected):
+    res = False
+  else:
+    res = abs(value - expected) <= tol
+  if update:
+    if not res:
+      print("checking float", comment, '|', value, "!=", expected)
+      results["fail"] += 1
+    else:
+      results["pass"] += 1
+  return res
+
+def checkSame(comment, value, expected, update=True):
+  """
+    This method compares two identical things
+    @ In, comment, string, a comment printed out if it fails
+    @ In, value, float, the value to compare
+    @ In, expected, float, the expected value
+    @ In, update, bool, optional, if False then don't update results counter
+    @ Out, res, bool, True if same
+  """
+  res = value == expected
+  if update:
+    if res:
+      results["pass"] += 1
+    else:
+      print("checking string", comment, '|', value, "!=", expected)
+      results["fail"] += 1
+  return res
+
+results = {'pass': 0, 'fail': 0}
+
+#
+#
+# quadratic model and its exact gradient
+#
+optVars = ['a', 'b']
+hessian = np.array([[2.0, 0.5], [0.5, 20.0]])
+center = np.array([0.4, 0.6])
+
+def evaluate(point):
+  """
+    Objective and gradient of the quadratic model, in the format of the optimizer
+    @ In, point, dict, point to evaluate
+    @ Out, opt, dict, point with objective
+    @ Out, gradient, tuple, (magnitude, versor)
+  """
+  delta = np.array([point[v] for v in optVars]) - center
+  grad = hessian.dot(delta)
+  mag = np.linalg.norm(grad)
+  opt = dict(point)
+  opt['ans'] = 0.5 * delta.dot(hessian).dot(delta)
+  return opt, (mag, dict((v, grad[i] / mag) for i, v in enumerate(optVars)))
+
+cg._numCandidates = 3
+cg.initialize(optVars, persistence=1)
+stepHist = deque([{'magnitude': 0.1, 'versor': None, 'info': None}])
+
+#
+#
+# first bracket follows the gradient with step lengths in geometric progression
+#
+opt, grad = evaluate({'a': 0.1, 'b': 0.9})
+gradHist = deque([grad])
+candidates, size, info = cg.step(opt, gradientHist=gradHist, prevStepSize=stepHist, objVar='ans')
+checkSame('first bracket, number of candidates', len(candidates), 3)
+checkFloat('first bracket, ratio', info['bracket'][2] / info['bracket'][1], 2.0)
+checkFloat('first bracket, central step', info['bracket'][1], info['stepSize'])
+checkFloat('first bracket, step size', size, info['stepSize'] * grad[0])
+for c, alpha in enumerate(info['bracket']):
+  for v in optVars:
+    checkFloat('first bracket, candidate {} var "{}"'.format(c, v), candidates[c][v], opt[v] - alpha * grad[0] * grad[1][v])
+
+#
+#
+# the candidate satisfying the Wolfe conditions is preferred, then the lowest
+#
+evaluated = list(evaluate(c) for c in candidates)
+choice = cg.chooseCandidate(list((o, g[0], g[1]) for o, g in evaluated), 'ans', info)
+wolfe = []
+for o, g in evaluated:
+  point = np.array([o[v] for v in optVars])
+  wolfe.append(cg._checkWolfe(info, point, o['ans'], g[0] * np.array([g[1][v] for v in optVars])))
+if any(all(w) for w in wolfe):
+  checkSame('choice satisfies Wolfe', all(wolfe[choice]), True)
+else:
+  checkSame('choice is lowest', choice, int(np.argmin([o['ans'] for o, _ in evaluated])))
+
+#
+#
+# iterating converges on the quadratic
+#
+for _ in range(100):
+  opt, grad = evaluated[choice]
+  if grad[0] < 1e-10:
+    break
+  stepHist.append({'magnitude': size, 'versor': None, 'info': info})
+  gradHist.append(grad)
+  candidates, size, info = cg.step(opt, gradientHist=gradHist, prevStepSize=stepHist, objVar='ans')
+  evaluated = list(evaluate(c) for c in candidates)
+  choice = cg.chooseCandidate(list((o, g[0], g[1]) for o, g in evaluated), 'ans', info)
+for i, v in enumerate(optVars):
+  checkFloat('converged, var "{}"'.format(v), opt[v], center[i], tol=1e-8)
+
+#
+# end
+#
+print('Results:', results)
+sys.exit(results['fail'])
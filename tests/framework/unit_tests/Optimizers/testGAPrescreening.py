@@ -0,0 +1,186 @@
+# Copyright 2017 Battelle Energy Alliance, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+  Testing for the surrogate-assisted pre-screening of the GeneticAlgorithm offspring
+"""
+import os
+import sys
+import xarray as xr
+import numpy as np
+
+ravenPath = os.path.abspath(os.path.join(__file__, *['..'] * 5, 'framework'))
+print('... located RAVEN at:', ravenPath)
+sys.path.append(ravenPath)
+import Driver
+from Optimizers.GeneticAlgorithm import GeneticAlgorithm
+from Optimizers.fitness.fitness import returnInstance
+from Optimizers.survivorSelectors.survivorSelectors import returnInstance as returnSurvivorSelector
+
+#
+#
+# checkers
+#
+def checkSame(comment, value, expected, update=True):
+  """
+    This method compares two identical things
+    @ In, comment, string, a comment printed out if it fails
+    @ In, value, float, the value to compare
+    @ In, expected, float, the expected value
+    @ In, update, bool, optional, if False then don't update results counter
+    @ Out, res, bool, True if same
+  """
+  res = value == expected
+  if update:
+    if res:
+      results["pass"] += 1
+    else:
+      print("checking string", comment, '|', value, "!=", expected)
+      results["fail"] += 1
+  return res
+
+results = {'pass': 0, 'fail': 0}
+
+#
+#
+# surrogate standing in for a trained ROM
+#
+class Surrogate:
+  """
+    Quadratic surrogate with the ROM evaluation API
+  """
+  name = 'surrogate'
+  amITrained = True
+
+  def evaluate(self, request):
+    """
+      Predicts the objective
+      @ In, request, dict, feature values
+      @ Out, prediction, dict, target values
+    """
+    checkSame('constant in request', bool(np.all(request['c'] == 2.0)), True)
+    return {'ans': (request['x'] - 3) ** 2 + (request['y'] - 1) ** 2}
+
+ga = GeneticAlgorithm()
+ga.toBeSampled = {'x': None, 'y': None}
+ga.constants = {'c': 2.0}
+ga._objectiveVar = 'ans'
+ga._objCoeff = None
+ga._penaltyCoeff = None
+ga._fitnessInstance = returnInstance(ga, name='invLinear')
+ga._constraintFunctions = []
+ga._impConstraintFunctions = []
+ga._populationSize = 6
+ga._surrogate = Surrogate()
+ga._evaluated = np.array([[3., 1.], [0., 0.]])
+
+candidates = np.array([[3, 1], [2, 1], [5, 5], [3, 2], [2, 1], [0, 3], [4, 1], [9, 9]], dtype=float)
+children = xr.DataArray(candidates,
+                        dims=['chromosome', 'Gene'],
+                        coords={'chromosome': np.arange(len(candidates)),
+                                'Gene': list(ga.toBeSampled)})
+
+#
+#
+# minimization keeps the best predicted, skipping evaluated and repeated chromosomes
+#
+ga._minMax = 'min'
+screened = ga._screenOffsprings(children)
+checkSame('min, kept', screened.data.tolist(), [[2, 1], [3, 2], [4, 1]])
+
+#
+#
+# maximization reverses the ranking
+#
+ga._minMax = 'max'
+screened = ga._screenOffsprings(children)
+checkSame('max, kept', screened.data.tolist(), [[9, 9], [5, 5], [0, 3]])
+
+#
+#
+# duplicates within the tolerance are only submitted when nothing else is left
+#
+ga._minMax = 'min'
+ga._duplicateTol = 1.0
+ga._screenFraction = 1.0
+screened = ga._screenOffsprings(children)
+checkSame('tolerance, duplicates last', screened.data.tolist()[:3], [[0, 3], [5, 5], [9, 9]])
+checkSame('tolerance, number kept', len(screened), 6)
+
+#
+#
+# the surrogate is retrained every "retrainEvery" generations, starting from the initial population
+#
+class TrainingRecorder(Surrogate):
+  """
+    Surrogate recording the size of its training sets
+  """
+  def __init__(self, ga):
+    """
+      Constructor
+      @ In, ga, GeneticAlgorithm, the optimizer using the surrogate
+      @ Out, None
+    """
+    self.ga = ga
+    self.trainings = []
+
+  def train(self, trainingSet):
+    """
+      Records the training
+      @ In, trainingSet, object, the training data
+      @ Out, None
+    """
+    self.trainings.append((self.ga.getIteration(0), len(self.ga._evaluated)))
+
+ga._surrogate = TrainingRecorder(ga)
+ga._retrainEvery = 2
+ga._evaluated = None
+ga._targetEvaluation = None
+generation = xr.DataArray(np.array([[1, 2], [3, 4], [5, 6]], dtype=float),
+                          dims=['chromosome', 'Gene'],
+                          coords={'chromosome': np.arange(3),
+                                  'Gene': list(ga.toBeSampled)})
+for iteration in range(5):
+  ga._RavenSampled__stepCounter = {0: iteration}
+  ga._updateSurrogate(0, generation)
+checkSame('retraining schedule', ga._surrogate.trainings, [(0, 3), (2, 9), (4, 15)])
+
+#
+#
+# the survivor selection keeps the population size when fewer offspring than the population are evaluated
+#
+population = xr.DataArray(np.arange(12, dtype=float).reshape(6, 2),
+                          dims=['chromosome', 'Gene'],
+                          coords={'chromosome': np.arange(6),
+                                  'Gene': list(ga.toBeSampled)})
+fitness = xr.DataArray(np.arange(6, dtype=float), dims=['chromosome'], coords={'chromosome': np.arange(6)})
+offSprings = xr.Dataset({'x': ('RAVEN_sample_ID', [20., 30.]), 'y': ('RAVEN_sample_ID', [21., 31.])})
+offSpringsFitness = xr.DataArray([10., -1.], dims=['chromosome'], coords={'chromosome': np.arange(2)})
+for selector in ['fitnessBased', 'ageBased']:
+  newPopulation, newFitness, newAge, _ = returnSurvivorSelector(ga, selector)(offSprings,
+                                                                              age=[0, 1, 2, 3, 4, 5],
+                                                                              variables=list(ga.toBeSampled),
+                                                                              population=population,
+                                                                              fitness=fitness,
+                                                                              offSpringsFitness=offSpringsFitness,
+                                                                              popObjectiveVal=None)
+  checkSame('{}, population size'.format(selector), np.shape(newPopulation.data), (6, 2))
+  checkSame('{}, fitness size'.format(selector), len(newFitness), 6)
+  checkSame('{}, age size'.format(selector), len(newAge), 6)
+  checkSame('{}, best offspring survives'.format(selector), [20., 21.] in newPopulation.data.tolist(), True)
+
+#
+# end
+#
+print('Results:', results)
+sys.exit(results['fail'])
@@ -0,0 +1,185 @@
+# Copyright 2017 Battelle Energy Alliance, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+  Testing for the LBFGS step manipulator
+"""
+import os
+import sys
+from collections import deque
+
+import numpy as np
+
+ravenPath = os.path.abspath(os.path.join(__file__, *['..'] * 5, 'framework'))
+print('... located RAVEN at:', ravenPath)
+sys.path.append(ravenPath)
+import Driver
+
+from Optimizers.stepManipulators import factory, NoMoreStepsNeeded
+
+lbfgs = factory.returnInstance('LBFGS')
+
+#
+#
+# checkers
+#
+def checkFloat(comment, value, expected, tol=1e-10, update=True):
+  """
+    This method compares two floats given a certain tolerance
+    @ In, comment, string, a comment printed out if it fails
+    @ In, value, float, the value to compare
+    @ In, expected, float, the expected value
+    @ In, tol, float, optional, the tolerance
+    @ In, update, bool, optional, if False then don't update results counter
+    @ Out, res, bool, True if same
+  """
+  if np.isnan(value) and np.isnan(expected):
+    res = True
+  elif np.isnan(value) or np.isnan(expected):
+    res = False
+  else:
+    res = abs(value - expected) <= tol
+  if update:
+    if not res:
+      print("checking float", comment, '|', value, "!=", expected)
+      results["fail"] += 1
+    else:
+      results["pass"] += 1
+  return res
+
+def checkSame(comment, value, expected, update=True):
+  """
+    This method compares two identical things
+    @ In, comment, string, a comment printed out if it fails
+    @ In, value, float, the value to compare
+    @ In, expected, float, the expected value
+    @ In, update, bool, optional, if False then don't update results counter
+    @ Out, res, bool, True if same
+  """
+  res = value == expected
+  if update:
+    if res:
+      results["pass"] += 1
+    else:
+      print("checking string", comment, '|', value, "!=", expected)
+      results["fail"] += 1
+  return res
+
+results = {'pass': 0, 'fail': 0}
+
+#
+#
+# quadratic model and its exact gradient
+#
+optVars = ['a', 'b']
+hessian = np.array([[2.0, 0.5], [0.5, 20.0]])
+center = np.array([0.4, 0.6])
+
+def gradient(point):
+  """
+    Gradient of the quadratic model, in the format of the gradient history
+    @ In, point, dict, point to evaluate
+    @ Out, gradient, tuple, (magnitude, versor)
+  """
+  grad = hessian.dot(np.array([point[v] for v in optVars]) - center)
+  mag = np.linalg.norm(grad)
+  return mag, dict((v, grad[i] / mag) for i, v in enumerate(optVars))
+
+lbfgs.initialize(optVars)
+gradHist = deque()
+stepHist = deque()
+initialStep = lbfgs.initialStepSize(numOptVars=2)
+checkFloat('initial step size', initialStep, 0.05 * np.sqrt(2))
+stepHist.append({'magnitude': initialStep, 'versor': None, 'info': None})
+
+#
+#
+# first step follows the gradient
+#
+opt0 = {'a': 0.1, 'b': 0.9}
+gradHist.append(gradient(opt0))
+opt1, size, info = lbfgs.step(opt0, gradientHist=gradHist, prevStepSize=stepHist)
+checkFloat('first step size', size, initialStep)
+for v in optVars:
+  checkFloat('first step, var "{}"'.format(v), opt1[v], opt0[v] - initialStep * gradHist[-1][1][v])
+checkSame('first step, no curvature', len(info['pairs']), 0)
+stepHist.append({'magnitude': size, 'versor': None, 'info': info})
+
+#
+#
+# second step uses the curvature of the first one
+#
+gradHist.append(gradient(opt1))
+opt2, size, info = lbfgs.step(opt1, gradientHist=gradHist, prevStepSize=stepHist)
+checkSame('second step, one pair', len(info['pairs']), 1)
+# compare with the explicit BFGS update of the scaled identity
+s = np.array([opt1[v] - opt0[v] for v in optVars])
+y = hessian.dot(s)
+rho = 1.0 / s.dot(y)
+inverse = np.eye(2) * s.dot(y) / y.dot(y)
+inverse = (np.eye(2) - rho * np.outer(s, y)).dot(inverse).dot(np.eye(2) - rho * np.outer(y, s)) + rho * np.outer(s, s)
+grad1 = gradHist[-1][0] * np.array([gradHist[-1][1][v] for v in optVars])
+expected = np.array([opt1[v] for v in optVars]) - inverse.dot(grad1)
+for i, v in enumerate(optVars):
+  checkFloat('second step, var "{}"'.format(v), opt2[v], expected[i])
+checkFloat('second step size', size, np.linalg.norm(inverse.dot(grad1)))
+stepHist.append({'magnitude': size, 'versor': None, 'info': info})
+
+#
+#
+# a rejected point is rerun from the same opt point, so the step is cut and no pair is added
+#
+optShrink, sizeShrink, infoShrink = lbfgs.step(opt1, gradientHist=gradHist, prevStepSize=stepHist, recommend='shrink')
+checkSame('shrink, no new pair', len(infoShrink['pairs']), 1)
+checkFloat('shrink, step size', sizeShrink, 0.5 * size)
+
+#
+#
+# iterating converges on the quadratic
+#
+opt = opt2
+for _ in range(10):
+  gradHist.append(gradient(opt))
+  if gradHist[-1][0] < 1e-12:
+    break
+  opt, size, info = lbfgs.step(opt, gradientHist=gradHist, prevStepSize=stepHist)
+  stepHist.append({'magnitude': size, 'versor': None, 'info': info})
+for i, v in enumerate(optVars):
+  checkFloat('converged, var "{}"'.format(v), opt[v], center[i], tol=1e-8)
+
+#
+#
+# variables on the boundary of the normalized space are held there
+#
+lbfgs.initialize(optVars)
+onBound = {'a': 0.0, 'b': 0.9}
+gradHist = deque([(1.0, {'a': np.sqrt(0.5), 'b': np.sqrt(0.5)})])
+stepHist = deque([{'magnitude': initialStep, 'versor': None, 'info': None}])
+newOpt, size, _ = lbfgs.step(onBound, gradientHist=gradHist, prevStepSize=stepHist)
+checkFloat('bound, held var', newOpt['a'], 0.0)
+checkFloat('bound, free var', newOpt['b'], 0.9 - initialStep)
+# gradient pointing out of the space everywhere: nothing more to do
+onCorner = {'a': 0.0, 'b': 1.0}
+gradHist = deque([(1.0, {'a': np.sqrt(0.5), 'b': -np.sqrt(0.5)})])
+try:
+  lbfgs.step(onCorner, gradientHist=gradHist, prevStepSize=stepHist)
+  done = False
+except NoMoreStepsNeeded:
+  done = True
+checkSame('corner, no more steps', done, True)
+
+#
+# end
+#
+print('Results:', results)
+sys.exit(results['fail'])
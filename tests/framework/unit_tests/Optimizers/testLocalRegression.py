@@ -0,0 +1,192 @@
+# Copyright 2017 Battelle Energy Alliance, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+  Testing for LocalRegression gradient approximation
+"""
+import os
+import sys
+
+import numpy as np
+
+ravenPath = os.path.abspath(os.path.join(__file__, *['..'] * 5, 'framework'))
+print('... located RAVEN at:', ravenPath)
+sys.path.append(ravenPath)
+import Driver
+
+from Optimizers.gradients import factory # returnInstance
+
+lr = factory.returnInstance('LocalRegression')
+
+#
+#
+# checkers
+#
+def checkFloat(comment, value, expected, tol=1e-10, update=True):
+  """
+    This method compares two floats given a certain tolerance
+    @ In, comment, string, a comment printed out if it fails
+    @ In, value, float, the value to compare
+    @ In, expected, float, the expected value
+    @ In, tol, float, optional, the tolerance
+    @ In, update, bool, optional, if False then don't update results counter
+    @ Out, res, bool, True if same
+  """
+  if np.isnan(value) and np.isnan(expected):
+    res = True
+  elif np.isnan(value) or np.isnan(expected):
+    res = False
+  else:
+    res = abs(value - expected) <= tol
+  if update:
+    if not res:
+      print("checking float", comment, '|', value, "!=", expected)
+      results["fail"] += 1
+    else:
+      results["pass"] += 1
+  return res
+
+def checkSame(comment, value, expected, update=True):
+  """
+    This method compares two identical things
+    @ In, comment, string, a comment printed out if it fails
+    @ In, value, float, the value to compare
+    @ In, expected, float, the expected value
+    @ In, update, bool, optional, if False then don't update results counter
+    @ Out, res, bool, True if same
+  """
+  res = value == expected
+  if update:
+    if res:
+      results["pass"] += 1
+    else:
+      print("checking string", comment, '|', value, "!=", expected)
+      results["fail"] += 1
+  return res
+
+results = {'pass': 0, 'fail': 0}
+
+#
+#
+# models
+#
+optVars = ['a', 'b', 'c']
+
+def linearModel(vs):
+  vs['ans'] = 3 * vs['a'] + 2 * vs['b'] + vs['c']
+  return vs
+
+def quadraticModel(vs):
+  vs['ans'] = 3 * vs['a'] + 2 * vs['b'] + vs['c'] + 50 * (vs['a'] ** 2 + vs['b'] ** 2 + vs['c'] ** 2)
+  return vs
+
+def check(comment, mag, vsr, correct):
+  """
+    Checks a gradient against the expected one
+    @ In, comment, string, a comment printed out if it fails
+    @ In, mag, float, gradient magnitude
+    @ In, vsr, dict, gradient versor
+    @ In, correct, list(float), expected gradient
+    @ Out, None
+  """
+  correctMag = np.linalg.norm(correct)
+  checkFloat('{}, magnitude'.format(comment), mag, correctMag, tol=1e-8)
+  for v, var in enumerate(optVars):
+    checkFloat('{}, versor, var "{}"'.format(comment, var), vsr[var], correct[v] / correctMag, tol=1e-8)
+
+#
+#
+# with nothing to reuse, perturbations are the same as FiniteDifference
+#
+lr.initialize(optVars)
+checkSame('Number of samples needed', lr.numGradPoints(), 3)
+optPoint = {'a': 0.1, 'b': 0.2, 'c': 0.3}
+stepSize = 0.5
+pts, info = lr.chooseEvaluationPoints(optPoint, stepSize)
+checkSame('Empty archive, new points', [i['reused'] for i in info], [False] * 3)
+for p, pt in enumerate(pts):
+  for v, var in enumerate(optVars):
+    delta = abs(pt[var] - optPoint[var])
+    checkFloat('Empty archive, point "{}" var "{}"'.format(p, var), delta, 0.005 if v == p else 0.0)
+# evaluate, collecting the realizations
+lr.recordRealization(linearModel(dict(optPoint)), 'ans')
+grads = [linearModel(pt) for pt in pts]
+for grad in grads:
+  lr.recordRealization(grad, 'ans')
+mag, vsr, inf = lr.evaluate(linearModel(dict(optPoint)), grads, info, 'ans')
+checkSame('Empty archive, inf check', inf, False)
+check('Empty archive', mag, vsr, [3, 2, 1])
+
+#
+#
+# a nearby opt point reuses the existing realizations
+#
+nearPoint = {'a': 0.101, 'b': 0.2, 'c': 0.3}
+pts, info = lr.chooseEvaluationPoints(nearPoint, stepSize)
+checkSame('Nearby, all reused', [i['reused'] for i in info], [True] * 3)
+mag, vsr, _ = lr.evaluate(linearModel(dict(nearPoint)), pts, info, 'ans')
+check('Nearby', mag, vsr, [3, 2, 1])
+
+#
+#
+# a point with a single neighbor only perturbs the directions orthogonal to it
+#
+lr.initialize(optVars)
+farPoint = {'a': 0.5, 'b': 0.5, 'c': 0.5}
+lr.recordRealization(linearModel({'a': 0.504, 'b': 0.504, 'c': 0.5}), 'ans')
+pts, info = lr.chooseEvaluationPoints(farPoint, stepSize)
+checkSame('Partial coverage, reused', [i['reused'] for i in info], [True, False, False])
+displacements = [np.array([pt[var] - farPoint[var] for var in optVars]) for pt in pts]
+for p in range(1, 3):
+  checkFloat('Partial coverage, new point "{}" distance'.format(p), np.linalg.norm(displacements[p]), 0.005)
+  for q in range(p):
+    checkFloat('Partial coverage, orthogonal "{}" "{}"'.format(p, q), np.dot(displacements[p], displacements[q]), 0.0)
+grads = [linearModel(pt) for pt in pts]
+mag, vsr, _ = lr.evaluate(linearModel(dict(farPoint)), grads, info, 'ans')
+check('Partial coverage', mag, vsr, [3, 2, 1])
+
+#
+#
+# the quadratic model is exact with realizations on both sides of the opt point
+#
+lr.initialize(optVars)
+lr._model = 'quadratic'
+for v, var in enumerate(optVars):
+  for side in (-1, 1):
+    pt = dict(optPoint)
+    pt[var] += side * 0.005
+    lr.recordRealization(quadraticModel(pt), 'ans')
+pts, info = lr.chooseEvaluationPoints(optPoint, stepSize)
+checkSame('Quadratic, all reused', [i['reused'] for i in info], [True] * 3)
+mag, vsr, _ = lr.evaluate(quadraticModel(dict(optPoint)), pts, info, 'ans')
+check('Quadratic', mag, vsr, [3 + 100 * 0.1, 2 + 100 * 0.2, 1 + 100 * 0.3])
+
+#
+#
+# infinite values point the gradient toward them
+#
+lr.initialize(optVars)
+lr._model = 'linear'
+grads = [{'a': 0.105, 'b': 0.2, 'c': 0.3, 'ans': np.inf},
+         linearModel({'a': 0.1, 'b': 0.205, 'c': 0.3}),
+         linearModel({'a': 0.1, 'b': 0.2, 'c': 0.305})]
+mag, vsr, inf = lr.evaluate(linearModel(dict(optPoint)), grads, [{'type': 'grad', 'reused': False}] * 3, 'ans')
+checkSame('Infinite, inf check', inf, True)
+checkSame('Infinite, magnitude', mag, np.inf)
+check('Infinite', 1.0, vsr, [1, 0, 0])
+
+#
+# end
+#
+print('Results:', results)
+sys.exit(results['fail'])
@@ -0,0 +1,276 @@
+# Copyright 2017 Battelle Energy Alliance, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+  Testing for the population of candidates of the SimulatedAnnealing: the best of the candidates
+  collected at each iteration goes through the Metropolis acceptance.
+"""
+import os
+import sys
+import xml.etree.ElementTree as ET
+import numpy as np
+
+frameworkDir = os.path.abspath(os.path.join(*([os.path.dirname(__file__)]+[os.pardir]*4+['framework'])))
+sys.path.append(frameworkDir)
+
+from utils.utils import find_crow, add_path
+find_crow(frameworkDir)
+add_path(os.path.join(frameworkDir, 'contrib', 'AMSC'))
+add_path(os.path.join(frameworkDir, 'contrib'))
+
+import MessageHandler
+
+mh = MessageHandler.MessageHandler()
+mh.initialize({'verbosity':'quiet', 'callerLength':10, 'tagLength':10})
+
+import Distributions
+import DataObjects
+from Optimizers import factory
+
+#
+#
+# checkers
+#
+def checkSame(comment, value, expected, update=True):
+  """
+    This method compares two identical things
+    @ In, comment, string, a comment printed out if it fails
+    @ In, value, float, the value to compare
+    @ In, expected, float, the expected value
+    @ In, update, bool, optional, if False then don't update results counter
+    @ Out, res, bool, True if same
+  """
+  res = value == expected
+  if update:
+    if res:
+      results["pass"] += 1
+    else:
+      print("checking string", comment, '|', value, "!=", expected)
+      results["fail"] += 1
+  return res
+
+def checkFloat(comment, value, expected, tol=1e-12, update=True):
+  """
+    This method compares two floats given a certain tolerance
+    @ In, comment, string, a comment printed out if it fails
+    @ In, value, float, the value to compare
+    @ In, expected, float, the expected value
+    @ In, tol, float, optional, the tolerance
+    @ In, update, bool, optional, if False then don't update results counter
+    @ Out, res, bool, True if same
+  """
+  res = abs(value - expected) <= tol
+  if update:
+    if res:
+      results["pass"] += 1
+    else:
+      print("checking float", comment, '|', value, "!=", expected)
+      results["fail"] += 1
+  return res
+
+def checkTrue(comment, value, update=True):
+  """
+    This method checks that a condition holds
+    @ In, comment, string, a comment printed out if it fails
+    @ In, value, bool, the condition
+    @ In, update, bool, optional, if False then don't update results counter
+    @ Out, value, bool, the condition
+  """
+  if update:
+    if value:
+      results["pass"] += 1
+    else:
+      print("checking condition", comment, "failed!")
+      results["fail"] += 1
+  return value
+
+results = {'pass': 0, 'fail': 0}
+
+#
+#
+# optimizer set up
+#
+uniform = Distributions.factory.returnInstance('Uniform')
+uniform.setMessageHandler(mh)
+paramInput = uniform.getInputSpecification()()
+paramInput.parseNode(ET.fromstring('<Uniform name="unif"><lowerBound>-2.0</lowerBound><upperBound>2.0</upperBound></Uniform>'))
+uniform._handleInput(paramInput)
+uniform.initializeDistribution()
+
+def createPointSet(name, inputs, outputs):
+  """
+    Creates an empty PointSet
+    @ In, name, str, name of the data object
+    @ In, inputs, str, the comma-separated inputs
+    @ In, outputs, str, the comma-separated outputs
+    @ Out, data, PointSet, the data object
+  """
+  data = DataObjects.PointSet()
+  data.messageHandler = mh
+  data._readMoreXML(ET.fromstring('<PointSet name="{}"><Input>{}</Input><Output>{}</Output></PointSet>'.format(name, inputs, outputs)))
+  return data
+
+def createOptimizer(minMax, candidates):
+  """
+    Creates and initializes a SimulatedAnnealing optimizer, recording the points it considers for acceptance
+    and the Metropolis acceptance probabilities
+    @ In, minMax, str, "min" or "max"
+    @ In, candidates, int, the number of candidates per iteration
+    @ Out, sa, SimulatedAnnealing, the optimizer
+  """
+  xml = ET.fromstring('<SimulatedAnnealing name="sa">'
+                      + '<samplerInit><limit>100</limit><initialSeed>42</initialSeed><writeSteps>final</writeSteps><type>{}</type></samplerInit>'.format(minMax)
+                      + '<convergence><objective>1e-12</objective><temperature>1e-30</temperature><persistence>100</persistence></convergence>'
+                      + '<coolingSchedule><exponential><alpha>0.94</alpha></exponential></coolingSchedule>'
+                      + '<candidates>{}</candidates>'.format(candidates)
+                      + '<variable name="x"><distribution>unif</distribution><initial>0.5</initial></variable>'
+                      + '<variable name="y"><distribution>unif</distribution><initial>-0.5</initial></variable>'
+                      + '<objective>ans</objective>'
+                      + '<TargetEvaluation class="DataObjects" type="PointSet">optOut</TargetEvaluation></SimulatedAnnealing>')
+  sa = factory.returnInstance('SimulatedAnnealing')
+  sa.setMessageHandler(mh)
+  sa._readMoreXML(xml)
+  sa._generateDistributions({'unif':uniform}, {})
+  sa.assemblerDict['TargetEvaluation'] = [['DataObjects', 'PointSet', 'optOut', createPointSet('optOut', 'x,y', 'ans')]]
+  sa.initialize(solutionExport=createPointSet('export', 'trajID', 'x,y,ans'))
+  # record the opt points checked for acceptance and the Metropolis acceptance probabilities
+  sa.considered = []
+  sa.metropolis = []
+  checkAcceptability = sa._checkAcceptability
+  def recordAcceptability(traj, opt, optVal, info):
+    """
+      Checks the acceptability, recording it
+      @ In, traj, int, identifier
+      @ In, opt, dict, new opt point
+      @ In, optVal, float, new optimization value
+      @ In, info, dict, meta information about the opt point
+      @ Out, acceptable, str, acceptability condition for point
+      @ Out, old, dict, old opt point
+      @ Out, rejectReason, str, reject reason of opt point
+    """
+    acceptable, old, rejectReason = checkAcceptability(traj, opt, optVal, info)
+    sa.considered.append((dict(opt), acceptable, dict(sa.info)))
+    return acceptable, old, rejectReason
+  sa._checkAcceptability = recordAcceptability
+  acceptabilityCriterion = sa._acceptabilityCriterion
+  def recordCriterion(currentObjective, newObjective):
+    """
+      Computes the Metropolis acceptance probability, recording it
+      @ In, currentObjective, float, the current value of the objective function
+      @ In, newObjective, float, the value of the objective function at the new candidate
+      @ Out, prob, float, the acceptance probability
+    """
+    prob = acceptabilityCriterion(currentObjective, newObjective)
+    sa.metropolis.append((currentObjective, newObjective, prob, sa.T))
+    return prob
+  sa._acceptabilityCriterion = recordCriterion
+  return sa
+
+def model(x, y):
+  """
+    Model optimized, with the minimum at (1, -0.5)
+    @ In, x, float, first input
+    @ In, y, float, second input
+    @ Out, ans, float, the objective
+  """
+  return (x - 1.0)**2 + (y + 0.5)**2
+
+def runOptimizer(minMax, candidates, iterations=15):
+  """
+    Runs the optimizer, collecting the runs of each iteration as the RavenSampled optimizer does
+    @ In, minMax, str, "min" or "max"
+    @ In, candidates, int, the number of candidates per iteration
+    @ In, iterations, int, optional, the number of iterations
+    @ Out, sa, SimulatedAnnealing, the optimizer
+    @ Out, batches, list, for each iteration the list of (info, rlz) of the collected runs
+  """
+  sa = createOptimizer(minMax, candidates)
+  sign = 1.0 if minMax == 'min' else -1.0
+  batches = []
+  for _ in range(iterations):
+    submitted = list(sa._submissionQueue)
+    sa._submissionQueue.clear()
+    batch = []
+    for point, info in submitted:
+      denormed = sa.denormalizeData(point)
+      rlz = dict(point)
+      # the objective is sign-corrected for the maximization (see RavenSampled.localFinalizeActualSampling)
+      rlz['ans'] = sign * model(denormed['x'], denormed['y'])
+      batch.append((info, rlz))
+      sa._useRealization(info, rlz)
+    batches.append(batch)
+  return sa, batches
+
+#
+#
+# the best candidate is considered for acceptance, then goes through the Metropolis test
+#
+for minMax in ['min', 'max']:
+  sa, batches = runOptimizer(minMax, 3)
+  checkSame(minMax + ' first run', len(batches[0]), 1)
+  checkSame(minMax + ' candidates per iteration', [len(batch) for batch in batches[1:]], [3] * (len(batches) - 1))
+  checkSame(minMax + ' one acceptance check per iteration', len(sa.considered), len(batches))
+  current = None
+  # the Metropolis test is expected for each best candidate other than the first run and the current point
+  tested = []
+  for it, (batch, (opt, acceptable, info)) in enumerate(zip(batches, sa.considered)):
+    best = min(batch, key=lambda run: run[1]['ans'])
+    if minMax == 'max':
+      # the best of the maximization has the largest objective
+      raw = [-rlz['ans'] for _, rlz in batch]
+      checkFloat(minMax + ' best is the largest, iteration {}'.format(it), -best[1]['ans'], max(raw))
+    checkSame(minMax + ' best considered, iteration {}'.format(it), opt, best[1])
+    if it > 0:
+      # the step of the best candidate is the one recorded for the solution export
+      checkSame(minMax + ' best step, iteration {}'.format(it), info['delta_x'], best[0]['neighbour']['delta_x'])
+    if current is not None and any(opt[var] != current[var] for var in ['x', 'y']):
+      tested.append((current, opt))
+    if acceptable in ['first', 'accepted']:
+      current = opt
+  # the best candidates go through the Metropolis test against the accepted state
+  checkSame(minMax + ' Metropolis tests', len(sa.metropolis), len(tested))
+  checkTrue(minMax + ' Metropolis tests run', len(tested) > len(batches) // 2)
+  for it, ((old, new), (currentObjective, newObjective, prob, T)) in enumerate(zip(tested, sa.metropolis)):
+    checkSame(minMax + ' Metropolis current, test {}'.format(it), currentObjective, old['ans'])
+    checkSame(minMax + ' Metropolis candidate, test {}'.format(it), newObjective, new['ans'])
+    expected = 1.0 if newObjective <= currentObjective else min(1.0, np.exp(-(newObjective - currentObjective) / T))
+    checkFloat(minMax + ' Metropolis probability, test {}'.format(it), prob, expected)
+  # uphill moves are tested with a probability below 1, and some are rejected
+  checkTrue(minMax + ' uphill tested', any(prob < 1.0 for _, _, prob, _ in sa.metropolis))
+  checkTrue(minMax + ' uphill rejected', any(acceptable == 'rejected' for _, acceptable, _ in sa.considered))
+  # the last accepted state is the current opt point
+  checkSame(minMax + ' current opt point', sa._optPointHistory[0][-1][0], current)
+
+#
+#
+# a single candidate keeps the one-neighbour path
+#
+sa, batches = runOptimizer('min', 1, iterations=5)
+checkSame('single candidate runs per iteration', [len(batch) for batch in batches], [1] * 5)
+checkSame('single candidate no population info', any('candidate' in info for batch in batches for info, _ in batch), False)
+checkSame('single candidate Metropolis tests', len(sa.metropolis), 4)
+
+print('Results:', results)
+sys.exit(results['fail'])
+"""
+  <TestInfo>
+    <name>framework.unit_tests.Optimizers.SimulatedAnnealingCandidates</name>
+    <author>Jimmy-INL</author>
+    <created>2026-10-19</created>
+    <classesTested>SimulatedAnnealing</classesTested>
+    <description>
+       Tests that, with several candidates per iteration, the SimulatedAnnealing considers the best candidate
+       for both minimization and maximization, and that this candidate goes through the Metropolis acceptance.
+    </description>
+  </TestInfo>
+"""
@@ -0,0 +1,130 @@
+# Copyright 2017 Battelle Energy Alliance, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+  This Module performs Unit Tests for the probability weights of the SafestPoint post-processor,
+  in particular for distributions whose cdf only accepts scalars.
+"""
+import xml.etree.ElementTree as ET
+import sys, os
+import math
+import numpy as np
+
+# find location of crow, message handler
+frameworkDir = os.path.abspath(os.path.join(*([os.path.dirname(__file__)]+[os.pardir]*4+['framework'])))
+
+sys.path.append(frameworkDir)
+
+from utils.utils import find_crow
+find_crow(frameworkDir)
+
+import MessageHandler
+
+# message handler
+mh = MessageHandler.MessageHandler()
+mh.initialize({'verbosity':'quiet', 'callerLength':10, 'tagLength':10})
+
+import Distributions
+from Models.PostProcessors import factory
+
+print('Module undergoing testing:')
+print(factory.returnClass('SafestPoint'))
+print('')
+
+results = {"pass":0,"fail":0}
+
+def checkArray(comment, value, expected, tol=1e-10):
+  """
+    This method compares two arrays of floats given a certain tolerance
+    @ In, comment, string, a comment printed out if it fails
+    @ In, value, np.array, the values to compare
+    @ In, expected, np.array, the expected values
+    @ In, tol, float, optional, the tolerance
+    @ Out, res, bool, True if same
+  """
+  value = np.asarray(value)
+  expected = np.asarray(expected)
+  res = value.shape == expected.shape and np.allclose(value, expected, rtol=0, atol=tol)
+  if res:
+    results["pass"] += 1
+  else:
+    print("checking array", comment, value, "!=", expected)
+    results["fail"] += 1
+  return res
+
+def createElement(tag, text):
+  """
+    Method to create a dummy xml element readable by the distribution classes
+    @ In, tag, string, the node tag
+    @ In, text, string, the text of the node
+    @ Out, element, xml.etree.ElementTree.Element, the node
+  """
+  element = ET.Element(tag)
+  element.text = text
+  return element
+
+def getDistribution(xmlElement):
+  """
+    Parses the xmlElement and returns the distribution
+    @ In, xmlElement, xml.etree.ElementTree.Element, the distribution node
+    @ Out, distribution, Distributions.Distribution, the initialized distribution
+  """
+  distribution = Distributions.factory.returnInstance(xmlElement.tag)
+  distribution.setMessageHandler(mh)
+  paramInput = distribution.getInputSpecification()()
+  paramInput.parseNode(xmlElement)
+  distribution._handleInput(paramInput)
+  distribution.initializeDistribution()
+  return distribution
+
+# LogUniform cdf only accepts scalars: x in [1, exp(3)]
+logUniformNode = ET.Element('LogUniform', {'name':'logUnif'})
+logUniformNode.append(createElement('lowerBound', '0.0'))
+logUniformNode.append(createElement('upperBound', '3.0'))
+logUniformNode.append(createElement('base', 'natural'))
+logUniform = getDistribution(logUniformNode)
+# Uniform cdf accepts arrays
+uniformNode = ET.Element('Uniform', {'name':'unif'})
+uniformNode.append(createElement('lowerBound', '0.0'))
+uniformNode.append(createElement('upperBound', '10.0'))
+uniform = getDistribution(uniformNode)
+
+safestPoint = factory.returnInstance('SafestPoint')
+safestPoint.setMessageHandler(mh)
+safestPoint.nonControllableOrd = ['x', 'y']
+safestPoint.nonControllableDist = {'x':logUniform, 'y':uniform}
+safestPoint.nonControllableGrid = {'x':['value', 4, 2.0], 'y':['value', 5, 2.5]}
+# (x, y) points of the non-controllable grid, including the boundaries of y
+xValues = np.array([2.0, 4.0, 6.0, 8.0, 2.0, 4.0])
+yValues = np.array([0.0, 2.5, 5.0, 7.5, 10.0, 5.0])
+safestPoint.nonControllableSpace = np.stack([xValues, yValues], axis=1)
+
+xExpected = np.array([math.log(x + 1.0) - math.log(x - 1.0) for x in xValues]) / 3.0
+yExpected = np.array([0.125, 0.25, 0.25, 0.25, 0.125, 0.25])
+checkArray('probability weights with a scalar-only cdf', safestPoint.__probabilityWeights__(), xExpected*yExpected)
+
+print(results)
+
+sys.exit(results["fail"])
+"""
+  <TestInfo>
+    <name>framework.safestPointWeights</name>
+    <author>alfoa</author>
+    <created>2026-10-19</created>
+    <classesTested>Models.PostProcessors.SafestPoint</classesTested>
+    <description>
+       This test checks the probability weights of the non-controllable grid points computed by the SafestPoint
+       post-processor, using a distribution (LogUniform) whose cdf only accepts scalar arguments.
+    </description>
+  </TestInfo>
+"""
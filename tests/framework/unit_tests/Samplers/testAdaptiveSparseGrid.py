@@ -0,0 +1,169 @@
+# Copyright 2017 Battelle Energy Alliance, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+  This Module performs Unit Tests for the AdaptiveSparseGrid sampler: the polynomial expansion
+  coefficients projected on the solutions at each refinement step are the ones of a
+  GaussPolynomialRom retrained on the same sparse grid and index set.
+"""
+import xml.etree.ElementTree as ET
+import sys, os
+import numpy as np
+
+# find location of crow, message handler
+frameworkDir = os.path.abspath(os.path.join(*([os.path.dirname(__file__)]+[os.pardir]*4+['framework'])))
+
+sys.path.append(frameworkDir)
+
+from utils.utils import find_crow, add_path
+find_crow(frameworkDir)
+add_path(os.path.join(frameworkDir, 'contrib', 'AMSC'))
+add_path(os.path.join(frameworkDir, 'contrib'))
+
+import MessageHandler
+
+# message handler
+mh = MessageHandler.MessageHandler()
+mh.initialize({'verbosity':'quiet', 'callerLength':10, 'tagLength':10})
+
+import Distributions
+import DataObjects
+from Models import ROM
+from Samplers import factory
+
+print('Module undergoing testing:')
+print(factory.returnClass('AdaptiveSparseGrid'))
+print('')
+
+results = {"pass":0,"fail":0}
+
+def checkTrue(comment, value):
+  """
+    This method checks that a condition holds
+    @ In, comment, string, a comment printed out if it fails
+    @ In, value, bool, the condition
+    @ Out, value, bool, the condition
+  """
+  if value:
+    results["pass"] += 1
+  else:
+    print("checking condition", comment, "failed!")
+    results["fail"] += 1
+  return value
+
+def checkAnswer(comment, value, expected, tol=1e-12):
+  """
+    This method compares two floats given a certain tolerance
+    @ In, comment, string, a comment printed out if it fails
+    @ In, value, float, the value to compare
+    @ In, expected, float, the expected value
+    @ In, tol, float, optional, the tolerance
+    @ Out, res, bool, True if same
+  """
+  res = abs(value - expected) <= tol
+  if res:
+    results["pass"] += 1
+  else:
+    print("checking answer", comment, value, "!=", expected)
+    results["fail"] += 1
+  return res
+
+def model(x1, x2):
+  """
+    Model sampled by the sparse grid
+    @ In, x1, float, first input
+    @ In, x2, float, second input
+    @ Out, (ans, ans2), tuple(float), the responses
+  """
+  return np.exp(0.5 * x1) * (1.0 + x2 + x2**3), np.sin(x1 + 2.0 * x2)
+
+def runSampler(refinementBatch, numSteps):
+  """
+    Runs an AdaptiveSparseGrid on the model for a number of refinement steps, checking at each step the
+    projected polynomial coefficients against a ROM retrained on the current sparse grid and index set
+    @ In, refinementBatch, int, the number of indices added at each refinement step
+    @ In, numSteps, int, the number of refinement steps
+    @ Out, sampler, AdaptiveSparseGrid, the sampler
+  """
+  rom = ROM()
+  romXml = ET.fromstring('<ROM name="rom" subType="GaussPolynomialRom"><Target>ans,ans2</Target><Features>x1,x2</Features>'
+                         + '<IndexSet>TotalDegree</IndexSet><PolynomialOrder>1</PolynomialOrder></ROM>')
+  ROM.getInputSpecification(romXml)
+  rom.setMessageHandler(mh)
+  rom._readMoreXML(romXml)
+  solns = DataObjects.PointSet()
+  solns.messageHandler = mh
+  solns._readMoreXML(ET.fromstring('<PointSet name="solns"><Input>x1,x2</Input><Output>ans,ans2</Output></PointSet>'))
+  # the convergence is not reached in the steps of the test
+  xml = ET.fromstring('<AdaptiveSparseGrid name="SG"><Convergence target="variance" refinementBatch="{}">1e-30</Convergence>'.format(refinementBatch)
+                      + '<variable name="x1"><distribution>unif</distribution></variable>'
+                      + '<variable name="x2"><distribution>unif</distribution></variable>'
+                      + '<ROM class="Models" type="ROM">rom</ROM>'
+                      + '<TargetEvaluation class="DataObjects" type="PointSet">solns</TargetEvaluation></AdaptiveSparseGrid>')
+  sampler = factory.returnInstance('AdaptiveSparseGrid')
+  sampler.setMessageHandler(mh)
+  sampler._readMoreXML(xml)
+  # serial quadrature generation, without the job handler
+  sampler._localGenerateAssembler({'Distributions':{'unif':uniform}, 'Functions':{}, 'internal':{'jobHandler':None}})
+  sampler.assemblerDict['ROM'] = [['Models', 'ROM', 'rom', rom]]
+  sampler.assemblerDict['TargetEvaluation'] = [['DataObjects', 'PointSet', 'solns', solns]]
+  sampler.initialize()
+  for step in range(numSteps):
+    # run the requested points
+    while len(sampler.neededPoints) > 0:
+      x1, x2 = sampler.neededPoints.pop()
+      ans, ans2 = model(x1, x2)
+      solns.addRealization({'x1':np.atleast_1d(x1), 'x2':np.atleast_1d(x2), 'ans':np.atleast_1d(ans), 'ans2':np.atleast_1d(ans2)})
+    checkTrue('batch {} step {} ready'.format(refinementBatch, step), sampler.localStillReady(True, skipJobHandlerCheck=True))
+    # the index set grows by refinementBatch indices at each step after the first one
+    if step > 0:
+      checkTrue('batch {} step {} in training'.format(refinementBatch, step), len(sampler.inTraining) == refinementBatch)
+    projected = sampler._projectCoefficients()
+    retrained = sampler._makeARom(sampler.sparseGrid, sampler.indexSet).supervisedContainer[0].polyCoeffDict
+    for target in ['ans', 'ans2']:
+      checkTrue('batch {} step {} {} indices'.format(refinementBatch, step, target), sorted(projected[target].keys()) == sorted(retrained[target].keys()))
+      for poly, coeff in retrained[target].items():
+        checkAnswer('batch {} step {} {} coefficient {}'.format(refinementBatch, step, target, poly), projected[target][poly], coeff)
+  return sampler
+
+uniform = Distributions.factory.returnInstance('Uniform')
+uniform.setMessageHandler(mh)
+paramInput = uniform.getInputSpecification()()
+paramInput.parseNode(ET.fromstring('<Uniform name="unif"><lowerBound>-1.0</lowerBound><upperBound>1.0</upperBound></Uniform>'))
+uniform._handleInput(paramInput)
+uniform.initializeDistribution()
+
+######################################
+#   PROJECTION VS ROM RETRAINING     #
+######################################
+single = runSampler(1, 5)
+batched = runSampler(3, 4)
+# the batched refinement adds the highest-impact indices first
+checkTrue('batched index set is larger', len(batched.indexSet.points) > len(single.indexSet.points))
+
+print(results)
+
+sys.exit(results["fail"])
+"""
+  <TestInfo>
+    <name>framework.adaptiveSparseGrid</name>
+    <author>talbpaul</author>
+    <created>2026-10-19</created>
+    <classesTested>Samplers.AdaptiveSparseGrid</classesTested>
+    <description>
+       This test drives an AdaptiveSparseGrid sampler, one and several indices at a time, and checks that the
+       polynomial expansion coefficients projected on the solutions at each refinement step match the ones of a
+       GaussPolynomialRom retrained on the same sparse grid and index set.
+    </description>
+  </TestInfo>
+"""
@@ -0,0 +1,269 @@
+# Copyright 2017 Battelle Energy Alliance, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+  This Module performs Unit Tests for the DynamicEventTree sampler bookkeeping:
+  the branch probability cutoff and the jobID -> node index.
+  The DET is driven by a fake code that writes the branch info files of the runs.
+"""
+import xml.etree.ElementTree as ET
+import sys, os
+import shutil
+import tempfile
+import numpy as np
+
+# find location of crow, message handler
+frameworkDir = os.path.abspath(os.path.join(*([os.path.dirname(__file__)]+[os.pardir]*4+['framework'])))
+
+sys.path.append(frameworkDir)
+
+from utils.utils import find_crow, add_path
+find_crow(frameworkDir)
+add_path(os.path.join(frameworkDir, 'contrib', 'AMSC'))
+add_path(os.path.join(frameworkDir, 'contrib'))
+
+import MessageHandler
+
+# message handler
+mh = MessageHandler.MessageHandler()
+mh.initialize({'verbosity':'quiet', 'callerLength':10, 'tagLength':10})
+
+import Distributions
+from Samplers import factory
+
+print('Module undergoing testing:')
+print(factory.returnClass('DynamicEventTree'))
+print('')
+
+results = {"pass":0,"fail":0}
+
+def checkTrue(comment, value):
+  """
+    This method checks that a condition holds
+    @ In, comment, string, a comment printed out if it fails
+    @ In, value, bool, the condition
+    @ Out, value, bool, the condition
+  """
+  if value:
+    results["pass"] += 1
+  else:
+    print("checking condition", comment, "failed!")
+    results["fail"] += 1
+  return value
+
+def checkSame(comment, value, expected):
+  """
+    This method compares two objects
+    @ In, comment, string, a comment printed out if it fails
+    @ In, value, object, the value to compare
+    @ In, expected, object, the expected value
+    @ Out, res, bool, True if same
+  """
+  res = value == expected
+  if res:
+    results["pass"] += 1
+  else:
+    print("checking answer", comment, value, "!=", expected)
+    results["fail"] += 1
+  return res
+
+def checkAnswer(comment, value, expected, tol=1e-10):
+  """
+    This method compares two floats given a certain tolerance
+    @ In, comment, string, a comment printed out if it fails
+    @ In, value, float, the value to compare
+    @ In, expected, float, the expected value
+    @ In, tol, float, optional, the tolerance
+    @ Out, res, bool, True if same
+  """
+  res = abs(value - expected) <= tol
+  if res:
+    results["pass"] += 1
+  else:
+    print("checking answer", comment, value, "!=", expected)
+    results["fail"] += 1
+  return res
+
+class FakeModel:
+  """
+    Minimal model providing what the DET needs to create the branch inputs
+  """
+  def __init__(self, workingDir):
+    """
+      Constructor
+      @ In, workingDir, string, the working directory
+      @ Out, None
+    """
+    self.workingDir = workingDir
+
+  def getAdditionalInputEdits(self, inputInfo):
+    """
+      No additional edits are needed
+      @ In, inputInfo, dict, the input info
+      @ Out, None
+    """
+    pass
+
+  def _replaceVariablesNamesWithAliasSystem(self, variables):
+    """
+      No alias is defined
+      @ In, variables, dict, the variables
+      @ Out, None
+    """
+    pass
+
+class FakeJob:
+  """
+    Minimal job providing what the DET needs to read the branch info
+  """
+  def __init__(self, prefix, workingDir):
+    """
+      Constructor
+      @ In, prefix, string, the job identifier
+      @ In, workingDir, string, the step working directory
+      @ Out, None
+    """
+    self.identifier = prefix
+    self.args = [None, None, None, {'WORKING_DIR':workingDir, 'prefix':prefix}]
+
+  def getMetadata(self):
+    """
+      Returns the metadata of the job
+      @ In, None
+      @ Out, metadata, dict, the metadata
+    """
+    return {'outfile':'out'}
+
+def runDET(probabilityCutoff=None, maxDepth=4):
+  """
+    Runs a DET on a fake code that branches on the variable "x" whenever a threshold is left to hit
+    and the branch is shallower than maxDepth
+    @ In, probabilityCutoff, float, optional, the branch probability cutoff
+    @ In, maxDepth, int, optional, the maximum depth of the branches
+    @ Out, (det, messages), tuple, the sampler and the messages it raised
+  """
+  attrib = '' if probabilityCutoff is None else ' probabilityCutoff="{}"'.format(probabilityCutoff)
+  xml = ET.fromstring('<DynamicEventTree name="det"{}><variable name="x"><distribution>unif</distribution>'.format(attrib)
+                      + '<grid construction="custom" type="CDF">0.1 0.5 0.8</grid></variable></DynamicEventTree>')
+  det = factory.returnInstance('DynamicEventTree')
+  det.setMessageHandler(mh)
+  det._readMoreXML(xml)
+  det._generateDistributions({'unif':uniform}, {})
+  det.initialize()
+  messages = []
+  det.raiseAMessage = lambda *args, **kwargs: messages.append(' '.join(str(arg) for arg in args))
+  workingDir = tempfile.mkdtemp()
+  model = FakeModel(workingDir)
+  while det.amIreadyToProvideAnInput():
+    det.generateInput(model, [])
+    prefix = det.inputInfo['prefix']
+    os.makedirs(os.path.join(workingDir, prefix))
+    depth = prefix.count('-')
+    if det.inputInfo['PbThreshold'] and depth < maxDepth:
+      with open(os.path.join(workingDir, prefix, 'out_actual_branch_info.xml'), 'w') as branchInfo:
+        branchInfo.write('<Branch_info end_time="{}"><Distribution_trigger name="x"/></Branch_info>'.format(depth + 1))
+    det.finalizeActualSampling(FakeJob(prefix, workingDir), model, [])
+  shutil.rmtree(workingDir)
+  return det, messages
+
+def walkTree(det):
+  """
+    Collects the nodes of the DET walking the trees
+    @ In, det, DynamicEventTree, the sampler
+    @ Out, nodes, dict, {name: node}
+  """
+  nodes = {}
+  for tree in det.TreeInfo.values():
+    for node in tree.getrootnode().iter():
+      nodes[node.name] = node
+  return nodes
+
+uniform = Distributions.factory.returnInstance('Uniform')
+uniform.setMessageHandler(mh)
+paramInput = uniform.getInputSpecification()()
+paramInput.parseNode(ET.fromstring('<Uniform name="unif"><lowerBound>0.0</lowerBound><upperBound>1.0</upperBound></Uniform>'))
+uniform._handleInput(paramInput)
+uniform.initializeDistribution()
+
+######################################
+#          FULL TREE                 #
+######################################
+det, messages = runDET()
+fullTree = walkTree(det)
+fullPb = dict((name, node.get('conditionalPb')) for name, node in fullTree.items())
+# probability of each branch (not conditioned on its parent)
+branchPb = dict((name, np.prod(node.get('branchChangedParamPb'))) for name, node in fullTree.items() if node.get('branchChangedParamPb') is not None)
+checkSame('full tree number of branches', len(fullTree), 30)
+checkSame('full tree number of runs', det.counter, 30)
+checkSame('full tree pruned branches', det.prunedBranches, 0)
+checkTrue('full tree no cutoff message', not any('cutoff' in message for message in messages))
+
+# the node index gives the same nodes as the tree walk
+checkSame('nodeIndex keys', sorted(det.nodeIndex.keys()), sorted(fullTree.keys()))
+checkTrue('nodeIndex nodes', all(det.nodeIndex[name] is node for name, node in fullTree.items()))
+checkTrue('_retrieveParentNode nodes', all(det._retrieveParentNode(name) is node for name, node in fullTree.items()))
+# not indexed nodes are found walking the tree (and then indexed)
+det.nodeIndex.clear()
+checkTrue('_retrieveParentNode not indexed', all(det._retrieveParentNode(name) is node for name, node in fullTree.items()))
+checkSame('_retrieveParentNode indexes', sorted(det.nodeIndex.keys()), sorted(fullTree.keys()))
+
+# the end info of the siblings is not shared
+first, second = fullTree['det_1-1-1'].get('endInfo'), fullTree['det_1-1-2'].get('endInfo')
+checkTrue('siblings end info', first is not second and first['branchChangedParams'] is not second['branchChangedParams'])
+first['branchChangedParams']['None']['unchangedPb'] = -1.0
+checkTrue('siblings end info values', second['branchChangedParams']['None']['unchangedPb'] >= 0.0)
+
+######################################
+#        PROBABILITY CUTOFF          #
+######################################
+cutoff = 0.05
+det, messages = runDET(probabilityCutoff=cutoff)
+cutTree = walkTree(det)
+# the conditional probability of a branch is not larger than the one of its parent => the branches
+#   above the cutoff are the ones of the full tree above the cutoff
+expected = sorted(name for name, pb in fullPb.items() if pb >= cutoff)
+checkSame('cutoff branches', sorted(cutTree.keys()), expected)
+checkSame('cutoff number of runs', det.counter, len(expected))
+checkTrue('cutoff conditional probabilities', all(abs(node.get('conditionalPb') - fullPb[name]) < 1e-12 for name, node in cutTree.items()))
+pruned = [name for name, pb in fullPb.items() if pb < cutoff and fullPb[name.rsplit('-', 1)[0]] >= cutoff]
+checkSame('cutoff pruned branches', sorted(pruned), ['det_1-1-2-1-1', 'det_1-2-1-1', 'det_1-2-1-2', 'det_1-2-2'])
+checkSame('cutoff pruned branches count', det.prunedBranches, len(pruned))
+# the pruned probability is the total probability of the pruned branches: each branch weighted by its parent
+prunedPb = sum(fullPb[name.rsplit('-', 1)[0]] * branchPb[name] for name in pruned)
+checkAnswer('cutoff pruned probability', det.prunedProbability, prunedPb)
+checkTrue('cutoff pruned probability below cutoff', det.prunedProbability < len(pruned) * cutoff)
+# the history ends where all the continuations have been pruned
+checkTrue('cutoff completed history', cutTree['det_1-2-1'].get('completedHistory'))
+checkTrue('cutoff not completed history', not cutTree['det_1-2'].get('completedHistory'))
+checkTrue('cutoff nodeIndex nodes', all(det._retrieveParentNode(name) is node for name, node in cutTree.items()))
+# the pruned branches are reported once, not at every poll of the sampler
+for _ in range(3):
+  checkTrue('cutoff sampler done', not det.amIreadyToProvideAnInput())
+checkSame('cutoff message reported once', len([message for message in messages if 'cutoff' in message]), 1)
+
+print(results)
+
+sys.exit(results["fail"])
+"""
+  <TestInfo>
+    <name>framework.dynamicEventTree</name>
+    <author>alfoa</author>
+    <created>2026-10-19</created>
+    <classesTested>Samplers.DynamicEventTree</classesTested>
+    <description>
+       This test drives a DynamicEventTree with a fake code and checks that the probability cutoff prunes the
+       expected branches, that the jobID to node index matches the tree walk and that the end info is not
+       shared among the sibling branches.
+    </description>
+  </TestInfo>
+"""
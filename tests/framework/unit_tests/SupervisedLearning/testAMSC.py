@@ -0,0 +1,207 @@
+# Copyright 2017 Battelle Energy Alliance, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+  This Module performs Unit Tests for the incremental construction of the AMSC
+  (approximate Morse-Smale complex) used by the MSR ROM and the TopologicalDecomposition.
+  Adding samples to an existing decomposition must give the same result as building it from scratch.
+"""
+import xml.etree.ElementTree as ET
+import sys, os
+import numpy as np
+
+# find location of crow, message handler
+frameworkDir = os.path.abspath(os.path.join(*([os.path.dirname(__file__)]+[os.pardir]*4+['framework'])))
+
+sys.path.append(frameworkDir)
+
+from utils.utils import find_crow, add_path
+find_crow(frameworkDir)
+add_path(os.path.join(frameworkDir, 'contrib', 'AMSC'))
+add_path(os.path.join(frameworkDir, 'contrib'))
+
+import MessageHandler
+
+# message handler
+mh = MessageHandler.MessageHandler()
+mh.initialize({'verbosity':'quiet', 'callerLength':10, 'tagLength':10})
+
+# input specs come mostly from the Models.ROM
+from Models import ROM
+
+import AMSC_Object as AMSC
+
+print('Module undergoing testing:')
+print(AMSC)
+print('')
+
+results = {"pass":0,"fail":0}
+
+def checkTrue(comment, value):
+  """
+    This method checks that a condition holds
+    @ In, comment, string, a comment printed out if it fails
+    @ In, value, bool, the condition
+    @ Out, value, bool, the condition
+  """
+  if value:
+    results["pass"] += 1
+  else:
+    print("checking condition", comment, "failed!")
+    results["fail"] += 1
+  return value
+
+def checkSame(comment, value, expected):
+  """
+    This method compares two objects
+    @ In, comment, string, a comment printed out if it fails
+    @ In, value, object, the value to compare
+    @ In, expected, object, the expected value
+    @ Out, res, bool, True if same
+  """
+  res = value == expected
+  if res:
+    results["pass"] += 1
+  else:
+    print("checking answer", comment, value, "!=", expected)
+    results["fail"] += 1
+  return res
+
+def checkArray(comment, value, expected, tol=1e-10):
+  """
+    This method compares two arrays of floats given a certain tolerance
+    @ In, comment, string, a comment printed out if it fails
+    @ In, value, np.array, the values to compare
+    @ In, expected, np.array, the expected values
+    @ In, tol, float, optional, the tolerance
+    @ Out, res, bool, True if same
+  """
+  value = np.asarray(value)
+  expected = np.asarray(expected)
+  res = value.shape == expected.shape and np.allclose(value, expected, rtol=0, atol=tol)
+  if res:
+    results["pass"] += 1
+  else:
+    print("checking array", comment, value, "!=", expected)
+    results["fail"] += 1
+  return res
+
+def partitionsOf(amsc):
+  """
+    Returns the partitions of an AMSC as a comparable object
+    @ In, amsc, AMSC_Object, the decomposition
+    @ Out, partitions, dict, {(min, max): sorted sample indices}
+  """
+  return dict((key, sorted(indices)) for key, indices in amsc.Partitions(0).items())
+
+rng = np.random.RandomState(42)
+X = rng.rand(80, 2)
+Y = np.sin(6*X[:,0])*np.cos(5*X[:,1])
+old = 50
+
+######################################
+#         NEIGHBOR GRAPH             #
+######################################
+full = AMSC.NeighborGraph(X, 6)
+extended = AMSC.NeighborGraph(X[:old], 6)
+extended.AddSamples(X[old:])
+checkArray('NeighborGraph.AddSamples distances', extended.distances, full.distances)
+checkSame('NeighborGraph.AddSamples neighbors', extended.neighbors.tolist(), full.neighbors.tolist())
+checkSame('NeighborGraph.AddSamples edges', extended.Edges().tolist(), full.Edges().tolist())
+
+# fully connected graph (non-positive knn)
+full = AMSC.NeighborGraph(X, -1)
+extended = AMSC.NeighborGraph(X[:old], -1)
+extended.AddSamples(X[old:])
+checkSame('NeighborGraph.AddSamples fully connected edges', extended.Edges().tolist(), full.Edges().tolist())
+
+######################################
+#            AMSC_Object             #
+######################################
+for normalization in [None, 'feature']:
+  AMSC._graphCache.clear()
+  rebuilt = AMSC.AMSC_Object(X=X, Y=Y, knn=8, normalization=normalization)
+  AMSC._graphCache.clear()
+  incremental = AMSC.AMSC_Object(X=X[:old], Y=Y[:old], knn=8, normalization=normalization)
+  incremental.AddSamples(X[old:], Y[old:])
+  checkSame('AddSamples ({}) sample count'.format(normalization), len(incremental.X), len(X))
+  checkArray('AddSamples ({}) graph'.format(normalization), incremental.neighborGraph.distances, rebuilt.neighborGraph.distances)
+  checkSame('AddSamples ({}) hierarchy'.format(normalization), incremental.PrintHierarchy(), rebuilt.PrintHierarchy())
+  checkSame('AddSamples ({}) partitions'.format(normalization), partitionsOf(incremental), partitionsOf(rebuilt))
+
+# Update only adds the new samples when the current ones come first
+AMSC._graphCache.clear()
+rebuilt = AMSC.AMSC_Object(X=X, Y=Y, knn=8)
+AMSC._graphCache.clear()
+updated = AMSC.AMSC_Object(X=X[:old], Y=Y[:old], knn=8)
+graph = updated.neighborGraph
+updated.Update(X, Y)
+checkTrue('Update extends the graph', updated.neighborGraph is not graph and len(updated.neighborGraph.X) == len(X))
+checkSame('Update partitions', partitionsOf(updated), partitionsOf(rebuilt))
+# otherwise it starts over
+order = rng.permutation(len(X))
+AMSC._graphCache.clear()
+rebuilt = AMSC.AMSC_Object(X=X[order], Y=Y[order], knn=8)
+updated.Update(X[order], Y[order])
+checkSame('Update (shuffled) partitions', partitionsOf(updated), partitionsOf(rebuilt))
+
+######################################
+#        MSR RETRAINING              #
+######################################
+def createMSR():
+  """
+    Creates a MSR ROM
+    @ In, None
+    @ Out, msr, MSR, the ROM engine
+  """
+  xml = ET.fromstring('<ROM name="msr" subType="MSR"><Features>x1,x2</Features><Target>y</Target>'
+                      + '<simplification>0.0</simplification><knn>8</knn></ROM>')
+  ROM.getInputSpecification(xml)
+  rom = ROM()
+  rom._readMoreXML(xml)
+  return rom.supervisedContainer[0]
+
+def predict(msr, points):
+  """
+    Evaluates a MSR ROM point by point
+    @ In, msr, MSR, the ROM engine
+    @ In, points, np.array, the points to evaluate
+    @ Out, predict, np.array, the predictions
+  """
+  return np.array([msr.evaluate({'x1':point[:1], 'x2':point[1:]})['y'][0] for point in points])
+
+AMSC._graphCache.clear()
+retrained = createMSR()
+retrained.train({'x1':X[:old,0], 'x2':X[:old,1], 'y':Y[:old]})
+retrained.train({'x1':X[:,0], 'x2':X[:,1], 'y':Y})
+AMSC._graphCache.clear()
+rebuilt = createMSR()
+rebuilt.train({'x1':X[:,0], 'x2':X[:,1], 'y':Y})
+points = rng.rand(10, 2)
+checkArray('MSR retrained with more samples', predict(retrained, points), predict(rebuilt, points))
+
+print(results)
+
+sys.exit(results["fail"])
+"""
+  <TestInfo>
+    <name>framework.AMSC</name>
+    <author>maljdan</author>
+    <created>2026-10-19</created>
+    <classesTested>AMSC_Object, SupervisedLearning.MSR</classesTested>
+    <description>
+       This test checks that adding samples to an approximate Morse-Smale complex (and retraining the MSR ROM on a
+       grown training set) gives the same results as building it from scratch.
+    </description>
+  </TestInfo>
+"""
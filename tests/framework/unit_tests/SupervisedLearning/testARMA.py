@@ -471,6 +471,35 @@ sig7=[0.39975177, -0.14531468,  0.13138866, -0.56565224,  0.06020252,
 for n in range(10):
   checkFloat('signal 7, evaluation ind{}'.format(n), signal7[n], sig7[n], tol=1e-7)
 
+#############################################
+#            NUMHISTORIES                   #
+#############################################
+def createMultiHistoryARMA(numHistories, seed):
+  xml = createARMAXml(['a'], 't', 2, 0, [])
+  xml.append(createElement('seed',text=str(seed)))
+  xml.append(createElement('numHistories',text=str(numHistories)))
+  rom, arma = createFromXML(xml)
+  arma.__trainLocal__(featureVals,targetVals)
+  return arma
+
+numHist = 20
+ev = createMultiHistoryARMA(numHist, 42).__evaluateLocal__(np.array([1.0]))
+checkSame('numHistories shape', ev['a'].shape, (numHist, len(data)))
+checkArray('numHistories history index', ev['History'], np.arange(numHist), float)
+checkSame('numHistories index map', ev['_indexMap']['a'], ['History', 't'])
+# the same seed gives the same histories
+evSeeded = createMultiHistoryARMA(numHist, 42).__evaluateLocal__(np.array([1.0]))
+checkArray('numHistories, same seed', evSeeded['a'].ravel(), ev['a'].ravel(), float)
+# the histories are statistically alike to single (numHistories=1) samples
+singles = np.array([createMultiHistoryARMA(1, seed).__evaluateLocal__(np.array([1.0]))['a'] for seed in range(numHist)])
+checkSame('numHistories=1 shape', singles.shape, (numHist, len(data)))
+checkFloat('numHistories mean', np.average(ev['a']), np.average(singles), tol=2e-1)
+checkFloat('numHistories std', np.average(np.std(ev['a'], axis=1)), np.average(np.std(singles, axis=1)), tol=1.5e-1)
+# the correlation between pairs of histories (of only 100 steps) should be low, and zero on average
+correlation = np.corrcoef(ev['a'])[np.triu_indices(numHist, 1)]
+checkTrue('numHistories, histories are uncorrelated', abs(correlation).max() < 0.5)
+checkFloat('numHistories, average correlation', np.average(correlation), 0.0, tol=5e-2)
+
 #################
 # TODO UNTESTED #
 #################
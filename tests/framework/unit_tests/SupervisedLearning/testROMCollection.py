@@ -0,0 +1,163 @@
+# Copyright 2017 Battelle Energy Alliance, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+  This Module performs Unit Tests for the segmented ROMs of the ROMCollection: the segments trained and
+  evaluated one at a time or distributed across processes give the same results.
+  It can not be considered part of the active code but of the regression test system
+"""
+import xml.etree.ElementTree as ET
+import sys, os
+import numpy as np
+
+# find location of crow, message handler
+frameworkDir = os.path.abspath(os.path.join(*([os.path.dirname(__file__)]+[os.pardir]*4+['framework'])))
+
+sys.path.append(frameworkDir)
+
+from utils.utils import find_crow
+find_crow(frameworkDir)
+from utils import randomUtils
+from utils import TreeStructure as TS
+
+import MessageHandler
+
+# message handler
+mh = MessageHandler.MessageHandler()
+mh.initialize({'verbosity':'quiet', 'callerLength':10, 'tagLength':10})
+
+# input specs come mostly from the Models.ROM
+from Models import ROM
+import DataObjects
+
+results = {"pass":0,"fail":0}
+
+def checkTrue(comment, res, update=True):
+  """
+    This method is a pass-through for consistency and updating
+    @ In, comment, string, a comment printed out if it fails
+    @ In, res, bool, the tested value
+    @ In, update, bool, optional, if False then don't update results counter
+    @ Out, res, bool, True if test
+  """
+  if update:
+    if res:
+      results["pass"] += 1
+    else:
+      print("checking bool", comment, '|', res, 'is not True!')
+      results["fail"] += 1
+  return res
+
+def checkArray(comment, first, second, update=True):
+  """
+    This method is used to compare two arrays, which must be identical
+    @ In, comment, string, a comment printed out if it fails
+    @ In, first, np.array, the first array
+    @ In, second, np.array, the second array
+    @ In, update, bool, optional, if False then don't update results counter
+    @ Out, res, bool, True if same
+  """
+  res = np.array_equal(first, second)
+  if update:
+    if res:
+      results["pass"] += 1
+    else:
+      print("checking array", comment, '|', first, "!=", second)
+      results["fail"] += 1
+  return res
+
+def createSegmentedARMA(numWorkers):
+  """
+    Creates a segmented ARMA ROM
+    @ In, numWorkers, int, number of processes the segments are distributed over
+    @ Out, rom, ROM, the segmented ROM
+  """
+  xml = ET.fromstring("""
+    <ROM name="arma" subType="ARMA">
+      <Target>Signal,Time</Target>
+      <Features>scaling</Features>
+      <pivotParameter>Time</pivotParameter>
+      <P>1</P>
+      <Q>0</Q>
+      <Fourier>100, 25</Fourier>
+      <Segment>
+        <subspace divisions="4" shift="first">Time</subspace>
+        <numWorkers>{}</numWorkers>
+      </Segment>
+    </ROM>""".format(numWorkers))
+  # the segment node is taken out of the input read by the Driver
+  xml = TS.xmlToInputTree(ET.ElementTree(xml)).getroot()
+  ROM.getInputSpecification(xml)
+  rom = ROM()
+  rom.setMessageHandler(mh)
+  rom._readMoreXML(xml)
+  return rom
+
+# training signal
+time = np.arange(400, dtype=float)
+noise = np.random.RandomState(3)
+signal = 2.0 * np.sin(2.0 * np.pi * time / 100.0) + 0.5 * np.sin(2.0 * np.pi * time / 25.0) + noise.normal(0.0, 0.5, len(time))
+data = DataObjects.HistorySet()
+data.messageHandler = mh
+data._readMoreXML(ET.fromstring('<HistorySet name="signal"><Input>scaling</Input><Output>Signal</Output>'
+                                + '<options><pivotParameter>Time</pivotParameter></options></HistorySet>'))
+data.addRealization({'scaling':np.ones(1), 'Time':time, 'Signal':signal})
+
+######################################
+#   SERIAL VS PARALLEL SEGMENTS      #
+######################################
+numEvals = 3
+trained = {}
+for numWorkers in [1, 2, 3]:
+  rom = createSegmentedARMA(numWorkers)
+  randomUtils.randomSeed(42, seedBoth=True)
+  rom.train(data)
+  # the global stream resumes in the same state, whatever the number of processes
+  resumed = randomUtils.random()
+  randomUtils.randomSeed(42, seedBoth=True)
+  evaluations = [rom.evaluate({'scaling':np.ones(1)})['Signal'] for _ in range(numEvals)]
+  trained[numWorkers] = rom.supervisedContainer[0], resumed, evaluations
+
+serial, resumed, evaluations = trained[1]
+checkTrue('serial segments', len(serial._roms) == 4)
+checkTrue('serial evaluation length', all(len(evaluation) == len(time) for evaluation in evaluations))
+# the evaluations are stochastic, so consecutive evaluations are different histories
+checkTrue('serial evaluations differ', not np.array_equal(evaluations[0], evaluations[1]))
+for numWorkers in [2, 3]:
+  collection, parallelResumed, parallelEvaluations = trained[numWorkers]
+  checkTrue('{} workers segments'.format(numWorkers), len(collection._roms) == len(serial._roms))
+  for s, (segment, serialSegment) in enumerate(zip(collection._roms, serial._roms)):
+    fit = segment.armaResult['Signal']
+    serialFit = serialSegment.armaResult['Signal']
+    checkArray('{} workers segment {} ARMA parameters'.format(numWorkers, s), np.asarray(fit.params), np.asarray(serialFit.params))
+    checkArray('{} workers segment {} ARMA variance'.format(numWorkers, s), fit.sigma2, serialFit.sigma2)
+  checkTrue('{} workers resumed stream'.format(numWorkers), parallelResumed == resumed)
+  for e, (evaluation, serialEvaluation) in enumerate(zip(parallelEvaluations, evaluations)):
+    checkArray('{} workers evaluation {}'.format(numWorkers, e), evaluation, serialEvaluation)
+
+print(results)
+
+sys.exit(results["fail"])
+"""
+  <TestInfo>
+    <name>framework.test_rom_collection</name>
+    <author>talbpaul</author>
+    <created>2026-10-19</created>
+    <classesTested>SupervisedLearning.ROMCollection.Segments</classesTested>
+    <description>
+       This test is a Unit Test for the segmented ROMs: an ARMA segmented ROM trained and evaluated with its
+       segments handled one at a time, or distributed across two or three processes, gives identical
+       segment fits and identical histories, and leaves the global random number stream in the same state.
+    </description>
+  </TestInfo>
+"""
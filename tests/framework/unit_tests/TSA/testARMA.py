@@ -328,6 +328,34 @@ checkFloat('Simple denorm 250', 2.051286365253135, new[250], tol=1e-6)
 checkFloat('Simple denorm 500', -0.5047179383332892, new[500], tol=1e-6)
 checkFloat('Simple denorm 999', 1.3200315405820204, new[999], tol=1e-6)
 
+##########
+# Several targets, fit one at a time or distributed across processes
+#
+targets = ['A', 'B']
+signalB, _ = createARMASignal([0.5], [0.2], pivot)
+signals = np.zeros((len(pivot), 2))
+signals[:, 0] = signalA
+signals[:, 1] = signalB
+arma = createARMA(targets, 2, 3)
+fits = {}
+for numWorkers in [1, 2]:
+  settings = {'P': 2, 'Q': 3,
+              'gaussianize': False,
+              'seed': 42,
+              'numWorkers': numWorkers}
+  settings = arma.setDefaults(settings)
+  fits[numWorkers] = arma.characterize(signals, pivot, targets, settings)
+alone = arma.characterize(signals[:, :1], pivot, ['A'], settings)
+for target in targets:
+  serial = fits[1][target]['arma']
+  parallel = fits[2][target]['arma']
+  checkFloat(f'Several targets {target} intercept', serial['const'], parallel['const'], tol=1e-12)
+  checkArray(f'Several targets {target} AR', serial['ar'], parallel['ar'], float, tol=1e-12)
+  checkArray(f'Several targets {target} MA', serial['ma'], parallel['ma'], float, tol=1e-12)
+  checkFloat(f'Several targets {target} variance', serial['var'], parallel['var'], tol=1e-12)
+checkArray('Several targets A AR as alone', fits[2]['A']['arma']['ar'], alone['A']['arma']['ar'], float, tol=1e-12)
+checkArray('Several targets A MA as alone', fits[2]['A']['arma']['ma'], alone['A']['arma']['ma'], float, tol=1e-12)
+
 print(results)
 
 sys.exit(results["fail"])
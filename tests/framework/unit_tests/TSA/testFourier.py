@@ -343,6 +343,24 @@ for tg, target in enumerate(targets):
 
 
 
+####################
+# Several Targets  #
+####################
+# the targets share the Fourier bases and are fit together, each as if it was fit alone
+noisy = signals + np.random.normal(0, 0.1, signals.shape)
+for simultFit in [True, False]:
+  params = fourier.characterize(noisy, pivot, targets, settings, simultFit=simultFit)
+  synthetic = fourier.generate(params, pivot, settings)
+  for tg, target in enumerate(targets):
+    alone = fourier.characterize(noisy[:, tg:tg+1], pivot, [target], settings, simultFit=simultFit)
+    checkFloat(f'Several targets {target} intercept, simultaneous {simultFit}', params[target]['intercept'], alone[target]['intercept'])
+    for period in periods:
+      for stat in ['amplitude', 'phase']:
+        checkFloat(f'Several targets {target} period {period} {stat}, simultaneous {simultFit}',
+                   params[target]['coeffs'][period][stat], alone[target]['coeffs'][period][stat])
+    checkArray(f'Several targets {target} generate, simultaneous {simultFit}', synthetic[:, tg],
+               fourier.generate(alone, pivot, settings)[:, 0], float)
+
 print(results)
 
 sys.exit(results["fail"])
@@ -300,6 +300,30 @@ check = params['A']['model']
 for title, real, pred in zip(coef_titles, okay_coefs, check):
   checkFloat(title, real, check[pred], tol=1e-1)
 
+####################
+# Several Targets  #
+####################
+# the targets share the polynomial features and are fit together, each as if it was fit alone
+targets = ['A', 'B', 'C']
+signals = np.zeros((N, 3))
+signals[:, 0] = signalA
+signals[:, 1] = signalB
+signals[:, 2] = 5.0 - 0.5 * pivot + np.random.normal(0, 1, 100)
+
+model = createRegression(targets, 3)
+settings = {'degree': 3}
+settings = model.setDefaults(settings)
+params = model.characterize(signals, pivot, targets, settings)
+synthetic = model.generate(params, pivot, settings)
+for t, target in enumerate(targets):
+  alone = model.characterize(signals[:, t:t+1], pivot, [target], settings)
+  for name, value in alone[target]['model'].items():
+    checkFloat(f'Several targets {target} {name}', params[target]['model'][name], value, tol=1e-6)
+  checkArray(f'Several targets {target} generate', synthetic[:, t], model.generate(alone, pivot, settings)[:, 0], float, tol=1e-6)
+checkFloat('Several targets C slope', params['C']['model']['coef1'], -0.5, tol=1e-1)
+rlz = model.getParamsAsVars(params)
+checkSame('Several targets variables', len(rlz), 3 * 4)
+
 print(results)
 
 sys.exit(results["fail"])
@@ -0,0 +1,119 @@
+# Copyright 2017 Battelle Energy Alliance, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+  This Module performs Unit Tests for the temporal (per time step) data mining
+  in the unSupervisedLearning module. The results must not depend on the number of workers.
+"""
+import sys, os
+import numpy as np
+
+# find location of crow, message handler
+frameworkDir = os.path.abspath(os.path.join(*([os.path.dirname(__file__)]+[os.pardir]*4+['framework'])))
+
+sys.path.append(frameworkDir)
+
+from utils.utils import find_crow
+find_crow(frameworkDir)
+
+import MessageHandler
+
+# message handler
+mh = MessageHandler.MessageHandler()
+mh.initialize({'verbosity':'silent', 'callerLength':10, 'tagLength':10})
+
+import unSupervisedLearning
+
+print('Module undergoing testing:')
+print(unSupervisedLearning)
+print('')
+
+results = {"pass":0,"fail":0}
+
+def checkSame(comment, value, expected):
+  """
+    This method compares two objects
+    @ In, comment, string, a comment printed out if it fails
+    @ In, value, object, the value to compare
+    @ In, expected, object, the expected value
+    @ Out, res, bool, True if same
+  """
+  res = value == expected
+  if res:
+    results["pass"] += 1
+  else:
+    print("checking answer", comment, value, "!=", expected)
+    results["fail"] += 1
+  return res
+
+def checkSteps(comment, value, expected, tol=1e-10):
+  """
+    This method compares two dictionaries of arrays, keyed by time step
+    @ In, comment, string, a comment printed out if it fails
+    @ In, value, dict, the per-step arrays to compare
+    @ In, expected, dict, the expected per-step arrays
+    @ In, tol, float, optional, the tolerance
+    @ Out, res, bool, True if same
+  """
+  res = sorted(value.keys()) == sorted(expected.keys()) and \
+        all(np.shape(value[t]) == np.shape(expected[t]) and np.allclose(value[t], expected[t], rtol=0, atol=tol) for t in expected)
+  if res:
+    results["pass"] += 1
+  else:
+    print("checking steps", comment, "failed!")
+    results["fail"] += 1
+  return res
+
+def createKMeans(numWorkers, warmStart):
+  """
+    Creates and trains a temporal KMeans engine
+    @ In, numWorkers, int, number of workers fitting the time steps
+    @ In, warmStart, bool, True to initialize each step from the previous one
+    @ Out, engine, temporalSciKitLearn, the trained engine
+  """
+  engine = unSupervisedLearning.factory.returnInstance('temporalSciKitLearn', SKLtype='cluster|KMeans', Features='x,y',
+                                                      n_clusters=5, random_state=1, n_init=10, pivotParameter='time',
+                                                      numWorkers=numWorkers, warmStart=warmStart)
+  engine.train({'x':x.copy(), 'y':y.copy()})
+  return engine
+
+# unstructured data, so that the clusters found depend on the initial centers
+rng = np.random.RandomState(0)
+numSamples, numSteps = 60, 12
+x = rng.rand(numSamples, numSteps)
+y = rng.rand(numSamples, numSteps)
+
+for warmStart in [False, True]:
+  serial = createKMeans(1, warmStart)
+  parallel = createKMeans(3, warmStart)
+  checkSame('number of fitted steps (warmStart={})'.format(warmStart), len(parallel.metaDict['clusterCenters']), numSteps)
+  checkSteps('labels, 1 vs 3 workers (warmStart={})'.format(warmStart),
+             parallel.outputDict['outputs']['labels'], serial.outputDict['outputs']['labels'])
+  checkSteps('cluster centers, 1 vs 3 workers (warmStart={})'.format(warmStart),
+             parallel.metaDict['clusterCenters'], serial.metaDict['clusterCenters'])
+
+print(results)
+
+sys.exit(results["fail"])
+"""
+  <TestInfo>
+    <name>framework.temporalClustering</name>
+    <author>maljdan</author>
+    <created>2026-10-19</created>
+    <classesTested>unSupervisedLearning.temporalSciKitLearn</classesTested>
+    <description>
+       This test checks that the per time step clustering gives the same labels and cluster centers when the time
+       steps are fit by one or by several workers, with and without warm start.
+    </description>
+  </TestInfo>
+"""
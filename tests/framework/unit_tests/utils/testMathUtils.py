@@ -501,6 +501,28 @@ testVarGroup(groups,'symmdiff','a2,a3,b1')      # symdiff is XOR for a, d
 testVarGroup(groups,'symmrev','b1,a2,a3')       # symmrev shows order depends on how variables are put in
 
 
+### check "rankData"
+# ties share the average rank, and weights are accumulated
+checkArray('rankData unweighted',mathUtils.rankData([3.,1.,2.,1.]),[4.,1.5,3.,1.5])
+checkArray('rankData weighted',mathUtils.rankData([3.,1.,2.,1.],[1.,2.,1.,1.]),[5.,2.25,4.,2.25])
+# columns of a matrix are ranked independently
+ranks = mathUtils.rankData(np.array([[3.,1.],[1.,1.],[2.,0.],[1.,2.]]),np.array([[1.,1.],[2.,1.],[1.,3.],[1.,1.]]))
+checkArray('rankData matrix column 0',ranks[:,0],mathUtils.rankData([3.,1.,2.,1.],[1.,2.,1.,1.]))
+checkArray('rankData matrix column 1',ranks[:,1],mathUtils.rankData([1.,1.,0.,2.],[1.,1.,3.,1.]))
+
+### check "computeTruncatedSingularValueDecomposition" with the randomized solver
+# matrix with a fast decaying spectrum (rank 8 plus small noise)
+svdRng = np.random.RandomState(7)
+svdMatrix = (svdRng.randn(300,8)*np.logspace(0,-2,8)).dot(svdRng.randn(8,200)) + 1e-10*svdRng.randn(300,200)
+for truncation in [5, 0.99]:
+  U, s, V = mathUtils.computeTruncatedSingularValueDecomposition(svdMatrix, truncation)
+  Ur, sr, Vr = mathUtils.computeTruncatedSingularValueDecomposition(svdMatrix, truncation, randomized=True)
+  checkAnswer('randomized SVD rank '+str(truncation), len(sr), len(s))
+  checkArray('randomized SVD singular values '+str(truncation), sr, s, tol=1e-8)
+  checkAnswer('randomized SVD truncated matrix '+str(truncation), np.abs((Ur*sr).dot(Vr.T) - (U*s).dot(V.T)).max(), 0.0, tol=1e-8)
+# ranks close to the matrix dimensions are computed with the full decomposition
+checkTrue('randomized SVD large rank', mathUtils.computeRandomizedSingularValueDecomposition(svdMatrix, 150) is None, True)
+
 print(results)
 
 sys.exit(results["fail"])
@@ -518,6 +540,8 @@ sys.exit(results["fail"])
       <revision author="talbpaul" date="2016-11-08">Relocated utils tests</revision>
       <revision author="alfoa" date="2017-01-21">Adding this test description.</revision>
       <revision author="alfoa" date="2019-03-04">Moved methods isAString, isAFloat, isAInteger, isABoolean from mathUtils to utils</revision>
+      <revision author="agent" date="2026-10-18">Added tests of rankData</revision>
+      <revision author="agent" date="2026-10-18">Added tests of the randomized truncated SVD</revision>
     </revisions>
   </TestInfo>
 """
@@ -0,0 +1,92 @@
+# Copyright 2017 Battelle Energy Alliance, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+  This Module performs Unit Tests for the parallelUtils methods
+  It cannot be considered part of the active code but of the regression test system
+"""
+
+import os,sys
+import numpy as np
+frameworkDir = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(sys.argv[0])),os.pardir,os.pardir,os.pardir,os.pardir,'framework'))
+sys.path.append(frameworkDir)
+
+from utils import parallelUtils
+
+results = {"pass":0,"fail":0}
+
+def checkTrue(comment,value,expected):
+  """
+    Takes a boolean and checks it against True or False.
+    @ In, comment, string, a comment printed out if it fails
+    @ In, value, object, the value to compare
+    @ In, expected, object, the expected value
+    @ Out, None
+  """
+  if value == expected:
+    results["pass"] += 1
+    return True
+  else:
+    print("checking answer",comment,value,"!=",expected)
+    results["fail"] += 1
+    return False
+
+def sliceSum(start, end):
+  """
+    Sums a slice of the shared data.
+    @ In, start, int, first index
+    @ In, end, int, last index (exclusive)
+    @ Out, sliceSum, float, sum of the shared data in the slice
+  """
+  return float(parallelUtils.getShared('data')[start:end].sum())
+
+data = np.arange(1000, dtype=float)
+tasks = [(i*100, (i+1)*100) for i in range(10)]
+expected = [float(data[s:e].sum()) for s, e in tasks]
+
+# serial
+res, timings = parallelUtils.mapInParallel(sliceSum, tasks, numWorkers=1, shared={'data': data})
+checkTrue('serial results', res, expected)
+checkTrue('serial timings', len(timings), len(tasks))
+
+# distributed
+res, timings = parallelUtils.mapInParallel(sliceSum, tasks, numWorkers=3, shared={'data': data})
+checkTrue('parallel results', res, expected)
+checkTrue('parallel timings', len(timings), len(tasks))
+
+# shared data is only available during the mapping
+try:
+  parallelUtils.getShared('data')
+  checkTrue('shared cleared', False, True)
+except KeyError:
+  checkTrue('shared cleared', True, True)
+
+# number of workers
+checkTrue('workers None', parallelUtils.resolveNumWorkers(None), 1)
+checkTrue('workers capped', parallelUtils.resolveNumWorkers(8, numTasks=2), 2)
+checkTrue('workers all', parallelUtils.resolveNumWorkers(-1) >= 1, True)
+
+print(results)
+
+sys.exit(results["fail"])
+"""
+  <TestInfo>
+    <name>framework.parallelUtils</name>
+    <author>agent</author>
+    <created>2026-10-18</created>
+    <classesTested>utils.parallelUtils</classesTested>
+    <description>
+       This test performs Unit Tests for the parallelUtils methods
+    </description>
+  </TestInfo>
+"""
@@ -396,6 +396,51 @@ engine.seed(42)
 sampled = [engine.random() for _ in range(5)]
 checkArray('Independent RNG, seeded',sampled,correct)
 
+### resetGlobalEngines(), global engines back to their initial (unseeded) state
+randomUtils.randomSeed(42,engine=None)
+randomUtils.randomNormal(engine=None) # leaves a value in the Box-Muller queue
+randomUtils.resetGlobalEngines()
+sampled = [randomUtils.random(engine=None) for _ in range(5)]
+correct = [0.814723692093,
+           0.135477004139,
+           0.905791934325,
+           0.835008589978,
+           0.126986811898]
+checkArray('Global RNG, reset',sampled,correct)
+randomUtils.resetGlobalEngines()
+first = randomUtils.randomNormal(engine=None)
+randomUtils.resetGlobalEngines()
+checkAnswer('Global normal sample, reset',randomUtils.randomNormal(engine=None),first)
+
+### BoxMullerGenerator.generateMany(), several normal samples at once
+for engine, engName in [(None, 'engine not provided'), (eng, 'local engine provided')]:
+  # same values (and leftover in the queue) as one at a time, including a value left over in the queue
+  randomUtils.randomSeed(42,engine=engine)
+  generator = randomUtils.BoxMullerGenerator()
+  generator.generate(engine=engine)
+  single = [generator.generate(engine=engine) for _ in range(7)]
+  singleQueue = list(generator.queue[engine])
+  randomUtils.randomSeed(42,engine=engine)
+  generator = randomUtils.BoxMullerGenerator()
+  generator.generate(engine=engine)
+  many = generator.generateMany(7,engine=engine)
+  checkAnswer('generateMany number of samples for '+engName,len(many),7)
+  checkArray('generateMany samples for '+engName,many,single)
+  checkArray('generateMany queue for '+engName,list(generator.queue[engine]),singleQueue)
+  # same distribution as the single samples
+  many = generator.generateMany(100000,engine=engine)
+  checkAnswer('generateMany mean for '+engName,np.average(many),0.0,tol=1e-2)
+  checkAnswer('generateMany stdv for '+engName,np.std(many),1.0,tol=1e-2)
+  # randomNormal draws its samples from generateMany
+  randomUtils.randomSeed(42,engine=engine)
+  randomUtils.boxMullerGen.queue.clear()
+  single = [randomUtils.randomNormal(engine=engine) for _ in range(6)]
+  randomUtils.randomSeed(42,engine=engine)
+  randomUtils.boxMullerGen.queue.clear()
+  vals = randomUtils.randomNormal((3,2),engine=engine)
+  checkTrue('randomNormal shape for '+engName,vals.shape,(3,2))
+  checkArray('randomNormal matrix samples for '+engName,vals.ravel(),single)
+
 
 print(results)
 